@@ -61,6 +61,10 @@ def create_app(test_config=None):
     # Initialize database
     db.init_app(app)
 
+    # Count SQL statements per request (X-SQL-Statements header)
+    from app import query_counter
+    query_counter.init_app(app)
+
     # Configure database session
     @app.teardown_appcontext
     def shutdown_session(exception=None):
@@ -75,6 +79,16 @@ def create_app(test_config=None):
         logger.warning(f"DB create_all error (continuing anyway): {e}")
         # Continue even if table creation fails - tables may already exist
 
+    # Apply pending schema migrations (indexes and columns added after tables were created)
+    try:
+        from app.migrations import MIGRATIONS, run_migrations
+        with app.app_context():
+            applied = run_migrations(db.engine, MIGRATIONS)
+            if applied:
+                logger.info(f"Applied schema migrations: {applied}")
+    except Exception as e:
+        logger.warning(f"Schema migration error (continuing anyway): {e}")
+
     # Enable CORS for frontend communication (only in development)
     # In production (Docker), CORS not needed as same-origin
     if not in_docker:
@@ -116,6 +130,10 @@ def create_app(test_config=None):
     from .api.v1.scraping_routes import scraping_bp
     app.register_blueprint(scraping_bp, url_prefix='/api/v1')
 
+    # Background job API
+    from .api.v1.job_routes import jobs_bp
+    app.register_blueprint(jobs_bp, url_prefix='/api/v1')
+
     # Serve frontend (only in production/Docker)
     if in_docker:
         logger.info("=" * 60)
@@ -2,34 +2,60 @@
 Deal management API routes
 Provides REST endpoints for CRUD operations on deals
 """
-from flask import Blueprint, request, jsonify, send_file
+import json
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 from app.services.deal_service import DealService
+from app.jobs import JobQueue
+from app.jobs import handlers as job_handlers
+from app.api.v1.job_routes import job_accepted, render_result, wants_async
 
 deals_bp = Blueprint('deals', __name__)
 
+# Deals serialized per write when streaming the deal list
+STREAM_CHUNK_SIZE = 100
+
 
 @deals_bp.route('/deals', methods=['GET'])
 def get_deals():
     """
-    Get all deals with optional status filter
+    Get deals, most recently updated first, one page at a time
 
     Query Parameters:
         status (optional): Filter by status ('potential', 'ongoing', 'completed', 'rejected')
-        limit (optional): Maximum number of deals to return (default 100)
+        limit (optional): Maximum number of deals to return (default 100, max 5000)
+        cursor (optional): nextCursor from the previous page
+        fields (optional): Comma-separated fields to include (e.g. id,dealName,status,capRate)
 
     Returns:
-        JSON response with deals array
+        JSON response with deals array and nextCursor (null on the last page),
+        streamed as it is serialized
     """
     try:
         status = request.args.get('status')
         limit = request.args.get('limit', 100, type=int)
+        cursor = request.args.get('cursor')
+        fields = request.args.get('fields')
+        fields = [field.strip() for field in fields.split(',') if field.strip()] if fields else None
 
-        deals = DealService.get_all_deals(status=status, limit=limit)
+        page = DealService.list_deals(status=status, limit=limit, cursor=cursor, fields=fields)
 
-        return jsonify({
-            'deals': [deal.to_dict() for deal in deals]
-        }), 200
+        def generate():
+            yield '{"deals":['
+            chunk = []
+            for index, deal in enumerate(page):
+                chunk.append(('' if index == 0 else ',') + json.dumps(deal))
+                if len(chunk) >= STREAM_CHUNK_SIZE:
+                    yield ''.join(chunk)
+                    chunk = []
+            yield ''.join(chunk)
+            yield '],"nextCursor":' + json.dumps(page.next_cursor) + '}'
 
+        return Response(stream_with_context(generate()), status=200, mimetype='application/json')
+
+    except ValueError as e:
+        return jsonify({
+            'error': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'error': str(e)
@@ -177,13 +203,13 @@ def export_deal(deal_id):
     Path Parameters:
         deal_id: ID of the deal to export
 
+    Query Parameters:
+        async (optional): Queue as a background job and return 202 (true/false)
+
     Returns:
-        Excel file download
+        Excel file download, or 202 with the queued job
     """
     try:
-        # Import here to avoid circular dependency
-        from app.services.excel_export_service import ExcelExportService
-
         deal = DealService.get_deal(deal_id)
 
         if not deal:
@@ -191,23 +217,46 @@ def export_deal(deal_id):
                 'error': 'Deal not found'
             }), 404
 
+        if wants_async():
+            return job_accepted(JobQueue.enqueue('export_deal', {'deal_id': deal_id}))
+
         # Generate Excel file
-        excel_file = ExcelExportService.generate_excel(deal_id)
+        return render_result(job_handlers.export_deal({'deal_id': deal_id}, None))
+
+    except Exception as e:
+        return jsonify({
+            'error': str(e)
+        }), 500
 
-        if not excel_file:
-            return jsonify({
-                'error': 'Failed to generate Excel file'
-            }), 500
-
-        # Send file as download
-        filename = f"{deal.deal_name.replace(' ', '_')}_financial_model.xlsx"
-        return send_file(
-            excel_file,
-            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            as_attachment=True,
-            download_name=filename
-        )
 
+@deals_bp.route('/deals/board', methods=['GET'])
+def get_deal_board():
+    """
+    Get the deal board: exact per-status counts and the newest deals of each status
+
+    Query Parameters:
+        perStatus (optional): Deals per status (default 25, max 5000)
+        fields (optional): Comma-separated fields to include (e.g. id,dealName,capRate)
+
+    Returns:
+        JSON response keyed by status, each with count, deals and nextCursor.
+        Load more of a column with GET /deals?status=<status>&cursor=<nextCursor>
+    """
+    try:
+        per_status = request.args.get('perStatus', 25, type=int)
+        fields = request.args.get('fields')
+        fields = [field.strip() for field in fields.split(',') if field.strip()] if fields else None
+
+        board = DealService.get_deal_board(per_status=per_status, fields=fields)
+
+        return jsonify({
+            'board': board
+        }), 200
+
+    except ValueError as e:
+        return jsonify({
+            'error': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'error': str(e)
@@ -220,17 +269,10 @@ def get_deals_grouped():
     Get deals grouped by status
 
     Returns:
-        JSON response with deals grouped by status
+        JSON response with the 100 most recently updated deals of each status
     """
     try:
-        grouped_deals = DealService.get_deals_by_status_grouped()
-
-        # Convert Deal objects to dicts
-        result = {}
-        for status, deals in grouped_deals.items():
-            result[status] = [deal.to_dict() for deal in deals]
-
-        return jsonify(result), 200
+        return jsonify(DealService.get_deals_by_status_grouped()), 200
 
     except Exception as e:
         return jsonify({
@@ -12,6 +12,9 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../'))
 
 from build_underwriting_model import create_underwriting_model
+from app.jobs import JobQueue
+from app.jobs import handlers as job_handlers
+from app.api.v1.job_routes import job_accepted, render_result, wants_async
 
 excel_export_bp = Blueprint('excel_export', __name__)
 
@@ -21,11 +24,14 @@ def export_underwriting_excel(deal_id):
     """
     Generate and download Excel underwriting model for a multifamily property
 
+    Query Parameters:
+        async (optional): Queue as a background job and return 202 (true/false)
+
     Request Body:
         JSON object with multifamily underwriting data
 
     Returns:
-        Excel file download
+        Excel file download, or 202 with the queued job
     """
     try:
         data = request.get_json()
@@ -33,25 +39,11 @@ def export_underwriting_excel(deal_id):
         if not data:
             return jsonify({'error': 'Request body with underwriting data is required'}), 400
 
-        # Generate the model with real data from request
-        wb = create_underwriting_model(data)
-
-        # Save to BytesIO
-        output = BytesIO()
-        wb.save(output)
-        output.seek(0)
-
-        # Generate filename
-        property_name = data.get('propertyName', 'Property').replace(' ', '_')
-        timestamp = datetime.now().strftime('%Y%m%d')
-        filename = f"{property_name}_Underwriting_{timestamp}.xlsx"
+        if wants_async():
+            return job_accepted(JobQueue.enqueue('export_underwriting', {'data': data}))
 
-        return send_file(
-            output,
-            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            as_attachment=True,
-            download_name=filename
-        )
+        # Generate the model with real data from request
+        return render_result(job_handlers.export_underwriting({'data': data}, None))
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -2,7 +2,7 @@
 Fund management API routes
 Provides REST endpoints for fund data operations
 """
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 from app.services.fund_service import FundService
 
 fund_routes = Blueprint('fund_routes', __name__)
@@ -56,16 +56,25 @@ def get_fund_overview(fund_id):
         - cashFlowSummary: Summary calculations
         - benchmarks: Performance vs industry benchmarks
         - recentActivities: Recent fund activities
+
+        Served from the materialized snapshot. The response carries an ETag
+        and X-Snapshot-Version; a request whose If-None-Match matches the
+        current ETag gets 304 Not Modified with no body.
     """
     try:
-        overview = FundService.get_fund_overview(fund_id)
+        snapshot = FundService.get_fund_overview_snapshot(fund_id)
 
-        if not overview:
+        if not snapshot:
             return jsonify({
                 'error': 'Fund not found'
             }), 404
 
-        return jsonify(overview), 200
+        response = Response(snapshot.payload, mimetype='application/json')
+        response.set_etag(snapshot.etag)
+        response.headers['X-Snapshot-Version'] = str(snapshot.version)
+        # Clients may keep the payload but must revalidate before reusing it
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
 
     except Exception as e:
         return jsonify({
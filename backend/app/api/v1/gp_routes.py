@@ -91,16 +91,26 @@ def get_gp_overview(gp_id):
 @gp_routes.route('/gps/performance-comparison', methods=['GET'])
 def get_performance_comparison():
     """
-    Get performance comparison data for all GPs
+    Get performance comparison data for GPs, highest net IRR first
     Used for the performance comparison chart
 
+    Query Parameters:
+        limit (optional): Number of GPs to return (default 50, max 500)
+        offset (optional): Number of GPs to skip (default 0)
+
     Returns:
-        JSON response with GP performance comparison data
+        JSON response with GP performance comparison data, the number of
+        ranked GPs and the offset of the next page (null on the last page)
     """
     try:
-        comparison = GPService.get_gp_performance_comparison()
+        limit = request.args.get('limit', 50, type=int)
+        offset = request.args.get('offset', 0, type=int)
+
+        page = GPService.get_gp_performance_comparison(limit=limit, offset=offset)
         return jsonify({
-            'comparison': comparison
+            'comparison': page['items'],
+            'total': page['total'],
+            'nextOffset': page['nextOffset']
         }), 200
 
     except Exception as e:
@@ -114,11 +124,18 @@ def get_top_performers():
     """
     Get top performing GPs and those needing attention
 
+    Query Parameters:
+        limit (optional): Number of attention items to return (default 20, max 500)
+        offset (optional): Number of attention items to skip (default 0)
+
     Returns:
         JSON response with top performers and attention items
     """
     try:
-        performers = GPService.get_top_performers()
+        limit = request.args.get('limit', 20, type=int)
+        offset = request.args.get('offset', 0, type=int)
+
+        performers = GPService.get_top_performers(attention_limit=limit, attention_offset=offset)
         return jsonify(performers), 200
 
     except Exception as e:
@@ -127,6 +144,91 @@ def get_top_performers():
         }), 500
 
 
+@gp_routes.route('/gps/leaderboard', methods=['GET'])
+def get_leaderboard():
+    """
+    Get a page of GPs ranked by net IRR
+
+    Query Parameters:
+        side (optional): 'top' (highest first, default) or 'bottom' (lowest first)
+        irrBelow (optional): Only GPs with net IRR below this, lowest first
+        irrAbove (optional): Only GPs with net IRR above this, highest first
+        limit (optional): Number of GPs to return (default 10, max 500)
+        offset (optional): Number of GPs to skip (default 0)
+
+    Returns:
+        JSON response with ranked GPs, the number of matching GPs and the
+        offset of the next page (null on the last page)
+    """
+    try:
+        page = GPService.get_leaderboard(
+            side=request.args.get('side', 'top'),
+            limit=request.args.get('limit', 10, type=int),
+            offset=request.args.get('offset', 0, type=int),
+            irr_below=request.args.get('irrBelow', type=float),
+            irr_above=request.args.get('irrAbove', type=float)
+        )
+        return jsonify({
+            'gps': page['items'],
+            'total': page['total'],
+            'nextOffset': page['nextOffset']
+        }), 200
+
+    except ValueError as e:
+        return jsonify({
+            'error': str(e)
+        }), 400
+
+    except Exception as e:
+        return jsonify({
+            'error': str(e)
+        }), 500
+
+
+@gp_routes.route('/gps/<int:gp_id>/quarterly-performance', methods=['POST'])
+def add_quarterly_performance(gp_id):
+    """
+    Record a GP's IRR for a quarter
+
+    Args:
+        gp_id: ID of the GP
+
+    Request Body:
+        JSON object with year, quarter and irr
+
+    Returns:
+        JSON response with the created quarterly performance record
+    """
+    try:
+        performance_data = request.get_json()
+
+        if not performance_data:
+            return jsonify({
+                'error': 'No data provided'
+            }), 400
+
+        performance = GPService.add_quarterly_performance(gp_id, performance_data)
+
+        if not performance:
+            return jsonify({
+                'error': 'GP not found'
+            }), 404
+
+        return jsonify({
+            'performance': performance
+        }), 201
+
+    except ValueError as e:
+        return jsonify({
+            'error': str(e)
+        }), 400
+
+    except Exception as e:
+        return jsonify({
+            'error': str(e)
+        }), 500
+
+
 @gp_routes.route('/gps', methods=['POST'])
 def create_gp():
     """
@@ -0,0 +1,188 @@
+"""
+Background Job API Routes
+Status, results and cancellation of queued jobs
+
+Heavy endpoints (PDF extraction, Excel exports, deal comparison) accept
+?async=true to queue the work for the worker pool (python -m app.jobs.worker)
+and respond 202 with the job; poll GET /jobs/<id> and fetch
+GET /jobs/<id>/result once it has succeeded.
+"""
+
+import json
+from io import BytesIO
+from typing import Dict
+from flask import Blueprint, current_app, jsonify, request, send_file
+from app.jobs import JobQueue
+
+jobs_bp = Blueprint('jobs', __name__)
+
+
+def wants_async() -> bool:
+    """Whether the request asked to run as a background job (?async=true)."""
+    default = 'true' if current_app.config.get('JOB_ASYNC_DEFAULT', False) else 'false'
+    return request.args.get('async', default).lower() == 'true'
+
+
+def job_accepted(job):
+    """202 response pointing at a newly queued job."""
+    response = jsonify({
+        'success': True,
+        'data': job.to_dict()
+    })
+    response.status_code = 202
+    response.headers['Location'] = f'/api/v1/jobs/{job.id}'
+    return response
+
+
+def render_result(result: Dict):
+    """Turn a handler result (see app.jobs.handlers) into a response."""
+    if 'file' in result:
+        return send_file(
+            BytesIO(result['file']),
+            mimetype=result['mimetype'],
+            as_attachment=True,
+            download_name=result['filename']
+        )
+    return jsonify(result['body']), result.get('status_code', 200)
+
+
+@jobs_bp.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """
+    Get the status of a background job
+
+    Returns:
+        200: Job status (queued, running, succeeded, failed, cancelled)
+        404: Unknown job, or its result has expired
+    """
+    try:
+        job = JobQueue.get(job_id)
+        if job is None:
+            return jsonify({
+                'success': False,
+                'error': 'Job not found'
+            }), 404
+
+        data = job.to_dict()
+        if job.status == 'succeeded':
+            data['resultUrl'] = f'/api/v1/jobs/{job.id}/result'
+
+        return jsonify({
+            'success': True,
+            'data': data
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@jobs_bp.route('/jobs/<job_id>/result', methods=['GET'])
+def get_job_result(job_id):
+    """
+    Get the result of a finished job: the response the endpoint would have
+    returned inline (JSON with its status code, or a file download)
+
+    Returns:
+        Job result
+        404: Unknown job, or its result has expired
+        409: Job has not finished
+        500: Job failed
+    """
+    try:
+        job = JobQueue.get(job_id)
+        if job is None:
+            return jsonify({
+                'success': False,
+                'error': 'Job not found'
+            }), 404
+
+        if job.status in ('queued', 'running'):
+            return jsonify({
+                'success': False,
+                'error': f'Job is {job.status}',
+                'data': job.to_dict()
+            }), 409
+
+        if job.status != 'succeeded':
+            return jsonify({
+                'success': False,
+                'error': job.error_message or f'Job {job.status}',
+                'data': job.to_dict()
+            }), 500
+
+        if job.result_filename is not None:
+            return render_result({
+                'file': job.result_data,
+                'filename': job.result_filename,
+                'mimetype': job.result_mimetype
+            })
+        return render_result({
+            'status_code': job.result_status_code or 200,
+            'body': json.loads(job.result) if job.result else None
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@jobs_bp.route('/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    """
+    Cancel a job that has not started
+
+    Returns:
+        200: Job cancelled
+        404: Unknown job
+        409: Job already running or finished
+    """
+    try:
+        job = JobQueue.get(job_id)
+        if job is None:
+            return jsonify({
+                'success': False,
+                'error': 'Job not found'
+            }), 404
+
+        if not JobQueue.cancel(job_id):
+            return jsonify({
+                'success': False,
+                'error': 'Job has already started'
+            }), 409
+
+        return jsonify({
+            'success': True,
+            'message': 'Job cancelled'
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@jobs_bp.route('/jobs/stats', methods=['GET'])
+def get_job_stats():
+    """
+    Get the number of retained jobs in each status
+
+    Returns:
+        200: Counts keyed by status
+    """
+    try:
+        return jsonify({
+            'success': True,
+            'data': JobQueue.get_counts()
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
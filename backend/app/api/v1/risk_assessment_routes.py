@@ -3,11 +3,15 @@ Risk Assessment API Routes
 Provides REST endpoints for risk assessment and deal memo generation
 """
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
 from app.services.deal_service import DealService
-from app.services.deal_memo_service import DealMemoService
+from app.services.deal_memo_service import DealMemoService, DealRankings
+from app.services.total_return_service import TotalReturnService
 from app.services.rent_tier_service import RentTierService
+from app.services.analysis_cache import AnalysisResultCache
 from app.database import db, RiskBenchmarkData, MarketDecileThresholds
+from app.jobs import JobQueue
+from app.api.v1.job_routes import job_accepted, wants_async
 
 # Create blueprint
 risk_assessment_bp = Blueprint('risk_assessment', __name__)
@@ -103,6 +107,125 @@ def get_risk_assessment(deal_id):
         }), 500
 
 
+@risk_assessment_bp.route('/deals/<int:deal_id>/risk-assessments', methods=['GET'])
+def get_risk_assessment_history(deal_id):
+    """
+    Get a deal's risk assessment history, newest first
+
+    GET /api/v1/deals/<deal_id>/risk-assessments?limit=20&cursor=<nextCursor>
+
+    Returns:
+        200: Page of assessments with nextCursor (null on the last page)
+        400: Invalid cursor
+        404: Deal not found
+    """
+    try:
+        if not DealService.get_deal_model(deal_id):
+            return jsonify({
+                'success': False,
+                'error': f'Deal {deal_id} not found'
+            }), 404
+
+        limit = request.args.get('limit', 20, type=int)
+        cursor = request.args.get('cursor')
+        history = DealService.get_risk_assessment_history(deal_id, limit=limit, cursor=cursor)
+
+        return jsonify({
+            'success': True,
+            'deal_id': deal_id,
+            'data': history['assessments'],
+            'nextCursor': history['nextCursor']
+        }), 200
+
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@risk_assessment_bp.route('/deals/risk-assessment/batch', methods=['POST'])
+def calculate_risk_assessments_batch():
+    """
+    Calculate risk assessments for many deals in one call
+
+    POST /api/v1/deals/risk-assessment/batch
+
+    Request Body:
+        {
+            "deal_ids": [1, 2, 3],         // optional; omit to select by status
+            "status": "potential",         // optional filter when deal_ids is omitted
+            "holding_period": 10,          // optional, default: 10
+            "geography": "US",             // optional, default: 'US'
+            "save_to_db": true,            // optional, default: true
+            "include_components": false    // optional, default: false
+        }
+
+    Returns:
+        200: Batch processed (per-deal failures are listed under errors)
+        400: Invalid request body
+        500: Calculation error
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+
+        deal_ids = data.get('deal_ids')
+        status = data.get('status')
+        holding_period = data.get('holding_period', 10)
+        geography = data.get('geography', 'US')
+        save_to_db = data.get('save_to_db', True)
+        include_components = data.get('include_components', False)
+
+        if deal_ids is not None and (
+            not isinstance(deal_ids, list) or
+            not all(isinstance(d, int) and not isinstance(d, bool) for d in deal_ids)
+        ):
+            return jsonify({
+                'success': False,
+                'error': 'deal_ids must be a list of integer deal IDs'
+            }), 400
+
+        if not isinstance(holding_period, int) or holding_period < 1 or holding_period > 30:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid holding_period. Must be between 1 and 30 years'
+            }), 400
+
+        result = DealService.calculate_risk_assessments(
+            deal_ids=deal_ids,
+            status=status,
+            holding_period=holding_period,
+            geography=geography,
+            save_to_db=bool(save_to_db)
+        )
+
+        if not include_components:
+            for assessment in result['assessments']:
+                assessment.pop('components', None)
+
+        return jsonify({
+            'success': True,
+            'data': result
+        }), 200
+
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Calculation error: {str(e)}'
+        }), 500
+
+
 @risk_assessment_bp.route('/deals/<int:deal_id>/deal-memo', methods=['GET'])
 def get_deal_memo(deal_id):
     """
@@ -150,6 +273,76 @@ def get_deal_memo(deal_id):
         }), 500
 
 
+@risk_assessment_bp.route('/deals/<int:deal_id>/sensitivity-grid', methods=['POST'])
+def get_sensitivity_grid(deal_id):
+    """
+    Evaluate total returns over a grid of assumptions
+
+    POST /api/v1/deals/<deal_id>/sensitivity-grid
+
+    Request Body:
+        {
+            "axes": {
+                "yieldDelta": [-1, -0.5, 0, 0.5, 1],
+                "appreciationDelta": {"start": -2, "stop": 2, "steps": 9},
+                "costOfDebt": [5.5, 6.5, 7.5],
+                "ltv": [0.5, 0.65, 0.75, 0.8]
+            },
+            "rentDecile": 3  // optional
+        }
+
+        Axes are optional; omitted ones hold the deal's base value.
+
+    Returns:
+        200: Grid with axes, shape and nested return arrays (levered returns
+             indexed [yieldDelta][appreciationDelta][costOfDebt][ltv])
+        400: Invalid axes or rent decile
+        404: Deal not found
+        500: Calculation error
+    """
+    try:
+        if not DealService.get_deal_model(deal_id):
+            return jsonify({
+                'success': False,
+                'error': f'Deal {deal_id} not found'
+            }), 404
+
+        data = request.get_json(silent=True) or {}
+        axes = data.get('axes') or {}
+        if not isinstance(axes, dict):
+            return jsonify({
+                'success': False,
+                'error': 'axes must be an object keyed by axis name'
+            }), 400
+
+        rent_decile = data.get('rentDecile')
+        if rent_decile is not None and (not isinstance(rent_decile, int) or not 1 <= rent_decile <= 10):
+            return jsonify({
+                'success': False,
+                'error': 'rentDecile must be an integer from 1 to 10'
+            }), 400
+
+        grid = TotalReturnService.sensitivity_grid(deal_id, axes, rent_decile=rent_decile)
+
+        return jsonify({
+            'success': True,
+            'deal_id': deal_id,
+            'data': grid
+        }), 200
+
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Sensitivity grid error: {str(e)}'
+        }), 500
+
+
 @risk_assessment_bp.route('/deals/compare', methods=['POST'])
 def compare_deals():
     """
@@ -157,12 +350,23 @@ def compare_deals():
 
     POST /api/v1/deals/compare
 
+    Query Parameters:
+        - stream: Stream results as NDJSON (true/false, default: false)
+        - async: Queue as a background job and return 202 (true/false, default: false)
+
     Request Body:
         {
-            "deal_ids": [1, 2, 3],
-            "holding_period": 10  // optional, default: 10
+            "deal_ids": [1, 2, 3],   // 2 to COMPARE_MAX_DEALS deal IDs
+            "holding_period": 10,    // optional, default: 10
+            "top_k": 10,             // optional, deals per ranking (default: 10)
+            "stream": false          // optional, same as ?stream=true
         }
 
+    Streaming responds with one JSON object per line: a
+    {"type": "memo", "deal_id": ..., "data": ...} line as each memo completes,
+    then {"type": "rankings", "data": ..., "summary": ...} with the final
+    rankings as [deal_id, metric value] pairs.
+
     Returns:
         200: Comparison generated successfully
         400: Invalid request body
@@ -179,6 +383,9 @@ def compare_deals():
 
         deal_ids = data['deal_ids']
         holding_period = data.get('holding_period', 10)
+        top_k = data.get('top_k', DealMemoService.RANKING_TOP_K)
+        # Only a JSON true streams; "false" or other truthy values do not
+        stream = data.get('stream') is True or request.args.get('stream', 'false').lower() == 'true'
 
         if not isinstance(deal_ids, list) or len(deal_ids) < 2:
             return jsonify({
@@ -186,16 +393,40 @@ def compare_deals():
                 'error': 'deal_ids must be a list of at least 2 deal IDs'
             }), 400
 
-        if len(deal_ids) > 5:
+        if not isinstance(top_k, int) or top_k < 1:
             return jsonify({
                 'success': False,
-                'error': 'Maximum 5 deals can be compared at once'
+                'error': 'top_k must be a positive integer'
             }), 400
 
+        if wants_async():
+            return job_accepted(JobQueue.enqueue('compare_deals', {
+                'deal_ids': DealMemoService.validate_comparison_ids(deal_ids),
+                'holding_period': holding_period,
+                'top_k': top_k
+            }))
+
+        if stream:
+            deal_ids = DealMemoService.validate_comparison_ids(deal_ids)
+            rankings = DealRankings(deal_ids, top_k)
+
+            def generate():
+                for deal_id, memo in DealMemoService.iter_comparison_memos(deal_ids, holding_period):
+                    rankings.add(deal_id, memo)
+                    yield current_app.json.dumps({'type': 'memo', 'deal_id': deal_id, 'data': memo}) + '\n'
+                yield current_app.json.dumps({
+                    'type': 'rankings',
+                    'data': rankings.to_dict(),
+                    'summary': rankings.summary()
+                }) + '\n'
+
+            return Response(stream_with_context(generate()), status=200, mimetype='application/x-ndjson')
+
         # Generate comparison
         comparison = DealMemoService.generate_comparison_memo(
             deal_ids=deal_ids,
-            holding_period=holding_period
+            holding_period=holding_period,
+            top_k=top_k
         )
 
         return jsonify({
@@ -357,6 +588,29 @@ def get_deal_summary(deal_id):
         }), 500
 
 
+@risk_assessment_bp.route('/analysis-cache/stats', methods=['GET'])
+def get_analysis_cache_stats():
+    """
+    Get hit/miss counters for the memo and risk assessment result cache
+
+    GET /api/v1/analysis-cache/stats
+
+    Returns:
+        200: Cache statistics
+    """
+    try:
+        return jsonify({
+            'success': True,
+            'data': AnalysisResultCache.get_stats()
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 # Error handlers
 @risk_assessment_bp.errorhandler(404)
 def not_found(error):
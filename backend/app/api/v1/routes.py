@@ -6,7 +6,10 @@ from datetime import datetime
 from pathlib import Path
 from app.services.census_service import CensusService
 from app.services.fred_service import FREDService
+from app.services.fred_series_store import FREDSeriesStore
 from app.services.rentcast_service import RentCastService
+from app.cache import TTLCache, ResponseStore, SQLiteBackend, get_cache_backend
+from app.clients import get_http_client, get_all_client_stats
 
 api_v1 = Blueprint('api_v1', __name__)
 
@@ -28,7 +31,9 @@ def get_census_service():
             api_key=current_app.config.get('CENSUS_API_KEY', ''),
             base_url=current_app.config.get('CENSUS_API_BASE_URL', 'https://api.census.gov/data'),
             api_year=current_app.config.get('CENSUS_API_YEAR', '2022'),
-            cache_ttl=current_app.config.get('CENSUS_CACHE_TTL', 86400)
+            cache_ttl=current_app.config.get('CENSUS_CACHE_TTL', 86400),
+            cache_backend=get_cache_backend(),
+            http_client=get_http_client('census', current_app.config)
         )
     return _census_service
 
@@ -40,21 +45,56 @@ def get_fred_service():
         _fred_service = FREDService(
             api_key=current_app.config.get('FRED_API_KEY', ''),
             base_url=current_app.config.get('FRED_API_BASE_URL', 'https://api.stlouisfed.org/fred'),
-            cache_ttl=current_app.config.get('FRED_CACHE_TTL', 3600)
+            cache_ttl=current_app.config.get('FRED_CACHE_TTL', 3600),
+            cache_backend=get_cache_backend(),
+            http_client=get_http_client('fred', current_app.config),
+            series_store=_create_fred_series_store()
         )
     return _fred_service
 
 
+def _create_fred_series_store():
+    """Open the local FRED time-series store, or None if disabled."""
+    store_path = current_app.config.get('FRED_SERIES_STORE_PATH')
+    if not store_path:
+        return None
+
+    return FREDSeriesStore(
+        store_path,
+        refresh_interval=current_app.config.get('FRED_CACHE_TTL', 3600)
+    )
+
+
 def get_rentcast_service():
     """Get or create RentCast service instance."""
     global _rentcast_service
     if _rentcast_service is None:
         _rentcast_service = RentCastService(
             api_key=current_app.config.get('RENTCAST_API_KEY', ''),
-            cache_ttl=current_app.config.get('RENTCAST_CACHE_TTL', 604800)
+            cache_ttl=current_app.config.get('RENTCAST_CACHE_TTL', 604800),
+            cache_backend=get_cache_backend(),
+            response_store=_create_rentcast_response_store(),
+            http_client=get_http_client('rentcast', current_app.config)
         )
     return _rentcast_service
 
+
+def _create_rentcast_response_store():
+    """Open the on-disk RentCast response store, or None if disabled."""
+    store_path = current_app.config.get('RENTCAST_RESPONSE_STORE_PATH')
+    if not store_path:
+        return None
+
+    backend = SQLiteBackend(
+        store_path,
+        max_bytes=current_app.config.get('RENTCAST_RESPONSE_STORE_MAX_BYTES') or None
+    )
+    return ResponseStore(
+        'rentcast',
+        backend,
+        ttl_seconds=current_app.config.get('RENTCAST_CACHE_TTL', 604800)
+    )
+
 @api_v1.route('/ping', methods=['GET'])
 def ping():
     return jsonify({'pong': True})
@@ -69,6 +109,37 @@ def status():
     return jsonify({'service': 'PE-Aequitas API', 'version': 'v1'})
 
 
+@api_v1.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    """Return per-namespace hit/miss and size counters for the API caches."""
+    try:
+        return jsonify({
+            'success': True,
+            'backend': current_app.config.get('CACHE_BACKEND', 'memory'),
+            'data': TTLCache.get_all_stats()
+        }), 200
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@api_v1.route('/http-clients/stats', methods=['GET'])
+def http_client_stats():
+    """Return request, retry and circuit breaker state per external data provider."""
+    try:
+        return jsonify({
+            'success': True,
+            'data': get_all_client_stats()
+        }), 200
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @api_v1.route('/metrics', methods=['GET'])
 def metrics():
     """Return simple metrics for the frontend dashboard.
@@ -191,26 +262,21 @@ def get_demographics_batch():
                 'code': 'INVALID_INPUT'
             }), 400
 
-        if len(zipcodes) > 50:
+        max_zipcodes = current_app.config.get('CENSUS_BATCH_MAX_ZIPCODES', 5000)
+        cache_max_entries = current_app.config.get('CACHE_MAX_ENTRIES')
+        if cache_max_entries:
+            # Each ZIP becomes a cache entry; keep one batch from evicting the whole cache
+            max_zipcodes = min(max_zipcodes, cache_max_entries // 10)
+        if len(zipcodes) > max_zipcodes:
             return jsonify({
                 'success': False,
-                'error': 'Maximum 50 ZIP codes per request',
+                'error': f'Maximum {max_zipcodes} ZIP codes per request',
                 'code': 'TOO_MANY_REQUESTS'
             }), 400
 
         census_service = get_census_service()
-        results = {}
-        errors = {}
-
-        for zipcode in zipcodes:
-            try:
-                demographic_data = census_service.get_demographics_by_zipcode(str(zipcode))
-                if demographic_data:
-                    results[zipcode] = demographic_data.to_dict()
-                else:
-                    errors[zipcode] = 'No data available'
-            except Exception as e:
-                errors[zipcode] = str(e)
+        demographics, errors = census_service.get_demographics_batch([str(zipcode) for zipcode in zipcodes])
+        results = {zipcode: demographic_data.to_dict() for zipcode, demographic_data in demographics.items()}
 
         return jsonify({
             'success': True,
@@ -918,6 +984,45 @@ def get_rentcast_market_trends():
         }), 500
 
 
+@api_v1.route('/rentcast/quota-stats', methods=['GET'])
+def get_rentcast_quota_stats():
+    """
+    Get paid RentCast calls made and saved by the response store, per endpoint.
+
+    Returns:
+        JSON response with quota statistics
+    """
+    try:
+        rentcast_service = get_rentcast_service()
+        stats = rentcast_service.get_quota_stats()
+
+        if stats is None:
+            return jsonify({
+                'success': False,
+                'error': 'RentCast response store is disabled',
+                'code': 'NO_DATA'
+            }), 404
+
+        return jsonify({
+            'success': True,
+            'data': stats
+        })
+
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'code': 'CONFIGURATION_ERROR'
+        }), 500
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': 'Internal server error',
+            'code': 'SERVER_ERROR'
+        }), 500
+
+
 @api_v1.route('/rentcast/property-valuation', methods=['GET'])
 def get_rentcast_property_valuation():
     """
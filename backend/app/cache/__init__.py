@@ -0,0 +1,14 @@
+from .backends import CacheBackend, MemoryBackend, SQLiteBackend, RedisBackend
+from .ttl_cache import TTLCache, create_backend, get_cache_backend
+from .response_store import ResponseStore
+
+__all__ = [
+    'CacheBackend',
+    'MemoryBackend',
+    'SQLiteBackend',
+    'RedisBackend',
+    'TTLCache',
+    'ResponseStore',
+    'create_backend',
+    'get_cache_backend'
+]
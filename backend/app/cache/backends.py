@@ -0,0 +1,569 @@
+"""
+Cache storage backends
+
+Every backend stores opaque byte strings under (namespace, key) with an
+absolute expiry time, evicts least recently used entries once its entry or
+byte limit is reached, and keeps per-namespace eviction counters.
+
+- MemoryBackend: per-process OrderedDict, O(1) get/set/evict
+- SQLiteBackend: on-disk WAL database shared by every worker on the host
+- RedisBackend: any server speaking the Redis protocol (RESP)
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+from urllib.parse import urlparse, unquote
+
+
+class CacheBackend:
+    """Interface implemented by all cache backends."""
+
+    name = 'base'
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """Return the stored bytes, or None if missing or expired."""
+        raise NotImplementedError
+
+    def set(self, namespace: str, key: str, data: bytes, ttl_seconds: int):
+        """Store bytes for ttl_seconds, evicting LRU entries if over the limits."""
+        raise NotImplementedError
+
+    def delete(self, namespace: str, key: str):
+        """Remove one entry."""
+        raise NotImplementedError
+
+    def clear(self, namespace: Optional[str] = None):
+        """Remove every entry in a namespace (or all namespaces)."""
+        raise NotImplementedError
+
+    def get_namespace_stats(self, namespace: str) -> Dict:
+        """Return entry count, byte size and evictions for a namespace."""
+        raise NotImplementedError
+
+    def incr_counter(self, namespace: str, name: str, amount: int = 1):
+        """Add to a named counter that lives as long as the backend's storage."""
+        raise NotImplementedError
+
+    def get_counters(self, namespace: str) -> Dict[str, int]:
+        """Return every counter recorded for a namespace."""
+        raise NotImplementedError
+
+
+class MemoryBackend(CacheBackend):
+    """
+    In-process LRU+TTL store
+
+    Entries live in one OrderedDict ordered from least to most recently used,
+    so hits, inserts and evictions are all O(1). Expired entries are dropped
+    when read or when they reach the LRU end.
+    """
+
+    name = 'memory'
+
+    def __init__(self, max_entries: Optional[int] = 1000, max_bytes: Optional[int] = None):
+        """
+        Args:
+            max_entries: Maximum number of entries across all namespaces (None = unlimited)
+            max_bytes: Maximum total size of stored values (None = unlimited)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        self._namespace_entries: Dict[str, int] = {}
+        self._namespace_bytes: Dict[str, int] = {}
+        self._evictions: Dict[str, int] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                return None
+
+            data, expires_at = entry
+            if time.time() >= expires_at:
+                self._remove((namespace, key))
+                return None
+
+            self._entries.move_to_end((namespace, key))
+            return data
+
+    def set(self, namespace: str, key: str, data: bytes, ttl_seconds: int):
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            if (namespace, key) in self._entries:
+                self._remove((namespace, key))
+
+            self._entries[(namespace, key)] = (data, time.time() + ttl_seconds)
+            self._account(namespace, 1, len(data))
+
+            while self._over_limit():
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions[oldest[0]] = self._evictions.get(oldest[0], 0) + 1
+
+    def delete(self, namespace: str, key: str):
+        with self._lock:
+            if (namespace, key) in self._entries:
+                self._remove((namespace, key))
+
+    def clear(self, namespace: Optional[str] = None):
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                self._total_bytes = 0
+                self._namespace_entries.clear()
+                self._namespace_bytes.clear()
+                return
+
+            for entry_key in [k for k in self._entries if k[0] == namespace]:
+                self._remove(entry_key)
+
+    def get_namespace_stats(self, namespace: str) -> Dict:
+        with self._lock:
+            return {
+                'entries': self._namespace_entries.get(namespace, 0),
+                'bytes': self._namespace_bytes.get(namespace, 0),
+                'evictions': self._evictions.get(namespace, 0)
+            }
+
+    def incr_counter(self, namespace: str, name: str, amount: int = 1):
+        with self._lock:
+            counters = self._counters.setdefault(namespace, {})
+            counters[name] = counters.get(name, 0) + amount
+
+    def get_counters(self, namespace: str) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters.get(namespace, {}))
+
+    def _over_limit(self) -> bool:
+        """Whether the store exceeds its entry or byte limit (caller holds the lock)."""
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._total_bytes > self.max_bytes
+
+    def _remove(self, entry_key: tuple):
+        """Drop one entry and update the size counters (caller holds the lock)."""
+        data, _ = self._entries.pop(entry_key)
+        self._account(entry_key[0], -1, -len(data))
+
+    def _account(self, namespace: str, entries: int, size: int):
+        """Adjust total and per-namespace counters (caller holds the lock)."""
+        self._total_bytes += size
+        self._namespace_entries[namespace] = self._namespace_entries.get(namespace, 0) + entries
+        self._namespace_bytes[namespace] = self._namespace_bytes.get(namespace, 0) + size
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    On-disk LRU+TTL store shared by every process that opens the same file
+
+    Uses WAL journaling so readers never block the writer, memory-maps the
+    database file, and keeps running byte/entry totals in a one-row table
+    maintained by triggers so limit checks are O(1).
+    """
+
+    name = 'sqlite'
+
+    # Skip the access-time write when an entry was touched this recently
+    TOUCH_INTERVAL = 30
+    EVICTION_BATCH = 32
+    MMAP_SIZE = 256 * 1024 * 1024
+
+    SCHEMA = [
+        """
+        CREATE TABLE IF NOT EXISTS cache_entries (
+            namespace TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            expires_at REAL NOT NULL,
+            accessed_at REAL NOT NULL,
+            PRIMARY KEY (namespace, key)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed_at ON cache_entries (accessed_at)",
+        "CREATE INDEX IF NOT EXISTS ix_cache_entries_expires_at ON cache_entries (expires_at)",
+        """
+        CREATE TABLE IF NOT EXISTS cache_totals (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            entries INTEGER NOT NULL,
+            bytes INTEGER NOT NULL
+        )
+        """,
+        "INSERT OR IGNORE INTO cache_totals (id, entries, bytes) VALUES (1, 0, 0)",
+        """
+        CREATE TABLE IF NOT EXISTS cache_evictions (
+            namespace TEXT PRIMARY KEY,
+            evictions INTEGER NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS cache_counters (
+            namespace TEXT NOT NULL,
+            name TEXT NOT NULL,
+            value INTEGER NOT NULL,
+            PRIMARY KEY (namespace, name)
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS cache_entries_insert AFTER INSERT ON cache_entries
+        BEGIN
+            UPDATE cache_totals SET entries = entries + 1, bytes = bytes + NEW.size WHERE id = 1;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS cache_entries_delete AFTER DELETE ON cache_entries
+        BEGIN
+            UPDATE cache_totals SET entries = entries - 1, bytes = bytes - OLD.size WHERE id = 1;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS cache_entries_update AFTER UPDATE OF size ON cache_entries
+        BEGIN
+            UPDATE cache_totals SET bytes = bytes + NEW.size - OLD.size WHERE id = 1;
+        END
+        """
+    ]
+
+    def __init__(self, path: str, max_entries: Optional[int] = None,
+                 max_bytes: Optional[int] = 64 * 1024 * 1024):
+        """
+        Args:
+            path: Database file path (created if missing)
+            max_entries: Maximum number of entries across all namespaces (None = unlimited)
+            max_bytes: Maximum total size of stored values (None = unlimited)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        for statement in self.SCHEMA:
+            conn.execute(statement)
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT value, expires_at, accessed_at FROM cache_entries WHERE namespace = ? AND key = ?",
+            (namespace, key)
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, expires_at, accessed_at = row
+        now = time.time()
+        if now >= expires_at:
+            conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ? AND expires_at <= ?",
+                (namespace, key, now)
+            )
+            return None
+
+        if now - accessed_at > self.TOUCH_INTERVAL:
+            conn.execute(
+                "UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, namespace, key)
+            )
+        return bytes(value)
+
+    def set(self, namespace: str, key: str, data: bytes, ttl_seconds: int):
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return
+
+        now = time.time()
+        conn = self._connection()
+        conn.execute(
+            """
+            INSERT INTO cache_entries (namespace, key, value, size, expires_at, accessed_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (namespace, key) DO UPDATE SET
+                value = excluded.value,
+                size = excluded.size,
+                expires_at = excluded.expires_at,
+                accessed_at = excluded.accessed_at
+            """,
+            (namespace, key, sqlite3.Binary(data), len(data), now + ttl_seconds, now)
+        )
+        self._enforce_limits(conn, now)
+
+    def delete(self, namespace: str, key: str):
+        self._connection().execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+            (namespace, key)
+        )
+
+    def clear(self, namespace: Optional[str] = None):
+        conn = self._connection()
+        if namespace is None:
+            conn.execute("DELETE FROM cache_entries")
+        else:
+            conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (namespace,))
+
+    def get_namespace_stats(self, namespace: str) -> Dict:
+        conn = self._connection()
+        entries, size = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?",
+            (namespace,)
+        ).fetchone()
+        evictions = conn.execute(
+            "SELECT evictions FROM cache_evictions WHERE namespace = ?",
+            (namespace,)
+        ).fetchone()
+        return {
+            'entries': entries,
+            'bytes': size,
+            'evictions': evictions[0] if evictions else 0
+        }
+
+    def incr_counter(self, namespace: str, name: str, amount: int = 1):
+        self._connection().execute(
+            """
+            INSERT INTO cache_counters (namespace, name, value) VALUES (?, ?, ?)
+            ON CONFLICT (namespace, name) DO UPDATE SET value = value + excluded.value
+            """,
+            (namespace, name, amount)
+        )
+
+    def get_counters(self, namespace: str) -> Dict[str, int]:
+        rows = self._connection().execute(
+            "SELECT name, value FROM cache_counters WHERE namespace = ?",
+            (namespace,)
+        ).fetchall()
+        return dict(rows)
+
+    def _enforce_limits(self, conn: sqlite3.Connection, now: float):
+        """Drop expired, then least recently used, entries until within limits."""
+        excess_entries, excess_bytes = self._excess(conn)
+        if excess_entries <= 0 and excess_bytes <= 0:
+            return
+
+        conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        excess_entries, excess_bytes = self._excess(conn)
+
+        while excess_entries > 0 or excess_bytes > 0:
+            candidates = conn.execute(
+                "SELECT namespace, key, size FROM cache_entries ORDER BY accessed_at LIMIT ?",
+                (max(excess_entries, self.EVICTION_BATCH),)
+            ).fetchall()
+            if not candidates:
+                break
+
+            victims = []
+            for namespace, key, size in candidates:
+                if excess_entries <= 0 and excess_bytes <= 0:
+                    break
+                victims.append((namespace, key))
+                excess_entries -= 1
+                excess_bytes -= size
+
+            conn.executemany(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                victims
+            )
+            for namespace, _ in victims:
+                conn.execute(
+                    """
+                    INSERT INTO cache_evictions (namespace, evictions) VALUES (?, 1)
+                    ON CONFLICT (namespace) DO UPDATE SET evictions = evictions + 1
+                    """,
+                    (namespace,)
+                )
+
+    def _excess(self, conn: sqlite3.Connection) -> tuple:
+        """Entries and bytes above the limits, from the trigger-maintained totals."""
+        entries, size = conn.execute(
+            "SELECT entries, bytes FROM cache_totals WHERE id = 1"
+        ).fetchone()
+        excess_entries = entries - self.max_entries if self.max_entries is not None else 0
+        excess_bytes = size - self.max_bytes if self.max_bytes is not None else 0
+        return excess_entries, excess_bytes
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, reopening it after a fork."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA mmap_size={self.MMAP_SIZE}")
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+
+class RedisError(Exception):
+    """Raised when the server replies with a RESP error."""
+    pass
+
+
+class RedisBackend(CacheBackend):
+    """
+    Store backed by any server that speaks the Redis protocol
+
+    Talks RESP directly over a socket, so no client library is needed and a
+    local stand-in server can replace Redis. Expiry uses SET ... PX; LRU
+    eviction and the byte limit are the server's job (configure maxmemory
+    with an allkeys-lru policy). max_bytes here only rejects oversized values.
+    """
+
+    name = 'redis'
+
+    KEY_PREFIX = 'aequitas:cache'
+    SCAN_BATCH = 500
+
+    def __init__(self, url: str = 'redis://localhost:6379/0', max_bytes: Optional[int] = None,
+                 socket_timeout: float = 2.0):
+        """
+        Args:
+            url: redis://[:password@]host[:port][/db]
+            max_bytes: Largest single value to store (None = unlimited)
+            socket_timeout: Connect/read timeout in seconds
+        """
+        parsed = urlparse(url)
+        self.host = parsed.hostname or 'localhost'
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip('/') or 0)
+        self.max_bytes = max_bytes
+        self.socket_timeout = socket_timeout
+        self._local = threading.local()
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        return self._command('GET', self._key(namespace, key))
+
+    def set(self, namespace: str, key: str, data: bytes, ttl_seconds: int):
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return
+        self._command('SET', self._key(namespace, key), data, 'PX', int(ttl_seconds * 1000))
+
+    def delete(self, namespace: str, key: str):
+        self._command('DEL', self._key(namespace, key))
+
+    def clear(self, namespace: Optional[str] = None):
+        pattern = f"{self.KEY_PREFIX}:{namespace}:*" if namespace else f"{self.KEY_PREFIX}:*"
+        for keys in self._scan(pattern):
+            if keys:
+                self._command('DEL', *keys)
+
+    def get_namespace_stats(self, namespace: str) -> Dict:
+        # Counting keys requires a SCAN of the namespace; the server tracks
+        # memory and evictions globally (INFO stats), not per namespace
+        entries = sum(len(keys) for keys in self._scan(f"{self.KEY_PREFIX}:{namespace}:*"))
+        return {'entries': entries, 'bytes': None, 'evictions': None}
+
+    def incr_counter(self, namespace: str, name: str, amount: int = 1):
+        self._command('HINCRBY', f"{self.KEY_PREFIX}-counters:{namespace}", name, amount)
+
+    def get_counters(self, namespace: str) -> Dict[str, int]:
+        reply = self._command('HGETALL', f"{self.KEY_PREFIX}-counters:{namespace}") or []
+        return {
+            reply[i].decode('utf-8'): int(reply[i + 1])
+            for i in range(0, len(reply), 2)
+        }
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.KEY_PREFIX}:{namespace}:{key}"
+
+    def _scan(self, pattern: str):
+        """Yield batches of keys matching a pattern."""
+        cursor = b'0'
+        while True:
+            cursor, keys = self._command('SCAN', cursor, 'MATCH', pattern, 'COUNT', self.SCAN_BATCH)
+            yield keys
+            if cursor == b'0':
+                break
+
+    def _command(self, *args):
+        """Send one command, reconnecting once if the connection dropped."""
+        try:
+            return self._send(self._connection(), args)
+        except (ConnectionError, socket.timeout, OSError):
+            self._close()
+            return self._send(self._connection(), args)
+
+    def _send(self, conn, args):
+        sock, reader = conn
+        sock.sendall(self._encode(args))
+        return self._read_reply(reader)
+
+    @staticmethod
+    def _encode(args) -> bytes:
+        """Encode a command as a RESP array of bulk strings."""
+        parts = [b'*%d\r\n' % len(args)]
+        for arg in args:
+            if isinstance(arg, bytes):
+                value = arg
+            else:
+                value = str(arg).encode('utf-8')
+            parts.append(b'$%d\r\n%s\r\n' % (len(value), value))
+        return b''.join(parts)
+
+    def _read_reply(self, reader):
+        """Parse one RESP reply."""
+        line = reader.readline()
+        if not line:
+            raise ConnectionError('Connection closed by cache server')
+
+        prefix, payload = line[:1], line[1:-2]
+        if prefix == b'+':
+            return payload
+        if prefix == b'-':
+            raise RedisError(payload.decode('utf-8', 'replace'))
+        if prefix == b':':
+            return int(payload)
+        if prefix == b'$':
+            length = int(payload)
+            if length == -1:
+                return None
+            data = reader.read(length + 2)
+            return data[:-2]
+        if prefix == b'*':
+            count = int(payload)
+            if count == -1:
+                return None
+            return [self._read_reply(reader) for _ in range(count)]
+
+        raise RedisError(f'Unexpected reply from cache server: {line!r}')
+
+    def _connection(self):
+        """Get this thread's socket, opening (and authenticating) it if needed."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        sock = socket.create_connection((self.host, self.port), timeout=self.socket_timeout)
+        conn = (sock, sock.makefile('rb'))
+        if self.password:
+            self._send(conn, ('AUTH', self.password))
+        if self.db:
+            self._send(conn, ('SELECT', self.db))
+
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            try:
+                conn[1].close()
+                conn[0].close()
+            except OSError:
+                pass
+        self._local.conn = None
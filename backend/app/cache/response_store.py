@@ -0,0 +1,153 @@
+"""
+Durable store for raw responses from metered APIs
+
+Responses are keyed on the endpoint plus normalized request parameters, so
+'123 Main St ' and '123 main st' or bathrooms=2 and bathrooms=2.0 share one
+entry. With a SQLiteBackend the store survives restarts and worker recycles;
+a warm lookup is a single primary-key read from a memory-mapped file.
+
+Each hit is recorded as one saved API call for the endpoint, next to the
+number of calls actually made, in counters kept by the same backend.
+"""
+
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional
+from app.cache.backends import CacheBackend
+
+
+class ResponseStore:
+    """Persistent, TTL-bounded cache of API responses with quota accounting."""
+
+    def __init__(self, namespace: str, backend: CacheBackend, ttl_seconds: int):
+        """
+        Args:
+            namespace: Provider name used to partition keys and counters ('rentcast')
+            backend: Storage backend (use SQLiteBackend for durability)
+            ttl_seconds: How long a stored response stays valid
+        """
+        self.namespace = namespace
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._session = {'hits': 0, 'misses': 0, 'errors': 0}
+
+    def get(self, endpoint: str, params: Dict, endpoint_name: str) -> Optional[Any]:
+        """
+        Look up a stored response
+
+        Args:
+            endpoint: Request URL or path
+            params: Query parameters as sent to the API
+            endpoint_name: Label used for quota accounting
+
+        Returns:
+            Decoded JSON response, or None on a miss
+        """
+        try:
+            data = self.backend.get(self.namespace, self.make_key(endpoint, params))
+        except Exception as e:
+            self._record_error('get', e)
+            return None
+
+        if data is None:
+            self._count('misses')
+            return None
+
+        self._count('hits')
+        self.record_saved(endpoint_name)
+        return json.loads(data)
+
+    def put(self, endpoint: str, params: Dict, response: Any, endpoint_name: str):
+        """
+        Store a response from a paid API call
+
+        Args:
+            endpoint: Request URL or path
+            params: Query parameters as sent to the API
+            response: JSON-serializable response body
+            endpoint_name: Label used for quota accounting
+        """
+        data = json.dumps(response, separators=(',', ':')).encode('utf-8')
+        try:
+            self.backend.set(self.namespace, self.make_key(endpoint, params), data, self.ttl_seconds)
+            self.backend.incr_counter(self.namespace, f"calls:{endpoint_name}")
+        except Exception as e:
+            self._record_error('put', e)
+
+    def record_saved(self, endpoint_name: str, calls: int = 1):
+        """Record API calls avoided for an endpoint (also used for upstream cache hits)."""
+        try:
+            self.backend.incr_counter(self.namespace, f"saved:{endpoint_name}", calls)
+        except Exception as e:
+            self._record_error('record', e)
+
+    def get_stats(self) -> Dict:
+        """
+        Get quota and storage statistics
+
+        Returns:
+            Dictionary with per-endpoint calls made, calls saved and saved
+            percentage (all time), this process's hit/miss counts, and the
+            backend's entries/bytes/evictions
+        """
+        try:
+            counters = self.backend.get_counters(self.namespace)
+            storage = self.backend.get_namespace_stats(self.namespace)
+        except Exception as e:
+            self._record_error('stats', e)
+            counters, storage = {}, {}
+
+        endpoints = {}
+        for name, value in counters.items():
+            kind, _, endpoint_name = name.partition(':')
+            endpoint_stats = endpoints.setdefault(endpoint_name, {'calls_made': 0, 'calls_saved': 0})
+            endpoint_stats['calls_made' if kind == 'calls' else 'calls_saved'] += value
+
+        for endpoint_stats in endpoints.values():
+            total = endpoint_stats['calls_made'] + endpoint_stats['calls_saved']
+            endpoint_stats['saved_pct'] = round(endpoint_stats['calls_saved'] / total * 100, 1) if total else None
+
+        with self._lock:
+            session = dict(self._session)
+
+        return {
+            'backend': self.backend.name,
+            'ttl_seconds': self.ttl_seconds,
+            'endpoints': endpoints,
+            'total_calls_saved': sum(e['calls_saved'] for e in endpoints.values()),
+            'total_calls_made': sum(e['calls_made'] for e in endpoints.values()),
+            'process': session,
+            **storage
+        }
+
+    @staticmethod
+    def make_key(endpoint: str, params: Dict) -> str:
+        """Hash the endpoint and normalized parameters into a storage key."""
+        normalized = {
+            key: ResponseStore._normalize_value(value)
+            for key, value in params.items()
+            if value is not None
+        }
+        payload = json.dumps([endpoint, normalized], sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _normalize_value(value: Any) -> Any:
+        """Canonical form of a parameter value for key purposes."""
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, (int, float)):
+            return repr(float(value))
+        if isinstance(value, str):
+            return ' '.join(value.split()).lower()
+        return value
+
+    def _count(self, counter: str):
+        with self._lock:
+            self._session[counter] += 1
+
+    def _record_error(self, operation: str, error: Exception):
+        self._count('errors')
+        print(f"Response store {operation} failed for '{self.namespace}': {error}")
@@ -0,0 +1,157 @@
+"""
+Namespaced TTL cache front-end
+
+TTLCache is what services use: it JSON-encodes values, delegates storage to a
+backend and counts hits and misses per namespace. Backend failures are logged
+and treated as misses so a cache outage never fails a request.
+"""
+
+import json
+import threading
+from typing import Any, Dict, Optional
+from app.cache.backends import CacheBackend, MemoryBackend, SQLiteBackend, RedisBackend
+
+
+class TTLCache:
+    """Cache view over one namespace of a backend."""
+
+    _registry: Dict[str, 'TTLCache'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, namespace: str, default_ttl: int = 3600,
+                 backend: Optional[CacheBackend] = None, max_entries: int = 1000):
+        """
+        Args:
+            namespace: Name used to partition keys and report stats ('census', 'fred', ...)
+            default_ttl: TTL in seconds when set() is called without one
+            backend: Shared storage backend (defaults to a private MemoryBackend)
+            max_entries: Entry limit for the private MemoryBackend
+        """
+        self.namespace = namespace
+        self.default_ttl = default_ttl
+        self.backend = backend if backend is not None else MemoryBackend(max_entries=max_entries)
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'sets': 0, 'errors': 0}
+
+        with TTLCache._registry_lock:
+            TTLCache._registry[namespace] = self
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retrieve cached value if present and not expired."""
+        try:
+            data = self.backend.get(self.namespace, key)
+        except Exception as e:
+            self._record_error('get', e)
+            return None
+
+        if data is None:
+            self._count('misses')
+            return None
+
+        self._count('hits')
+        return json.loads(data)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None):
+        """Store a JSON-serializable value with a TTL."""
+        data = json.dumps(value, separators=(',', ':')).encode('utf-8')
+        try:
+            self.backend.set(self.namespace, key, data, ttl_seconds or self.default_ttl)
+        except Exception as e:
+            self._record_error('set', e)
+            return
+        self._count('sets')
+
+    def delete(self, key: str):
+        """Remove one entry."""
+        try:
+            self.backend.delete(self.namespace, key)
+        except Exception as e:
+            self._record_error('delete', e)
+
+    def clear(self):
+        """Clear all entries in this namespace."""
+        try:
+            self.backend.clear(self.namespace)
+        except Exception as e:
+            self._record_error('clear', e)
+
+    def get_stats(self) -> Dict:
+        """
+        Get counters for this namespace
+
+        Returns:
+            Dictionary with backend name, hits, misses, sets, errors, hit_rate,
+            and the backend's entries/bytes/evictions for the namespace
+        """
+        with self._lock:
+            stats = dict(self._stats)
+
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else None
+        stats['backend'] = self.backend.name
+
+        try:
+            stats.update(self.backend.get_namespace_stats(self.namespace))
+        except Exception as e:
+            self._record_error('stats', e)
+
+        return stats
+
+    @staticmethod
+    def get_all_stats() -> Dict[str, Dict]:
+        """Get stats for every namespace created in this process."""
+        with TTLCache._registry_lock:
+            caches = list(TTLCache._registry.values())
+        return {cache.namespace: cache.get_stats() for cache in caches}
+
+    def _count(self, counter: str):
+        with self._lock:
+            self._stats[counter] += 1
+
+    def _record_error(self, operation: str, error: Exception):
+        self._count('errors')
+        print(f"Cache {operation} failed for namespace '{self.namespace}': {error}")
+
+
+_shared_backend = None
+_shared_backend_lock = threading.Lock()
+
+
+def create_backend(config) -> CacheBackend:
+    """
+    Build a backend from app config
+
+    Args:
+        config: Mapping with CACHE_BACKEND ('memory', 'sqlite' or 'redis'),
+            CACHE_MAX_ENTRIES, CACHE_MAX_BYTES, CACHE_SQLITE_PATH and CACHE_REDIS_URL
+
+    Returns:
+        Configured CacheBackend
+
+    Raises:
+        ValueError: If CACHE_BACKEND is not recognized
+    """
+    kind = (config.get('CACHE_BACKEND') or 'memory').lower()
+    max_entries = config.get('CACHE_MAX_ENTRIES') or None
+    max_bytes = config.get('CACHE_MAX_BYTES') or None
+
+    if kind == 'memory':
+        return MemoryBackend(max_entries=max_entries, max_bytes=max_bytes)
+    if kind == 'sqlite':
+        return SQLiteBackend(config.get('CACHE_SQLITE_PATH'), max_entries=max_entries, max_bytes=max_bytes)
+    if kind == 'redis':
+        return RedisBackend(config.get('CACHE_REDIS_URL'), max_bytes=max_bytes)
+
+    raise ValueError(f"Unknown CACHE_BACKEND: {kind}")
+
+
+def get_cache_backend() -> CacheBackend:
+    """Get or create the process-wide backend configured for the current app."""
+    global _shared_backend
+    if _shared_backend is None:
+        from flask import current_app
+
+        with _shared_backend_lock:
+            if _shared_backend is None:
+                _shared_backend = create_backend(current_app.config)
+    return _shared_backend
@@ -0,0 +1,21 @@
+from .http_client import (
+    HTTPClient,
+    ProviderPolicy,
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimiter,
+    RateLimitTimeout,
+    get_http_client,
+    get_all_client_stats
+)
+
+__all__ = [
+    'HTTPClient',
+    'ProviderPolicy',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'RateLimiter',
+    'RateLimitTimeout',
+    'get_http_client',
+    'get_all_client_stats'
+]
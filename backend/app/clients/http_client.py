@@ -0,0 +1,391 @@
+"""
+Pooled HTTP client for external data providers
+
+One HTTPClient per provider (Census, FRED, RentCast) holds a keep-alive
+requests.Session per host, so repeat calls reuse TCP/TLS connections. Each
+request passes through:
+
+1. Circuit breaker: after repeated failures the provider is skipped for a
+   cool-down period instead of tying up a worker on timeouts
+2. Token-bucket rate limiter sized to the provider's quota
+3. Retries on connection errors, timeouts, 429 and 5xx, with full-jitter
+   exponential backoff (Retry-After is honored when present)
+
+Failures surface as requests exceptions, so existing
+``except requests.exceptions.RequestException`` handlers keep working.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@dataclass(frozen=True)
+class ProviderPolicy:
+    """Connection, retry, rate and circuit settings for one provider."""
+    pool_size: int = 10
+    connect_timeout: float = 3.05
+    read_timeout: float = 10.0
+    max_retries: int = 3
+    backoff_base: float = 0.5    # seconds; attempt n waits up to base * 2**n
+    backoff_max: float = 8.0
+    rate_per_second: Optional[float] = None  # None = unlimited
+    burst: int = 5
+    max_rate_wait: float = 10.0  # longest a caller waits for a rate-limit token
+    failure_threshold: int = 5   # consecutive failures that open the circuit
+    recovery_timeout: float = 30.0
+
+
+# Per-worker defaults; quotas are shared by all gunicorn workers, so divide accordingly
+DEFAULT_POLICIES = {
+    'census': ProviderPolicy(rate_per_second=5.0, burst=10),
+    'fred': ProviderPolicy(rate_per_second=1.0, burst=15),      # FRED allows 120 requests/minute per key
+    'rentcast': ProviderPolicy(rate_per_second=5.0, burst=5, max_retries=2),
+}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised without making a request while a provider's circuit is open."""
+    pass
+
+
+class RateLimitTimeout(requests.exceptions.RequestException):
+    """Raised when a rate-limit token is not available within max_rate_wait."""
+    pass
+
+
+class RateLimiter:
+    """Thread-safe token bucket."""
+
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate = rate_per_second
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, max_wait: float) -> bool:
+        """
+        Take one token, sleeping until one is available
+
+        Args:
+            max_wait: Give up if the wait would exceed this many seconds
+
+        Returns:
+            True if a token was taken, False if the wait was too long
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            wait = (1 - self._tokens) / self.rate if self._tokens < 1 else 0.0
+            if wait > max_wait:
+                return False
+
+            # Reserve the token now; concurrent callers queue behind it
+            self._tokens -= 1
+
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+
+class CircuitBreaker:
+    """Closed -> open after N consecutive failures -> half-open trial after a cool-down."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+
+            # Half-open: let a single trial request through
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def release_trial(self):
+        """Give back a half-open trial slot that was not used for a request."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+
+class HTTPClient:
+    """Provider-scoped HTTP client with pooled sessions, retries, rate limiting and a circuit breaker."""
+
+    def __init__(self, provider: str, policy: Optional[ProviderPolicy] = None,
+                 headers: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            provider: Provider name used in errors and stats ('census', 'fred', 'rentcast')
+            policy: Settings (defaults to DEFAULT_POLICIES[provider] or ProviderPolicy())
+            headers: Headers sent with every request
+        """
+        self.provider = provider
+        self.policy = policy or DEFAULT_POLICIES.get(provider, ProviderPolicy())
+        self.headers = headers or {}
+        self.circuit = CircuitBreaker(self.policy.failure_threshold, self.policy.recovery_timeout)
+        self.rate_limiter = (
+            RateLimiter(self.policy.rate_per_second, self.policy.burst)
+            if self.policy.rate_per_second else None
+        )
+        self._sessions: Dict[str, requests.Session] = {}
+        self._sessions_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'requests': 0, 'retries': 0, 'failures': 0,
+            'short_circuited': 0, 'rate_limited': 0
+        }
+
+    def get(self, url: str, params: Optional[dict] = None,
+            headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        Send a GET request
+
+        Args:
+            url: Absolute URL
+            params: Query parameters
+            headers: Extra headers for this request
+
+        Returns:
+            The final requests.Response (callers still call raise_for_status)
+
+        Raises:
+            CircuitOpenError: Provider is cooling down after repeated failures
+            RateLimitTimeout: No rate-limit token within policy.max_rate_wait
+            requests.exceptions.RequestException: Connection errors or timeouts after all retries,
+                or any other request error (not retried)
+        """
+        return self.request('GET', url, params=params, headers=headers)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request with the provider's retry, rate and circuit policy (see get())."""
+        policy = self.policy
+        session = self._session_for(url)
+        request_headers = {**self.headers, **(kwargs.pop('headers', None) or {})}
+
+        if not self.circuit.allow():
+            self._count('short_circuited')
+            raise CircuitOpenError(f"{self.provider} circuit is open; skipping request to {url}")
+
+        attempt = 0
+        while True:
+            if self.rate_limiter and not self.rate_limiter.acquire(policy.max_rate_wait):
+                self._count('rate_limited')
+                self.circuit.release_trial()
+                raise RateLimitTimeout(f"{self.provider} rate limit exceeded")
+
+            self._count('requests')
+            try:
+                response = session.request(
+                    method, url,
+                    headers=request_headers,
+                    timeout=(policy.connect_timeout, policy.read_timeout),
+                    **kwargs
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= policy.max_retries:
+                    self._record_failure()
+                    raise
+                self._backoff(attempt)
+                attempt += 1
+                continue
+            except requests.exceptions.RequestException as e:
+                # Not retried. A malformed request (InvalidURL, MissingSchema, ...)
+                # says nothing about the provider, so only give back the half-open
+                # trial; anything else (broken body, redirect loop) is a failure
+                if isinstance(e, ValueError):
+                    self.circuit.release_trial()
+                else:
+                    self._record_failure()
+                raise
+
+            if response.status_code in RETRY_STATUSES and attempt < policy.max_retries:
+                delay = self._retry_after(response)
+                response.close()
+                self._backoff(attempt, delay)
+                attempt += 1
+                continue
+
+            if response.status_code >= 500:
+                self._record_failure()
+            else:
+                # 4xx (including a final 429) means the provider is up
+                self.circuit.record_success()
+            return response
+
+    def get_stats(self) -> Dict:
+        """Get request counters and circuit state."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['circuit_state'] = self.circuit.state
+        stats['hosts'] = sorted(self._sessions)
+        return stats
+
+    def close(self):
+        """Close every pooled session."""
+        with self._sessions_lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def _session_for(self, url: str) -> requests.Session:
+        """Get (or create) the keep-alive session for the URL's host."""
+        host = urlparse(url).netloc
+        session = self._sessions.get(host)
+        if session is not None:
+            return session
+
+        with self._sessions_lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                # Retries are handled above so they can share backoff, rate and circuit state
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=self.policy.pool_size,
+                    max_retries=0
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._sessions[host] = session
+            return session
+
+    def _backoff(self, attempt: int, minimum: Optional[float] = None):
+        """Sleep with full-jitter exponential backoff."""
+        self._count('retries')
+        ceiling = min(self.policy.backoff_max, self.policy.backoff_base * (2 ** attempt))
+        delay = random.uniform(0, ceiling)
+        if minimum is not None:
+            delay = max(delay, min(minimum, self.policy.backoff_max))
+        time.sleep(delay)
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """Parse a Retry-After header (seconds or HTTP date)."""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _record_failure(self):
+        self._count('failures')
+        self.circuit.record_failure()
+
+    def _count(self, counter: str):
+        with self._stats_lock:
+            self._stats[counter] += 1
+
+
+_clients: Dict[str, HTTPClient] = {}
+_clients_lock = threading.Lock()
+
+
+def policy_from_config(provider: str, config) -> ProviderPolicy:
+    """
+    Build a provider policy from app config
+
+    Reads HTTP_POOL_SIZE, HTTP_MAX_RETRIES, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT,
+    HTTP_CIRCUIT_FAILURE_THRESHOLD, HTTP_CIRCUIT_RECOVERY_TIMEOUT,
+    <PROVIDER>_RATE_LIMIT (requests per second) and <PROVIDER>_MAX_RETRIES (takes
+    precedence over HTTP_MAX_RETRIES); missing or None keys keep the defaults.
+    """
+    policy = DEFAULT_POLICIES.get(provider, ProviderPolicy())
+    max_retries = config.get(f'{provider.upper()}_MAX_RETRIES')
+    overrides = {
+        'pool_size': config.get('HTTP_POOL_SIZE'),
+        'max_retries': max_retries if max_retries is not None else config.get('HTTP_MAX_RETRIES'),
+        'connect_timeout': config.get('HTTP_CONNECT_TIMEOUT'),
+        'read_timeout': config.get('HTTP_READ_TIMEOUT'),
+        'failure_threshold': config.get('HTTP_CIRCUIT_FAILURE_THRESHOLD'),
+        'recovery_timeout': config.get('HTTP_CIRCUIT_RECOVERY_TIMEOUT'),
+        'rate_per_second': config.get(f'{provider.upper()}_RATE_LIMIT'),
+    }
+    return replace(policy, **{key: value for key, value in overrides.items() if value is not None})
+
+
+def get_http_client(provider: str, config=None) -> HTTPClient:
+    """
+    Get the process-wide client for a provider
+
+    Args:
+        provider: Provider name
+        config: App config used to build the policy on first use (optional)
+
+    Returns:
+        Shared HTTPClient
+    """
+    client = _clients.get(provider)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(provider)
+        if client is None:
+            policy = policy_from_config(provider, config) if config is not None else None
+            client = HTTPClient(provider, policy)
+            _clients[provider] = client
+        return client
+
+
+def get_all_client_stats() -> Dict[str, Dict]:
+    """Get stats for every provider client created in this process."""
+    with _clients_lock:
+        clients = list(_clients.values())
+    return {client.provider: client.get_stats() for client in clients}
@@ -3,7 +3,8 @@ Database configuration and models for Aequitas MVP
 """
 from datetime import datetime, date
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Date, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Date, ForeignKey, Boolean, LargeBinary
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 
 db = SQLAlchemy()
@@ -23,8 +24,10 @@ class DealModel(db.Model):
     deal_name = Column(String(255), nullable=False)
     location = Column(String(255), nullable=False)
     status = Column(String(50), default='potential', nullable=False)
-    created_at = Column(DateTime, default=func.now(), nullable=False)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+    # Set in Python (not by func.now()) so every row is stored in one format with
+    # microseconds: the deal list's keyset cursor compares updated_at exactly
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     # Property Information
     property_address = Column(String(500))
@@ -75,6 +78,9 @@ class DealModel(db.Model):
     npv = Column(Float)
     irr = Column(Float)
 
+    # Most recent RiskAssessmentModel row, maintained when assessments are saved
+    latest_assessment_id = Column(Integer)
+
     def __repr__(self):
         return f'<Deal {self.id}: {self.deal_name} ({self.status})>'
 
@@ -729,6 +735,25 @@ class BenchmarkDataModel(db.Model):
             self.as_of_date = dt.fromisoformat(data['asOfDate']).date() if data['asOfDate'] else None
 
 
+class FundOverviewSnapshotModel(db.Model):
+    """
+    SQLAlchemy model for materialized fund overviews
+    Stores the serialized /funds/<id>/overview payload, refreshed in the same
+    transaction as the fund rows it is built from (see FundService)
+    """
+    __tablename__ = 'fund_overview_snapshots'
+
+    # One row per fund; no foreign key so the snapshot can be dropped after its fund
+    fund_id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=1)  # Incremented whenever the payload changes
+    etag = Column(String(64), nullable=False)  # SHA-256 of payload
+    payload = Column(Text, nullable=False)  # Overview JSON
+    refreshed_at = Column(DateTime, default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f'<FundOverviewSnapshot Fund {self.fund_id} v{self.version}>'
+
+
 # ============================================================================
 # RISK ASSESSMENT MODELS
 # ============================================================================
@@ -1029,6 +1054,30 @@ class MarketDecileThresholds(db.Model):
         }
 
 
+class ReferenceDataVersionModel(db.Model):
+    """
+    SQLAlchemy model for reference data version stamps
+    Bumped whenever a reference table (benchmarks, thresholds) is rewritten so
+    every worker process knows to reload its in-memory copy
+    """
+    __tablename__ = 'reference_data_versions'
+
+    name = Column(String(50), primary_key=True)  # e.g. 'benchmarks'
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f'<ReferenceDataVersion {self.name}: v{self.version}>'
+
+    def to_dict(self):
+        """Convert model to dictionary for JSON serialization"""
+        return {
+            'name': self.name,
+            'version': self.version,
+            'updatedAt': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+
 # ============================================================================
 # GP (GENERAL PARTNER) MODELS
 # ============================================================================
@@ -1285,6 +1334,13 @@ class PropertyImportModel(db.Model):
     user_assisted = Column(Boolean, default=False)
     confidence_score = Column(Float)
 
+    # PDF extraction cache: SHA-256 of the uploaded file, the extractor settings
+    # that produced the result, and the full ScrapingResult JSON (stored only on
+    # the import that actually ran the extraction)
+    content_hash = Column(String(64))
+    extractor_version = Column(String(50))
+    extraction_result = Column(Text)
+
     def __repr__(self):
         return f'<PropertyImport {self.id}: {self.source_platform} {self.import_status}>'
 
@@ -1321,7 +1377,9 @@ class PropertyImportModel(db.Model):
             'errorMessage': self.error_message,
             'errorType': self.error_type,
             'userAssisted': self.user_assisted,
-            'confidenceScore': self.confidence_score
+            'confidenceScore': self.confidence_score,
+            'contentHash': self.content_hash,
+            'extractorVersion': self.extractor_version
         }
 
     @staticmethod
@@ -1357,3 +1415,66 @@ class PropertyImportModel(db.Model):
             user_assisted=data.get('userAssisted', False),
             confidence_score=data.get('confidenceScore')
         )
+
+
+# ============================================================================
+# BACKGROUND JOB MODELS
+# ============================================================================
+
+
+class JobModel(db.Model):
+    """
+    SQLAlchemy model for background jobs
+    Durable queue of long-running work (PDF extraction, exports, comparisons)
+    claimed and run by the worker pool in app.jobs.worker
+    """
+    __tablename__ = 'jobs'
+
+    # Primary Key (random, so job IDs cannot be guessed)
+    id = Column(String(32), primary_key=True)
+
+    # Job definition
+    job_type = Column(String(50), nullable=False)
+    status = Column(String(20), default='queued', nullable=False)  # queued, running, succeeded, failed, cancelled
+    payload = Column(Text)  # JSON arguments for the handler
+    input_data = deferred(Column(LargeBinary))  # Uploaded file, if any (loaded only when read)
+
+    # Execution
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=3, nullable=False)
+    worker_id = Column(String(100))
+    lease_expires_at = Column(DateTime)  # Requeued if the worker stops renewing before this
+
+    # Result: JSON body and HTTP status, or a file
+    result = Column(Text)
+    result_status_code = Column(Integer)
+    result_data = deferred(Column(LargeBinary))
+    result_filename = Column(String(255))
+    result_mimetype = Column(String(100))
+    error_message = Column(Text)
+
+    # Timestamps
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    expires_at = Column(DateTime)  # Finished jobs are deleted after this
+
+    def __repr__(self):
+        return f'<Job {self.id}: {self.job_type} {self.status}>'
+
+    def to_dict(self):
+        """Convert model to dictionary for JSON serialization (without input or result data)"""
+        return {
+            'id': self.id,
+            'jobType': self.job_type,
+            'status': self.status,
+            'attempts': self.attempts,
+            'maxAttempts': self.max_attempts,
+            'hasFileResult': self.result_filename is not None,
+            'resultFilename': self.result_filename,
+            'errorMessage': self.error_message,
+            'createdAt': self.created_at.isoformat() if self.created_at else None,
+            'startedAt': self.started_at.isoformat() if self.started_at else None,
+            'finishedAt': self.finished_at.isoformat() if self.finished_at else None,
+            'expiresAt': self.expires_at.isoformat() if self.expires_at else None
+        }
@@ -0,0 +1,10 @@
+from .queue import JobQueue
+from .handlers import HANDLERS, XLSX_MIMETYPE, file_result, json_result
+
+__all__ = [
+    'HANDLERS',
+    'JobQueue',
+    'XLSX_MIMETYPE',
+    'file_result',
+    'json_result'
+]
@@ -0,0 +1,103 @@
+"""
+Background job handlers
+
+Each handler takes the job's JSON payload and uploaded bytes (or None) and
+returns one of:
+
+    {'status_code': 200, 'body': {...}}                     JSON response
+    {'file': b'...', 'filename': '...', 'mimetype': '...'}  file download
+
+The API routes call the same handlers when a request runs inline, so a job's
+result is exactly the response the endpoint would have returned.
+"""
+
+import os
+import sys
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+
+def json_result(body: Dict, status_code: int = 200) -> Dict:
+    return {'status_code': status_code, 'body': body}
+
+
+def file_result(data: bytes, filename: str, mimetype: str = XLSX_MIMETYPE) -> Dict:
+    return {'file': data, 'filename': filename, 'mimetype': mimetype}
+
+
+def extract_pdf(payload: Dict, input_data: Optional[bytes]) -> Dict:
+    """Extract property data from an uploaded PDF (payload: filename, max_pages, force)."""
+    from app.services.pdf_import_service import PDFImportService
+
+    body, status_code = PDFImportService.import_pdf(
+        input_data,
+        payload['filename'],
+        max_pages=payload.get('max_pages'),
+        force=payload.get('force', False)
+    )
+    return json_result(body, status_code)
+
+
+def export_deal(payload: Dict, input_data: Optional[bytes]) -> Dict:
+    """Export a deal's financial model to Excel (payload: deal_id)."""
+    # Import here to avoid circular dependency
+    from app.services.deal_service import DealService
+    from app.services.excel_export_service import ExcelExportService
+
+    deal = DealService.get_deal(payload['deal_id'])
+    if not deal:
+        return json_result({'error': 'Deal not found'}, 404)
+
+    excel_file = ExcelExportService.generate_excel(payload['deal_id'])
+    if not excel_file:
+        return json_result({'error': 'Failed to generate Excel file'}, 500)
+
+    filename = f"{deal.deal_name.replace(' ', '_')}_financial_model.xlsx"
+    return file_result(excel_file.getvalue(), filename)
+
+
+def export_underwriting(payload: Dict, input_data: Optional[bytes]) -> Dict:
+    """Build the multifamily underwriting model (payload: data, the request body)."""
+    from io import BytesIO
+
+    # build_underwriting_model lives in the backend root
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../'))
+    from build_underwriting_model import create_underwriting_model
+
+    data = payload['data']
+    wb = create_underwriting_model(data)
+
+    output = BytesIO()
+    wb.save(output)
+
+    property_name = data.get('propertyName', 'Property').replace(' ', '_')
+    timestamp = datetime.now().strftime('%Y%m%d')
+    filename = f"{property_name}_Underwriting_{timestamp}.xlsx"
+    return file_result(output.getvalue(), filename)
+
+
+def compare_deals(payload: Dict, input_data: Optional[bytes]) -> Dict:
+    """Compare deals side by side (payload: deal_ids, holding_period, top_k)."""
+    from app.services.deal_memo_service import DealMemoService
+
+    try:
+        comparison = DealMemoService.generate_comparison_memo(
+            deal_ids=payload['deal_ids'],
+            holding_period=payload.get('holding_period', 10),
+            top_k=payload.get('top_k')
+        )
+    except ValueError as e:
+        return json_result({'success': False, 'error': str(e)}, 400)
+
+    return json_result({'success': True, 'data': comparison})
+
+
+# Job type -> handler
+HANDLERS: Dict[str, Callable[[Dict, Optional[bytes]], Dict]] = {
+    'extract_pdf': extract_pdf,
+    'export_deal': export_deal,
+    'export_underwriting': export_underwriting,
+    'compare_deals': compare_deals
+}
@@ -0,0 +1,323 @@
+"""
+Durable job queue
+
+Jobs are rows in the jobs table (SQLite or Postgres, whichever the app
+uses), so they survive restarts and are shared by every web and worker
+process. Workers claim a job with a conditional UPDATE (status still
+'queued'), which is atomic on both databases without row locks.
+
+A claimed job carries a lease that its worker renews while the handler
+runs. If the worker dies, the lease expires and the job is requeued (up to
+max_attempts claims). A handler that raises fails the job without a retry:
+the same input would fail the same way.
+
+Finished jobs keep their result for JOB_RESULT_TTL seconds, then
+purge_expired() deletes them.
+"""
+
+import json
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from flask import current_app
+from sqlalchemy import func, update
+
+from app.database import db, JobModel
+
+
+class JobQueue:
+    """
+    Submission, claiming and completion of background jobs
+    """
+
+    DEFAULT_MAX_ATTEMPTS = 3
+    DEFAULT_LEASE_SECONDS = 300
+    DEFAULT_RESULT_TTL = 86400  # 24 hours
+
+    # Queued jobs considered per claim; another worker may take some first
+    CLAIM_BATCH_SIZE = 5
+
+    FINISHED_STATUSES = ('succeeded', 'failed', 'cancelled')
+
+    @staticmethod
+    def enqueue(
+        job_type: str,
+        payload: Optional[Dict] = None,
+        input_data: Optional[bytes] = None,
+        max_attempts: Optional[int] = None
+    ) -> JobModel:
+        """
+        Submit a job
+
+        Args:
+            job_type: Registered handler name (see app.jobs.handlers.HANDLERS)
+            payload: JSON-serializable handler arguments
+            input_data: Uploaded file contents, if any
+            max_attempts: Claims allowed before a job abandoned by dead workers fails
+
+        Returns:
+            The queued JobModel
+
+        Raises:
+            ValueError: If job_type has no handler
+        """
+        from app.jobs.handlers import HANDLERS
+
+        if job_type not in HANDLERS:
+            raise ValueError(f"Unknown job type: {job_type}")
+
+        job = JobModel(
+            id=uuid.uuid4().hex,
+            job_type=job_type,
+            status='queued',
+            payload=json.dumps(payload or {}),
+            input_data=input_data,
+            attempts=0,
+            max_attempts=max_attempts or current_app.config.get(
+                'JOB_MAX_ATTEMPTS', JobQueue.DEFAULT_MAX_ATTEMPTS
+            ),
+            created_at=datetime.utcnow()
+        )
+        db.session.add(job)
+        db.session.commit()
+        return job
+
+    @staticmethod
+    def get(job_id: str) -> Optional[JobModel]:
+        """Get a job, or None if unknown or past its retention."""
+        job = db.session.get(JobModel, job_id)
+        if job is None or (job.expires_at is not None and job.expires_at <= datetime.utcnow()):
+            return None
+        return job
+
+    @staticmethod
+    def cancel(job_id: str) -> bool:
+        """
+        Cancel a job that has not started
+
+        Returns:
+            True if the job was queued and is now cancelled
+        """
+        now = datetime.utcnow()
+        cancelled = db.session.execute(
+            update(JobModel)
+            .where(JobModel.id == job_id, JobModel.status == 'queued')
+            .values(
+                status='cancelled',
+                finished_at=now,
+                expires_at=now + timedelta(seconds=JobQueue._result_ttl()),
+                input_data=None
+            )
+        ).rowcount
+        db.session.commit()
+        return cancelled == 1
+
+    @staticmethod
+    def claim(worker_id: str) -> Optional[str]:
+        """
+        Claim the oldest queued job whose type is below its concurrency limit
+
+        Args:
+            worker_id: Identifier of the claiming worker process
+
+        Returns:
+            ID of the claimed job, or None if there is nothing to run
+        """
+        limits = current_app.config.get('JOB_TYPE_CONCURRENCY') or {}
+        saturated = []
+        if limits:
+            running = dict(
+                db.session.query(JobModel.job_type, func.count(JobModel.id))
+                .filter(JobModel.status == 'running')
+                .group_by(JobModel.job_type)
+                .all()
+            )
+            saturated = [
+                job_type for job_type, limit in limits.items()
+                if running.get(job_type, 0) >= limit
+            ]
+
+        query = db.session.query(JobModel.id).filter(JobModel.status == 'queued')
+        if saturated:
+            query = query.filter(JobModel.job_type.notin_(saturated))
+        candidates = [
+            row.id for row in
+            query.order_by(JobModel.created_at, JobModel.id).limit(JobQueue.CLAIM_BATCH_SIZE).all()
+        ]
+        db.session.commit()
+
+        for job_id in candidates:
+            now = datetime.utcnow()
+            claimed = db.session.execute(
+                update(JobModel)
+                .where(JobModel.id == job_id, JobModel.status == 'queued')
+                .values(
+                    status='running',
+                    worker_id=worker_id,
+                    attempts=JobModel.attempts + 1,
+                    started_at=now,
+                    lease_expires_at=now + timedelta(seconds=JobQueue._lease_seconds())
+                )
+            ).rowcount
+            db.session.commit()
+            if claimed == 1:
+                return job_id
+
+        return None
+
+    @staticmethod
+    def renew_lease(job_id: str, worker_id: str) -> bool:
+        """
+        Extend a running job's lease
+
+        Returns:
+            False if the job is no longer held by this worker
+        """
+        renewed = db.session.execute(
+            update(JobModel)
+            .where(
+                JobModel.id == job_id,
+                JobModel.status == 'running',
+                JobModel.worker_id == worker_id
+            )
+            .values(lease_expires_at=datetime.utcnow() + timedelta(seconds=JobQueue._lease_seconds()))
+        ).rowcount
+        db.session.commit()
+        return renewed == 1
+
+    @staticmethod
+    def execute(job_id: str, worker_id: str) -> str:
+        """
+        Run a claimed job's handler and store its result
+
+        Args:
+            job_id: Job claimed by this worker
+            worker_id: Identifier of the worker
+
+        Returns:
+            Final status ('succeeded' or 'failed')
+        """
+        from app.jobs.handlers import HANDLERS
+
+        job = db.session.get(JobModel, job_id)
+        payload = json.loads(job.payload or '{}')
+        input_data = job.input_data
+        handler = HANDLERS.get(job.job_type)
+        db.session.commit()
+
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown job type: {job.job_type}")
+            result = handler(payload, input_data)
+        except Exception as e:
+            db.session.rollback()
+            print(f"Job {job_id} ({job.job_type}) failed: {e}")
+            JobQueue._finish(job_id, worker_id, 'failed', {'error_message': str(e)})
+            return 'failed'
+
+        values = {'result_status_code': result.get('status_code', 200)}
+        if 'file' in result:
+            values.update({
+                'result_data': result['file'],
+                'result_filename': result.get('filename'),
+                'result_mimetype': result.get('mimetype')
+            })
+        else:
+            values['result'] = json.dumps(result.get('body'))
+
+        JobQueue._finish(job_id, worker_id, 'succeeded', values)
+        return 'succeeded'
+
+    @staticmethod
+    def recover_stale() -> List[str]:
+        """
+        Requeue running jobs whose lease expired (worker died), or fail them
+        once they have used max_attempts
+
+        Returns:
+            IDs of the jobs that were requeued or failed
+        """
+        now = datetime.utcnow()
+        stale = db.session.query(JobModel.id, JobModel.attempts, JobModel.max_attempts).filter(
+            JobModel.status == 'running',
+            JobModel.lease_expires_at < now
+        ).all()
+
+        recovered = []
+        for job_id, attempts, max_attempts in stale:
+            if attempts < max_attempts:
+                values = {'status': 'queued', 'worker_id': None, 'lease_expires_at': None}
+            else:
+                values = {
+                    'status': 'failed',
+                    'error_message': f'Worker stopped responding ({attempts} attempts)',
+                    'finished_at': now,
+                    'expires_at': now + timedelta(seconds=JobQueue._result_ttl()),
+                    'input_data': None
+                }
+            changed = db.session.execute(
+                update(JobModel)
+                .where(
+                    JobModel.id == job_id,
+                    JobModel.status == 'running',
+                    JobModel.lease_expires_at < now
+                )
+                .values(**values)
+            ).rowcount
+            if changed == 1:
+                recovered.append(job_id)
+
+        db.session.commit()
+        return recovered
+
+    @staticmethod
+    def purge_expired() -> int:
+        """
+        Delete finished jobs past their retention
+
+        Returns:
+            Number of jobs deleted
+        """
+        deleted = JobModel.query.filter(
+            JobModel.status.in_(JobQueue.FINISHED_STATUSES),
+            JobModel.expires_at <= datetime.utcnow()
+        ).delete(synchronize_session=False)
+        db.session.commit()
+        return deleted
+
+    @staticmethod
+    def get_counts() -> Dict[str, int]:
+        """Number of retained jobs in each status."""
+        rows = db.session.query(JobModel.status, func.count(JobModel.id)).group_by(JobModel.status).all()
+        return {status: count for status, count in rows}
+
+    @staticmethod
+    def _finish(job_id: str, worker_id: str, status: str, values: Dict):
+        """Record a job's outcome if this worker still holds it."""
+        now = datetime.utcnow()
+        db.session.execute(
+            update(JobModel)
+            .where(
+                JobModel.id == job_id,
+                JobModel.status == 'running',
+                JobModel.worker_id == worker_id
+            )
+            .values(
+                status=status,
+                finished_at=now,
+                expires_at=now + timedelta(seconds=JobQueue._result_ttl()),
+                lease_expires_at=None,
+                input_data=None,
+                **values
+            )
+        )
+        db.session.commit()
+
+    @staticmethod
+    def _lease_seconds() -> int:
+        return current_app.config.get('JOB_LEASE_SECONDS', JobQueue.DEFAULT_LEASE_SECONDS)
+
+    @staticmethod
+    def _result_ttl() -> int:
+        return current_app.config.get('JOB_RESULT_TTL', JobQueue.DEFAULT_RESULT_TTL)
@@ -0,0 +1,190 @@
+"""
+Background job worker pool
+
+Runs outside the web server so slow exports and extractions never hold a
+gunicorn request thread:
+
+    python -m app.jobs.worker              # JOB_WORKER_PROCESSES processes
+    python -m app.jobs.worker --processes 4
+
+The parent process starts the workers, restarts any that die, and on
+SIGTERM/SIGINT lets each finish its current job before exiting. Every
+worker builds its own app (and database connection), claims one job at a
+time, and renews the job's lease from a heartbeat thread while the handler
+runs. Idle workers recover jobs abandoned by dead workers and purge
+expired results.
+"""
+
+import argparse
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+from typing import Dict, Optional
+
+DEFAULT_PROCESSES = 2
+DEFAULT_POLL_INTERVAL = 1.0
+MAINTENANCE_INTERVAL = 60  # seconds between stale-job recovery and purge runs
+RESTART_DELAY = 1.0  # seconds before replacing a worker that died
+SUPERVISE_INTERVAL = 0.5  # seconds between the pool's liveness/stop checks
+
+
+def run_worker(index: int, stop_event, test_config: Optional[Dict] = None):
+    """
+    Claim and run jobs until stop_event is set (entry point of each worker process)
+
+    Args:
+        index: Worker number within the pool
+        stop_event: Shared event set by the pool on shutdown
+        test_config: Optional config overrides passed to create_app
+    """
+    # The pool handles SIGINT and sets stop_event. A SIGTERM sent to this
+    # process directly only sets a flag: setting the multiprocessing Event from
+    # a handler deadlocks while this thread is blocked in stop_event.wait()
+    terminated = threading.Event()
+    pool = multiprocessing.parent_process()
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda signum, frame: terminated.set())
+
+    from app import create_app
+    from app.jobs.queue import JobQueue
+
+    app = create_app(test_config)
+    worker_id = f'{socket.gethostname()}:{os.getpid()}:{index}'
+    poll_interval = app.config.get('JOB_POLL_INTERVAL', DEFAULT_POLL_INTERVAL)
+    last_maintenance = 0.0
+
+    print(f"Job worker {worker_id} started")
+
+    while not (stop_event.is_set() or terminated.is_set()):
+        if pool is not None and not pool.is_alive():
+            # The pool was killed; exit rather than run unsupervised
+            print(f"Job worker {worker_id}: pool process is gone, exiting")
+            break
+
+        with app.app_context():
+            if time.monotonic() - last_maintenance >= MAINTENANCE_INTERVAL:
+                try:
+                    recovered = JobQueue.recover_stale()
+                    purged = JobQueue.purge_expired()
+                    if recovered or purged:
+                        print(f"Job worker {worker_id}: recovered {len(recovered)}, purged {purged}")
+                except Exception as e:
+                    print(f"Job maintenance error: {e}")
+                last_maintenance = time.monotonic()
+
+            try:
+                job_id = JobQueue.claim(worker_id)
+            except Exception as e:
+                print(f"Job claim error: {e}")
+                job_id = None
+
+            if job_id is not None:
+                _run_with_heartbeat(app, job_id, worker_id)
+                continue
+
+        stop_event.wait(poll_interval)
+
+    print(f"Job worker {worker_id} stopped")
+
+
+def _run_with_heartbeat(app, job_id: str, worker_id: str):
+    """Execute a claimed job while a thread renews its lease."""
+    from app.jobs.queue import JobQueue
+
+    done = threading.Event()
+    lease_seconds = app.config.get('JOB_LEASE_SECONDS', JobQueue.DEFAULT_LEASE_SECONDS)
+
+    def heartbeat():
+        while not done.wait(lease_seconds / 3):
+            with app.app_context():
+                try:
+                    if not JobQueue.renew_lease(job_id, worker_id):
+                        return
+                except Exception as e:
+                    print(f"Job {job_id} lease renewal error: {e}")
+
+    thread = threading.Thread(target=heartbeat, name=f'job-heartbeat-{job_id}', daemon=True)
+    thread.start()
+    try:
+        started = time.monotonic()
+        status = JobQueue.execute(job_id, worker_id)
+        print(f"Job {job_id} {status} in {time.monotonic() - started:.1f}s")
+    finally:
+        done.set()
+        thread.join()
+
+
+class WorkerPool:
+    """
+    Supervisor for a fixed number of worker processes
+    """
+
+    def __init__(self, processes: int = DEFAULT_PROCESSES, test_config: Optional[Dict] = None):
+        if processes < 1:
+            raise ValueError("processes must be at least 1")
+        self.processes = processes
+        self.test_config = test_config
+        # Spawned (not forked) so each worker starts without the parent's state
+        self._context = multiprocessing.get_context('spawn')
+        self._stop_event = self._context.Event()
+        self._stop_requested = False
+        self._workers = {}
+
+    def run(self):
+        """Start the workers and supervise them until stop() or a signal."""
+        signal.signal(signal.SIGTERM, lambda signum, frame: self.stop())
+        signal.signal(signal.SIGINT, lambda signum, frame: self.stop())
+
+        for index in range(self.processes):
+            self._start(index)
+
+        # Poll a plain flag with sleep rather than waiting on _stop_event: the
+        # signal handlers run on this thread, and setting a multiprocessing
+        # Event while the same thread waits on it deadlocks
+        while not self._stop_requested:
+            for index, process in list(self._workers.items()):
+                if not process.is_alive() and not self._stop_requested:
+                    print(f"Job worker {index} exited with code {process.exitcode}; restarting")
+                    time.sleep(RESTART_DELAY)
+                    self._start(index)
+            time.sleep(SUPERVISE_INTERVAL)
+
+        # Outside signal context: tell the workers, then let running jobs finish
+        print("Stopping job workers after their current jobs")
+        self._stop_event.set()
+        for process in self._workers.values():
+            process.join()
+
+    def stop(self):
+        """Ask every worker to exit after its current job (safe to call from a signal handler)."""
+        self._stop_requested = True
+
+    def _start(self, index: int):
+        process = self._context.Process(
+            target=run_worker,
+            args=(index, self._stop_event, self.test_config),
+            name=f'job-worker-{index}'
+        )
+        process.start()
+        self._workers[index] = process
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the background job worker pool')
+    parser.add_argument(
+        '--processes',
+        type=int,
+        default=int(os.getenv('JOB_WORKER_PROCESSES', str(DEFAULT_PROCESSES))),
+        help='Number of worker processes (default: JOB_WORKER_PROCESSES or 2)'
+    )
+    args = parser.parse_args()
+
+    print(f"Starting {args.processes} job worker(s)")
+    WorkerPool(args.processes).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,13 @@
+from .runner import AddColumn, CreateIndex, Migration, RunSQL, get_applied_versions, get_pending_migrations, run_migrations
+from .versions import MIGRATIONS
+
+__all__ = [
+    'AddColumn',
+    'CreateIndex',
+    'Migration',
+    'MIGRATIONS',
+    'RunSQL',
+    'get_applied_versions',
+    'get_pending_migrations',
+    'run_migrations'
+]
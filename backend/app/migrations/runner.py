@@ -0,0 +1,145 @@
+"""
+Versioned schema migrations
+
+db.create_all() creates missing tables but never changes existing ones, so
+anything added to a table after it was first created (indexes, columns) is
+declared as a numbered Migration. Applied versions are recorded in the
+schema_migrations table; run_migrations() applies the pending ones in order,
+each in its own transaction.
+
+Operations are idempotent (CREATE INDEX IF NOT EXISTS, column checks,
+re-runnable backfills), so several workers starting at once, or a database
+whose tables were just created by create_all(), end up in the same state.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError
+
+
+@dataclass(frozen=True)
+class CreateIndex:
+    """Create a (composite) index if it does not exist."""
+    name: str
+    table: str
+    columns: Tuple[str, ...]
+    unique: bool = False
+
+    def apply(self, conn: Connection):
+        if not inspect(conn).has_table(self.table):
+            return
+        unique = 'UNIQUE ' if self.unique else ''
+        columns = ', '.join(self.columns)
+        conn.execute(text(f"CREATE {unique}INDEX IF NOT EXISTS {self.name} ON {self.table} ({columns})"))
+
+    def describe(self) -> str:
+        return f"index {self.name} on {self.table}({', '.join(self.columns)})"
+
+
+@dataclass(frozen=True)
+class AddColumn:
+    """Add a nullable column if it does not exist."""
+    table: str
+    column: str
+    ddl_type: str
+
+    def apply(self, conn: Connection):
+        inspector = inspect(conn)
+        if not inspector.has_table(self.table):
+            return
+        if any(column['name'] == self.column for column in inspector.get_columns(self.table)):
+            return
+        conn.execute(text(f"ALTER TABLE {self.table} ADD COLUMN {self.column} {self.ddl_type}"))
+
+    def describe(self) -> str:
+        return f"column {self.table}.{self.column} {self.ddl_type}"
+
+
+@dataclass(frozen=True)
+class RunSQL:
+    """
+    Run a SQL statement (e.g. a backfill); it must be safe to re-run
+
+    With dialect set (e.g. 'sqlite'), it only runs on that database.
+    """
+    sql: str
+    dialect: Optional[str] = None
+
+    def apply(self, conn: Connection):
+        if self.dialect and conn.dialect.name != self.dialect:
+            return
+        conn.execute(text(self.sql))
+
+    def describe(self) -> str:
+        sql = ' '.join(self.sql.split())
+        return f"{sql} ({self.dialect} only)" if self.dialect else sql
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema version: an ordered list of operations."""
+    version: int
+    name: str
+    operations: Sequence = field(default_factory=tuple)
+
+
+SCHEMA_MIGRATIONS_DDL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        applied_at TIMESTAMP NOT NULL
+    )
+"""
+
+
+def get_applied_versions(engine: Engine) -> List[int]:
+    """Get the migration versions recorded in the database."""
+    with engine.begin() as conn:
+        conn.execute(text(SCHEMA_MIGRATIONS_DDL))
+        return [row[0] for row in conn.execute(text("SELECT version FROM schema_migrations ORDER BY version"))]
+
+
+def get_pending_migrations(engine: Engine, migrations: Sequence[Migration]) -> List[Migration]:
+    """Get migrations not yet applied, in version order."""
+    applied = set(get_applied_versions(engine))
+    return [m for m in sorted(migrations, key=lambda m: m.version) if m.version not in applied]
+
+
+def run_migrations(engine: Engine, migrations: Sequence[Migration]) -> List[int]:
+    """
+    Apply pending migrations in version order
+
+    Args:
+        engine: SQLAlchemy engine (SQLite or Postgres)
+        migrations: All declared migrations
+
+    Returns:
+        Versions applied by this call
+
+    Raises:
+        ValueError: If two migrations share a version number
+    """
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError("Duplicate migration versions")
+
+    applied = []
+    for migration in get_pending_migrations(engine, migrations):
+        try:
+            with engine.begin() as conn:
+                for operation in migration.operations:
+                    operation.apply(conn)
+                conn.execute(
+                    text("INSERT INTO schema_migrations (version, name, applied_at) VALUES (:version, :name, :applied_at)"),
+                    {'version': migration.version, 'name': migration.name, 'applied_at': datetime.utcnow()}
+                )
+        except IntegrityError:
+            # Another worker recorded this version first
+            continue
+        applied.append(migration.version)
+
+    return applied
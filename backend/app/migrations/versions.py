@@ -0,0 +1,74 @@
+"""
+Declared schema migrations, oldest first
+
+Append new migrations with the next version number; never edit or
+renumber one that has shipped.
+"""
+
+from app.migrations.runner import AddColumn, CreateIndex, Migration, RunSQL
+
+MIGRATIONS = [
+    Migration(1, 'hot lookup indexes', (
+        # Deal list and board: keyset pagination newest first, with and without a status filter
+        CreateIndex('ix_deals_updated_at_id', 'deals', ('updated_at', 'id')),
+        CreateIndex('ix_deals_status_updated_at_id', 'deals', ('status', 'updated_at', 'id')),
+
+        # Assessments and imports looked up by deal
+        CreateIndex('ix_risk_assessments_deal_id', 'risk_assessments', ('deal_id', 'id')),
+        CreateIndex('ix_property_imports_deal_id_created_at', 'property_imports', ('deal_id', 'created_at')),
+        CreateIndex('ix_property_imports_status_created_at', 'property_imports', ('import_status', 'created_at')),
+
+        # Reference data lookups
+        CreateIndex('ix_market_decile_thresholds_lookup', 'market_decile_thresholds',
+                    ('geography', 'bedrooms', 'data_year')),
+        CreateIndex('ix_risk_benchmark_data_decile_geography', 'risk_benchmark_data',
+                    ('rent_decile', 'geography')),
+
+        # Fund child tables, in the order the fund overview reads them
+        CreateIndex('ix_fund_metrics_fund_id_as_of_date', 'fund_metrics', ('fund_id', 'as_of_date')),
+        CreateIndex('ix_fund_quarterly_performance_fund_id', 'fund_quarterly_performance',
+                    ('fund_id', 'year', 'quarter')),
+        CreateIndex('ix_investment_strategies_fund_id', 'investment_strategies', ('fund_id', 'deployed_capital')),
+        CreateIndex('ix_fund_cash_flows_fund_id', 'fund_cash_flows', ('fund_id', 'year', 'quarter')),
+        CreateIndex('ix_fund_activities_fund_id_date', 'fund_activities', ('fund_id', 'activity_date')),
+        CreateIndex('ix_benchmark_data_fund_id_as_of_date', 'benchmark_data', ('fund_id', 'as_of_date')),
+
+        # GP child tables
+        CreateIndex('ix_gp_quarterly_performance_gp_id', 'gp_quarterly_performance', ('gp_id', 'year', 'quarter')),
+        CreateIndex('ix_gp_portfolio_summary_gp_id', 'gp_portfolio_summary', ('gp_id', 'year', 'quartile')),
+    )),
+
+    Migration(2, 'latest risk assessment pointer', (
+        AddColumn('deals', 'latest_assessment_id', 'INTEGER'),
+        RunSQL(
+            "UPDATE deals SET latest_assessment_id = ("
+            "SELECT MAX(risk_assessments.id) FROM risk_assessments "
+            "WHERE risk_assessments.deal_id = deals.id)"
+        ),
+    )),
+
+    Migration(3, 'background job queue indexes', (
+        # Workers claim the oldest queued job; retention deletes finished jobs by expiry
+        CreateIndex('ix_jobs_status_created_at', 'jobs', ('status', 'created_at')),
+        CreateIndex('ix_jobs_expires_at', 'jobs', ('expires_at',)),
+    )),
+
+    Migration(4, 'pdf extraction cache', (
+        AddColumn('property_imports', 'content_hash', 'VARCHAR(64)'),
+        AddColumn('property_imports', 'extractor_version', 'VARCHAR(50)'),
+        AddColumn('property_imports', 'extraction_result', 'TEXT'),
+        # Duplicate uploads look up the newest import of the same file and extractor
+        CreateIndex('ix_property_imports_content_hash', 'property_imports',
+                    ('content_hash', 'extractor_version', 'created_at')),
+    )),
+
+    Migration(5, 'uniform deal timestamps', (
+        # func.now() stored SQLite timestamps without the fraction ('2026-10-16 19:30:20')
+        # while Python-side values carry microseconds; the deal list cursor compares
+        # updated_at as text there, so give every row the same format
+        RunSQL("UPDATE deals SET updated_at = updated_at || '.000000' WHERE length(updated_at) = 19",
+               dialect='sqlite'),
+        RunSQL("UPDATE deals SET created_at = created_at || '.000000' WHERE length(created_at) = 19",
+               dialect='sqlite'),
+    )),
+]
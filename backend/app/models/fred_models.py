@@ -1,7 +1,7 @@
 """Data models for Federal Reserve Economic Data (FRED) API responses."""
 
-from dataclasses import dataclass, asdict
-from typing import Optional
+from dataclasses import dataclass, asdict, field
+from typing import Optional, List
 
 
 @dataclass
@@ -106,6 +106,7 @@ class MacroeconomicData:
     housing_market: HousingMarketData
     economic_indicators: EconomicIndicators
     last_updated: str
+    missing_series: List[str] = field(default_factory=list)  # series that failed to load
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -114,5 +115,6 @@ class MacroeconomicData:
             'inflation': self.inflation.to_dict(),
             'housingMarket': self.housing_market.to_dict(),
             'economicIndicators': self.economic_indicators.to_dict(),
-            'lastUpdated': self.last_updated
+            'lastUpdated': self.last_updated,
+            'missingSeries': self.missing_series
         }
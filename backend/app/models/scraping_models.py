@@ -121,6 +121,46 @@ class PropertyData:
             'listingStatus': self.listing_status
         }
 
+    @staticmethod
+    def from_dict(data: dict) -> 'PropertyData':
+        """Create PropertyData from a camelCase dictionary (as produced by to_dict)."""
+        return PropertyData(
+            property_name=data.get('propertyName'),
+            address=data.get('address'),
+            city=data.get('city'),
+            state=data.get('state'),
+            zipcode=data.get('zipcode'),
+            latitude=data.get('latitude'),
+            longitude=data.get('longitude'),
+            walk_score=data.get('walkScore'),
+            transit_score=data.get('transitScore'),
+            property_type=data.get('propertyType'),
+            building_size_sf=data.get('buildingSizeSf'),
+            # LLM extraction returns lotSizeAc and occupancy
+            lot_size_acres=data.get('lotSizeAcres', data.get('lotSizeAc')),
+            year_built=data.get('yearBuilt'),
+            num_units=data.get('numUnits'),
+            num_stories=data.get('numStories'),
+            bedrooms=data.get('bedrooms'),
+            bathrooms=data.get('bathrooms'),
+            zoning=data.get('zoning'),
+            parcel_id=data.get('parcelId'),
+            asking_price=data.get('askingPrice'),
+            price_per_sf=data.get('pricePerSf'),
+            price_per_unit=data.get('pricePerUnit'),
+            cap_rate=data.get('capRate'),
+            noi=data.get('noi'),
+            gross_income=data.get('grossIncome'),
+            occupancy_rate=data.get('occupancyRate', data.get('occupancy')),
+            parking_spaces=data.get('parkingSpaces'),
+            parking_type=data.get('parkingType'),
+            parking_ratio=data.get('parkingRatio'),
+            listing_url=data.get('listingUrl'),
+            listing_id=data.get('listingId'),
+            days_on_market=data.get('daysOnMarket'),
+            listing_status=data.get('listingStatus')
+        )
+
 
 @dataclass
 class EnrichmentData:
@@ -157,6 +197,22 @@ class EnrichmentData:
             'comparableCount': self.comparable_count
         }
 
+    @staticmethod
+    def from_dict(data: dict) -> 'EnrichmentData':
+        """Create EnrichmentData from a camelCase dictionary (as produced by to_dict)."""
+        return EnrichmentData(
+            estimated_rent=data.get('estimatedRent'),
+            rent_range_low=data.get('rentRangeLow'),
+            rent_range_high=data.get('rentRangeHigh'),
+            estimated_value=data.get('estimatedValue'),
+            value_range_low=data.get('valueRangeLow'),
+            value_range_high=data.get('valueRangeHigh'),
+            market_avg_rent=data.get('marketAvgRent'),
+            market_median_rent=data.get('marketMedianRent'),
+            market_inventory_level=data.get('marketInventoryLevel'),
+            comparable_count=data.get('comparableCount')
+        )
+
 
 @dataclass
 class ScrapingResult:
@@ -202,3 +258,22 @@ class ScrapingResult:
             'sourceUrl': self.source_url,
             'sourcePlatform': self.source_platform
         }
+
+    @staticmethod
+    def from_dict(data: dict) -> 'ScrapingResult':
+        """Create a ScrapingResult from a camelCase dictionary (as produced by to_dict)."""
+        return ScrapingResult(
+            status=data['status'],
+            method=data.get('method'),
+            extracted_data=PropertyData.from_dict(data['extractedData']) if data.get('extractedData') else None,
+            enrichment_data=EnrichmentData.from_dict(data['enrichmentData']) if data.get('enrichmentData') else None,
+            confidence_score=data.get('confidenceScore'),
+            missing_fields=data.get('missingFields'),
+            warnings=data.get('warnings'),
+            requires_user_input=data.get('requiresUserInput', False),
+            error_type=data.get('errorType'),
+            error_message=data.get('errorMessage'),
+            suggested_action=data.get('suggestedAction'),
+            source_url=data.get('sourceUrl'),
+            source_platform=data.get('sourcePlatform')
+        )
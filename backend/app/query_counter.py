@@ -0,0 +1,86 @@
+"""
+SQL statement counter
+
+Counts the statements each request sends to the database and reports the
+total in an X-SQL-Statements response header (when SQL_STATEMENT_COUNT_HEADER
+is enabled). count_queries() counts a block of code, e.g. to check that an
+analysis costs a constant number of queries:
+
+    with count_queries() as counter:
+        DealMemoService.generate_memo(deal_id)
+    print(counter.statements)
+
+Counters nest; a statement counts toward every enclosing block. Streamed
+responses report the statements issued before streaming started.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from flask import g
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    """Statement count for one request or block."""
+
+    def __init__(self, parent: Optional['QueryCounter'] = None):
+        self.statements = 0
+        self.parent = parent
+
+    def record(self):
+        counter = self
+        while counter is not None:
+            counter.statements += 1
+            counter = counter.parent
+
+
+_current: ContextVar[Optional[QueryCounter]] = ContextVar('sql_query_counter', default=None)
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    counter = _current.get()
+    if counter is not None:
+        counter.record()
+
+
+@contextmanager
+def count_queries():
+    """Count the SQL statements executed inside the block."""
+    counter = QueryCounter(parent=_current.get())
+    token = _current.set(counter)
+    try:
+        yield counter
+    finally:
+        _current.reset(token)
+
+
+def init_app(app):
+    """Count statements per request and add the X-SQL-Statements header."""
+
+    @app.before_request
+    def _start_query_counter():
+        counter = QueryCounter(parent=_current.get())
+        g.sql_query_counter = counter
+        g.sql_query_counter_token = _current.set(counter)
+
+    @app.after_request
+    def _report_query_count(response):
+        counter = g.get('sql_query_counter')
+        if counter is not None and app.config.get('SQL_STATEMENT_COUNT_HEADER', True):
+            response.headers['X-SQL-Statements'] = str(counter.statements)
+        return response
+
+    @app.teardown_request
+    def _stop_query_counter(exception=None):
+        token = g.pop('sql_query_counter_token', None)
+        g.pop('sql_query_counter', None)
+        if token is not None:
+            try:
+                _current.reset(token)
+            except ValueError:
+                # Token created in another context (e.g. a streamed response)
+                _current.set(None)
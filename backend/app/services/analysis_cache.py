@@ -0,0 +1,180 @@
+"""
+Analysis Result Cache
+Content-addressed LRU cache for deal memos and risk assessments
+
+Entries are keyed by a SHA-256 of everything the analysis depends on:
+- the deal's stored columns
+- the hedonic model version and coefficients
+- the benchmark data version stamp (see BenchmarkRegistry)
+- call parameters (holding period, geography) and the current year
+
+Editing a deal or reseeding benchmarks therefore changes the key, so stale
+results are never served. DealService.update_deal also drops a deal's entries
+eagerly, and a benchmark version change clears the whole cache.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict
+from datetime import datetime
+from app.services.benchmark_registry import BenchmarkRegistry
+from app.services.hedonic_model_service import HedonicModelService
+
+
+class AnalysisResultCache:
+    """
+    Process-wide LRU cache of computed analysis results
+    """
+
+    MAX_ENTRIES = 512
+    HEDONIC_MODEL_VERSION = 'us_national_v1'
+
+    # Deal columns that do not affect any analysis output
+    IGNORED_COLUMNS = {'created_at', 'updated_at', 'latest_assessment_id'}
+
+    _lock = threading.Lock()
+    _entries: OrderedDict = OrderedDict()
+    _keys_by_deal: Dict[int, set] = {}
+    _benchmark_version = None
+    _model_fingerprint = None
+    _stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+    _stats_by_kind: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def get_or_compute(kind: str, deal, params: Dict, compute: Callable[[], Dict]) -> Dict:
+        """
+        Return a cached result or compute and store it
+
+        Args:
+            kind: Result type ('memo', 'assessment')
+            deal: DealModel the result is computed from
+            params: Call parameters that affect the result
+            compute: Zero-argument function producing the result
+
+        Returns:
+            Deep copy of the cached or freshly computed result
+        """
+        benchmark_version = BenchmarkRegistry.get_version()
+        if benchmark_version != AnalysisResultCache._benchmark_version:
+            AnalysisResultCache.clear()
+            AnalysisResultCache._benchmark_version = benchmark_version
+
+        key = AnalysisResultCache._make_key(kind, deal, params, benchmark_version)
+        kind_stats = AnalysisResultCache._kind_stats(kind)
+
+        with AnalysisResultCache._lock:
+            if key in AnalysisResultCache._entries:
+                AnalysisResultCache._entries.move_to_end(key)
+                AnalysisResultCache._stats['hits'] += 1
+                kind_stats['hits'] += 1
+                return copy.deepcopy(AnalysisResultCache._entries[key][1])
+
+            AnalysisResultCache._stats['misses'] += 1
+            kind_stats['misses'] += 1
+
+        result = compute()
+
+        with AnalysisResultCache._lock:
+            AnalysisResultCache._entries[key] = (deal.id, copy.deepcopy(result))
+            AnalysisResultCache._entries.move_to_end(key)
+            AnalysisResultCache._keys_by_deal.setdefault(deal.id, set()).add(key)
+
+            while len(AnalysisResultCache._entries) > AnalysisResultCache.MAX_ENTRIES:
+                old_key, (old_deal_id, _) = AnalysisResultCache._entries.popitem(last=False)
+                AnalysisResultCache._discard_deal_key(old_deal_id, old_key)
+                AnalysisResultCache._stats['evictions'] += 1
+
+        return result
+
+    @staticmethod
+    def invalidate_deal(deal_id: int):
+        """
+        Drop every cached result for a deal
+
+        Args:
+            deal_id: Deal whose results are stale
+        """
+        with AnalysisResultCache._lock:
+            keys = AnalysisResultCache._keys_by_deal.pop(deal_id, set())
+            for key in keys:
+                AnalysisResultCache._entries.pop(key, None)
+            if keys:
+                AnalysisResultCache._stats['invalidations'] += len(keys)
+
+    @staticmethod
+    def clear():
+        """Drop all cached results."""
+        with AnalysisResultCache._lock:
+            AnalysisResultCache._stats['invalidations'] += len(AnalysisResultCache._entries)
+            AnalysisResultCache._entries.clear()
+            AnalysisResultCache._keys_by_deal.clear()
+
+    @staticmethod
+    def get_stats() -> Dict:
+        """
+        Get cache counters
+
+        Returns:
+            Dictionary with size, hits, misses, evictions, invalidations,
+            hit_rate and per-kind hit/miss counts
+        """
+        with AnalysisResultCache._lock:
+            lookups = AnalysisResultCache._stats['hits'] + AnalysisResultCache._stats['misses']
+            return {
+                'size': len(AnalysisResultCache._entries),
+                'max_entries': AnalysisResultCache.MAX_ENTRIES,
+                **AnalysisResultCache._stats,
+                'hit_rate': round(AnalysisResultCache._stats['hits'] / lookups, 3) if lookups else None,
+                'by_kind': copy.deepcopy(AnalysisResultCache._stats_by_kind),
+                'benchmark_version': AnalysisResultCache._benchmark_version
+            }
+
+    @staticmethod
+    def _make_key(kind: str, deal, params: Dict, benchmark_version: int) -> str:
+        """Hash the analysis inputs into a cache key."""
+        columns = {
+            column.name: getattr(deal, column.name)
+            for column in deal.__table__.columns
+            if column.name not in AnalysisResultCache.IGNORED_COLUMNS
+        }
+        payload = {
+            'kind': kind,
+            'deal': columns,
+            'params': params,
+            'model': AnalysisResultCache._get_model_fingerprint(),
+            'benchmark_version': benchmark_version,
+            'year': datetime.now().year  # property age depends on the current year
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    @staticmethod
+    def _get_model_fingerprint() -> str:
+        """Version plus a digest of the hedonic coefficients in use."""
+        if AnalysisResultCache._model_fingerprint is None:
+            model = HedonicModelService.load_coefficients(AnalysisResultCache.HEDONIC_MODEL_VERSION)
+            digest = hashlib.sha256(
+                json.dumps(model, sort_keys=True).encode('utf-8')
+            ).hexdigest()[:16]
+            AnalysisResultCache._model_fingerprint = (
+                f"{AnalysisResultCache.HEDONIC_MODEL_VERSION}:{digest}"
+            )
+        return AnalysisResultCache._model_fingerprint
+
+    @staticmethod
+    def _kind_stats(kind: str) -> Dict[str, int]:
+        """Get (creating if needed) the hit/miss counters for a result type."""
+        with AnalysisResultCache._lock:
+            return AnalysisResultCache._stats_by_kind.setdefault(kind, {'hits': 0, 'misses': 0})
+
+    @staticmethod
+    def _discard_deal_key(deal_id: int, key: str):
+        """Remove a key from the per-deal index (caller holds the lock)."""
+        keys = AnalysisResultCache._keys_by_deal.get(deal_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del AnalysisResultCache._keys_by_deal[deal_id]
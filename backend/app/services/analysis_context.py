@@ -0,0 +1,68 @@
+"""
+Analysis Context
+Request-scoped identity map for one analysis of one deal
+
+The deal row, benchmark rows and decile thresholds an analysis reads are
+loaded once when the context is created. Scoring services accept the context
+alongside the deal_id and read from it instead of querying again, so a memo
+or a sensitivity run costs the same number of queries however many
+sub-calculations or scenarios it contains.
+"""
+
+from typing import Optional
+from datetime import datetime
+from app.database import DealModel
+from app.services.benchmark_registry import BenchmarkRegistry
+from app.services.rent_tier_service import RentTierService
+
+
+class AnalysisContext:
+    """
+    Deal, benchmarks and thresholds for one analysis
+    """
+
+    def __init__(self, deal: DealModel, year: Optional[int] = None):
+        """
+        Args:
+            deal: Loaded DealModel
+            year: Data year for decile thresholds (defaults to current year)
+        """
+        self.deal = deal
+        self.year = year or datetime.now().year
+
+        # Keyed by (rent_decile, geography), usable as the services' ``benchmarks`` argument
+        self.benchmarks = BenchmarkRegistry.get_benchmarks()
+
+        # Keyed by (geography, bedrooms, year), usable as classify_property's ``thresholds``
+        self.thresholds = RentTierService.get_decile_thresholds_bulk(
+            geography='national',
+            bedrooms_values=[deal.bedrooms],
+            year=self.year
+        )
+
+    @staticmethod
+    def for_deal(deal_id: int) -> 'AnalysisContext':
+        """
+        Load a deal and build its context
+
+        Raises:
+            ValueError: If the deal does not exist
+        """
+        deal = DealModel.query.get(deal_id)
+        if not deal:
+            raise ValueError(f"Deal {deal_id} not found")
+        return AnalysisContext(deal)
+
+    @staticmethod
+    def resolve(deal_id: int, context: Optional['AnalysisContext'] = None) -> 'AnalysisContext':
+        """
+        Use the caller's context, or load one for deal_id
+
+        Raises:
+            ValueError: If the deal does not exist or the context is for another deal
+        """
+        if context is None:
+            return AnalysisContext.for_deal(deal_id)
+        if context.deal.id != deal_id:
+            raise ValueError(f"Analysis context is for deal {context.deal.id}, not {deal_id}")
+        return context
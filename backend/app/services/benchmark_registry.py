@@ -0,0 +1,228 @@
+"""
+Benchmark Registry
+In-memory lookup tables for RiskBenchmarkData and MarketDecileThresholds
+
+Both tables are small and change only when seed_benchmark_data.py or
+update_market_thresholds.py runs, so they are loaded once per process and
+indexed by (rent_decile, geography) and (geography, bedrooms, data_year).
+
+Writers bump a version stamp in reference_data_versions; each worker compares
+its loaded version with the stamp at most once per check interval and reloads
+when it has changed.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+from datetime import datetime
+from flask import current_app
+from app.database import db, RiskBenchmarkData, MarketDecileThresholds, ReferenceDataVersionModel
+
+
+class BenchmarkRegistry:
+    """
+    Process-wide cache of benchmark and decile threshold reference data
+    """
+
+    VERSION_KEY = 'benchmarks'
+    DEFAULT_CHECK_INTERVAL = 30  # seconds between version stamp checks
+
+    BENCHMARK_FIELDS = [
+        'id', 'rent_decile', 'geography',
+        'net_yield_min', 'net_yield_max',
+        'capital_gain_min', 'capital_gain_max',
+        'total_return_min', 'total_return_max',
+        'maintenance_cost_pct', 'turnover_cost_pct', 'default_cost_pct',
+        'systematic_risk_beta', 'cash_flow_volatility'
+    ]
+
+    _lock = threading.Lock()
+    _loaded = False
+    _version = None
+    _last_check = 0.0
+
+    # (rent_decile, geography) -> benchmark snapshot
+    _benchmarks: Dict = {}
+    # (geography, bedrooms, data_year) -> threshold dict
+    _thresholds: Dict = {}
+    # geography -> [(data_year, bedrooms, threshold dict)] sorted newest first
+    _thresholds_by_geography: Dict = {}
+
+    @staticmethod
+    def get_benchmark(rent_decile: int, geography: str = 'US') -> Optional[SimpleNamespace]:
+        """
+        Get the benchmark row for a decile and geography
+
+        Args:
+            rent_decile: Rent tier (1-10)
+            geography: Geographic market
+
+        Returns:
+            Read-only snapshot with the RiskBenchmarkData column attributes, or None
+        """
+        BenchmarkRegistry._ensure_loaded()
+        return BenchmarkRegistry._benchmarks.get((rent_decile, geography))
+
+    @staticmethod
+    def get_benchmarks(geographies: Optional[List[str]] = None) -> Dict:
+        """
+        Get benchmark snapshots keyed by (rent_decile, geography)
+
+        Args:
+            geographies: Restrict to these geographies (optional)
+
+        Returns:
+            Dictionary usable as the ``benchmarks`` argument of the scoring services
+        """
+        BenchmarkRegistry._ensure_loaded()
+        if geographies is None:
+            return dict(BenchmarkRegistry._benchmarks)
+
+        wanted = set(geographies)
+        return {
+            key: row for key, row in BenchmarkRegistry._benchmarks.items()
+            if key[1] in wanted
+        }
+
+    @staticmethod
+    def get_decile_thresholds(
+        geography: str = 'national',
+        bedrooms: Optional[int] = None,
+        year: Optional[int] = None
+    ) -> Optional[Dict]:
+        """
+        Get decile thresholds with the same matching rules as the database query
+
+        Args:
+            geography: Geographic market identifier
+            bedrooms: Number of bedrooms (optional filter)
+            year: Data year (optional filter; most recent year otherwise)
+
+        Returns:
+            Dictionary with d1_threshold through d10_threshold, or None if not found
+        """
+        BenchmarkRegistry._ensure_loaded()
+
+        if bedrooms is not None and year is not None:
+            thresholds = BenchmarkRegistry._thresholds.get((geography, bedrooms, year))
+            return dict(thresholds) if thresholds else None
+
+        for data_year, row_bedrooms, thresholds in BenchmarkRegistry._thresholds_by_geography.get(geography, []):
+            if bedrooms is not None and row_bedrooms != bedrooms:
+                continue
+            if year is not None and data_year != year:
+                continue
+            return dict(thresholds)
+
+        return None
+
+    @staticmethod
+    def get_version() -> int:
+        """
+        Get the version stamp of the loaded reference data
+
+        Returns:
+            Version number (0 if the data has never been stamped)
+        """
+        BenchmarkRegistry._ensure_loaded()
+        return BenchmarkRegistry._version or 0
+
+    @staticmethod
+    def bump_version(commit: bool = True) -> int:
+        """
+        Mark benchmark/threshold data as changed for every worker
+
+        Call after writing RiskBenchmarkData or MarketDecileThresholds.
+
+        Args:
+            commit: Whether to commit the session (set False to stamp within
+                the caller's own transaction)
+
+        Returns:
+            New version number
+        """
+        record = ReferenceDataVersionModel.query.get(BenchmarkRegistry.VERSION_KEY)
+        if record is None:
+            record = ReferenceDataVersionModel(name=BenchmarkRegistry.VERSION_KEY, version=1)
+            db.session.add(record)
+        else:
+            ReferenceDataVersionModel.query.filter_by(
+                name=BenchmarkRegistry.VERSION_KEY
+            ).update(
+                {
+                    'version': ReferenceDataVersionModel.version + 1,
+                    'updated_at': datetime.utcnow()
+                },
+                synchronize_session=False
+            )
+
+        if commit:
+            db.session.commit()
+
+        BenchmarkRegistry.invalidate()
+        return BenchmarkRegistry._read_version()
+
+    @staticmethod
+    def invalidate():
+        """Drop this process's copy so the next lookup reloads from the database."""
+        with BenchmarkRegistry._lock:
+            BenchmarkRegistry._loaded = False
+            BenchmarkRegistry._last_check = 0.0
+
+    @staticmethod
+    def _ensure_loaded():
+        """Load the tables if missing or if another worker bumped the version."""
+        now = time.monotonic()
+        interval = current_app.config.get(
+            'BENCHMARK_VERSION_CHECK_INTERVAL',
+            BenchmarkRegistry.DEFAULT_CHECK_INTERVAL
+        )
+
+        if BenchmarkRegistry._loaded and now - BenchmarkRegistry._last_check < interval:
+            return
+
+        with BenchmarkRegistry._lock:
+            if BenchmarkRegistry._loaded and now - BenchmarkRegistry._last_check < interval:
+                return
+
+            version = BenchmarkRegistry._read_version()
+            if not BenchmarkRegistry._loaded or version != BenchmarkRegistry._version:
+                BenchmarkRegistry._load(version)
+
+            BenchmarkRegistry._last_check = now
+
+    @staticmethod
+    def _read_version() -> int:
+        """Read the shared version stamp (0 if never stamped)."""
+        version = db.session.query(ReferenceDataVersionModel.version).filter_by(
+            name=BenchmarkRegistry.VERSION_KEY
+        ).scalar()
+        return version or 0
+
+    @staticmethod
+    def _load(version: int):
+        """Rebuild the in-memory indexes from the database (caller holds the lock)."""
+        benchmarks = {}
+        for row in RiskBenchmarkData.query.order_by(RiskBenchmarkData.id).all():
+            snapshot = SimpleNamespace(**{
+                field: getattr(row, field) for field in BenchmarkRegistry.BENCHMARK_FIELDS
+            })
+            benchmarks.setdefault((row.rent_decile, row.geography), snapshot)
+
+        thresholds = {}
+        by_geography = {}
+        rows = MarketDecileThresholds.query.order_by(
+            MarketDecileThresholds.data_year.desc(),
+            MarketDecileThresholds.id
+        ).all()
+        for row in rows:
+            values = {f'd{i}_threshold': getattr(row, f'd{i}_threshold') for i in range(1, 11)}
+            thresholds.setdefault((row.geography, row.bedrooms, row.data_year), values)
+            by_geography.setdefault(row.geography, []).append((row.data_year, row.bedrooms, values))
+
+        BenchmarkRegistry._benchmarks = benchmarks
+        BenchmarkRegistry._thresholds = thresholds
+        BenchmarkRegistry._thresholds_by_geography = by_geography
+        BenchmarkRegistry._version = version
+        BenchmarkRegistry._loaded = True
@@ -11,7 +11,8 @@ Academic Research Basis:
 
 from typing import Dict, Optional
 from datetime import datetime
-from app.database import db, RiskBenchmarkData, DealModel
+from app.services.benchmark_registry import BenchmarkRegistry
+from app.services.analysis_context import AnalysisContext
 
 
 class CapitalAppreciationService:
@@ -24,7 +25,8 @@ class CapitalAppreciationService:
         current_value: float,
         rent_decile: int,
         years: int = 10,
-        geography: str = 'US'
+        geography: str = 'US',
+        benchmarks: Optional[Dict] = None
     ) -> Dict:
         """
         Project future property value based on rent decile
@@ -34,6 +36,8 @@ class CapitalAppreciationService:
             rent_decile: Property's rent tier (1-10)
             years: Projection horizon (default 10 years)
             geography: Geographic market
+            benchmarks: Optional preloaded benchmark rows keyed by
+                (rent_decile, geography)
 
         Returns:
             Dictionary with projections:
@@ -50,10 +54,10 @@ class CapitalAppreciationService:
         """
 
         # Get benchmark appreciation rates for this decile
-        benchmark = RiskBenchmarkData.query.filter_by(
-            rent_decile=rent_decile,
-            geography=geography
-        ).first()
+        if benchmarks is not None:
+            benchmark = benchmarks.get((rent_decile, geography))
+        else:
+            benchmark = BenchmarkRegistry.get_benchmark(rent_decile, geography)
 
         if benchmark:
             # Use midpoint of benchmark range
@@ -195,7 +199,8 @@ class CapitalAppreciationService:
     def calculate_for_deal(
         deal_id: int,
         rent_decile: int,
-        holding_period: int = 10
+        holding_period: int = 10,
+        context: Optional[AnalysisContext] = None
     ) -> Dict:
         """
         Calculate complete capital appreciation analysis for a deal
@@ -204,15 +209,15 @@ class CapitalAppreciationService:
             deal_id: Deal ID to analyze
             rent_decile: Property's rent tier
             holding_period: Years to hold property
+            context: Optional AnalysisContext with the deal and benchmarks already loaded
 
         Returns:
             Complete appreciation analysis
         """
 
-        # Fetch deal from database
-        deal = DealModel.query.get(deal_id)
-        if not deal:
-            raise ValueError(f"Deal {deal_id} not found")
+        # Fetch deal (once per analysis)
+        context = AnalysisContext.resolve(deal_id, context)
+        deal = context.deal
 
         # Current property value
         current_value = deal.purchase_price or 0.0
@@ -221,7 +226,7 @@ class CapitalAppreciationService:
 
         # Property age for NOI growth
         current_year = datetime.now().year
-        year_built = deal.year_built or deal.construction_year or current_year - 30
+        year_built = deal.year_built or getattr(deal, 'construction_year', None) or current_year - 30
         property_age = current_year - year_built
 
         # Project property value
@@ -229,13 +234,14 @@ class CapitalAppreciationService:
             current_value=current_value,
             rent_decile=rent_decile,
             years=holding_period,
-            geography='US'
+            geography='US',
+            benchmarks=context.benchmarks
         )
 
         # Calculate current NOI (simplified)
         monthly_rent = deal.monthly_rent or 0.0
         vacancy_rate = deal.vacancy_rate or 0.05
-        num_units = deal.number_of_units or 1
+        num_units = getattr(deal, 'number_of_units', None) or 1
 
         annual_gross_income = monthly_rent * 12 * num_units
         annual_effective_income = annual_gross_income * (1 - vacancy_rate)
@@ -320,10 +326,7 @@ class CapitalAppreciationService:
         """
 
         # Get benchmark data
-        benchmark = RiskBenchmarkData.query.filter_by(
-            rent_decile=rent_decile,
-            geography=geography
-        ).first()
+        benchmark = BenchmarkRegistry.get_benchmark(rent_decile, geography)
 
         if not benchmark:
             return {
@@ -1,8 +1,11 @@
 """US Census Bureau API client service."""
 
 import requests
-from typing import Optional, Dict, List
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Tuple
+from datetime import datetime
+from app.cache import TTLCache, CacheBackend
+from app.clients import HTTPClient, get_http_client
 from app.models.census_models import (
     PopulationData,
     IncomeData,
@@ -11,38 +14,6 @@ from app.models.census_models import (
 )
 
 
-class CensusCache:
-    """Simple in-memory cache with TTL support."""
-
-    def __init__(self):
-        self._cache: Dict[str, tuple] = {}
-        self._max_size = 1000
-
-    def get(self, key: str) -> Optional[dict]:
-        """Retrieve cached value if not expired."""
-        if key in self._cache:
-            value, expiry = self._cache[key]
-            if datetime.now() < expiry:
-                return value
-            else:
-                del self._cache[key]
-        return None
-
-    def set(self, key: str, value: dict, ttl_seconds: int = 86400):
-        """Store value with TTL (default 24 hours)."""
-        if len(self._cache) >= self._max_size:
-            # Simple LRU: remove oldest entry
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
-
-        expiry = datetime.now() + timedelta(seconds=ttl_seconds)
-        self._cache[key] = (value, expiry)
-
-    def clear(self):
-        """Clear all cached entries."""
-        self._cache.clear()
-
-
 class CensusService:
     """Service for interacting with US Census Bureau API."""
 
@@ -88,8 +59,20 @@ class CensusService:
         'B23025_003E': 'labor_force',
     }
 
+    ZCTA_GEOGRAPHY = 'zip code tabulation area'
+
+    # Bulk fetching: uncached ZIPs are requested as comma lists of up to
+    # BULK_GROUP_SIZE ZCTAs, with groups sent in parallel. Past
+    # BULK_WILDCARD_THRESHOLD ZIPs a single 'zip code tabulation area:*'
+    # request (every ZCTA, ~34k rows) is cheaper than many groups.
+    BULK_GROUP_SIZE = 100
+    BULK_MAX_WORKERS = 4
+    BULK_WILDCARD_THRESHOLD = 3000
+
     def __init__(self, api_key: str = '', base_url: str = 'https://api.census.gov/data',
-                 api_year: str = '2022', cache_ttl: int = 86400):
+                 api_year: str = '2022', cache_ttl: int = 86400,
+                 cache_backend: Optional[CacheBackend] = None,
+                 http_client: Optional[HTTPClient] = None):
         """
         Initialize Census API client.
 
@@ -98,12 +81,15 @@ class CensusService:
             base_url: Base URL for Census API
             api_year: Year of ACS 5-Year data to use
             cache_ttl: Cache time-to-live in seconds (default 24 hours)
+            cache_backend: Shared cache backend (defaults to a private in-memory cache)
+            http_client: Pooled client for API calls (defaults to the shared 'census' client)
         """
         self.api_key = api_key
         self.base_url = base_url
         self.api_year = api_year
         self.cache_ttl = cache_ttl
-        self.cache = CensusCache()
+        self.cache = TTLCache('census', default_ttl=cache_ttl, backend=cache_backend, max_entries=1000)
+        self.http = http_client or get_http_client('census')
 
         # Construct full API endpoint URL
         self.endpoint = f"{base_url}/{api_year}/acs/acs5"
@@ -154,6 +140,84 @@ class CensusService:
             print(f"Error fetching Census data for ZIP {zipcode}: {str(e)}")
             return None
 
+    def get_demographics_batch(self, zipcodes: List[str]) -> Tuple[Dict[str, DemographicData], Dict[str, str]]:
+        """
+        Fetch demographic data for many ZIP codes with bulk Census requests.
+
+        Cached ZIPs are served from the cache; the rest are fetched in groups
+        (comma-separated ZCTA lists, or one all-ZCTA request for very large
+        batches) run in parallel, and every result is cached.
+
+        Args:
+            zipcodes: 5-digit ZIP codes (duplicates are ignored)
+
+        Returns:
+            Tuple of (ZIP -> DemographicData, ZIP -> error message)
+        """
+        results: Dict[str, DemographicData] = {}
+        errors: Dict[str, str] = {}
+        uncached: List[str] = []
+
+        for zipcode in dict.fromkeys(zipcodes):
+            if not zipcode or len(zipcode) != 5 or not zipcode.isdigit():
+                errors[zipcode] = f"Invalid ZIP code format: {zipcode}"
+                continue
+
+            cached_data = self.cache.get(f"census:{zipcode}:{self.api_year}")
+            if cached_data:
+                results[zipcode] = self._dict_to_demographic_data(cached_data)
+            else:
+                uncached.append(zipcode)
+
+        if not uncached:
+            return results, errors
+
+        all_vars = {**self.POPULATION_VARS, **self.INCOME_VARS,
+                   **self.HOUSING_VARS, **self.EMPLOYMENT_VARS}
+        variables = list(all_vars.keys())
+
+        if len(uncached) >= self.BULK_WILDCARD_THRESHOLD:
+            groups = [['*']]
+        else:
+            groups = [
+                uncached[i:i + self.BULK_GROUP_SIZE]
+                for i in range(0, len(uncached), self.BULK_GROUP_SIZE)
+            ]
+
+        def fetch_group(group: List[str]) -> Optional[List[dict]]:
+            return self._fetch_census_rows(variables, f"{self.ZCTA_GEOGRAPHY}:{','.join(group)}")
+
+        workers = min(self.BULK_MAX_WORKERS, len(groups))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='census') as executor:
+            group_rows = list(executor.map(fetch_group, groups))
+
+        wanted = set(uncached)
+        failed = set()
+        for group, rows in zip(groups, group_rows):
+            if rows is None:
+                failed.update(wanted if group == ['*'] else group)
+                continue
+
+            for raw_data in rows:
+                zipcode = raw_data.get(self.ZCTA_GEOGRAPHY)
+                if zipcode not in wanted:
+                    continue
+                try:
+                    demographic_data = self._parse_demographic_data(zipcode, raw_data, all_vars)
+                except Exception as e:
+                    print(f"Error parsing Census data for ZIP {zipcode}: {str(e)}")
+                    continue
+                self.cache.set(f"census:{zipcode}:{self.api_year}",
+                               self._demographic_data_to_dict(demographic_data), self.cache_ttl)
+                results[zipcode] = demographic_data
+
+        for zipcode in uncached:
+            if zipcode in results:
+                continue
+            errors[zipcode] = 'Census API request failed' if zipcode in failed else 'No data available'
+
+        return results, errors
+
     def _fetch_census_data(self, variables: List[str], geography: str) -> Optional[dict]:
         """
         Make request to Census API.
@@ -165,6 +229,20 @@ class CensusService:
         Returns:
             Raw Census API response data
         """
+        rows = self._fetch_census_rows(variables, geography)
+        return rows[0] if rows else None
+
+    def _fetch_census_rows(self, variables: List[str], geography: str) -> Optional[List[dict]]:
+        """
+        Make request to Census API and return every result row.
+
+        Args:
+            variables: List of Census variable codes
+            geography: Geographic filter (e.g., "zip code tabulation area:95814,95819")
+
+        Returns:
+            List of row dictionaries (empty if no rows), or None if the request failed
+        """
         # Build query parameters
         params = {
             'get': ','.join(variables),
@@ -175,20 +253,19 @@ class CensusService:
             params['key'] = self.api_key
 
         try:
-            response = requests.get(self.endpoint, params=params, timeout=10)
+            response = self.http.get(self.endpoint, params=params)
             response.raise_for_status()
 
             data = response.json()
 
-            # Census API returns [[headers], [values]]
+            # Census API returns [[headers], [values], ...]
             if len(data) < 2:
-                return None
+                return []
 
             headers = data[0]
-            values = data[1]
 
-            # Convert to dictionary
-            return dict(zip(headers, values))
+            # Convert to dictionaries
+            return [dict(zip(headers, values)) for values in data[1:]]
 
         except requests.exceptions.RequestException as e:
             print(f"Census API request failed: {str(e)}")
@@ -12,9 +12,12 @@ Combines all assessment services:
 - Arbitrage opportunity
 """
 
-from typing import Dict, Optional
+import heapq
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
-from app.database import db, DealModel
+from flask import current_app
+from app.database import DealModel
 from app.services.hedonic_model_service import HedonicModelService
 from app.services.rent_tier_service import RentTierService
 from app.services.yield_calculation_service import YieldCalculationService
@@ -22,6 +25,9 @@ from app.services.capital_appreciation_service import CapitalAppreciationService
 from app.services.total_return_service import TotalReturnService
 from app.services.risk_assessment_service import RiskAssessmentService
 from app.services.arbitrage_limits_service import ArbitrageLimitsService
+from app.services.analysis_cache import AnalysisResultCache
+from app.services.analysis_context import AnalysisContext
+from app.services.monte_carlo_service import MonteCarloSimulationService
 
 
 class DealMemoService:
@@ -29,6 +35,10 @@ class DealMemoService:
     Service for generating comprehensive deal analysis memos
     """
 
+    COMPARE_MAX_DEALS = 500
+    COMPARE_MAX_WORKERS = 4
+    RANKING_TOP_K = 10
+
     @staticmethod
     def generate_memo(
         deal_id: int,
@@ -52,6 +62,33 @@ class DealMemoService:
         if not deal:
             raise ValueError(f"Deal {deal_id} not found")
 
+        # Repeat views of an unchanged deal are served from the result cache
+        return AnalysisResultCache.get_or_compute(
+            'memo',
+            deal,
+            {'holding_period': holding_period, 'geography': geography},
+            lambda: DealMemoService._build_memo(deal, holding_period, geography)
+        )
+
+    @staticmethod
+    def _build_memo(deal: DealModel, holding_period: int, geography: str) -> Dict:
+        """
+        Compute the memo sections for an already loaded deal
+
+        Benchmarks and decile thresholds are read once into an AnalysisContext
+        and passed to every section.
+
+        Args:
+            deal: DealModel to analyze
+            holding_period: Investment horizon in years
+            geography: Geographic market
+
+        Returns:
+            Comprehensive analysis dictionary with all components
+        """
+        deal_id = deal.id
+        context = AnalysisContext(deal)
+
         memo = {
             'deal_id': deal_id,
             'generated_at': datetime.utcnow().isoformat(),
@@ -116,7 +153,9 @@ class DealMemoService:
         classification = RentTierService.classify_property(
             predicted_rent=predicted_rent,
             geography='national',
-            bedrooms=deal.bedrooms
+            bedrooms=deal.bedrooms,
+            year=context.year,
+            thresholds=context.thresholds
         )
         memo['tier_classification'] = classification
 
@@ -135,7 +174,8 @@ class DealMemoService:
             rent_decile=rent_decile,
             num_units=getattr(deal, 'number_of_units', None) or 1,
             property_value=property_value,
-            annual_rent=annual_rent
+            annual_rent=annual_rent,
+            benchmarks=context.benchmarks
         )
 
         net_yield = YieldCalculationService.calculate_net_yield(
@@ -146,7 +186,8 @@ class DealMemoService:
         yield_benchmark = YieldCalculationService.compare_to_benchmark(
             calculated_net_yield=net_yield,
             rent_decile=rent_decile,
-            geography=geography
+            geography=geography,
+            benchmarks=context.benchmarks
         )
 
         memo['yield_analysis'] = {
@@ -163,7 +204,8 @@ class DealMemoService:
             current_value=property_value,
             rent_decile=rent_decile,
             years=holding_period,
-            geography=geography
+            geography=geography,
+            benchmarks=context.benchmarks
         )
 
         memo['appreciation_projection'] = appreciation
@@ -188,7 +230,8 @@ class DealMemoService:
         return_benchmark = TotalReturnService.compare_to_benchmark(
             total_return_unlevered=total_return_unlevered,
             rent_decile=rent_decile,
-            geography=geography
+            geography=geography,
+            benchmarks=context.benchmarks
         )
 
         memo['total_return'] = {
@@ -208,7 +251,8 @@ class DealMemoService:
 
         systematic_risk = RiskAssessmentService.calculate_systematic_risk(
             rent_decile=rent_decile,
-            geography=geography
+            geography=geography,
+            benchmarks=context.benchmarks
         )
 
         regulatory_risk = RiskAssessmentService.calculate_regulatory_risk(
@@ -300,6 +344,22 @@ class DealMemoService:
             ltv=ltv
         )
 
+        # Distribution of outcomes under correlated shocks
+        sensitivity['simulation'] = MonteCarloSimulationService.simulate_returns(
+            base_net_yield=net_yield,
+            base_appreciation=appreciation['annualized_appreciation_rate'],
+            cost_of_debt=cost_of_debt,
+            ltv=ltv,
+            gross_yield=gross_yield,
+            vacancy_rate=deal.vacancy_rate or 0.05,
+            capital_gain_range=(
+                appreciation['appreciation_range_min'],
+                appreciation['appreciation_range_max']
+            ),
+            paths=current_app.config.get('MONTE_CARLO_PATHS', MonteCarloSimulationService.DEFAULT_PATHS),
+            seed=current_app.config.get('MONTE_CARLO_SEED', MonteCarloSimulationService.DEFAULT_SEED)
+        )
+
         memo['sensitivity_analysis'] = sensitivity
 
         # SECTION 11: Executive Summary
@@ -559,23 +619,28 @@ class DealMemoService:
         }
 
     @staticmethod
-    def generate_comparison_memo(deal_ids: list, holding_period: int = 10) -> Dict:
+    def generate_comparison_memo(
+        deal_ids: list,
+        holding_period: int = 10,
+        top_k: Optional[int] = None
+    ) -> Dict:
         """
         Generate side-by-side comparison of multiple deals
 
+        Memos are generated in parallel (see iter_comparison_memos).
+
         Args:
-            deal_ids: List of deal IDs to compare
+            deal_ids: List of deal IDs to compare (2 to COMPARE_MAX_DEALS)
             holding_period: Investment horizon
+            top_k: Deals per ranking (default RANKING_TOP_K)
 
         Returns:
             Comparison analysis with rankings
-        """
-
-        if len(deal_ids) < 2:
-            raise ValueError("Need at least 2 deals to compare")
 
-        if len(deal_ids) > 5:
-            raise ValueError("Maximum 5 deals for comparison")
+        Raises:
+            ValueError: If fewer than 2 or more than COMPARE_MAX_DEALS deals are given
+        """
+        deal_ids = DealMemoService.validate_comparison_ids(deal_ids)
 
         comparison = {
             'generated_at': datetime.utcnow().isoformat(),
@@ -586,64 +651,151 @@ class DealMemoService:
         }
 
         # Generate memo for each deal
-        for deal_id in deal_ids:
-            try:
-                memo = DealMemoService.generate_memo(deal_id, holding_period)
-                comparison['deals'][deal_id] = memo
-            except Exception as e:
-                comparison['deals'][deal_id] = {'error': str(e)}
+        rankings = DealRankings(deal_ids, top_k or DealMemoService.RANKING_TOP_K)
+        for deal_id, memo in DealMemoService.iter_comparison_memos(deal_ids, holding_period):
+            comparison['deals'][deal_id] = memo
+            rankings.add(deal_id, memo)
 
         # Rank deals by various metrics
-        comparison['rankings'] = DealMemoService._rank_deals(comparison['deals'])
+        comparison['rankings'] = rankings.to_dict(memos=comparison['deals'])
+        comparison['summary'] = rankings.summary()
 
         return comparison
 
     @staticmethod
-    def _rank_deals(deals: Dict) -> Dict:
-        """Rank deals by key metrics"""
-
-        rankings = {
-            'by_total_return': [],
-            'by_risk_adjusted_return': [],
-            'by_arbitrage_opportunity': [],
-            'by_overall_rating': []
-        }
+    def validate_comparison_ids(deal_ids: list) -> List[int]:
+        """
+        Check a comparison request and drop repeated IDs (first occurrence kept)
 
-        valid_deals = {
-            deal_id: memo
-            for deal_id, memo in deals.items()
-            if 'error' not in memo
-        }
+        Raises:
+            ValueError: If fewer than 2 or more than COMPARE_MAX_DEALS distinct deals are given
+        """
+        deal_ids = list(dict.fromkeys(deal_ids))
 
-        # Rank by total return (levered)
-        rankings['by_total_return'] = sorted(
-            valid_deals.items(),
-            key=lambda x: x[1]['total_return']['total_return_levered'],
-            reverse=True
-        )
+        if len(deal_ids) < 2:
+            raise ValueError("Need at least 2 deals to compare")
 
-        # Rank by risk-adjusted return (Sharpe-like: return / risk)
-        rankings['by_risk_adjusted_return'] = sorted(
-            valid_deals.items(),
-            key=lambda x: (
-                x[1]['total_return']['total_return_unlevered'] /
-                max(x[1]['risk_assessment']['composite_risk']['composite_risk_score'], 1)
-            ),
-            reverse=True
-        )
+        max_deals = current_app.config.get('COMPARE_MAX_DEALS', DealMemoService.COMPARE_MAX_DEALS)
+        if len(deal_ids) > max_deals:
+            raise ValueError(f"Maximum {max_deals} deals for comparison")
 
-        # Rank by arbitrage opportunity
-        rankings['by_arbitrage_opportunity'] = sorted(
-            valid_deals.items(),
-            key=lambda x: x[1]['arbitrage_opportunity']['overall_opportunity']['arbitrage_opportunity_score'],
-            reverse=True
-        )
+        return deal_ids
 
-        # Rank by overall rating
-        rankings['by_overall_rating'] = sorted(
-            valid_deals.items(),
-            key=lambda x: x[1]['investment_recommendation']['rating_score'],
-            reverse=True
+    @staticmethod
+    def iter_comparison_memos(deal_ids: List[int], holding_period: int = 10) -> Iterator[Tuple[int, Dict]]:
+        """
+        Generate memos on a worker pool, yielding each as it completes
+
+        Each worker runs in its own app context (and so its own database
+        session). A deal whose memo fails yields {'error': message}.
+
+        Args:
+            deal_ids: Deal IDs to generate memos for
+            holding_period: Investment horizon
+
+        Yields:
+            (deal_id, memo) in completion order
+        """
+        if not deal_ids:
+            return
+
+        app = current_app._get_current_object()
+        workers = min(
+            app.config.get('COMPARE_MAX_WORKERS', DealMemoService.COMPARE_MAX_WORKERS),
+            len(deal_ids)
         )
 
+        def generate(deal_id):
+            with app.app_context():
+                try:
+                    return deal_id, DealMemoService.generate_memo(deal_id, holding_period)
+                except Exception as e:
+                    return deal_id, {'error': str(e)}
+
+        executor = ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix='memo')
+        try:
+            futures = [executor.submit(generate, deal_id) for deal_id in deal_ids]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # A consumer that stops early (e.g. a disconnected stream) skips queued deals
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+class DealRankings:
+    """
+    Running top-k rankings of compared deals
+
+    Memos are added as they complete; each metric keeps a k-sized min-heap,
+    so ranking n deals costs O(n log k) and never holds more than k entries
+    per metric. Ties keep the order the deals were requested in.
+    """
+
+    # Ranking name -> metric (higher is better)
+    METRICS = {
+        'by_total_return': lambda memo: memo['total_return']['total_return_levered'],
+        # Sharpe-like: return / risk
+        'by_risk_adjusted_return': lambda memo: (
+            memo['total_return']['total_return_unlevered'] /
+            max(memo['risk_assessment']['composite_risk']['composite_risk_score'], 1)
+        ),
+        'by_arbitrage_opportunity': lambda memo: (
+            memo['arbitrage_opportunity']['overall_opportunity']['arbitrage_opportunity_score']
+        ),
+        'by_overall_rating': lambda memo: memo['investment_recommendation']['rating_score']
+    }
+
+    def __init__(self, deal_ids: List[int], top_k: int = DealMemoService.RANKING_TOP_K):
+        if top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        self.top_k = top_k
+        self.requested = len(deal_ids)
+        self.completed = 0
+        self.failed = 0
+        self._positions = {deal_id: position for position, deal_id in enumerate(deal_ids)}
+        self._heaps = {name: [] for name in DealRankings.METRICS}
+
+    def add(self, deal_id: int, memo: Dict):
+        """Rank one completed memo (memos with an 'error' are counted, not ranked)."""
+        if 'error' in memo:
+            self.failed += 1
+            return
+        self.completed += 1
+
+        position = self._positions.get(deal_id, len(self._positions))
+        for name, metric in DealRankings.METRICS.items():
+            # Smallest entry is evicted first: lowest value, then latest-requested deal
+            entry = (metric(memo), -position, deal_id)
+            heap = self._heaps[name]
+            if len(heap) < self.top_k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+    def to_dict(self, memos: Optional[Dict] = None) -> Dict:
+        """
+        Rankings, best first
+
+        Args:
+            memos: deal_id -> memo; when given, entries are [deal_id, memo]
+                pairs, otherwise [deal_id, metric value]
+
+        Returns:
+            Ranking name -> list of entries
+        """
+        rankings = {}
+        for name, heap in self._heaps.items():
+            ranked = sorted(heap, reverse=True)
+            if memos is not None:
+                rankings[name] = [[deal_id, memos[deal_id]] for _, _, deal_id in ranked]
+            else:
+                rankings[name] = [[deal_id, value] for value, _, deal_id in ranked]
         return rankings
+
+    def summary(self) -> Dict:
+        return {
+            'deals_requested': self.requested,
+            'deals_completed': self.completed,
+            'deals_failed': self.failed,
+            'top_k': self.top_k
+        }
@@ -2,8 +2,12 @@
 Deal service layer for CRUD operations
 Handles business logic for deal management
 """
-from typing import List, Optional, Dict
-from datetime import datetime
+import base64
+import json
+from typing import List, Optional, Dict, Iterator
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import and_, func, or_
 from app.database import db, DealModel, RiskAssessmentModel
 from app.models.deal_models import Deal
 from app.services.hedonic_model_service import HedonicModelService
@@ -13,11 +17,75 @@ from app.services.capital_appreciation_service import CapitalAppreciationService
 from app.services.total_return_service import TotalReturnService
 from app.services.risk_assessment_service import RiskAssessmentService
 from app.services.arbitrage_limits_service import ArbitrageLimitsService
+from app.services.benchmark_registry import BenchmarkRegistry
+from app.services.analysis_cache import AnalysisResultCache
+
+
+def _camel_case(name: str) -> str:
+    head, *rest = name.split('_')
+    return head + ''.join(part.title() for part in rest)
+
+
+# API field name (as in DealModel.to_dict) -> column, for projected listings
+DEAL_FIELD_COLUMNS = {
+    _camel_case(column.name): getattr(DealModel, column.name)
+    for column in DealModel.__table__.columns
+    if column.name != 'latest_assessment_id'  # bookkeeping, not part of the deal
+}
+
+DEAL_STATUSES = ('potential', 'ongoing', 'completed', 'rejected')
+
+
+def _project_row(fields: List[str], values) -> dict:
+    """Build an API dict from selected column values."""
+    return {
+        field: value.isoformat() if isinstance(value, datetime) else value
+        for field, value in zip(fields, values)
+    }
+
+
+class DealPage:
+    """
+    One page of the deal list, streamed from the database
+
+    Iterating yields one dict per deal containing only the requested fields.
+    Rows are fetched in chunks of DealService.PAGE_FETCH_SIZE, so memory use
+    does not grow with the page size. After iteration, next_cursor is set if
+    more deals follow.
+    """
+
+    def __init__(self, query, limit: int, fields: List[str]):
+        self.query = query
+        self.limit = limit
+        self.fields = fields
+        self.next_cursor: Optional[str] = None
+
+    def __iter__(self) -> Iterator[dict]:
+        # Selected columns: the requested fields, then updated_at and id for the cursor
+        field_count = len(self.fields)
+        count = 0
+        last = None
+
+        for row in self.query.yield_per(DealService.PAGE_FETCH_SIZE):
+            if count == self.limit:
+                self.next_cursor = DealService.encode_cursor(*last)
+                return
+
+            yield _project_row(self.fields, row[:field_count])
+            last = row[field_count:]
+            count += 1
 
 
 class DealService:
     """Service class for managing real estate deals"""
 
+    # Deal list pages: largest page a client may request, and rows fetched per round trip
+    MAX_PAGE_SIZE = 5000
+    PAGE_FETCH_SIZE = 500
+
+    # Maximum number of ids per IN (...) clause when bulk-loading deals
+    BATCH_CHUNK_SIZE = 500
+
     @staticmethod
     def create_deal(deal_data: dict) -> Deal:
         """
@@ -66,32 +134,132 @@ class DealService:
         return Deal.from_dict(deal_model.to_dict())
 
     @staticmethod
-    def get_all_deals(status: Optional[str] = None, limit: int = 100) -> List[Deal]:
+    def list_deals(status: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None,
+                   fields: Optional[List[str]] = None) -> DealPage:
         """
-        Get all deals, optionally filtered by status
+        Get a page of deals, most recently updated first, using keyset pagination
+
+        Pages are ordered by (updated_at, id) descending and continue from the
+        cursor of the previous page, so each page is an index range scan
+        regardless of how deep the client has paged.
 
         Args:
-            status: Optional status filter ('potential', 'ongoing', 'completed', 'rejected')
-            limit: Maximum number of deals to return (default 100)
+            status: Optional status filter
+            limit: Maximum number of deals in the page (1 to MAX_PAGE_SIZE)
+            cursor: next_cursor of the previous page (optional)
+            fields: API field names to include (default all, e.g. ['id', 'dealName', 'status'])
 
         Returns:
-            List of Deal objects
+            DealPage to iterate; only the requested columns are loaded
+
+        Raises:
+            ValueError: If the cursor is malformed or a field is unknown
         """
-        query = DealModel.query
+        limit = max(1, min(limit, DealService.MAX_PAGE_SIZE))
+
+        fields = DealService._resolve_fields(fields)
+        columns = [DEAL_FIELD_COLUMNS[field] for field in fields]
+        query = db.session.query(*columns, DealModel.updated_at, DealModel.id)
 
-        # Apply status filter if provided
         if status:
             query = query.filter(DealModel.status == status)
 
-        # Order by updated_at descending (most recent first)
-        query = query.order_by(DealModel.updated_at.desc())
+        if cursor:
+            updated_at, deal_id = DealService.decode_cursor(cursor)
+            query = query.filter(or_(
+                DealModel.updated_at < updated_at,
+                and_(DealModel.updated_at == updated_at, DealModel.id < deal_id)
+            ))
+
+        # One extra row tells whether another page follows
+        query = query.order_by(DealModel.updated_at.desc(), DealModel.id.desc()).limit(limit + 1)
+        return DealPage(query, limit, fields)
 
-        # Limit results
-        query = query.limit(limit)
+    @staticmethod
+    def get_deal_board(per_status: int = 25, fields: Optional[List[str]] = None) -> Dict[str, dict]:
+        """
+        Get the deal board: per-status counts and the most recently updated deals of each status
+
+        Runs a single query ranking deals within each status with
+        ROW_NUMBER() OVER (PARTITION BY status ORDER BY updated_at DESC, id DESC)
+        and counting them with COUNT(*) OVER (PARTITION BY status), keeping the
+        top per_status rows of each group.
+
+        Args:
+            per_status: Deals returned per status (1 to MAX_PAGE_SIZE)
+            fields: API field names to include (default all)
+
+        Returns:
+            Dictionary of status -> {'count', 'deals', 'nextCursor'}; every
+            standard status is present. nextCursor continues the column with
+            list_deals(status=..., cursor=...) and is None when it is complete.
+
+        Raises:
+            ValueError: If a field is unknown
+        """
+        per_status = max(1, min(per_status, DealService.MAX_PAGE_SIZE))
+        fields = DealService._resolve_fields(fields)
+
+        ordering = (DealModel.updated_at.desc(), DealModel.id.desc())
+        ranked = db.session.query(
+            *[DEAL_FIELD_COLUMNS[field].label(f'field_{index}') for index, field in enumerate(fields)],
+            DealModel.status.label('board_status'),
+            DealModel.updated_at.label('board_updated_at'),
+            DealModel.id.label('board_id'),
+            func.row_number().over(partition_by=DealModel.status, order_by=ordering).label('board_rank'),
+            func.count().over(partition_by=DealModel.status).label('board_count')
+        ).subquery()
+
+        # One extra row per status tells whether that column has more deals
+        rows = db.session.query(ranked).filter(
+            ranked.c.board_rank <= per_status + 1
+        ).order_by(ranked.c.board_status, ranked.c.board_rank).all()
+
+        board = {status: {'count': 0, 'deals': [], 'nextCursor': None} for status in DEAL_STATUSES}
+        field_count = len(fields)
+        for row in rows:
+            column = board.setdefault(row.board_status, {'count': 0, 'deals': [], 'nextCursor': None})
+            column['count'] = row.board_count
+            if row.board_rank <= per_status:
+                column['deals'].append(_project_row(fields, row[:field_count]))
+                last_position = (row.board_updated_at, row.board_id)
+            else:
+                column['nextCursor'] = DealService.encode_cursor(*last_position)
+
+        return board
+
+    @staticmethod
+    def _resolve_fields(fields: Optional[List[str]]) -> List[str]:
+        """Validate requested API fields (default all), dropping duplicates."""
+        fields = list(dict.fromkeys(fields)) if fields else list(DEAL_FIELD_COLUMNS)
+        unknown = [field for field in fields if field not in DEAL_FIELD_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown deal fields: {', '.join(unknown)}")
+        return fields
+
+    @staticmethod
+    def encode_cursor(updated_at: datetime, deal_id: int) -> str:
+        """Encode a page position as an opaque URL-safe cursor."""
+        payload = json.dumps([updated_at.isoformat(), deal_id], separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple:
+        """
+        Decode a cursor from encode_cursor()
+
+        Returns:
+            Tuple of (updated_at, deal_id)
 
-        # Execute query and convert to Deal objects
-        deal_models = query.all()
-        return [Deal.from_dict(dm.to_dict()) for dm in deal_models]
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            updated_at, deal_id = json.loads(payload)
+            return datetime.fromisoformat(updated_at), int(deal_id)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
 
     @staticmethod
     def update_deal(deal_id: int, deal_data: dict) -> Optional[Deal]:
@@ -115,6 +283,9 @@ class DealService:
         # Commit changes
         db.session.commit()
 
+        # Cached memos/assessments for this deal are now stale
+        AnalysisResultCache.invalidate_deal(deal_id)
+
         # Return updated Deal
         return Deal.from_dict(deal_model.to_dict())
 
@@ -135,31 +306,28 @@ class DealService:
 
         db.session.delete(deal_model)
         db.session.commit()
+
+        AnalysisResultCache.invalidate_deal(deal_id)
         return True
 
     @staticmethod
-    def get_deals_by_status_grouped() -> dict:
+    def get_deals_by_status_grouped(per_status: int = 100) -> dict:
         """
         Get deals grouped by status
 
+        Args:
+            per_status: Most recently updated deals returned per status (default 100)
+
         Returns:
-            Dictionary with status as keys and lists of deals as values
+            Dictionary with status as keys and lists of deal dicts as values;
+            deals with a non-standard status are listed under 'potential'
         """
-        deals = DealService.get_all_deals()
+        board = DealService.get_deal_board(per_status=per_status)
 
-        grouped = {
-            'potential': [],
-            'ongoing': [],
-            'completed': [],
-            'rejected': []
-        }
-
-        for deal in deals:
-            status = deal.status or 'potential'
-            if status in grouped:
-                grouped[status].append(deal)
-            else:
-                grouped['potential'].append(deal)
+        grouped = {status: board[status]['deals'] for status in DEAL_STATUSES}
+        for status, column in board.items():
+            if status not in grouped:
+                grouped['potential'].extend(column['deals'])
 
         return grouped
 
@@ -216,6 +384,142 @@ class DealService:
         if not deal:
             raise ValueError(f"Deal {deal_id} not found")
 
+        assessment = AnalysisResultCache.get_or_compute(
+            'assessment',
+            deal,
+            {'holding_period': holding_period, 'geography': geography},
+            lambda: DealService._run_risk_pipeline(deal, holding_period, geography)
+        )
+
+        # Step 10: Save to database if requested
+        if save_to_db:
+            assessment_id = DealService._save_risk_assessment(deal_id, assessment)
+            assessment['assessment_id'] = assessment_id
+
+        return assessment
+
+    @staticmethod
+    def calculate_risk_assessments(
+        deal_ids: Optional[List[int]] = None,
+        status: Optional[str] = None,
+        holding_period: int = 10,
+        geography: str = 'US',
+        save_to_db: bool = True
+    ) -> Dict:
+        """
+        Run the risk assessment pipeline over many deals at once
+
+        Deals are loaded with a single query, benchmark rows and decile
+        thresholds come from BenchmarkRegistry, the pipeline runs in memory,
+        and all RiskAssessmentModel rows are written in one transaction.
+
+        Args:
+            deal_ids: Deals to analyze (optional)
+            status: Status filter used when deal_ids is not given (optional);
+                with neither, every deal is scored
+            holding_period: Investment horizon in years
+            geography: Geographic market for benchmarks
+            save_to_db: Whether to save results to database
+
+        Returns:
+            Dictionary with:
+                - assessments: List of assessment dictionaries
+                - errors: List of {'deal_id', 'error'} for deals that could not be scored
+                - total / succeeded / failed counts
+        """
+
+        # Step 1: Bulk-load deals
+        query = DealModel.query
+        if deal_ids is not None:
+            deal_ids = list(dict.fromkeys(deal_ids))
+            deals = []
+            for start in range(0, len(deal_ids), DealService.BATCH_CHUNK_SIZE):
+                chunk = deal_ids[start:start + DealService.BATCH_CHUNK_SIZE]
+                deals.extend(query.filter(DealModel.id.in_(chunk)).all())
+        else:
+            if status:
+                query = query.filter(DealModel.status == status)
+            deals = query.order_by(DealModel.id).all()
+
+        errors = []
+        if deal_ids is not None:
+            found_ids = {deal.id for deal in deals}
+            errors.extend(
+                {'deal_id': deal_id, 'error': f"Deal {deal_id} not found"}
+                for deal_id in deal_ids if deal_id not in found_ids
+            )
+            # Preserve the caller's ordering
+            position = {deal_id: i for i, deal_id in enumerate(deal_ids)}
+            deals.sort(key=lambda d: position[d.id])
+
+        # Preload lookup tables shared by every deal in the batch
+        # Cost components always use the US benchmark rows
+        benchmarks = BenchmarkRegistry.get_benchmarks([geography, 'US'])
+        thresholds = RentTierService.get_decile_thresholds_bulk(
+            geography='national',
+            bedrooms_values=[deal.bedrooms for deal in deals],
+            year=datetime.now().year
+        )
+
+        # Steps 2-9 for every deal
+        assessments = []
+        for deal in deals:
+            try:
+                assessments.append(AnalysisResultCache.get_or_compute(
+                    'assessment',
+                    deal,
+                    {'holding_period': holding_period, 'geography': geography},
+                    lambda: DealService._run_risk_pipeline(
+                        deal,
+                        holding_period,
+                        geography,
+                        benchmarks=benchmarks,
+                        thresholds=thresholds
+                    )
+                ))
+            except ValueError as e:
+                errors.append({'deal_id': deal.id, 'error': str(e)})
+
+        # Step 10: Save all results in one transaction
+        if save_to_db and assessments:
+            assessment_ids = DealService._save_risk_assessments(assessments)
+            for assessment in assessments:
+                assessment['assessment_id'] = assessment_ids[assessment['deal_id']]
+
+        return {
+            'assessments': assessments,
+            'errors': errors,
+            'total': len(assessments) + len(errors),
+            'succeeded': len(assessments),
+            'failed': len(errors)
+        }
+
+    @staticmethod
+    def _run_risk_pipeline(
+        deal: DealModel,
+        holding_period: int,
+        geography: str,
+        benchmarks: Optional[Dict] = None,
+        thresholds: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Run pipeline steps 2-9 for an already loaded deal
+
+        Args:
+            deal: DealModel to analyze
+            holding_period: Investment horizon in years
+            geography: Geographic market for benchmarks
+            benchmarks: Optional preloaded benchmark rows keyed by (rent_decile, geography)
+            thresholds: Optional preloaded decile thresholds keyed by (geography, bedrooms, year)
+
+        Returns:
+            Complete risk assessment dictionary (not persisted)
+
+        Raises:
+            ValueError: If the deal is missing required fields
+        """
+        deal_id = deal.id
+
         # Validate required fields
         required_fields = ['square_footage', 'bedrooms', 'bathrooms']
         missing_fields = [f for f in required_fields if not getattr(deal, f, None)]
@@ -239,7 +543,8 @@ class DealService:
         classification = RentTierService.classify_property(
             predicted_rent=predicted_rent,
             geography='national',
-            bedrooms=deal.bedrooms
+            bedrooms=deal.bedrooms,
+            thresholds=thresholds
         )
 
         rent_decile = classification['national_decile']
@@ -257,7 +562,8 @@ class DealService:
             rent_decile=rent_decile,
             num_units=getattr(deal, 'number_of_units', None) or 1,
             property_value=property_value,
-            annual_rent=annual_rent
+            annual_rent=annual_rent,
+            benchmarks=benchmarks
         )
 
         net_yield = YieldCalculationService.calculate_net_yield(
@@ -270,7 +576,8 @@ class DealService:
             current_value=property_value,
             rent_decile=rent_decile,
             years=holding_period,
-            geography=geography
+            geography=geography,
+            benchmarks=benchmarks
         )
 
         # Step 6: Calculate total returns
@@ -300,7 +607,8 @@ class DealService:
 
         systematic_risk = RiskAssessmentService.calculate_systematic_risk(
             rent_decile=rent_decile,
-            geography=geography
+            geography=geography,
+            benchmarks=benchmarks
         )
 
         regulatory_risk = RiskAssessmentService.calculate_regulatory_risk(
@@ -358,13 +666,15 @@ class DealService:
         yield_benchmark = YieldCalculationService.compare_to_benchmark(
             calculated_net_yield=net_yield,
             rent_decile=rent_decile,
-            geography=geography
+            geography=geography,
+            benchmarks=benchmarks
         )
 
         return_benchmark = TotalReturnService.compare_to_benchmark(
             total_return_unlevered=total_return_unlevered,
             rent_decile=rent_decile,
-            geography=geography
+            geography=geography,
+            benchmarks=benchmarks
         )
 
         # Compile complete assessment
@@ -455,11 +765,6 @@ class DealService:
             }
         }
 
-        # Step 10: Save to database if requested
-        if save_to_db:
-            assessment_id = DealService._save_risk_assessment(deal_id, assessment)
-            assessment['assessment_id'] = assessment_id
-
         return assessment
 
     @staticmethod
@@ -467,6 +772,10 @@ class DealService:
         """
         Save risk assessment to database
 
+        Each calculation is appended as a new row so the deal keeps an
+        assessment history; the deal's latest_assessment_id pointer is moved
+        to it. Old rows are removed by compact_risk_assessments, not here.
+
         Args:
             deal_id: Deal ID
             assessment: Assessment data dictionary
@@ -474,90 +783,94 @@ class DealService:
         Returns:
             ID of created RiskAssessmentModel
         """
+        return DealService._save_risk_assessments([{**assessment, 'deal_id': deal_id}])[deal_id]
 
-        # Create or update risk assessment record
-        existing = RiskAssessmentModel.query.filter_by(deal_id=deal_id).first()
+    @staticmethod
+    def _build_risk_assessment_model(deal_id: int, assessment: Dict) -> RiskAssessmentModel:
+        """
+        Build an unsaved RiskAssessmentModel from an assessment dictionary
 
-        if existing:
-            # Update existing record
-            try:
-                # Log database path for debugging
-                import os
-                db_path = db.engine.url.database
-                print(f"DEBUG: Database path: {db_path}")
-                print(f"DEBUG: File exists: {os.path.exists(db_path) if db_path else 'N/A'}")
-                print(f"DEBUG: File writable: {os.access(db_path, os.W_OK) if db_path else 'N/A'}")
-
-                for key, value in assessment.items():
-                    if key not in ['deal_id', 'calculated_at', 'components', 'assessment_id']:
-                        if hasattr(existing, key):
-                            setattr(existing, key, value)
-                existing.updated_at = datetime.utcnow()
-
-                # Try to flush before commit
-                db.session.flush()
-                db.session.commit()
-                return existing.id
-            except Exception as e:
-                db.session.rollback()
-                print(f"DEBUG: Database error: {str(e)}")
-                print(f"DEBUG: Error type: {type(e)}")
-                raise Exception(f"Failed to update risk assessment: {str(e)}")
-        else:
-            # Create new record
-            risk_assessment = RiskAssessmentModel(
-                deal_id=deal_id,
-                predicted_fundamental_rent=assessment['predicted_fundamental_rent'],
-                rent_decile_national=assessment['rent_decile_national'],
-                rent_decile_regional=assessment['rent_decile_regional'],
-                rent_tier_label=assessment['rent_tier_label'],
-                gross_yield=assessment['gross_yield'],
-                net_yield=assessment['net_yield'],
-                maintenance_cost_pct=assessment['maintenance_cost_pct'],
-                property_tax_pct=assessment['property_tax_pct'],
-                turnover_cost_pct=assessment['turnover_cost_pct'],
-                default_cost_pct=assessment['default_cost_pct'],
-                management_cost_pct=assessment['management_cost_pct'],
-                projected_price_yr1=assessment['projected_price_yr1'],
-                projected_price_yr5=assessment['projected_price_yr5'],
-                projected_price_yr10=assessment['projected_price_yr10'],
-                capital_gain_yield_annual=assessment['capital_gain_yield_annual'],
-                total_return_unlevered=assessment['total_return_unlevered'],
-                total_return_levered=assessment['total_return_levered'],
-                systematic_risk_score=assessment['systematic_risk_score'],
-                cash_flow_cyclicality=assessment['cash_flow_cyclicality'],
-                regulatory_risk_score=assessment['regulatory_risk_score'],
-                idiosyncratic_risk_score=assessment['idiosyncratic_risk_score'],
-                composite_risk_level=assessment['composite_risk_level'],
-                composite_risk_score=assessment['composite_risk_score'],
-                renter_constraint_score=assessment['renter_constraint_score'],
-                institutional_constraint_score=assessment['institutional_constraint_score'],
-                medium_landlord_constraint_score=assessment['medium_landlord_fit_score'],
-                arbitrage_opportunity_score=assessment['arbitrage_opportunity_score'],
-                benchmark_net_yield_min=assessment.get('benchmark_net_yield_min'),
-                benchmark_net_yield_max=assessment.get('benchmark_net_yield_max'),
-                benchmark_capital_gain_min=assessment.get('benchmark_capital_gain_min'),
-                benchmark_capital_gain_max=assessment.get('benchmark_capital_gain_max'),
-                benchmark_total_return_min=assessment.get('benchmark_total_return_min'),
-                benchmark_total_return_max=assessment.get('benchmark_total_return_max'),
-                vs_benchmark_yield=assessment['vs_benchmark_yield'],
-                vs_benchmark_return=assessment['vs_benchmark_return']
-            )
+        Args:
+            deal_id: Deal ID
+            assessment: Assessment data dictionary
 
-            try:
-                db.session.add(risk_assessment)
-                db.session.commit()
+        Returns:
+            New RiskAssessmentModel (not added to the session)
+        """
+        return RiskAssessmentModel(
+            deal_id=deal_id,
+            predicted_fundamental_rent=assessment['predicted_fundamental_rent'],
+            rent_decile_national=assessment['rent_decile_national'],
+            rent_decile_regional=assessment['rent_decile_regional'],
+            rent_tier_label=assessment['rent_tier_label'],
+            gross_yield=assessment['gross_yield'],
+            net_yield=assessment['net_yield'],
+            maintenance_cost_pct=assessment['maintenance_cost_pct'],
+            property_tax_pct=assessment['property_tax_pct'],
+            turnover_cost_pct=assessment['turnover_cost_pct'],
+            default_cost_pct=assessment['default_cost_pct'],
+            management_cost_pct=assessment['management_cost_pct'],
+            projected_price_yr1=assessment['projected_price_yr1'],
+            projected_price_yr5=assessment['projected_price_yr5'],
+            projected_price_yr10=assessment['projected_price_yr10'],
+            capital_gain_yield_annual=assessment['capital_gain_yield_annual'],
+            total_return_unlevered=assessment['total_return_unlevered'],
+            total_return_levered=assessment['total_return_levered'],
+            systematic_risk_score=assessment['systematic_risk_score'],
+            cash_flow_cyclicality=assessment['cash_flow_cyclicality'],
+            regulatory_risk_score=assessment['regulatory_risk_score'],
+            idiosyncratic_risk_score=assessment['idiosyncratic_risk_score'],
+            composite_risk_level=assessment['composite_risk_level'],
+            composite_risk_score=assessment['composite_risk_score'],
+            renter_constraint_score=assessment['renter_constraint_score'],
+            institutional_constraint_score=assessment['institutional_constraint_score'],
+            medium_landlord_constraint_score=assessment['medium_landlord_fit_score'],
+            arbitrage_opportunity_score=assessment['arbitrage_opportunity_score'],
+            benchmark_net_yield_min=assessment.get('benchmark_net_yield_min'),
+            benchmark_net_yield_max=assessment.get('benchmark_net_yield_max'),
+            benchmark_capital_gain_min=assessment.get('benchmark_capital_gain_min'),
+            benchmark_capital_gain_max=assessment.get('benchmark_capital_gain_max'),
+            benchmark_total_return_min=assessment.get('benchmark_total_return_min'),
+            benchmark_total_return_max=assessment.get('benchmark_total_return_max'),
+            vs_benchmark_yield=assessment['vs_benchmark_yield'],
+            vs_benchmark_return=assessment['vs_benchmark_return']
+        )
+
+    @staticmethod
+    def _save_risk_assessments(assessments: List[Dict]) -> Dict[int, int]:
+        """
+        Save many risk assessments to the database in one transaction
 
-                # Update deal with risk_assessment_id
-                deal = DealModel.query.get(deal_id)
-                if deal:
-                    deal.risk_assessment_id = risk_assessment.id
-                    db.session.commit()
+        New rows are inserted together and each deal's latest_assessment_id
+        is pointed at its new row. The retention policy is not applied here,
+        so saves stay cheap; compact_risk_assessments applies it.
 
-                return risk_assessment.id
-            except Exception as e:
-                db.session.rollback()
-                raise Exception(f"Failed to create risk assessment: {str(e)}")
+        Args:
+            assessments: Assessment data dictionaries (each with 'deal_id')
+
+        Returns:
+            Dictionary mapping deal ID to RiskAssessmentModel ID
+        """
+        records = {
+            assessment['deal_id']: DealService._build_risk_assessment_model(assessment['deal_id'], assessment)
+            for assessment in assessments
+        }
+
+        try:
+            db.session.add_all(records.values())
+            db.session.flush()
+
+            for deal_id, record in records.items():
+                DealModel.query.filter_by(id=deal_id).update(
+                    {'latest_assessment_id': record.id}, synchronize_session=False
+                )
+
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            raise Exception(f"Failed to save risk assessments: {str(e)}")
+
+        return {deal_id: record.id for deal_id, record in records.items()}
 
     @staticmethod
     def get_risk_assessment(deal_id: int) -> Optional[Dict]:
@@ -571,13 +884,115 @@ class DealService:
             Risk assessment dictionary if found, None otherwise
         """
 
-        assessment = RiskAssessmentModel.query.filter_by(deal_id=deal_id).first()
+        latest_id = db.session.query(DealModel.latest_assessment_id).filter_by(id=deal_id).scalar()
+
+        if latest_id is not None:
+            assessment = RiskAssessmentModel.query.get(latest_id)
+        else:
+            # Rows saved before the pointer existed: newest by id, served by ix_risk_assessments_deal_id
+            assessment = RiskAssessmentModel.query.filter_by(deal_id=deal_id).order_by(
+                RiskAssessmentModel.id.desc()
+            ).first()
 
         if not assessment:
             return None
 
         return assessment.to_dict()
 
+    @staticmethod
+    def get_risk_assessment_history(deal_id: int, limit: int = 20, cursor: Optional[str] = None) -> Dict:
+        """
+        Get a deal's risk assessments, newest first, one page at a time
+
+        Args:
+            deal_id: Deal ID
+            limit: Maximum number of assessments in the page (1 to 100)
+            cursor: nextCursor of the previous page (optional)
+
+        Returns:
+            Dictionary with 'assessments' and 'nextCursor' (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        limit = max(1, min(limit, 100))
+
+        query = RiskAssessmentModel.query.filter_by(deal_id=deal_id)
+        if cursor:
+            try:
+                before_id = int(cursor)
+            except ValueError:
+                raise ValueError(f"Invalid cursor: {cursor}")
+            query = query.filter(RiskAssessmentModel.id < before_id)
+
+        rows = query.order_by(RiskAssessmentModel.id.desc()).limit(limit + 1).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        return {
+            'assessments': [row.to_dict() for row in rows],
+            'nextCursor': str(rows[-1].id) if has_more else None
+        }
+
+    @staticmethod
+    def compact_risk_assessments(deal_ids: Optional[List[int]] = None) -> int:
+        """
+        Delete old risk assessments according to the retention policy
+
+        For each deal the RISK_ASSESSMENT_KEEP_LATEST most recent assessments
+        are always kept; older ones are deleted once they are more than
+        RISK_ASSESSMENT_RETENTION_DAYS old. Saving assessments never deletes
+        history; run this periodically over every deal (deal_ids=None), e.g.
+        via scripts/compact_risk_assessments.py.
+
+        Args:
+            deal_ids: Deals to compact (default all)
+
+        Returns:
+            Number of assessments deleted
+        """
+        deleted = DealService._apply_assessment_retention(deal_ids)
+        db.session.commit()
+        return deleted
+
+    @staticmethod
+    def _apply_assessment_retention(deal_ids: Optional[List[int]]) -> int:
+        """Delete assessments outside the retention policy (caller commits)."""
+        keep_latest = current_app.config.get('RISK_ASSESSMENT_KEEP_LATEST', 10)
+        retention_days = current_app.config.get('RISK_ASSESSMENT_RETENTION_DAYS', 90)
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+
+        chunks = (
+            [deal_ids[i:i + DealService.BATCH_CHUNK_SIZE] for i in range(0, len(deal_ids), DealService.BATCH_CHUNK_SIZE)]
+            if deal_ids is not None else [None]
+        )
+
+        deleted = 0
+        for chunk in chunks:
+            ranked = db.session.query(
+                RiskAssessmentModel.id.label('assessment_id'),
+                RiskAssessmentModel.created_at.label('created_at'),
+                func.row_number().over(
+                    partition_by=RiskAssessmentModel.deal_id,
+                    order_by=RiskAssessmentModel.id.desc()
+                ).label('recency')
+            )
+            if chunk is not None:
+                ranked = ranked.filter(RiskAssessmentModel.deal_id.in_(chunk))
+            ranked = ranked.subquery()
+
+            stale_ids = [row[0] for row in db.session.query(ranked.c.assessment_id).filter(
+                ranked.c.recency > keep_latest,
+                ranked.c.created_at < cutoff
+            )]
+
+            for i in range(0, len(stale_ids), DealService.BATCH_CHUNK_SIZE):
+                deleted += RiskAssessmentModel.query.filter(
+                    RiskAssessmentModel.id.in_(stale_ids[i:i + DealService.BATCH_CHUNK_SIZE])
+                ).delete(synchronize_session=False)
+
+        return deleted
+
     @staticmethod
     def get_deal_with_risk_assessment(deal_id: int) -> Optional[Dict]:
         """
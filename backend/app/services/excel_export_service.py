@@ -8,8 +8,10 @@ from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.chart import BarChart, Reference
 from openpyxl.utils import get_column_letter
+from openpyxl.formatting.rule import ColorScaleRule
 from app.services.deal_service import DealService
 from app.services.deal_memo_service import DealMemoService
+from app.services.total_return_service import TotalReturnService
 
 
 class ExcelExportService:
@@ -25,6 +27,10 @@ class ExcelExportService:
     TITLE_FONT = Font(bold=True, size=14)
     BOLD_FONT = Font(bold=True)
 
+    # Sensitivity heat map axes (percentage points)
+    HEATMAP_YIELD_DELTAS = [-1.0, -0.5, 0.0, 0.5, 1.0]
+    HEATMAP_APPRECIATION_DELTAS = [-2.0, -1.0, 0.0, 1.0, 2.0]
+
     BORDER_THIN = Border(
         left=Side(style='thin'),
         right=Side(style='thin'),
@@ -762,6 +768,113 @@ class ExcelExportService:
         ws.merge_cells(f'A{row}:F{row}')
         ws[f'A{row}'].alignment = Alignment(wrap_text=True)
 
+        # Monte Carlo simulation
+        simulation = sensitivity.get('simulation')
+        if simulation:
+            row += 3
+            ws[f'A{row}'] = f"Monte Carlo Simulation ({simulation['paths']:,} paths, seed {simulation['seed']})"
+            ws[f'A{row}'].font = Font(bold=True, size=14)
+            ws.merge_cells(f'A{row}:F{row}')
+            row += 2
+
+            headers = ['Percentile', 'Unlevered Return', 'Levered Return']
+            for col, header in enumerate(headers, start=1):
+                ws.cell(row=row, column=col, value=header)
+                ws.cell(row=row, column=col).font = ExcelExportService.HEADER_FONT
+                ws.cell(row=row, column=col).fill = ExcelExportService.HEADER_FILL
+            row += 1
+
+            unlevered = simulation['total_return_unlevered']
+            levered = simulation['total_return_levered']
+            for key, levered_value in levered['percentiles'].items():
+                ws.cell(row=row, column=1, value=key.upper())
+                ws.cell(row=row, column=2, value=f"{unlevered['percentiles'][key]:.2f}%")
+                ws.cell(row=row, column=3, value=f"{levered_value:.2f}%")
+                if key == 'p50':
+                    for col in range(1, 4):
+                        ws.cell(row=row, column=col).fill = ExcelExportService.SUBHEADER_FILL
+                row += 1
+
+            ws.cell(row=row, column=1, value='Mean')
+            ws.cell(row=row, column=2, value=f"{unlevered['mean']:.2f}%")
+            ws.cell(row=row, column=3, value=f"{levered['mean']:.2f}%")
+            row += 1
+            ws.cell(row=row, column=1, value='Std. Deviation')
+            ws.cell(row=row, column=2, value=f"{unlevered['std']:.2f}%")
+            ws.cell(row=row, column=3, value=f"{levered['std']:.2f}%")
+            row += 2
+
+            value_at_risk = simulation['value_at_risk']
+            risk_rows = [
+                ("Probability of Loss", f"{simulation['probability_of_loss'] * 100:.1f}%"),
+                (f"VaR ({value_at_risk['confidence'] * 100:.0f}%, levered return)",
+                 f"{value_at_risk['total_return_levered']:.2f}%"),
+                ("Expected Shortfall (levered return)", f"{value_at_risk['expected_shortfall']:.2f}%")
+            ]
+            for label, value in risk_rows:
+                ws.cell(row=row, column=1, value=label).font = ExcelExportService.BOLD_FONT
+                ws.cell(row=row, column=2, value=value)
+                row += 1
+
+            row += 1
+            ws[f'A{row}'] = simulation.get('interpretation', '')
+            ws.merge_cells(f'A{row}:F{row}')
+            ws[f'A{row}'].alignment = Alignment(wrap_text=True)
+
+        # Levered return heat map: net yield change x appreciation change
+        total_return = memo.get('total_return') or {}
+        if total_return.get('ltv') is not None and total_return['ltv'] < 1.0:
+            grid = TotalReturnService.evaluate_grid(
+                base_net_yield=total_return['net_yield'],
+                base_capital_gain_yield=total_return['capital_gain_yield'],
+                base_cost_of_debt=total_return['cost_of_debt'],
+                base_ltv=total_return['ltv'],
+                axes={
+                    'yieldDelta': ExcelExportService.HEATMAP_YIELD_DELTAS,
+                    'appreciationDelta': ExcelExportService.HEATMAP_APPRECIATION_DELTAS
+                }
+            )
+
+            row += 3
+            ws[f'A{row}'] = "Levered Return Heat Map"
+            ws[f'A{row}'].font = Font(bold=True, size=14)
+            ws.merge_cells(f'A{row}:F{row}')
+            row += 1
+            ws[f'A{row}'] = (
+                f"Rows: net yield change; columns: appreciation change "
+                f"(cost of debt {total_return['cost_of_debt']:.2f}%, LTV {total_return['ltv'] * 100:.0f}%)"
+            )
+            row += 2
+
+            appreciation_values = grid['axes'][1]['values']
+            ws.cell(row=row, column=1, value='Yield / Appreciation')
+            ws.cell(row=row, column=1).font = ExcelExportService.HEADER_FONT
+            ws.cell(row=row, column=1).fill = ExcelExportService.HEADER_FILL
+            for col, delta in enumerate(appreciation_values, start=2):
+                ws.cell(row=row, column=col, value=f"{delta:+.1f}%")
+                ws.cell(row=row, column=col).font = ExcelExportService.HEADER_FONT
+                ws.cell(row=row, column=col).fill = ExcelExportService.HEADER_FILL
+            row += 1
+
+            first_row = row
+            for yield_delta, cells in zip(grid['axes'][0]['values'], grid['total_return_levered']):
+                ws.cell(row=row, column=1, value=f"{yield_delta:+.1f}%").font = ExcelExportService.BOLD_FONT
+                for col, value in enumerate(cells, start=2):
+                    # Single cost of debt / LTV: cells are [[value]]
+                    cell = ws.cell(row=row, column=col, value=value[0][0] / 100)
+                    cell.number_format = '0.00%'
+                row += 1
+
+            last_col = get_column_letter(1 + len(appreciation_values))
+            ws.conditional_formatting.add(
+                f'B{first_row}:{last_col}{row - 1}',
+                ColorScaleRule(
+                    start_type='min', start_color='F8696B',
+                    mid_type='percentile', mid_value=50, mid_color='FFEB84',
+                    end_type='max', end_color='63BE7B'
+                )
+            )
+
         # Column widths
         for col in ['A', 'B', 'C', 'D', 'E', 'F']:
             ws.column_dimensions[col].width = 20
@@ -0,0 +1,279 @@
+"""
+FRED Series Store
+Local columnar store for FRED observations with incremental refresh
+
+Each series is one SQLite row holding two packed arrays: observation dates
+(as proleptic Gregorian ordinals) and values. A series is downloaded in full
+once; afterwards refreshes request only observations from the last stored
+date onward (FRED's ``observation_start``) and append them. A full re-sync
+runs weekly to pick up revisions to older observations.
+
+Latest-value, nearest-date (YoY) and range queries run in memory with
+binary search over the date array.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+# (date 'YYYY-MM-DD', value) pairs in chronological order
+Observations = List[Tuple[str, float]]
+
+
+class _Series:
+    """In-memory copy of one stored series."""
+
+    __slots__ = ('dates', 'values', 'refreshed_at', 'synced_at')
+
+    def __init__(self, dates: array, values: array, refreshed_at: float, synced_at: float):
+        self.dates = dates
+        self.values = values
+        self.refreshed_at = refreshed_at
+        self.synced_at = synced_at
+
+
+class FREDSeriesStore:
+    """
+    Shared on-disk store of FRED series
+
+    Safe to use from several threads and from several processes opening the
+    same file (WAL mode); a worker that finds a fresh row written by another
+    worker loads it instead of calling the API.
+    """
+
+    FULL_RESYNC_INTERVAL = 7 * 24 * 3600  # seconds
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS fred_series (
+            series_id TEXT PRIMARY KEY,
+            dates BLOB NOT NULL,
+            observation_values BLOB NOT NULL,
+            last_date TEXT,
+            refreshed_at REAL NOT NULL,
+            synced_at REAL NOT NULL
+        )
+    """
+
+    def __init__(self, path: str, refresh_interval: int = 3600):
+        """
+        Args:
+            path: SQLite file path (created if missing)
+            refresh_interval: Seconds before a series is checked for new observations
+        """
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self._local = threading.local()
+        self._series: Dict[str, _Series] = {}
+        self._lock = threading.Lock()
+        self._series_locks: Dict[str, threading.Lock] = {}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection().execute(self.SCHEMA)
+
+    def refresh(self, series_id: str, download: Callable[[str, Optional[str]], Observations]) -> bool:
+        """
+        Make sure a series is stored and no older than refresh_interval
+
+        Args:
+            series_id: FRED series ID
+            download: Function (series_id, observation_start or None) returning
+                chronological observations; raises on request failure
+
+        Returns:
+            True if the series has data (possibly stale if the download failed)
+        """
+        with self._series_lock(series_id):
+            series = self._load(series_id)
+            now = time.time()
+            if series is not None and now - series.refreshed_at < self.refresh_interval:
+                return True
+
+            full_sync = series is None or now - series.synced_at >= self.FULL_RESYNC_INTERVAL
+            start = None
+            if not full_sync and series.dates:
+                start = date.fromordinal(series.dates[-1]).isoformat()
+
+            try:
+                observations = download(series_id, start)
+            except Exception as e:
+                print(f"FRED series store refresh failed for {series_id}: {str(e)}")
+                return series is not None and len(series.dates) > 0
+
+            if full_sync or start is None:
+                dates, values = array('i'), array('d')
+                synced_at = now
+            else:
+                dates, values = series.dates, series.values
+                synced_at = series.synced_at
+
+            dates, values = self._merge(dates, values, observations)
+            self._save(series_id, _Series(dates, values, now, synced_at))
+            return len(dates) > 0
+
+    def latest(self, series_id: str) -> Optional[Tuple[str, float]]:
+        """Most recent (date, value) pair, or None if the series is empty."""
+        series = self._get(series_id)
+        if series is None or not series.dates:
+            return None
+        return date.fromordinal(series.dates[-1]).isoformat(), series.values[-1]
+
+    def value_nearest(self, series_id: str, target: date) -> Optional[float]:
+        """
+        Value of the observation closest to a date (earlier one on ties)
+
+        Args:
+            series_id: FRED series ID
+            target: Date to match
+
+        Returns:
+            Observation value or None if the series is empty
+        """
+        series = self._get(series_id)
+        if series is None or not series.dates:
+            return None
+
+        ordinal = target.toordinal()
+        index = bisect_left(series.dates, ordinal)
+        candidates = [i for i in (index - 1, index) if 0 <= i < len(series.dates)]
+        best = min(candidates, key=lambda i: (abs(series.dates[i] - ordinal), i))
+        return series.values[best]
+
+    def yoy_change(self, series_id: str) -> Optional[float]:
+        """
+        Year-over-year percentage change of the latest observation
+
+        Returns:
+            Percent change versus the observation nearest to 365 days earlier,
+            or None if not enough data
+        """
+        series = self._get(series_id)
+        if series is None or len(series.dates) < 2:
+            return None
+
+        current_value = series.values[-1]
+        target = date.fromordinal(series.dates[-1]) - timedelta(days=365)
+        year_ago_value = self.value_nearest(series_id, target)
+
+        if year_ago_value is None or year_ago_value == 0:
+            return None
+
+        yoy_change = ((current_value - year_ago_value) / year_ago_value) * 100
+        return round(yoy_change, 2)
+
+    def get_range(self, series_id: str, start_date: Optional[str] = None,
+                  end_date: Optional[str] = None, limit: Optional[int] = None) -> Observations:
+        """
+        Observations within [start_date, end_date], newest `limit` of them, in chronological order
+
+        Args:
+            series_id: FRED series ID
+            start_date: Inclusive start (YYYY-MM-DD, optional)
+            end_date: Inclusive end (YYYY-MM-DD, optional)
+            limit: Maximum number of (most recent) observations
+
+        Returns:
+            List of (date, value) pairs
+        """
+        series = self._get(series_id)
+        if series is None:
+            return []
+
+        lo = bisect_left(series.dates, date.fromisoformat(start_date).toordinal()) if start_date else 0
+        hi = bisect_right(series.dates, date.fromisoformat(end_date).toordinal()) if end_date else len(series.dates)
+        if limit is not None:
+            lo = max(lo, hi - limit)
+
+        return [
+            (date.fromordinal(series.dates[i]).isoformat(), series.values[i])
+            for i in range(lo, hi)
+        ]
+
+    @staticmethod
+    def _merge(dates: array, values: array, observations: Observations) -> Tuple[array, array]:
+        """Append observations, replacing any that overlap the stored tail."""
+        if not observations:
+            return dates, values
+
+        first_new = date.fromisoformat(observations[0][0]).toordinal()
+        keep = bisect_left(dates, first_new)
+        merged_dates = dates[:keep]
+        merged_values = values[:keep]
+
+        for observation_date, value in observations:
+            ordinal = date.fromisoformat(observation_date).toordinal()
+            if merged_dates and ordinal <= merged_dates[-1]:
+                continue
+            merged_dates.append(ordinal)
+            merged_values.append(value)
+
+        return merged_dates, merged_values
+
+    def _get(self, series_id: str) -> Optional[_Series]:
+        """In-memory series, loading it from disk on first use."""
+        series = self._series.get(series_id)
+        if series is not None:
+            return series
+        return self._load(series_id)
+
+    def _load(self, series_id: str) -> Optional[_Series]:
+        """Read a series row if it is newer than the in-memory copy."""
+        row = self._connection().execute(
+            "SELECT dates, observation_values, refreshed_at, synced_at FROM fred_series WHERE series_id = ?",
+            (series_id,)
+        ).fetchone()
+
+        with self._lock:
+            cached = self._series.get(series_id)
+            if row is None:
+                return cached
+            if cached is not None and cached.refreshed_at >= row[2]:
+                return cached
+
+            dates = array('i')
+            dates.frombytes(row[0])
+            values = array('d')
+            values.frombytes(row[1])
+            series = _Series(dates, values, row[2], row[3])
+            self._series[series_id] = series
+            return series
+
+    def _save(self, series_id: str, series: _Series):
+        last_date = date.fromordinal(series.dates[-1]).isoformat() if series.dates else None
+        self._connection().execute(
+            """
+            INSERT INTO fred_series (series_id, dates, observation_values, last_date, refreshed_at, synced_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (series_id) DO UPDATE SET
+                dates = excluded.dates,
+                observation_values = excluded.observation_values,
+                last_date = excluded.last_date,
+                refreshed_at = excluded.refreshed_at,
+                synced_at = excluded.synced_at
+            """,
+            (series_id, series.dates.tobytes(), series.values.tobytes(),
+             last_date, series.refreshed_at, series.synced_at)
+        )
+        with self._lock:
+            self._series[series_id] = series
+
+    def _series_lock(self, series_id: str) -> threading.Lock:
+        with self._lock:
+            return self._series_locks.setdefault(series_id, threading.Lock())
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, reopening it after a fork."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
@@ -1,8 +1,12 @@
 """Federal Reserve Economic Data (FRED) API client service."""
 
 import requests
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime, timedelta
+from app.cache import TTLCache, CacheBackend
+from app.clients import HTTPClient, get_http_client
+from app.services.fred_series_store import FREDSeriesStore
 from app.models.fred_models import (
     InterestRateData,
     InflationData,
@@ -13,36 +17,8 @@ from app.models.fred_models import (
 )
 
 
-class FREDCache:
-    """Simple in-memory cache with TTL support."""
-
-    def __init__(self):
-        self._cache: dict[str, tuple] = {}
-        self._max_size = 500
-
-    def get(self, key: str) -> Optional[dict]:
-        """Retrieve cached value if not expired."""
-        if key in self._cache:
-            value, expiry = self._cache[key]
-            if datetime.now() < expiry:
-                return value
-            else:
-                del self._cache[key]
-        return None
-
-    def set(self, key: str, value: dict, ttl_seconds: int = 3600):
-        """Store value with TTL (default 1 hour)."""
-        if len(self._cache) >= self._max_size:
-            # Simple LRU: remove oldest entry
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
-
-        expiry = datetime.now() + timedelta(seconds=ttl_seconds)
-        self._cache[key] = (value, expiry)
-
-    def clear(self):
-        """Clear all cached entries."""
-        self._cache.clear()
+# Marks a series whose request failed (as opposed to FRED reporting no value)
+_FETCH_FAILED = object()
 
 
 class FREDService:
@@ -77,8 +53,45 @@ class FREDService:
         'UMCSENT': 'consumer_sentiment',
     }
 
+    # Series behind each snapshot section; 'yoy' series also need ~400 observations
+    SNAPSHOT_SECTIONS = {
+        'interest_rates': {
+            'cache_key': 'fred:interest_rates',
+            'model': InterestRateData,
+            'build': '_build_interest_rates',
+            'latest': ['FEDFUNDS', 'DPRIME', 'MORTGAGE30US', 'MORTGAGE15US', 'DGS10', 'DGS2'],
+        },
+        'inflation': {
+            'cache_key': 'fred:inflation',
+            'model': InflationData,
+            'build': '_build_inflation',
+            'latest': ['CPIAUCSL', 'CPILFESL', 'PCEPI'],
+            'yoy': ['CPIAUCSL'],
+        },
+        'housing_market': {
+            'cache_key': 'fred:housing_market',
+            'model': HousingMarketData,
+            'build': '_build_housing_market',
+            'latest': ['HOUST', 'PERMIT', 'EXHOSLUSM495S', 'HSN1F', 'CSUSHPISA'],
+        },
+        'economic_indicators': {
+            'cache_key': 'fred:economic_indicators',
+            'model': EconomicIndicators,
+            'build': '_build_economic_indicators',
+            'latest': ['GDPC1', 'UNRATE', 'CIVPART', 'UMCSENT'],
+            'yoy': ['GDPC1'],
+        },
+    }
+
+    # Concurrent series requests per snapshot (the HTTP client's rate limit still applies)
+    SNAPSHOT_MAX_WORKERS = 8
+    # TTL for snapshots/sections with missing series, so they are retried soon
+    PARTIAL_SNAPSHOT_TTL = 60
+
     def __init__(self, api_key: str = '', base_url: str = 'https://api.stlouisfed.org/fred',
-                 cache_ttl: int = 3600):
+                 cache_ttl: int = 3600, cache_backend: Optional[CacheBackend] = None,
+                 http_client: Optional[HTTPClient] = None,
+                 series_store: Optional[FREDSeriesStore] = None):
         """
         Initialize FRED API client.
 
@@ -86,6 +99,10 @@ class FREDService:
             api_key: FRED API key (required)
             base_url: Base URL for FRED API
             cache_ttl: Cache time-to-live in seconds (default 1 hour)
+            cache_backend: Shared cache backend (defaults to a private in-memory cache)
+            http_client: Pooled client for API calls (defaults to the shared 'fred' client)
+            series_store: Local time-series store (optional); when set, series are
+                downloaded once, refreshed incrementally and queried locally
         """
         if not api_key:
             raise ValueError(
@@ -96,12 +113,18 @@ class FREDService:
         self.api_key = api_key
         self.base_url = base_url
         self.cache_ttl = cache_ttl
-        self.cache = FREDCache()
+        self.cache = TTLCache('fred', default_ttl=cache_ttl, backend=cache_backend, max_entries=1000)
+        self.http = http_client or get_http_client('fred')
+        self.series_store = series_store
 
     def get_macroeconomic_snapshot(self) -> Optional[MacroeconomicData]:
         """
         Fetch complete macroeconomic snapshot with all indicators.
 
+        All series for sections not already cached are fetched concurrently.
+        A series that fails is reported in missing_series with a None value;
+        the snapshot is only None if every series failed.
+
         Returns:
             MacroeconomicData object or None if error
         """
@@ -112,37 +135,29 @@ class FREDService:
             return self._dict_to_macro_data(cached_data)
 
         try:
-            # Fetch interest rates
-            interest_rates = self.get_interest_rates()
-            if not interest_rates:
-                return None
-
-            # Fetch inflation data
-            inflation = self.get_inflation_data()
-            if not inflation:
-                return None
-
-            # Fetch housing market data
-            housing_market = self.get_housing_market_data()
-            if not housing_market:
-                return None
-
-            # Fetch economic indicators
-            economic_indicators = self.get_economic_indicators()
-            if not economic_indicators:
+            sections, missing = self._fetch_sections(list(self.SNAPSHOT_SECTIONS))
+
+            total_series = len({
+                series_id
+                for plan in self.SNAPSHOT_SECTIONS.values()
+                for series_id in plan['latest']
+            })
+            if len(missing) >= total_series:
                 return None
 
             # Create complete snapshot
             macro_data = MacroeconomicData(
-                interest_rates=interest_rates,
-                inflation=inflation,
-                housing_market=housing_market,
-                economic_indicators=economic_indicators,
-                last_updated=datetime.now().isoformat()
+                interest_rates=sections['interest_rates'],
+                inflation=sections['inflation'],
+                housing_market=sections['housing_market'],
+                economic_indicators=sections['economic_indicators'],
+                last_updated=datetime.now().isoformat(),
+                missing_series=missing
             )
 
-            # Cache the result
-            self.cache.set(cache_key, self._macro_data_to_dict(macro_data), self.cache_ttl)
+            # Cache the result (briefly if incomplete, so missing series are retried soon)
+            ttl = min(self.cache_ttl, self.PARTIAL_SNAPSHOT_TTL) if missing else self.cache_ttl
+            self.cache.set(cache_key, self._macro_data_to_dict(macro_data), ttl)
 
             return macro_data
 
@@ -152,131 +167,251 @@ class FREDService:
 
     def get_interest_rates(self) -> Optional[InterestRateData]:
         """Fetch current interest rates."""
-        # Check cache
-        cache_key = "fred:interest_rates"
-        cached_data = self.cache.get(cache_key)
-        if cached_data:
-            return InterestRateData(**cached_data)
+        return self._get_section('interest_rates')
 
-        try:
-            rates = {}
-            rate_series = ['FEDFUNDS', 'DPRIME', 'MORTGAGE30US', 'MORTGAGE15US', 'DGS10', 'DGS2']
-
-            for series_id in rate_series:
-                value = self._get_latest_observation(series_id)
-                field_name = self.SERIES_IDS[series_id]
-                rates[field_name] = value
-
-            interest_rates = InterestRateData(**rates)
+    def get_inflation_data(self) -> Optional[InflationData]:
+        """Fetch inflation metrics with YoY calculations."""
+        return self._get_section('inflation')
 
-            # Cache the result
-            self.cache.set(cache_key, asdict(interest_rates), self.cache_ttl)
+    def get_housing_market_data(self) -> Optional[HousingMarketData]:
+        """Fetch housing market indicators."""
+        return self._get_section('housing_market')
 
-            return interest_rates
+    def get_economic_indicators(self) -> Optional[EconomicIndicators]:
+        """Fetch broad economic indicators."""
+        return self._get_section('economic_indicators')
 
+    def _get_section(self, section: str):
+        """Fetch one snapshot section (its series run concurrently)."""
+        try:
+            sections, _ = self._fetch_sections([section])
+            return sections[section]
         except Exception as e:
-            print(f"Error fetching interest rates: {str(e)}")
+            print(f"Error fetching {section.replace('_', ' ')}: {str(e)}")
             return None
 
-    def get_inflation_data(self) -> Optional[InflationData]:
-        """Fetch inflation metrics with YoY calculations."""
-        # Check cache
-        cache_key = "fred:inflation"
-        cached_data = self.cache.get(cache_key)
-        if cached_data:
-            return InflationData(**cached_data)
+    def _fetch_sections(self, section_names: List[str]) -> Tuple[Dict[str, object], List[str]]:
+        """
+        Build snapshot sections, fetching every uncached series in one parallel batch.
 
-        try:
-            # Fetch current CPI values
-            cpi_all = self._get_latest_observation('CPIAUCSL')
-            core_cpi = self._get_latest_observation('CPILFESL')
-            pce = self._get_latest_observation('PCEPI')
-
-            # Calculate YoY change for CPI
-            cpi_yoy = self._calculate_yoy_change('CPIAUCSL')
-
-            inflation_data = InflationData(
-                cpi_all_items=cpi_all,
-                core_cpi=core_cpi,
-                pce_inflation=pce,
-                cpi_yoy_change=cpi_yoy
-            )
+        Args:
+            section_names: Keys of SNAPSHOT_SECTIONS
 
-            # Cache the result
-            self.cache.set(cache_key, asdict(inflation_data), self.cache_ttl)
+        Returns:
+            Tuple of (section name -> dataclass, sorted list of failed series IDs)
+        """
+        sections = {}
+        pending = []
+        for name in section_names:
+            plan = self.SNAPSHOT_SECTIONS[name]
+            cached_data = self.cache.get(plan['cache_key'])
+            if cached_data:
+                sections[name] = plan['model'](**cached_data)
+            else:
+                pending.append(name)
 
-            return inflation_data
+        if not pending:
+            return sections, []
 
-        except Exception as e:
-            print(f"Error fetching inflation data: {str(e)}")
-            return None
+        # Plan: dedupe series across sections; a series needed for YoY is fetched
+        # once as history and its latest value taken from the same response
+        history_ids = {s for name in pending for s in self.SNAPSHOT_SECTIONS[name].get('yoy', [])}
+        latest_ids = {s for name in pending for s in self.SNAPSHOT_SECTIONS[name]['latest']} - history_ids
 
-    def get_housing_market_data(self) -> Optional[HousingMarketData]:
-        """Fetch housing market indicators."""
-        # Check cache
-        cache_key = "fred:housing_market"
-        cached_data = self.cache.get(cache_key)
-        if cached_data:
-            return HousingMarketData(**cached_data)
+        latest, yoy, failed = self._fetch_series_concurrently(latest_ids, history_ids)
 
-        try:
-            housing_starts = self._get_latest_observation('HOUST')
-            building_permits = self._get_latest_observation('PERMIT')
-            existing_sales = self._get_latest_observation('EXHOSLUSM495S')
-            new_sales = self._get_latest_observation('HSN1F')
-            case_shiller = self._get_latest_observation('CSUSHPISA')
-
-            # Convert to int where appropriate
-            housing_data = HousingMarketData(
-                housing_starts=int(housing_starts) if housing_starts is not None else None,
-                building_permits=int(building_permits) if building_permits is not None else None,
-                home_sales_existing=existing_sales,
-                home_sales_new=int(new_sales) if new_sales is not None else None,
-                case_shiller_index=case_shiller
-            )
+        missing = set()
+        for name in pending:
+            plan = self.SNAPSHOT_SECTIONS[name]
+            section_missing = [s for s in plan['latest'] + plan.get('yoy', []) if s in failed]
+            missing.update(section_missing)
 
-            # Cache the result
-            self.cache.set(cache_key, asdict(housing_data), self.cache_ttl)
+            model = getattr(self, plan['build'])(latest, yoy)
+            sections[name] = model
 
-            return housing_data
+            # Incomplete sections are cached briefly so failed series are retried soon
+            ttl = min(self.cache_ttl, self.PARTIAL_SNAPSHOT_TTL) if section_missing else self.cache_ttl
+            self.cache.set(plan['cache_key'], asdict(model), ttl)
 
-        except Exception as e:
-            print(f"Error fetching housing market data: {str(e)}")
-            return None
+        return sections, sorted(missing)
 
-    def get_economic_indicators(self) -> Optional[EconomicIndicators]:
-        """Fetch broad economic indicators."""
-        # Check cache
-        cache_key = "fred:economic_indicators"
-        cached_data = self.cache.get(cache_key)
-        if cached_data:
-            return EconomicIndicators(**cached_data)
+    def _fetch_series_concurrently(self, latest_ids, history_ids) -> Tuple[Dict, Dict, set]:
+        """
+        Fetch latest observations and YoY histories on a bounded thread pool.
 
-        try:
-            gdp = self._get_latest_observation('GDPC1')
-            unemployment = self._get_latest_observation('UNRATE')
-            labor_force = self._get_latest_observation('CIVPART')
-            sentiment = self._get_latest_observation('UMCSENT')
-
-            # Calculate GDP growth rate (YoY)
-            gdp_growth = self._calculate_yoy_change('GDPC1')
-
-            indicators = EconomicIndicators(
-                gdp_real=gdp,
-                gdp_growth_rate=gdp_growth,
-                unemployment_rate=unemployment,
-                labor_force_participation=labor_force,
-                consumer_sentiment=sentiment
-            )
+        Args:
+            latest_ids: Series needing only the most recent observation
+            history_ids: Series needing ~400 observations for a YoY change
 
-            # Cache the result
-            self.cache.set(cache_key, asdict(indicators), self.cache_ttl)
+        Returns:
+            Tuple of (series -> latest value, series -> YoY change, failed series IDs)
+        """
+        if self.series_store is not None:
+            return self._refresh_series_concurrently(latest_ids, history_ids)
+
+        latest: Dict[str, Optional[float]] = {}
+        yoy: Dict[str, Optional[float]] = {}
+        failed = set()
+
+        jobs = [(series_id, 'latest') for series_id in sorted(latest_ids)]
+        jobs += [(series_id, 'history') for series_id in sorted(history_ids)]
+        if not jobs:
+            return latest, yoy, failed
+
+        workers = min(self.SNAPSHOT_MAX_WORKERS, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fred') as executor:
+            futures = {}
+            for series_id, kind in jobs:
+                if kind == 'latest':
+                    future = executor.submit(self._fetch_latest_strict, series_id)
+                else:
+                    future = executor.submit(self.get_time_series, series_id, limit=400)
+                futures[future] = (series_id, kind)
+
+            for future in as_completed(futures):
+                series_id, kind = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"Error fetching FRED series {series_id}: {str(e)}")
+                    result = None
+
+                if kind == 'latest':
+                    if result is _FETCH_FAILED:
+                        failed.add(series_id)
+                        result = None
+                    latest[series_id] = result
+                    continue
+
+                if result is None:
+                    failed.add(series_id)
+                    latest[series_id] = None
+                    yoy[series_id] = None
+                else:
+                    latest[series_id] = result[-1].value if result else None
+                    yoy[series_id] = self._yoy_from_series(result)
+
+        return latest, yoy, failed
+
+    def _refresh_series_concurrently(self, latest_ids, history_ids) -> Tuple[Dict, Dict, set]:
+        """
+        Refresh series in the local store in parallel, then answer from it.
 
-            return indicators
+        A series whose refresh fails but which has stored data is served stale
+        rather than reported as missing.
 
+        Returns:
+            Tuple of (series -> latest value, series -> YoY change, failed series IDs)
+        """
+        latest: Dict[str, Optional[float]] = {}
+        yoy: Dict[str, Optional[float]] = {}
+        failed = set()
+
+        series_ids = sorted(set(latest_ids) | set(history_ids))
+        if not series_ids:
+            return latest, yoy, failed
+
+        workers = min(self.SNAPSHOT_MAX_WORKERS, len(series_ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fred') as executor:
+            futures = {executor.submit(self._refresh_series, series_id): series_id for series_id in series_ids}
+            for future in as_completed(futures):
+                if not future.result():
+                    failed.add(futures[future])
+
+        for series_id in series_ids:
+            observation = self.series_store.latest(series_id)
+            latest[series_id] = observation[1] if observation else None
+            if series_id in history_ids:
+                yoy[series_id] = self.series_store.yoy_change(series_id)
+
+        return latest, yoy, failed
+
+    def _refresh_series(self, series_id: str) -> bool:
+        """Bring a series in the local store up to date (True if it has data)."""
+        return self.series_store.refresh(series_id, self._download_observations)
+
+    def _download_observations(self, series_id: str, observation_start: Optional[str] = None) -> List[tuple]:
+        """
+        Download observations in chronological order for the local store.
+
+        Args:
+            series_id: FRED series ID
+            observation_start: Only fetch observations on or after this date (YYYY-MM-DD)
+
+        Returns:
+            List of (date, value) tuples, skipping missing values
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        params = {
+            'series_id': series_id,
+            'api_key': self.api_key,
+            'file_type': 'json',
+            'sort_order': 'asc',
+            'limit': 100000
+        }
+        if observation_start:
+            params['observation_start'] = observation_start
+
+        url = f"{self.base_url}/series/observations"
+        response = self.http.get(url, params=params)
+        response.raise_for_status()
+
+        return [
+            (obs['date'], float(obs['value']))
+            for obs in response.json().get('observations', [])
+            if obs['value'] != '.'  # FRED uses '.' for missing values
+        ]
+
+    def _fetch_latest_strict(self, series_id: str):
+        """Latest observation, or _FETCH_FAILED if the request itself failed."""
+        try:
+            return self._get_latest_observation(series_id, raise_errors=True)
         except Exception as e:
-            print(f"Error fetching economic indicators: {str(e)}")
-            return None
+            print(f"Error fetching latest observation for {series_id}: {str(e)}")
+            return _FETCH_FAILED
+
+    @staticmethod
+    def _build_interest_rates(latest: Dict, yoy: Dict) -> InterestRateData:
+        return InterestRateData(**{
+            FREDService.SERIES_IDS[series_id]: latest.get(series_id)
+            for series_id in ['FEDFUNDS', 'DPRIME', 'MORTGAGE30US', 'MORTGAGE15US', 'DGS10', 'DGS2']
+        })
+
+    @staticmethod
+    def _build_inflation(latest: Dict, yoy: Dict) -> InflationData:
+        return InflationData(
+            cpi_all_items=latest.get('CPIAUCSL'),
+            core_cpi=latest.get('CPILFESL'),
+            pce_inflation=latest.get('PCEPI'),
+            cpi_yoy_change=yoy.get('CPIAUCSL')
+        )
+
+    @staticmethod
+    def _build_housing_market(latest: Dict, yoy: Dict) -> HousingMarketData:
+        housing_starts = latest.get('HOUST')
+        building_permits = latest.get('PERMIT')
+        new_sales = latest.get('HSN1F')
+
+        # Convert to int where appropriate
+        return HousingMarketData(
+            housing_starts=int(housing_starts) if housing_starts is not None else None,
+            building_permits=int(building_permits) if building_permits is not None else None,
+            home_sales_existing=latest.get('EXHOSLUSM495S'),
+            home_sales_new=int(new_sales) if new_sales is not None else None,
+            case_shiller_index=latest.get('CSUSHPISA')
+        )
+
+    @staticmethod
+    def _build_economic_indicators(latest: Dict, yoy: Dict) -> EconomicIndicators:
+        return EconomicIndicators(
+            gdp_real=latest.get('GDPC1'),
+            gdp_growth_rate=yoy.get('GDPC1'),
+            unemployment_rate=latest.get('UNRATE'),
+            labor_force_participation=latest.get('CIVPART'),
+            consumer_sentiment=latest.get('UMCSENT')
+        )
 
     def get_time_series(self, series_id: str, start_date: Optional[str] = None,
                        end_date: Optional[str] = None, limit: int = 100) -> Optional[List[TimeSeriesDataPoint]]:
@@ -295,6 +430,15 @@ class FREDService:
         # Validate limit
         limit = max(1, min(limit, 1000))
 
+        # Serve from the local store when configured
+        if self.series_store is not None:
+            if not self._refresh_series(series_id):
+                return None
+            return [
+                TimeSeriesDataPoint(date=observation_date, value=value)
+                for observation_date, value in self.series_store.get_range(series_id, start_date, end_date, limit)
+            ]
+
         # Build cache key
         cache_key = f"fred:series:{series_id}:{start_date}:{end_date}:{limit}"
         cached_data = self.cache.get(cache_key)
@@ -316,7 +460,7 @@ class FREDService:
                 params['observation_end'] = end_date
 
             url = f"{self.base_url}/series/observations"
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
 
             data = response.json()
@@ -346,16 +490,25 @@ class FREDService:
             print(f"Failed to parse FRED API response for series {series_id}: {str(e)}")
             return None
 
-    def _get_latest_observation(self, series_id: str) -> Optional[float]:
+    def _get_latest_observation(self, series_id: str, raise_errors: bool = False) -> Optional[float]:
         """
         Internal helper to get the most recent observation for a series.
 
         Args:
             series_id: FRED series ID
+            raise_errors: Re-raise request/parse errors instead of returning None
 
         Returns:
             Latest value as float or None if not available
         """
+        if self.series_store is not None:
+            if not self._refresh_series(series_id):
+                if raise_errors:
+                    raise requests.exceptions.RequestException(f"No data available for {series_id}")
+                return None
+            observation = self.series_store.latest(series_id)
+            return observation[1] if observation else None
+
         try:
             params = {
                 'series_id': series_id,
@@ -366,7 +519,7 @@ class FREDService:
             }
 
             url = f"{self.base_url}/series/observations"
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
 
             data = response.json()
@@ -378,6 +531,8 @@ class FREDService:
             return None
 
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error fetching latest observation for {series_id}: {str(e)}")
             return None
 
@@ -391,10 +546,32 @@ class FREDService:
         Returns:
             YoY percentage change or None if not enough data
         """
+        if self.series_store is not None:
+            if not self._refresh_series(series_id):
+                return None
+            return self.series_store.yoy_change(series_id)
+
         try:
             # Fetch 400 days of data to ensure we get 12 months ago
             time_series = self.get_time_series(series_id, limit=400)
+            return self._yoy_from_series(time_series)
 
+        except Exception as e:
+            print(f"Error calculating YoY change for {series_id}: {str(e)}")
+            return None
+
+    @staticmethod
+    def _yoy_from_series(time_series: Optional[List[TimeSeriesDataPoint]]) -> Optional[float]:
+        """
+        Year-over-year percentage change from a chronological series.
+
+        Args:
+            time_series: Observations in chronological order
+
+        Returns:
+            YoY percentage change or None if not enough data
+        """
+        try:
             if not time_series or len(time_series) < 2:
                 return None
 
@@ -424,7 +601,7 @@ class FREDService:
             return round(yoy_change, 2)
 
         except Exception as e:
-            print(f"Error calculating YoY change for {series_id}: {str(e)}")
+            print(f"Error calculating YoY change: {str(e)}")
             return None
 
     def _macro_data_to_dict(self, data: MacroeconomicData) -> dict:
@@ -462,7 +639,8 @@ class FREDService:
                 labor_force_participation=data['economicIndicators']['laborForceParticipation'],
                 consumer_sentiment=data['economicIndicators']['consumerSentiment']
             ),
-            last_updated=data['lastUpdated']
+            last_updated=data['lastUpdated'],
+            missing_series=data.get('missingSeries', [])
         )
 
 
@@ -1,8 +1,22 @@
 """
 Fund service layer for fund data operations
 Handles business logic for fund management
+
+The fund overview is materialized in FundOverviewSnapshotModel. Session
+listeners at the bottom of this module refresh the sections of a fund's
+snapshot whose source rows were inserted, updated or deleted, in the same
+transaction as the change, so /funds/<id>/overview is one primary-key read.
+Bulk query.update()/query.delete() bypass the listeners; call
+FundService.rebuild_overview_snapshots() after those.
 """
-from typing import List, Optional, Dict
+import hashlib
+import json
+from datetime import datetime
+from itertools import chain
+from typing import Iterable, List, Optional, Dict
+from flask import has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from app.database import (
     db,
     FundModel,
@@ -11,7 +25,8 @@ from app.database import (
     InvestmentStrategyModel,
     CashFlowModel,
     FundActivityModel,
-    BenchmarkDataModel
+    BenchmarkDataModel,
+    FundOverviewSnapshotModel
 )
 from app.models.fund_models import (
     Fund,
@@ -45,6 +60,18 @@ class FundService:
 
         return Fund.from_dict(fund_model.to_dict())
 
+    # Overview sections built from each model's rows
+    OVERVIEW_SECTIONS = {
+        FundModel: ('fund',),
+        FundMetricsModel: ('metrics',),
+        QuarterlyPerformanceModel: ('quarterlyPerformance',),
+        InvestmentStrategyModel: ('strategies',),
+        CashFlowModel: ('cashFlows', 'cashFlowSummary'),
+        BenchmarkDataModel: ('benchmarks',),
+        FundActivityModel: ('recentActivities',)
+    }
+    ALL_OVERVIEW_SECTIONS = tuple(chain.from_iterable(OVERVIEW_SECTIONS.values()))
+
     @staticmethod
     def get_fund_overview(fund_id: int) -> Optional[Dict]:
         """
@@ -57,40 +84,154 @@ class FundService:
         Returns:
             Dictionary containing all fund data, or None if fund not found
         """
-        # Get fund basic info
-        fund = FundService.get_fund(fund_id)
-        if not fund:
+        snapshot = FundService.get_fund_overview_snapshot(fund_id)
+        if not snapshot:
             return None
 
-        # Get latest metrics
-        metrics = FundService.get_fund_metrics(fund_id)
+        return json.loads(snapshot.payload)
 
-        # Get quarterly performance (last 8 quarters)
-        quarterly_performance = FundService.get_quarterly_performance(fund_id, limit=8)
+    @staticmethod
+    def get_fund_overview_snapshot(fund_id: int) -> Optional[FundOverviewSnapshotModel]:
+        """
+        Get the materialized overview of a fund
 
-        # Get investment strategies
-        strategies = FundService.get_investment_strategies(fund_id)
+        Snapshots are kept current by the session listeners; one missing for
+        an existing fund (e.g. written before snapshots existed) is built and
+        saved on first read.
 
-        # Get cash flows with summary (last 8 quarters)
-        cash_flow_data = FundService.get_cash_flows(fund_id, limit=8)
+        Args:
+            fund_id: ID of the fund
 
-        # Get benchmarks
-        benchmarks = FundService.get_benchmark_comparisons(fund_id)
+        Returns:
+            FundOverviewSnapshotModel with the serialized payload, version and
+            ETag, or None if fund not found
+        """
+        snapshot = db.session.get(FundOverviewSnapshotModel, fund_id)
+        if snapshot:
+            return snapshot
 
-        # Get recent activities (last 10)
-        recent_activities = FundService.get_fund_activities(fund_id, limit=10)
+        snapshot = FundService.refresh_overview_snapshot(fund_id)
+        if snapshot:
+            db.session.commit()
+        return snapshot
 
-        # Aggregate everything into one response
-        return {
-            'fund': fund.to_dict(),
-            'metrics': metrics.to_dict() if metrics else None,
-            'quarterlyPerformance': [qp.to_dict() for qp in quarterly_performance],
-            'strategies': [s.to_dict() for s in strategies],
-            'cashFlows': cash_flow_data['cashFlows'],
-            'cashFlowSummary': cash_flow_data['summary'],
-            'benchmarks': [b.to_dict() for b in benchmarks],
-            'recentActivities': [a.to_dict() for a in recent_activities]
-        }
+    @staticmethod
+    def refresh_overview_snapshot(
+        fund_id: int,
+        sections: Optional[Iterable[str]] = None
+    ) -> Optional[FundOverviewSnapshotModel]:
+        """
+        Rebuild sections of a fund's overview snapshot (not committed)
+
+        Sections not listed are kept from the stored payload. The version and
+        ETag only change when the serialized payload does.
+
+        Args:
+            fund_id: ID of the fund
+            sections: Overview keys to rebuild (default: all, as does a missing snapshot)
+
+        Returns:
+            The snapshot, or None if the fund does not exist (its snapshot is deleted)
+        """
+        snapshot = db.session.get(FundOverviewSnapshotModel, fund_id)
+
+        if not db.session.get(FundModel, fund_id):
+            if snapshot:
+                db.session.delete(snapshot)
+            return None
+
+        if snapshot is None or sections is None:
+            payload = FundService._build_overview_sections(fund_id, FundService.ALL_OVERVIEW_SECTIONS)
+        else:
+            payload = json.loads(snapshot.payload)
+            payload.update(FundService._build_overview_sections(fund_id, sections))
+
+        serialized = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+        etag = hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+        if snapshot is None:
+            snapshot = FundOverviewSnapshotModel(fund_id=fund_id, version=0)
+            db.session.add(snapshot)
+        elif snapshot.etag == etag:
+            return snapshot
+
+        snapshot.version += 1
+        snapshot.payload = serialized
+        snapshot.etag = etag
+        snapshot.refreshed_at = datetime.utcnow()
+        return snapshot
+
+    @staticmethod
+    def rebuild_overview_snapshots(fund_ids: Optional[List[int]] = None) -> int:
+        """
+        Fully rebuild and commit overview snapshots
+
+        Args:
+            fund_ids: Funds to rebuild (default: every fund)
+
+        Returns:
+            Number of snapshots rebuilt
+        """
+        if fund_ids is None:
+            fund_ids = [row.id for row in db.session.query(FundModel.id).all()]
+
+        rebuilt = 0
+        for fund_id in fund_ids:
+            if FundService.refresh_overview_snapshot(fund_id):
+                rebuilt += 1
+
+        db.session.commit()
+        return rebuilt
+
+    @staticmethod
+    def _build_overview_sections(fund_id: int, sections: Iterable[str]) -> Dict:
+        """
+        Query and serialize the requested overview sections
+
+        Args:
+            fund_id: ID of the fund
+            sections: Overview keys to build
+
+        Returns:
+            Dictionary of section key -> serialized value
+        """
+        sections = set(sections)
+        overview = {}
+
+        if 'fund' in sections:
+            fund = FundService.get_fund(fund_id)
+            overview['fund'] = fund.to_dict() if fund else None
+
+        if 'metrics' in sections:
+            # Latest metrics
+            metrics = FundService.get_fund_metrics(fund_id)
+            overview['metrics'] = metrics.to_dict() if metrics else None
+
+        if 'quarterlyPerformance' in sections:
+            # Quarterly performance (last 8 quarters)
+            quarterly_performance = FundService.get_quarterly_performance(fund_id, limit=8)
+            overview['quarterlyPerformance'] = [qp.to_dict() for qp in quarterly_performance]
+
+        if 'strategies' in sections:
+            strategies = FundService.get_investment_strategies(fund_id)
+            overview['strategies'] = [s.to_dict() for s in strategies]
+
+        if 'cashFlows' in sections or 'cashFlowSummary' in sections:
+            # Cash flows with summary (last 8 quarters)
+            cash_flow_data = FundService.get_cash_flows(fund_id, limit=8)
+            overview['cashFlows'] = cash_flow_data['cashFlows']
+            overview['cashFlowSummary'] = cash_flow_data['summary']
+
+        if 'benchmarks' in sections:
+            benchmarks = FundService.get_benchmark_comparisons(fund_id)
+            overview['benchmarks'] = [b.to_dict() for b in benchmarks]
+
+        if 'recentActivities' in sections:
+            # Recent activities (last 10)
+            recent_activities = FundService.get_fund_activities(fund_id, limit=10)
+            overview['recentActivities'] = [a.to_dict() for a in recent_activities]
+
+        return overview
 
     @staticmethod
     def get_fund_metrics(fund_id: int) -> Optional[FundMetrics]:
@@ -270,3 +411,51 @@ class FundService:
 
         # Convert to Fund dataclass and return
         return Fund.from_dict(fund_model.to_dict())
+
+
+# ============================================================================
+# OVERVIEW SNAPSHOT MAINTENANCE
+# ============================================================================
+
+_PENDING_SNAPSHOTS_KEY = 'fund_overview_snapshot_pending'
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_changed_fund_sections(session, flush_context):
+    """Record which overview sections of which funds this flush changed."""
+    # Snapshots are maintained through the app's scoped session only
+    if not has_app_context() or session is not db.session():
+        return
+
+    pending = None
+    for instance in chain(session.new, session.dirty, session.deleted):
+        sections = FundService.OVERVIEW_SECTIONS.get(type(instance))
+        if not sections:
+            continue
+        if instance in session.dirty and not session.is_modified(instance):
+            continue
+
+        fund_id = instance.id if isinstance(instance, FundModel) else instance.fund_id
+        if fund_id is None:
+            continue
+
+        if pending is None:
+            pending = session.info.setdefault(_PENDING_SNAPSHOTS_KEY, {})
+        pending.setdefault(fund_id, set()).update(sections)
+
+
+@event.listens_for(Session, 'after_flush_postexec')
+def _refresh_changed_fund_snapshots(session, flush_context):
+    """Refresh the recorded sections inside the flushing transaction."""
+    pending = session.info.pop(_PENDING_SNAPSHOTS_KEY, None)
+    if not pending:
+        return
+
+    with session.no_autoflush:
+        for fund_id, sections in pending.items():
+            FundService.refresh_overview_snapshot(fund_id, sections)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_pending_fund_sections(session, previous_transaction):
+    session.info.pop(_PENDING_SNAPSHOTS_KEY, None)
@@ -0,0 +1,327 @@
+"""
+GP Leaderboard
+In-memory ranking of GPs by net IRR, plus the attention list
+
+Each worker keeps every GP's ranking fields in lists sorted by (net_irr, id),
+so top-k, bottom-k and threshold queries are a bisect and a slice instead of
+a scan of the gps table.
+
+GPService writes (create/update/delete, quarterly performance) bump a version
+stamp in reference_data_versions and apply the change to this process's
+copy in place; other workers see the new stamp within the check interval and
+reload. Scripts that write GPModel directly call bump_version() when done.
+"""
+
+import threading
+import time
+from bisect import bisect_left, insort
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+from datetime import datetime
+from flask import current_app
+from app.database import db, GPModel, ReferenceDataVersionModel
+
+
+class GPLeaderboard:
+    """
+    Process-wide sorted index of GP performance
+    """
+
+    VERSION_KEY = 'gp_leaderboard'
+    DEFAULT_CHECK_INTERVAL = 30  # seconds between version stamp checks
+
+    # GPs below this net IRR (or with a negative trend) need attention
+    ATTENTION_IRR_THRESHOLD = 10.0
+
+    ENTRY_FIELDS = ['id', 'gp_name', 'net_irr', 'irr_trend', 'performance_rating']
+
+    _lock = threading.Lock()
+    _loaded = False
+    _version = None
+    _last_check = 0.0
+
+    # gp_id -> entry snapshot
+    _entries: Dict = {}
+    # (net_irr, gp_id) ascending, GPs with a net IRR only
+    _by_irr: List = []
+    # (net_irr or +inf, gp_id) ascending, GPs needing attention
+    _attention: List = []
+
+    @staticmethod
+    def get_top(limit: int = 10, offset: int = 0) -> Dict:
+        """
+        Get GPs ranked by net IRR, highest first
+
+        Args:
+            limit: Page size
+            offset: Number of ranked GPs to skip
+
+        Returns:
+            Page dict with 'items', 'total' and 'nextOffset'
+        """
+        GPLeaderboard._ensure_loaded()
+        ranking = GPLeaderboard._by_irr
+        total = len(ranking)
+        end = max(total - offset, 0)
+        keys = ranking[max(end - limit, 0):end][::-1]
+        return GPLeaderboard._page(keys, total, offset, limit)
+
+    @staticmethod
+    def get_bottom(limit: int = 10, offset: int = 0) -> Dict:
+        """
+        Get GPs ranked by net IRR, lowest first
+
+        Args:
+            limit: Page size
+            offset: Number of ranked GPs to skip
+
+        Returns:
+            Page dict with 'items', 'total' and 'nextOffset'
+        """
+        GPLeaderboard._ensure_loaded()
+        ranking = GPLeaderboard._by_irr
+        keys = ranking[offset:offset + limit]
+        return GPLeaderboard._page(keys, len(ranking), offset, limit)
+
+    @staticmethod
+    def get_below(threshold: float, limit: int = 10, offset: int = 0) -> Dict:
+        """
+        Get GPs whose net IRR is below a threshold, lowest first
+
+        Args:
+            threshold: Net IRR percentage (exclusive)
+            limit: Page size
+            offset: Number of matching GPs to skip
+
+        Returns:
+            Page dict with 'items', 'total' and 'nextOffset'
+        """
+        GPLeaderboard._ensure_loaded()
+        ranking = GPLeaderboard._by_irr
+        total = bisect_left(ranking, (threshold, float('-inf')))
+        keys = ranking[offset:min(offset + limit, total)]
+        return GPLeaderboard._page(keys, total, offset, limit)
+
+    @staticmethod
+    def get_above(threshold: float, limit: int = 10, offset: int = 0) -> Dict:
+        """
+        Get GPs whose net IRR is above a threshold, highest first
+
+        Args:
+            threshold: Net IRR percentage (exclusive)
+            limit: Page size
+            offset: Number of matching GPs to skip
+
+        Returns:
+            Page dict with 'items', 'total' and 'nextOffset'
+        """
+        GPLeaderboard._ensure_loaded()
+        ranking = GPLeaderboard._by_irr
+        start = bisect_left(ranking, (threshold, float('inf')))
+        total = len(ranking) - start
+        end = max(len(ranking) - offset, start)
+        keys = ranking[max(end - limit, start):end][::-1]
+        return GPLeaderboard._page(keys, total, offset, limit)
+
+    @staticmethod
+    def get_attention(limit: int = 20, offset: int = 0) -> Dict:
+        """
+        Get GPs needing attention (negative trend or net IRR below
+        ATTENTION_IRR_THRESHOLD), lowest net IRR first
+
+        Args:
+            limit: Page size
+            offset: Number of GPs to skip
+
+        Returns:
+            Page dict with 'items', 'total' and 'nextOffset'
+        """
+        GPLeaderboard._ensure_loaded()
+        attention = GPLeaderboard._attention
+        keys = attention[offset:offset + limit]
+        return GPLeaderboard._page(keys, len(attention), offset, limit)
+
+    @staticmethod
+    def get_entry(gp_id: int) -> Optional[SimpleNamespace]:
+        """Get the ranking fields of one GP, or None if unknown."""
+        GPLeaderboard._ensure_loaded()
+        return GPLeaderboard._entries.get(gp_id)
+
+    @staticmethod
+    def bump_version(commit: bool = True) -> int:
+        """
+        Mark GP rankings as changed for every worker
+
+        Args:
+            commit: Whether to commit the session (set False to stamp within
+                the caller's own transaction)
+
+        Returns:
+            New version number
+        """
+        record = ReferenceDataVersionModel.query.get(GPLeaderboard.VERSION_KEY)
+        if record is None:
+            record = ReferenceDataVersionModel(name=GPLeaderboard.VERSION_KEY, version=1)
+            db.session.add(record)
+        else:
+            ReferenceDataVersionModel.query.filter_by(
+                name=GPLeaderboard.VERSION_KEY
+            ).update(
+                {
+                    'version': ReferenceDataVersionModel.version + 1,
+                    'updated_at': datetime.utcnow()
+                },
+                synchronize_session=False
+            )
+
+        version = GPLeaderboard._read_version()
+        if commit:
+            db.session.commit()
+            GPLeaderboard.invalidate()
+        return version
+
+    @staticmethod
+    def apply_change(gp_id: int, gp: Optional[GPModel], version: int):
+        """
+        Apply a committed GP write to this process's copy
+
+        Falls back to a full reload when this copy is not at the version just
+        before the write (another worker wrote in between, or nothing loaded).
+
+        Args:
+            gp_id: ID of the written GP
+            gp: The GP as committed, or None if it was deleted
+            version: Version returned by bump_version for the write
+        """
+        with GPLeaderboard._lock:
+            if not GPLeaderboard._loaded or GPLeaderboard._version != version - 1:
+                GPLeaderboard._loaded = False
+                GPLeaderboard._last_check = 0.0
+                return
+
+            GPLeaderboard._remove(gp_id)
+            if gp is not None:
+                GPLeaderboard._insert(GPLeaderboard._snapshot(gp))
+            GPLeaderboard._version = version
+
+    @staticmethod
+    def invalidate():
+        """Drop this process's copy so the next lookup reloads from the database."""
+        with GPLeaderboard._lock:
+            GPLeaderboard._loaded = False
+            GPLeaderboard._last_check = 0.0
+
+    @staticmethod
+    def _needs_attention(entry: SimpleNamespace) -> bool:
+        return (
+            (entry.irr_trend is not None and entry.irr_trend < 0) or
+            (entry.net_irr is not None and entry.net_irr < GPLeaderboard.ATTENTION_IRR_THRESHOLD)
+        )
+
+    @staticmethod
+    def _attention_key(entry: SimpleNamespace):
+        return (entry.net_irr if entry.net_irr is not None else float('inf'), entry.id)
+
+    @staticmethod
+    def _insert(entry: SimpleNamespace):
+        """Index one entry (caller holds the lock)."""
+        GPLeaderboard._entries[entry.id] = entry
+        if entry.net_irr is not None:
+            insort(GPLeaderboard._by_irr, (entry.net_irr, entry.id))
+        if GPLeaderboard._needs_attention(entry):
+            insort(GPLeaderboard._attention, GPLeaderboard._attention_key(entry))
+
+    @staticmethod
+    def _remove(gp_id: int):
+        """Unindex one entry if present (caller holds the lock)."""
+        entry = GPLeaderboard._entries.pop(gp_id, None)
+        if entry is None:
+            return
+        if entry.net_irr is not None:
+            GPLeaderboard._discard(GPLeaderboard._by_irr, (entry.net_irr, entry.id))
+        if GPLeaderboard._needs_attention(entry):
+            GPLeaderboard._discard(GPLeaderboard._attention, GPLeaderboard._attention_key(entry))
+
+    @staticmethod
+    def _discard(ranking: List, key):
+        index = bisect_left(ranking, key)
+        if index < len(ranking) and ranking[index] == key:
+            del ranking[index]
+
+    @staticmethod
+    def _page(keys: List, total: int, offset: int, limit: int) -> Dict:
+        """Resolve sorted keys to serialized entries."""
+        entries = GPLeaderboard._entries
+        items = []
+        for _, gp_id in keys:
+            entry = entries.get(gp_id)
+            if entry is None:
+                continue
+            items.append({
+                'gpId': entry.id,
+                'gpName': entry.gp_name,
+                'netIrr': entry.net_irr,
+                'irrTrend': entry.irr_trend,
+                'performanceRating': entry.performance_rating
+            })
+
+        next_offset = offset + limit
+        return {
+            'items': items,
+            'total': total,
+            'nextOffset': next_offset if next_offset < total else None
+        }
+
+    @staticmethod
+    def _snapshot(gp) -> SimpleNamespace:
+        return SimpleNamespace(**{field: getattr(gp, field) for field in GPLeaderboard.ENTRY_FIELDS})
+
+    @staticmethod
+    def _ensure_loaded():
+        """Load the rankings if missing or if another worker bumped the version."""
+        now = time.monotonic()
+        interval = current_app.config.get(
+            'GP_LEADERBOARD_CHECK_INTERVAL',
+            GPLeaderboard.DEFAULT_CHECK_INTERVAL
+        )
+
+        if GPLeaderboard._loaded and now - GPLeaderboard._last_check < interval:
+            return
+
+        with GPLeaderboard._lock:
+            if GPLeaderboard._loaded and now - GPLeaderboard._last_check < interval:
+                return
+
+            version = GPLeaderboard._read_version()
+            if not GPLeaderboard._loaded or version != GPLeaderboard._version:
+                GPLeaderboard._load(version)
+
+            GPLeaderboard._last_check = now
+
+    @staticmethod
+    def _read_version() -> int:
+        """Read the shared version stamp (0 if never stamped)."""
+        version = db.session.query(ReferenceDataVersionModel.version).filter_by(
+            name=GPLeaderboard.VERSION_KEY
+        ).scalar()
+        return version or 0
+
+    @staticmethod
+    def _load(version: int):
+        """Rebuild the rankings from the database (caller holds the lock)."""
+        columns = [getattr(GPModel, field) for field in GPLeaderboard.ENTRY_FIELDS]
+        entries = {}
+        for row in db.session.query(*columns).all():
+            entry = SimpleNamespace(**dict(zip(GPLeaderboard.ENTRY_FIELDS, row)))
+            entries[entry.id] = entry
+
+        GPLeaderboard._entries = entries
+        GPLeaderboard._by_irr = sorted(
+            (entry.net_irr, entry.id) for entry in entries.values() if entry.net_irr is not None
+        )
+        GPLeaderboard._attention = sorted(
+            GPLeaderboard._attention_key(entry) for entry in entries.values()
+            if GPLeaderboard._needs_attention(entry)
+        )
+        GPLeaderboard._version = version
+        GPLeaderboard._loaded = True
@@ -9,11 +9,14 @@ from app.database import (
     GPQuarterlyPerformanceModel,
     GPPortfolioSummaryModel
 )
+from app.services.gp_leaderboard import GPLeaderboard
 
 
 class GPService:
     """Service class for managing General Partners"""
 
+    MAX_PAGE_SIZE = 500
+
     @staticmethod
     def get_gp(gp_id: int) -> Optional[Dict]:
         """
@@ -120,62 +123,114 @@ class GPService:
         return [summary.to_dict() for summary in summaries]
 
     @staticmethod
-    def get_gp_performance_comparison() -> List[Dict]:
+    def get_gp_performance_comparison(limit: int = 50, offset: int = 0) -> Dict:
         """
-        Get performance comparison data for all GPs
-        Returns GP names and their net IRR for comparison chart
+        Get performance comparison data for GPs
+        Returns GP names and their net IRR for comparison chart, highest first
+
+        Args:
+            limit: Page size
+            offset: Number of ranked GPs to skip
 
         Returns:
-            List of dictionaries with GP name and IRR
+            Page dict with 'items' (gpName, netIrr, gpId), 'total' and 'nextOffset'
         """
-        gps = GPModel.query.filter(GPModel.net_irr.isnot(None)).all()
-        return [
+        limit, offset = GPService._clamp_page(limit, offset)
+        page = GPLeaderboard.get_top(limit=limit, offset=offset)
+        page['items'] = [
             {
-                'gpName': gp.gp_name,
-                'netIrr': gp.net_irr,
-                'gpId': gp.id
+                'gpName': item['gpName'],
+                'netIrr': item['netIrr'],
+                'gpId': item['gpId']
             }
-            for gp in gps
+            for item in page['items']
         ]
+        return page
 
     @staticmethod
-    def get_top_performers() -> Dict:
+    def get_top_performers(attention_limit: int = 20, attention_offset: int = 0) -> Dict:
         """
         Get top performing GPs and those needing attention
 
+        Args:
+            attention_limit: Page size of the attention list
+            attention_offset: Number of attention items to skip
+
         Returns:
-            Dictionary with top performers and attention items
+            Dictionary with top performers and a page of attention items
         """
+        attention_limit, attention_offset = GPService._clamp_page(attention_limit, attention_offset)
+
         # Get top portfolio by IRR
-        top_gp = GPModel.query.filter(
-            GPModel.net_irr.isnot(None)
-        ).order_by(GPModel.net_irr.desc()).first()
-
-        # Get GPs needing attention (negative trend or low IRR)
-        attention_gps = GPModel.query.filter(
-            db.or_(
-                GPModel.irr_trend < 0,
-                GPModel.net_irr < 10
-            )
-        ).all()
+        top = GPLeaderboard.get_top(limit=1)['items']
+        top_gp = top[0] if top else None
+
+        # Get GPs needing attention (negative trend or low IRR), lowest IRR first
+        attention = GPLeaderboard.get_attention(limit=attention_limit, offset=attention_offset)
 
         return {
             'topPerformer': {
-                'gpName': top_gp.gp_name,
-                'netIrr': top_gp.net_irr,
-                'performanceRating': top_gp.performance_rating
+                'gpName': top_gp['gpName'],
+                'netIrr': top_gp['netIrr'],
+                'performanceRating': top_gp['performanceRating']
             } if top_gp else None,
             'needsAttention': [
                 {
-                    'gpName': gp.gp_name,
-                    'netIrr': gp.net_irr,
-                    'irrTrend': gp.irr_trend,
-                    'reason': 'Negative Trend' if gp.irr_trend < 0 else 'Low Performance'
+                    'gpName': gp['gpName'],
+                    'netIrr': gp['netIrr'],
+                    'irrTrend': gp['irrTrend'],
+                    'reason': 'Negative Trend' if gp['irrTrend'] is not None and gp['irrTrend'] < 0 else 'Low Performance'
                 }
-                for gp in attention_gps
-            ]
+                for gp in attention['items']
+            ],
+            'needsAttentionTotal': attention['total'],
+            'nextOffset': attention['nextOffset']
         }
 
+    @staticmethod
+    def get_leaderboard(
+        side: str = 'top',
+        limit: int = 10,
+        offset: int = 0,
+        irr_below: Optional[float] = None,
+        irr_above: Optional[float] = None
+    ) -> Dict:
+        """
+        Get a page of the GP leaderboard
+
+        Args:
+            side: 'top' (highest net IRR first) or 'bottom' (lowest first)
+            limit: Page size
+            offset: Number of GPs to skip
+            irr_below: Only GPs with net IRR below this, lowest first
+            irr_above: Only GPs with net IRR above this, highest first
+
+        Returns:
+            Page dict with 'items', 'total' and 'nextOffset'
+
+        Raises:
+            ValueError: If side is invalid or both thresholds are given
+        """
+        limit, offset = GPService._clamp_page(limit, offset)
+
+        if irr_below is not None and irr_above is not None:
+            raise ValueError('Use either irrBelow or irrAbove, not both')
+        if irr_below is not None:
+            return GPLeaderboard.get_below(irr_below, limit=limit, offset=offset)
+        if irr_above is not None:
+            return GPLeaderboard.get_above(irr_above, limit=limit, offset=offset)
+
+        if side == 'top':
+            return GPLeaderboard.get_top(limit=limit, offset=offset)
+        if side == 'bottom':
+            return GPLeaderboard.get_bottom(limit=limit, offset=offset)
+        raise ValueError(f"Invalid side '{side}'. Use 'top' or 'bottom'")
+
+    @staticmethod
+    def _clamp_page(limit: int, offset: int):
+        """Clamp limit to 1..MAX_PAGE_SIZE and offset to >= 0."""
+        return max(1, min(limit, GPService.MAX_PAGE_SIZE)), max(0, offset)
+
     @staticmethod
     def create_gp(gp_data: Dict) -> Dict:
         """
@@ -189,7 +244,11 @@ class GPService:
         """
         gp = GPModel.from_dict(gp_data)
         db.session.add(gp)
+        db.session.flush()
+        version = GPLeaderboard.bump_version(commit=False)
         db.session.commit()
+
+        GPLeaderboard.apply_change(gp.id, gp, version)
         return gp.to_dict()
 
     @staticmethod
@@ -209,7 +268,10 @@ class GPService:
             return None
 
         gp.update_from_dict(gp_data)
+        version = GPLeaderboard.bump_version(commit=False)
         db.session.commit()
+
+        GPLeaderboard.apply_change(gp.id, gp, version)
         return gp.to_dict()
 
     @staticmethod
@@ -228,5 +290,61 @@ class GPService:
             return False
 
         db.session.delete(gp)
+        version = GPLeaderboard.bump_version(commit=False)
         db.session.commit()
+
+        GPLeaderboard.apply_change(gp_id, None, version)
         return True
+
+    @staticmethod
+    def add_quarterly_performance(gp_id: int, performance_data: Dict) -> Optional[Dict]:
+        """
+        Record a GP's IRR for a quarter
+
+        When the quarter is the GP's most recent, its IRR becomes the GP's
+        net IRR and the leaderboard is updated.
+
+        Args:
+            gp_id: ID of the GP
+            performance_data: Dictionary with year, quarter and irr
+
+        Returns:
+            Created quarterly performance dictionary, or None if GP not found
+
+        Raises:
+            ValueError: If year or quarter is missing, year is not an integer or
+                quarter is not 1-4
+        """
+        gp = GPModel.query.get(gp_id)
+        if not gp:
+            return None
+
+        year = performance_data.get('year')
+        quarter = performance_data.get('quarter')
+        if year is None or quarter is None:
+            raise ValueError('year and quarter are required')
+        if isinstance(year, bool) or not isinstance(year, int):
+            raise ValueError('year must be an integer')
+        if quarter not in (1, 2, 3, 4):
+            raise ValueError('quarter must be 1, 2, 3 or 4')
+
+        latest = GPQuarterlyPerformanceModel.query.filter_by(
+            gp_id=gp_id
+        ).order_by(
+            GPQuarterlyPerformanceModel.year.desc(),
+            GPQuarterlyPerformanceModel.quarter.desc()
+        ).first()
+
+        performance = GPQuarterlyPerformanceModel.from_dict({**performance_data, 'gpId': gp_id})
+        db.session.add(performance)
+
+        is_latest = latest is None or (year, quarter) >= (latest.year, latest.quarter)
+        if is_latest and performance.irr is not None:
+            gp.net_irr = performance.irr
+            version = GPLeaderboard.bump_version(commit=False)
+            db.session.commit()
+            GPLeaderboard.apply_change(gp.id, gp, version)
+        else:
+            db.session.commit()
+
+        return performance.to_dict()
@@ -113,7 +113,7 @@ class HedonicModelService:
         sqft = property_data.get('square_footage', 1000)
         bedrooms = property_data.get('bedrooms', 2)
         bathrooms = property_data.get('bathrooms', 1)
-        property_type = property_data.get('property_type', '').lower()
+        property_type = (property_data.get('property_type') or '').lower()
         epc_score = property_data.get('epc_score', 'D')  # Default to D if unknown
 
         # Start with intercept
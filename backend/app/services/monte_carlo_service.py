@@ -0,0 +1,192 @@
+"""
+Monte Carlo Simulation Service
+Distribution of levered returns under correlated shocks
+
+Draws joint shocks to net yield, capital appreciation, cost of debt and
+vacancy from a multivariate normal (Cholesky factor of CORRELATION) and
+evaluates the levered return of every path at once with
+VectorizedScoringService.calculate_levered_return, the array form of
+TotalReturnService.calculate_levered_return.
+
+Appreciation is spread so that the decile's benchmark range
+(capital_gain_min to capital_gain_max) covers the central 90% of paths.
+Results are reproducible for a given seed and path count.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.vectorized_scoring_service import VectorizedScoringService
+
+
+class MonteCarloSimulationService:
+    """
+    Service for simulating the return distribution of a deal
+    """
+
+    DEFAULT_PATHS = 100000
+    DEFAULT_SEED = 42
+    MAX_PATHS = 2000000
+
+    PERCENTILES = (1, 5, 10, 25, 50, 75, 90, 95, 99)
+    VAR_CONFIDENCE = 0.95
+
+    # z-score of the 95th percentile: capital_gain_min/max bound the central 90%
+    RANGE_Z = 1.645
+
+    # One-sigma shocks (percentage points; vacancy as a fraction of rent)
+    NET_YIELD_VOLATILITY = 0.5
+    COST_OF_DEBT_VOLATILITY = 1.0
+    VACANCY_VOLATILITY = 0.03
+    DEFAULT_APPRECIATION_VOLATILITY = 1.0  # When no benchmark range is available
+
+    # Shock order: net yield, appreciation, cost of debt, vacancy.
+    # Higher rates and vacancy coincide with weaker appreciation; yield and
+    # appreciation move together with the local rental market.
+    FACTORS = ('net_yield', 'appreciation', 'cost_of_debt', 'vacancy')
+    CORRELATION = np.array([
+        [1.0, 0.3, -0.2, 0.0],
+        [0.3, 1.0, -0.4, -0.3],
+        [-0.2, -0.4, 1.0, 0.2],
+        [0.0, -0.3, 0.2, 1.0]
+    ])
+
+    @staticmethod
+    def simulate_returns(
+        base_net_yield: float,
+        base_appreciation: float,
+        cost_of_debt: float,
+        ltv: float,
+        gross_yield: float = 0.0,
+        vacancy_rate: float = 0.05,
+        capital_gain_range: Optional[Tuple[float, float]] = None,
+        paths: int = DEFAULT_PATHS,
+        seed: Optional[int] = DEFAULT_SEED
+    ) -> Dict:
+        """
+        Simulate the distribution of annual total returns
+
+        Args:
+            base_net_yield: Expected net yield percentage
+            base_appreciation: Expected annual capital gain percentage
+            cost_of_debt: Expected interest rate on debt (percentage)
+            ltv: Loan-to-value ratio (as decimal)
+            gross_yield: Gross yield percentage (scales the vacancy shock into lost yield)
+            vacancy_rate: Expected vacancy as a fraction of rent (e.g., 0.05)
+            capital_gain_range: (capital_gain_min, capital_gain_max) for the
+                rent decile, in percent per year
+            paths: Number of simulated paths (1 to MAX_PATHS)
+            seed: RNG seed (None for a fresh, non-reproducible draw)
+
+        Returns:
+            Dictionary with return distributions, probability of loss and
+            value at risk:
+                {
+                    'paths': 100000,
+                    'seed': 42,
+                    'total_return_levered': {'mean': 9.1, 'std': 4.2,
+                                             'percentiles': {'p5': 2.3, ...}},
+                    'total_return_unlevered': {...},
+                    'probability_of_loss': 0.031,
+                    'value_at_risk': {'confidence': 0.95, 'total_return_levered': -2.3,
+                                      'expected_shortfall': -0.8},
+                    'assumptions': {...}
+                }
+
+        Raises:
+            ValueError: If paths is out of range or LTV is 100% or more
+        """
+        if paths < 1 or paths > MonteCarloSimulationService.MAX_PATHS:
+            raise ValueError(f"paths must be between 1 and {MonteCarloSimulationService.MAX_PATHS}")
+        if ltv >= 1.0:
+            raise ValueError("LTV must be less than 100%")
+
+        if capital_gain_range is not None:
+            capital_gain_min, capital_gain_max = capital_gain_range
+            appreciation_volatility = max(capital_gain_max - capital_gain_min, 0.0) / (
+                2 * MonteCarloSimulationService.RANGE_Z
+            )
+        else:
+            appreciation_volatility = MonteCarloSimulationService.DEFAULT_APPRECIATION_VOLATILITY
+
+        volatilities = np.array([
+            MonteCarloSimulationService.NET_YIELD_VOLATILITY,
+            appreciation_volatility,
+            MonteCarloSimulationService.COST_OF_DEBT_VOLATILITY,
+            MonteCarloSimulationService.VACANCY_VOLATILITY
+        ])
+
+        # (paths, 4) correlated standard normals scaled to each factor's volatility
+        rng = np.random.default_rng(seed)
+        cholesky = np.linalg.cholesky(MonteCarloSimulationService.CORRELATION)
+        shocks = rng.standard_normal((paths, len(volatilities))) @ cholesky.T * volatilities
+
+        # Vacancy stays within [0, 1]; the extra (or recovered) share of rent moves net yield
+        vacancy = np.clip(vacancy_rate + shocks[:, 3], 0.0, 1.0)
+        vacancy_drag = (vacancy - vacancy_rate) * gross_yield
+
+        net_yield = base_net_yield + shocks[:, 0] - vacancy_drag
+        appreciation = base_appreciation + shocks[:, 1]
+        path_cost_of_debt = np.maximum(cost_of_debt + shocks[:, 2], 0.0)
+
+        unlevered = net_yield + appreciation
+        levered = VectorizedScoringService.calculate_levered_return(
+            unlevered, path_cost_of_debt, np.full(paths, ltv)
+        )
+
+        # VaR / expected shortfall: the return at (and average below) the tail quantile
+        tail_quantile = (1 - MonteCarloSimulationService.VAR_CONFIDENCE) * 100
+        var_return = float(np.percentile(levered, tail_quantile))
+        tail = levered[levered <= var_return]
+
+        return {
+            'paths': paths,
+            'seed': seed,
+            'total_return_levered': MonteCarloSimulationService._summarize(levered),
+            'total_return_unlevered': MonteCarloSimulationService._summarize(unlevered),
+            'probability_of_loss': round(float(np.mean(levered < 0)), 4),
+            'probability_below_unlevered': round(float(np.mean(levered < unlevered)), 4),
+            'value_at_risk': {
+                'confidence': MonteCarloSimulationService.VAR_CONFIDENCE,
+                'total_return_levered': round(var_return, 2),
+                'expected_shortfall': round(float(tail.mean()), 2) if tail.size else round(var_return, 2)
+            },
+            'assumptions': {
+                'factors': list(MonteCarloSimulationService.FACTORS),
+                'volatilities': [round(float(v), 4) for v in volatilities],
+                'correlation': MonteCarloSimulationService.CORRELATION.tolist(),
+                'capital_gain_range': list(capital_gain_range) if capital_gain_range is not None else None,
+                'vacancy_rate': vacancy_rate,
+                'ltv': ltv
+            },
+            'interpretation': MonteCarloSimulationService._interpret(levered, var_return)
+        }
+
+    @staticmethod
+    def _summarize(values: np.ndarray, percentiles: Sequence[int] = PERCENTILES) -> Dict:
+        """Mean, standard deviation and percentiles of one return array."""
+        points = np.percentile(values, percentiles)
+        return {
+            'mean': round(float(values.mean()), 2),
+            'std': round(float(values.std()), 2),
+            'percentiles': {
+                f'p{p}': round(float(point), 2) for p, point in zip(percentiles, points)
+            }
+        }
+
+    @staticmethod
+    def _interpret(levered: np.ndarray, var_return: float) -> str:
+        """Summarize the simulated downside in one sentence."""
+        probability_of_loss = float(np.mean(levered < 0)) * 100
+        median = float(np.median(levered))
+
+        if var_return >= 0:
+            return (
+                f"Median levered return {median:.1f}%; returns stay positive in at least "
+                f"95% of scenarios ({probability_of_loss:.1f}% chance of a loss)."
+            )
+        return (
+            f"Median levered return {median:.1f}% with a {probability_of_loss:.1f}% chance of a loss; "
+            f"in the worst 5% of scenarios the levered return falls below {var_return:.1f}%."
+        )
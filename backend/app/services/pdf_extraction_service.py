@@ -1,12 +1,35 @@
-"""PDF property listing extraction service."""
-
+"""
+PDF property listing extraction service.
+
+Text is extracted a few pages at a time, in page order, and extraction stops
+as soon as enough has been read: the page budget is spent or (without an
+LLM) the target fields have all been found. With more than one worker, page
+chunks are parsed on a shared process pool while a sliding window keeps only
+the next few chunks in flight, so an early stop wastes at most one window of
+work.
+
+Fields are found by PropertyFieldExtractor in a single scan per chunk of
+pages. When its labeled matches already cover the key fields confidently
+enough, the LLM is not called at all. Otherwise the LLM sees only the pages
+PDFPageSelector ranks as relevant, within a token budget; if they exceed one
+call's budget they are split into batches that are extracted in parallel and
+merged.
+"""
+
+import io
+import multiprocessing
 import pdfplumber
 import os
 import re
 import json
-from typing import Optional, Dict
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import BinaryIO, Iterable, List, Optional, Dict, Tuple, Union
 from datetime import datetime
 from app.models.scraping_models import PropertyData, ScrapingResult
+from app.services.pdf_page_selector import PDFPageSelector
+from app.services.property_field_extractor import FieldExtraction, PropertyFieldExtractor
 try:
     from anthropic import Anthropic
     ANTHROPIC_AVAILABLE = True
@@ -24,32 +47,113 @@ class PDFParseError(PDFExtractionError):
     pass
 
 
+# A PDF as a path, its bytes, or a binary stream (e.g. an uploaded file)
+PDFSource = Union[str, bytes, BinaryIO]
+
+
+def _extract_page_texts(pdf_source: Union[str, bytes], start: int, end: int) -> List[str]:
+    """Extract the text of pages [start, end) (runs in pool workers, so module-level)."""
+    source = io.BytesIO(pdf_source) if isinstance(pdf_source, bytes) else pdf_source
+    with pdfplumber.open(source) as pdf:
+        return [page.extract_text() or '' for page in pdf.pages[start:end]]
+
+
 class PDFExtractionService:
     """Service for extracting property data from PDF listing documents."""
 
-    def __init__(self):
-        """Initialize PDF extraction service."""
+    # Identifies the extraction logic in cached results; bump it whenever the
+    # prompt, model, patterns or text extraction change
+    EXTRACTOR_VERSION = '4'
+
+    LLM_MODEL = "claude-3-5-sonnet-20241022"
+    # Tokens of selected page text per document, and per LLM call
+    LLM_TOKEN_BUDGET = 6000
+    LLM_CALL_TOKEN_BUDGET = 3000
+    LLM_MAX_PARALLEL_CALLS = 3
+
+    DEFAULT_MAX_PAGES = 40
+    PAGES_PER_TASK = 4
+    MAX_WORKERS = 4
+
+    # Without an LLM, extraction stops once the regex pass has found all of these
+    TARGET_FIELDS = ('address', 'city', 'state', 'asking_price', 'num_units', 'building_size_sf')
+
+    # With an LLM, the regex result is used instead (and reading stops) once all
+    # of these are found with at least REGEX_MIN_CONFIDENCE
+    REGEX_SUFFICIENT_FIELDS = ('address', 'city', 'state', 'asking_price', 'num_units')
+    REGEX_MIN_CONFIDENCE = 0.7
+
+    _executor: Optional[ProcessPoolExecutor] = None
+    _executor_workers = 0
+    _executor_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        llm_client=None,
+        llm_token_budget: Optional[int] = None,
+        llm_call_token_budget: Optional[int] = None,
+        llm_max_parallel_calls: Optional[int] = None,
+        regex_min_confidence: Optional[float] = None
+    ):
+        """
+        Initialize PDF extraction service.
+
+        Args:
+            max_workers: Processes parsing pages in parallel (default: CPU
+                count up to MAX_WORKERS; 1 parses in the calling thread)
+            max_pages: Default page budget per document
+            llm_client: Client with the Anthropic messages.create interface
+                (default: an Anthropic client if ANTHROPIC_API_KEY is set)
+            llm_token_budget: Tokens of page text sent to the LLM per document
+            llm_call_token_budget: Tokens of page text per LLM call
+            llm_max_parallel_calls: LLM calls in flight per document
+            regex_min_confidence: Confidence at which regex matches for
+                REGEX_SUFFICIENT_FIELDS make the LLM call unnecessary
+                (above 1 always calls the LLM)
+        """
+        self.max_workers = max_workers or min(os.cpu_count() or 1, self.MAX_WORKERS)
+        self.max_pages = max_pages or self.DEFAULT_MAX_PAGES
+        self.llm_token_budget = llm_token_budget or self.LLM_TOKEN_BUDGET
+        self.llm_call_token_budget = min(llm_call_token_budget or self.LLM_CALL_TOKEN_BUDGET, self.llm_token_budget)
+        self.llm_max_parallel_calls = llm_max_parallel_calls or self.LLM_MAX_PARALLEL_CALLS
+        self.regex_min_confidence = (
+            regex_min_confidence if regex_min_confidence is not None else self.REGEX_MIN_CONFIDENCE
+        )
         self.anthropic_api_key = os.getenv('ANTHROPIC_API_KEY')
-        if self.anthropic_api_key and ANTHROPIC_AVAILABLE:
+        if llm_client is not None:
+            self.anthropic_client = llm_client
+            self.use_llm = True
+        elif self.anthropic_api_key and ANTHROPIC_AVAILABLE:
             self.anthropic_client = Anthropic(api_key=self.anthropic_api_key)
             self.use_llm = True
         else:
             self.anthropic_client = None
             self.use_llm = False
 
-    def extract_from_pdf(self, pdf_path: str) -> ScrapingResult:
+    def extract_from_pdf(
+        self,
+        pdf: PDFSource,
+        max_pages: Optional[int] = None,
+        target_fields: Optional[Iterable[str]] = None
+    ) -> ScrapingResult:
         """
         Extract property data from a PDF file.
 
         Args:
-            pdf_path: Path to the PDF file
+            pdf: Path to the PDF file, its bytes, or a binary stream
+            max_pages: Most pages to read (default: the service's page budget)
+            target_fields: PropertyData fields whose discovery ends regex-only
+                extraction early (default: TARGET_FIELDS)
 
         Returns:
             ScrapingResult object with extracted data
         """
         try:
-            # Extract text from PDF
-            pdf_text = self._extract_text_from_pdf(pdf_path)
+            # Extract text from PDF, scanning it for fields as it is read
+            pages, extraction = self._extract_pages(pdf, max_pages, target_fields)
+            pdf_text = '\n'.join(page for page in pages if page)
 
             if not pdf_text or len(pdf_text.strip()) < 50:
                 return ScrapingResult(
@@ -62,13 +166,14 @@ class PDFExtractionService:
                     source_platform='pdf_upload'
                 )
 
-            # Extract structured data
-            if self.use_llm:
-                property_data = self._extract_with_llm(pdf_text)
+            # Extract structured data: the regex scan first, the LLM only if it falls short
+            use_llm = self.use_llm and not self._regex_sufficient(extraction)
+            if use_llm:
+                property_data = self._extract_with_llm(pages)
                 confidence = 0.85  # Higher confidence with LLM
             else:
-                property_data = self._extract_with_regex(pdf_text)
-                confidence = 0.65  # Lower confidence with regex
+                property_data = self._regex_result(extraction)
+                confidence = round(extraction.confidence(self.TARGET_FIELDS), 2)
 
             # Determine status
             if property_data and (property_data.address or property_data.asking_price):
@@ -84,7 +189,7 @@ class PDFExtractionService:
                 status=status,
                 extracted_data=property_data,
                 confidence_score=confidence,
-                method='pdf_llm_extraction' if self.use_llm else 'pdf_regex_extraction',
+                method='pdf_llm_extraction' if use_llm else 'pdf_regex_extraction',
                 source_platform='pdf_upload',
                 error_type=error_type,
                 error_message=error_message,
@@ -114,33 +219,212 @@ class PDFExtractionService:
                 source_platform='pdf_upload'
             )
 
-    def _extract_text_from_pdf(self, pdf_path: str) -> str:
-        """Extract raw text from PDF file."""
+    def extractor_version(self, max_pages: Optional[int] = None) -> str:
+        """
+        Cache key for results of this extractor: EXTRACTOR_VERSION plus the
+        settings that change the result (LLM token budgets or regex, page budget)
+        """
+        if self.use_llm:
+            method = f'llm-t{self.llm_token_budget}x{self.llm_call_token_budget}-r{self.regex_min_confidence}'
+        else:
+            method = 'regex'
+        return f"{self.EXTRACTOR_VERSION}-{method}-p{max_pages or self.max_pages}"
+
+    def _extract_pages(
+        self,
+        pdf: PDFSource,
+        max_pages: Optional[int] = None,
+        target_fields: Optional[Iterable[str]] = None
+    ) -> Tuple[List[str], FieldExtraction]:
+        """
+        Extract the text of each page (empty string for pages without text)
+
+        Returns:
+            Tuple of (page texts, fields found in them by PropertyFieldExtractor)
+        """
         try:
-            text_parts = []
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
+            pdf_source = pdf.read() if hasattr(pdf, 'read') else pdf
+
+            with pdfplumber.open(io.BytesIO(pdf_source) if isinstance(pdf_source, bytes) else pdf_source) as doc:
+                page_count = min(len(doc.pages), max_pages or self.max_pages)
+
+                # Short documents (or a single worker) are not worth a round trip to the pool
+                if self.max_workers <= 1 or page_count <= self.PAGES_PER_TASK:
+                    chunks = (
+                        [page.extract_text() or '' for page in doc.pages[start:end]]
+                        for start, end in self._page_chunks(page_count)
+                    )
+                    return self._collect_pages(chunks, target_fields)
 
-            full_text = '\n'.join(text_parts)
-            return full_text
+            return self._collect_pages(self._parallel_page_texts(pdf_source, page_count), target_fields)
 
         except Exception as e:
             raise PDFParseError(f"Failed to parse PDF: {str(e)}")
 
-    def _extract_with_llm(self, pdf_text: str) -> Optional[PropertyData]:
-        """Use Claude API to extract structured data from PDF text."""
+    def _page_chunks(self, page_count: int) -> List[Tuple[int, int]]:
+        return [
+            (start, min(start + self.PAGES_PER_TASK, page_count))
+            for start in range(0, page_count, self.PAGES_PER_TASK)
+        ]
+
+    def _collect_pages(
+        self,
+        chunks: Iterable[List[str]],
+        target_fields: Optional[Iterable[str]] = None
+    ) -> Tuple[List[str], FieldExtraction]:
+        """
+        Gather page chunks in order, scanning each new chunk for fields once
+
+        Without an LLM, stop once the target fields are found. With one, stop
+        only once the regex matches make the LLM unnecessary; otherwise read
+        the whole page budget so page selection can reach a rent roll or T-12
+        near the end. The scan covers the same text, at the same offsets, as
+        the pages joined with newlines, so its result is returned for reuse.
+        """
+        targets = tuple(target_fields) if target_fields is not None else self.TARGET_FIELDS
+        pages = []
+        extraction = FieldExtraction()
+        offset = 0
+
+        for page_texts in chunks:
+            pages.extend(page_texts)
+
+            chunk_text = '\n'.join(page for page in page_texts if page)
+            if chunk_text:
+                PropertyFieldExtractor.scan(chunk_text, extraction, offset)
+                offset += len(chunk_text) + 1
+
+            if self.use_llm:
+                if self._regex_sufficient(extraction):
+                    break
+            elif targets and extraction.covers(targets):
+                break
+
+        if hasattr(chunks, 'close'):
+            # Stop a parallel generator: cancels the chunks still in flight
+            chunks.close()
+
+        return pages, extraction
+
+    def _parallel_page_texts(self, pdf_source: Union[str, bytes], page_count: int):
+        """
+        Yield page chunks in order, parsed on the process pool
+
+        At most max_workers chunks are in flight; closing the generator
+        cancels the ones not yet started.
+        """
+        chunks = self._page_chunks(page_count)
+        executor = self._get_executor(self.max_workers)
+        pending = []
+        next_chunk = 0
+        next_yield = 0
+
+        try:
+            while next_chunk < len(chunks) or pending:
+                while next_chunk < len(chunks) and len(pending) < self.max_workers:
+                    start, end = chunks[next_chunk]
+                    pending.append(executor.submit(_extract_page_texts, pdf_source, start, end))
+                    next_chunk += 1
+                texts = pending.pop(0).result()
+                next_yield += 1
+                yield texts
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); drop the pool and finish in this thread
+            PDFExtractionService._reset_executor()
+            for start, end in chunks[next_yield:]:
+                yield _extract_page_texts(pdf_source, start, end)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @classmethod
+    def _get_executor(cls, max_workers: int) -> ProcessPoolExecutor:
+        """Get the shared page-parsing pool, created on first use."""
+        with cls._executor_lock:
+            if cls._executor is None or cls._executor_workers != max_workers:
+                if cls._executor is not None:
+                    cls._executor.shutdown(wait=False, cancel_futures=True)
+                # Spawned workers start clean instead of forking a threaded web worker
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+                cls._executor_workers = max_workers
+            return cls._executor
+
+    @classmethod
+    def _reset_executor(cls):
+        with cls._executor_lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
+            cls._executor_workers = 0
+
+    def _extract_with_llm(self, pages: List[str]) -> Optional[PropertyData]:
+        """
+        Use Claude API to extract structured data from the most relevant pages.
+
+        Pages are chosen by PDFPageSelector within llm_token_budget and split
+        into batches of llm_call_token_budget, extracted in parallel and merged.
+        """
+        pdf_text = '\n'.join(page for page in pages if page)
         if not self.anthropic_client:
             return self._extract_with_regex(pdf_text)
 
         try:
-            # Construct prompt for Claude
-            prompt = f"""Extract property listing information from the following text and return it as a JSON object.
+            page_limit_chars = self.llm_call_token_budget * PDFPageSelector.CHARS_PER_TOKEN
+            selected = PDFPageSelector.select_pages(
+                pages,
+                self.llm_token_budget,
+                page_token_limit=self.llm_call_token_budget
+            )
+            batches = PDFPageSelector.batch_pages(selected, self.llm_call_token_budget)
+            if not batches:
+                return self._extract_with_regex(pdf_text)
+
+            batch_texts = [
+                '\n\n'.join(
+                    f"--- Page {page_score.page + 1} ---\n{pages[page_score.page][:page_limit_chars]}"
+                    for page_score in batch
+                )
+                for batch in batches
+            ]
+
+            if len(batch_texts) == 1:
+                results = [self._call_llm_safely(batch_texts[0])]
+            else:
+                workers = min(self.llm_max_parallel_calls, len(batch_texts))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pdf-llm') as executor:
+                    results = list(executor.map(self._call_llm_safely, batch_texts))
+
+            data = PDFPageSelector.merge_results(results, batches)
+            if data is None:
+                # Fallback to regex extraction
+                return self._extract_with_regex(pdf_text)
+
+            # Create PropertyData object
+            return PropertyData.from_dict(data)
+
+        except Exception as e:
+            print(f"LLM extraction error: {str(e)}")
+            # Fallback to regex extraction
+            return self._extract_with_regex(pdf_text)
+
+    def _call_llm_safely(self, text: str) -> Optional[Dict]:
+        """Extract fields from one batch of pages, or None if the call fails."""
+        try:
+            return self._call_llm(text)
+        except Exception as e:
+            print(f"LLM extraction error: {str(e)}")
+            return None
+
+    def _call_llm(self, text: str) -> Dict:
+        """Ask the LLM for the listing fields in one batch of pages."""
+        # Construct prompt for Claude
+        prompt = f"""Extract property listing information from the following pages of an offering memorandum and return it as a JSON object.
 
 Text:
-{pdf_text[:15000]}  # Limit to avoid token limits
+{text}
 
 Please extract the following fields if available:
 - address (full street address)
@@ -171,97 +455,38 @@ Please extract the following fields if available:
 Return ONLY a valid JSON object with these fields. Use null for any fields that are not found.
 Do not include any explanation or additional text."""
 
-            message = self.anthropic_client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=2048,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
-
-            # Parse response
-            response_text = message.content[0].text.strip()
+        message = self.anthropic_client.messages.create(
+            model=self.LLM_MODEL,
+            max_tokens=2048,
+            messages=[{
+                "role": "user",
+                "content": prompt
+            }]
+        )
 
-            # Remove markdown code blocks if present
-            if response_text.startswith('```'):
-                response_text = re.sub(r'^```json?\s*', '', response_text)
-                response_text = re.sub(r'\s*```$', '', response_text)
+        # Parse response
+        response_text = message.content[0].text.strip()
 
-            # Parse JSON
-            data = json.loads(response_text)
+        # Remove markdown code blocks if present
+        if response_text.startswith('```'):
+            response_text = re.sub(r'^```json?\s*', '', response_text)
+            response_text = re.sub(r'\s*```$', '', response_text)
 
-            # Create PropertyData object
-            return PropertyData.from_dict(data)
-
-        except Exception as e:
-            print(f"LLM extraction error: {str(e)}")
-            # Fallback to regex extraction
-            return self._extract_with_regex(pdf_text)
+        # Parse JSON
+        return json.loads(response_text)
 
     def _extract_with_regex(self, pdf_text: str) -> Optional[PropertyData]:
         """Extract data using regex patterns (fallback method)."""
-        data = PropertyData()
-
-        # Price patterns
-        price_pattern = r'\$\s*([0-9,]+(?:\.[0-9]{2})?)\s*(?:USD|Price)?'
-        price_matches = re.findall(price_pattern, pdf_text)
-        if price_matches:
-            # Get the largest price (likely asking price)
-            prices = [float(p.replace(',', '')) for p in price_matches]
-            data.asking_price = max(prices)
-
-        # Units pattern
-        units_pattern = r'(\d+)\s*[Uu]nit'
-        units_match = re.search(units_pattern, pdf_text)
-        if units_match:
-            data.num_units = int(units_match.group(1))
-
-        # Cap rate pattern
-        cap_rate_pattern = r'(\d+\.?\d*)\s*%?\s*[Cc]ap\s*[Rr]ate'
-        cap_match = re.search(cap_rate_pattern, pdf_text)
-        if cap_match:
-            data.cap_rate = float(cap_match.group(1))
-
-        # Square footage pattern
-        sf_pattern = r'([0-9,]+)\s*[Ss][Ff]|[Ss]quare\s*[Ff]eet'
-        sf_match = re.search(sf_pattern, pdf_text)
-        if sf_match:
-            data.building_size_sf = float(sf_match.group(1).replace(',', ''))
-
-        # Year built pattern
-        year_pattern = r'[Yy]ear\s*[Bb]uilt:?\s*(\d{4})|[Bb]uilt\s*in\s*(\d{4})|(\d{4})\s*[Bb]uilt'
-        year_match = re.search(year_pattern, pdf_text)
-        if year_match:
-            year = year_match.group(1) or year_match.group(2) or year_match.group(3)
-            data.year_built = int(year)
-
-        # Address pattern (basic)
-        address_pattern = r'(\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Court|Ct))'
-        address_match = re.search(address_pattern, pdf_text)
-        if address_match:
-            data.address = address_match.group(1)
-
-        # City, State, ZIP pattern
-        location_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2})\s+(\d{5})'
-        location_match = re.search(location_pattern, pdf_text)
-        if location_match:
-            data.city = location_match.group(1)
-            data.state = location_match.group(2)
-            data.zipcode = location_match.group(3)
-
-        # Property type patterns
-        if re.search(r'[Mm]ultifamily|[Aa]partment', pdf_text):
-            data.property_type = 'Multifamily'
-        elif re.search(r'[Oo]ffice', pdf_text):
-            data.property_type = 'Office'
-        elif re.search(r'[Rr]etail', pdf_text):
-            data.property_type = 'Retail'
-        elif re.search(r'[Ii]ndustrial', pdf_text):
-            data.property_type = 'Industrial'
+        return self._regex_result(PropertyFieldExtractor.extract(pdf_text))
 
+    def _regex_result(self, extraction: FieldExtraction) -> Optional[PropertyData]:
+        data = extraction.to_property_data()
         return data if (data.address or data.asking_price) else None
 
+    def _regex_sufficient(self, extraction: FieldExtraction) -> bool:
+        """Whether the regex matches are good enough to skip the LLM."""
+        return extraction.covers(self.REGEX_SUFFICIENT_FIELDS, self.regex_min_confidence)
+
     def _get_missing_fields(self, data: PropertyData) -> list:
         """Identify which critical fields are missing."""
         missing = []
@@ -0,0 +1,156 @@
+"""
+PDF Import Service
+Extracts property data from an uploaded PDF and records the import
+
+Shared by POST /scraping/extract-pdf (inline) and the extract_pdf background
+job, so both return the same response body.
+
+Results are cached by the SHA-256 of the file and the extractor version: the
+import that ran an extraction stores the full ScrapingResult, and a later
+upload of the same file reuses it (no PDF parsing, no LLM call) unless the
+caller forces a re-extract. Failed extractions are not reused.
+"""
+
+import hashlib
+import json
+from typing import Dict, Optional, Tuple
+
+from flask import current_app
+
+from app.database import db, PropertyImportModel
+from app.models.scraping_models import ScrapingResult
+from app.services.pdf_extraction_service import PDFExtractionService
+
+
+class PDFImportService:
+    """
+    Service for importing property data from PDF uploads
+    """
+
+    _pdf_service: Optional[PDFExtractionService] = None
+
+    CACHEABLE_STATUSES = ('success', 'partial')
+
+    @staticmethod
+    def get_pdf_service() -> PDFExtractionService:
+        """Get or create the PDF extraction service instance."""
+        if PDFImportService._pdf_service is None:
+            PDFImportService._pdf_service = PDFExtractionService(
+                max_workers=current_app.config.get('PDF_EXTRACTION_WORKERS'),
+                max_pages=current_app.config.get('PDF_MAX_PAGES'),
+                llm_token_budget=current_app.config.get('PDF_LLM_TOKEN_BUDGET'),
+                llm_call_token_budget=current_app.config.get('PDF_LLM_CALL_TOKEN_BUDGET'),
+                llm_max_parallel_calls=current_app.config.get('PDF_LLM_MAX_PARALLEL_CALLS'),
+                regex_min_confidence=current_app.config.get('PDF_REGEX_MIN_CONFIDENCE')
+            )
+        return PDFImportService._pdf_service
+
+    @staticmethod
+    def find_cached_import(content_hash: str, extractor_version: str) -> Optional[PropertyImportModel]:
+        """Get the newest reusable extraction of a file by the given extractor, if any."""
+        return PropertyImportModel.query.filter(
+            PropertyImportModel.content_hash == content_hash,
+            PropertyImportModel.extractor_version == extractor_version,
+            PropertyImportModel.import_status.in_(PDFImportService.CACHEABLE_STATUSES),
+            PropertyImportModel.extraction_result.isnot(None)
+        ).order_by(
+            PropertyImportModel.created_at.desc(),
+            PropertyImportModel.id.desc()
+        ).first()
+
+    @staticmethod
+    def import_pdf(
+        pdf_bytes: bytes,
+        filename: str,
+        max_pages: Optional[int] = None,
+        force: bool = False
+    ) -> Tuple[Dict, int]:
+        """
+        Extract property data from a PDF and save a PropertyImportModel
+
+        Args:
+            pdf_bytes: Contents of the uploaded PDF
+            filename: Sanitized upload filename
+            max_pages: Most pages to read (default: PDF_MAX_PAGES)
+            force: Re-extract even if this file was extracted before
+
+        Returns:
+            Tuple of (response body, HTTP status code): 200 with the
+            extracted data and importId, or 400 if extraction failed
+        """
+        pdf_service = PDFImportService.get_pdf_service()
+        content_hash = hashlib.sha256(pdf_bytes).hexdigest()
+        extractor_version = pdf_service.extractor_version(max_pages)
+
+        cached_import = None if force else PDFImportService.find_cached_import(content_hash, extractor_version)
+        if cached_import is not None:
+            result = ScrapingResult.from_dict(json.loads(cached_import.extraction_result))
+        else:
+            # Extract property data from PDF (parsed from memory)
+            result = pdf_service.extract_from_pdf(pdf_bytes, max_pages=max_pages)
+
+        # Save import record to database
+        import_record = PropertyImportModel(
+            source_url=f'pdf_upload:{filename}',
+            source_platform='pdf_upload',
+            import_status=result.status,
+            import_method=result.method,
+            error_type=result.error_type,
+            error_message=result.error_message,
+            confidence_score=result.confidence_score,
+            user_assisted=False,
+            content_hash=content_hash,
+            extractor_version=extractor_version,
+            extraction_result=json.dumps(result.to_dict()) if cached_import is None else None
+        )
+
+        # Save extracted data as JSON
+        if result.extracted_data:
+            import_record.extracted_data = json.dumps(result.extracted_data.to_dict())
+
+            # Also save individual fields for easy querying
+            import_record.property_address = result.extracted_data.address
+            import_record.city = result.extracted_data.city
+            import_record.state = result.extracted_data.state
+            import_record.zipcode = result.extracted_data.zipcode
+            import_record.latitude = result.extracted_data.latitude
+            import_record.longitude = result.extracted_data.longitude
+            import_record.price = result.extracted_data.asking_price
+            import_record.square_footage = result.extracted_data.building_size_sf
+            import_record.units = result.extracted_data.num_units
+            import_record.bedrooms = result.extracted_data.bedrooms
+            import_record.bathrooms = result.extracted_data.bathrooms
+            import_record.year_built = result.extracted_data.year_built
+            import_record.property_type = result.extracted_data.property_type
+            import_record.noi = result.extracted_data.noi
+            import_record.cap_rate = result.extracted_data.cap_rate
+            import_record.gross_income = result.extracted_data.gross_income
+
+        # Commit to database
+        db.session.add(import_record)
+        db.session.commit()
+
+        # Return result
+        if result.status == 'failed':
+            return {
+                'success': False,
+                'error': result.error_message or 'Failed to extract property data from PDF',
+                'code': 'EXTRACTION_FAILED',
+                'details': {
+                    'importId': import_record.id,
+                    'status': result.status,
+                    'errorType': result.error_type,
+                    'errorMessage': result.error_message,
+                    'suggestedAction': result.suggested_action
+                }
+            }, 400
+
+        response_data = result.to_dict()
+        response_data['importId'] = import_record.id
+        response_data['cached'] = cached_import is not None
+        response_data['cachedFromImportId'] = cached_import.id if cached_import is not None else None
+
+        return {
+            'success': True,
+            'data': response_data
+        }, 200
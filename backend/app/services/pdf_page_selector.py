@@ -0,0 +1,248 @@
+"""
+PDF page selection for LLM extraction
+
+Offering memorandums put the numbers that matter (pricing summary, rent
+roll, T-12) anywhere in the document, surrounded by pages of market
+narrative and photos. Instead of sending the LLM the first N characters,
+each page is scored by how densely it matches the signals the extraction
+needs (price, units, cap rate, NOI, year built, address, size), and the
+smallest set of pages that covers those signals is chosen greedily within
+a token budget.
+
+Selected pages are packed, in document order, into batches that each fit
+one LLM call; merge_results() combines the per-batch answers, taking each
+field from the batch with the strongest evidence for it.
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+
+@dataclass
+class PageScore:
+    """Relevance of one PDF page to property extraction."""
+
+    page: int  # Zero-based page index
+    score: float
+    tokens: int
+    signals: Dict[str, int] = field(default_factory=dict)  # Signal -> capped match count
+
+
+class PDFPageSelector:
+    """
+    Scores PDF pages and chooses the ones worth sending to the LLM
+    """
+
+    CHARS_PER_TOKEN = 4  # Rough English average, good enough for budgeting
+
+    # Signal -> (pattern, weight)
+    SIGNALS = {
+        'price': (re.compile(
+            r'asking\s+price|offering\s+price|purchase\s+price|list\s+price|price\s+per\s+unit|'
+            r'\$\s?\d{1,3}(?:,\d{3})+', re.I), 3.0),
+        'cap_rate': (re.compile(r'cap(?:italization)?\s*rate', re.I), 3.0),
+        'noi': (re.compile(
+            r'net\s+operating\s+income|\bNOI\b|\bT-?12\b|trailing\s+(?:12|twelve)|operating\s+statement|'
+            r'gross\s+(?:potential\s+)?income|effective\s+gross', re.I), 3.0),
+        'units': (re.compile(r'\b\d+\s*(?:units?|apartments|doors)\b|unit\s+mix|rent\s+roll', re.I), 2.0),
+        'address': (re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z]{2}\s+\d{5}\b'), 2.0),
+        'year_built': (re.compile(r'year\s+built|built\s+in\s+\d{4}|\d{4}\s+built|renovated\s+in', re.I), 1.5),
+        'size': (re.compile(r'square\s+feet|\bSF\b|rentable\s+area|lot\s+size|\bacres?\b', re.I), 1.0),
+    }
+
+    # Matches beyond this per page add nothing (one long table should not dominate)
+    MAX_MATCHES_PER_SIGNAL = 5
+    # Capped matches of a signal, across the selected pages, that count as covered
+    SIGNAL_TARGET = 3
+
+    # Extracted field (camelCase, as returned by the LLM) -> signal that evidences it
+    FIELD_SIGNALS = {
+        'askingPrice': 'price',
+        'pricePerUnit': 'price',
+        'capRate': 'cap_rate',
+        'noi': 'noi',
+        'grossIncome': 'noi',
+        'occupancy': 'noi',
+        'numUnits': 'units',
+        'bedrooms': 'units',
+        'bathrooms': 'units',
+        'address': 'address',
+        'city': 'address',
+        'state': 'address',
+        'zipcode': 'address',
+        'yearBuilt': 'year_built',
+        'buildingSizeSf': 'size',
+        'lotSizeAc': 'size',
+    }
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        return math.ceil(len(text) / PDFPageSelector.CHARS_PER_TOKEN)
+
+    @staticmethod
+    def score_page(page: int, text: str) -> PageScore:
+        """
+        Score one page by signal density
+
+        The weighted, capped match count is divided by the square root of the
+        page length (in 100-token units), so a short pricing summary outranks
+        a long narrative page with the same few mentions.
+        """
+        tokens = PDFPageSelector.estimate_tokens(text)
+        signals = {}
+        raw_score = 0.0
+        for name, (pattern, weight) in PDFPageSelector.SIGNALS.items():
+            count = min(len(pattern.findall(text)), PDFPageSelector.MAX_MATCHES_PER_SIGNAL)
+            if count:
+                signals[name] = count
+                raw_score += weight * count
+
+        score = raw_score / math.sqrt(max(tokens, 100) / 100)
+        return PageScore(page=page, score=score, tokens=tokens, signals=signals)
+
+    @staticmethod
+    def select_pages(
+        pages: Sequence[str],
+        token_budget: int,
+        page_token_limit: Optional[int] = None
+    ) -> List[PageScore]:
+        """
+        Choose the smallest set of pages that covers the extraction signals
+
+        Greedy weighted coverage: repeatedly take the page that adds the most
+        still-needed signal evidence per token, until every signal found in
+        the document reaches SIGNAL_TARGET (or all of its evidence) or the
+        budget is spent. Documents with no signals fall back to their
+        leading pages.
+
+        Args:
+            pages: Text of each page, in document order
+            token_budget: Most tokens of page text to select
+            page_token_limit: Pages longer than this are counted (and later
+                sent) truncated to it
+
+        Returns:
+            Selected pages in document order
+        """
+        scores = []
+        for index, text in enumerate(pages):
+            if not text.strip():
+                continue
+            page_score = PDFPageSelector.score_page(index, text)
+            if page_token_limit:
+                page_score.tokens = min(page_score.tokens, page_token_limit)
+            scores.append(page_score)
+
+        candidates = [page_score for page_score in scores if page_score.signals]
+        if not candidates:
+            return PDFPageSelector._leading_pages(scores, token_budget)
+
+        # How much evidence each signal still needs (capped by what the document has)
+        need = {}
+        for page_score in candidates:
+            for name, count in page_score.signals.items():
+                need[name] = need.get(name, 0) + count
+        need = {name: min(total, PDFPageSelector.SIGNAL_TARGET) for name, total in need.items()}
+
+        selected = []
+        remaining = token_budget
+        while any(need.values()):
+            best = None
+            best_key = None
+            for page_score in candidates:
+                if page_score.tokens > remaining:
+                    continue
+                gain = sum(
+                    PDFPageSelector.SIGNALS[name][1] * min(count, need[name])
+                    for name, count in page_score.signals.items()
+                )
+                if gain <= 0:
+                    continue
+                key = (gain / max(page_score.tokens, 1), page_score.score)
+                if best_key is None or key > best_key:
+                    best, best_key = page_score, key
+
+            if best is None:
+                break
+
+            selected.append(best)
+            candidates.remove(best)
+            remaining -= best.tokens
+            for name, count in best.signals.items():
+                need[name] = max(need[name] - count, 0)
+
+        return sorted(selected, key=lambda page_score: page_score.page)
+
+    @staticmethod
+    def batch_pages(selected: Sequence[PageScore], call_token_budget: int) -> List[List[PageScore]]:
+        """Pack selected pages, in document order, into batches of at most call_token_budget tokens."""
+        batches = []
+        current = []
+        current_tokens = 0
+        for page_score in selected:
+            if current and current_tokens + page_score.tokens > call_token_budget:
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(page_score)
+            current_tokens += page_score.tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    @staticmethod
+    def merge_results(results: Sequence[Optional[Dict]], batches: Sequence[Sequence[PageScore]]) -> Optional[Dict]:
+        """
+        Merge per-batch extraction results into one
+
+        Each field is taken from the batch with the most evidence for its
+        signal (FIELD_SIGNALS); other fields from the first batch that has
+        them. Failed batches (None) are skipped.
+
+        Args:
+            results: Extracted field dicts, one per batch (None if the call failed)
+            batches: The batches the results came from
+
+        Returns:
+            Merged field dict, or None if every batch failed
+        """
+        answered = [
+            (result, batch) for result, batch in zip(results, batches)
+            if result is not None
+        ]
+        if not answered:
+            return None
+
+        merged = {}
+        for result, _ in answered:
+            for key in result:
+                merged.setdefault(key, None)
+
+        for key in merged:
+            signal = PDFPageSelector.FIELD_SIGNALS.get(key)
+            best_value = None
+            best_evidence = -1
+            for result, batch in answered:
+                value = result.get(key)
+                if value is None:
+                    continue
+                evidence = sum(page_score.signals.get(signal, 0) for page_score in batch) if signal else 0
+                if evidence > best_evidence:
+                    best_value, best_evidence = value, evidence
+            merged[key] = best_value
+
+        return merged
+
+    @staticmethod
+    def _leading_pages(scores: Sequence[PageScore], token_budget: int) -> List[PageScore]:
+        """First pages that fit the budget (for documents with no recognizable signals)."""
+        selected = []
+        remaining = token_budget
+        for page_score in scores:
+            if page_score.tokens > remaining:
+                break
+            selected.append(page_score)
+            remaining -= page_score.tokens
+        return selected
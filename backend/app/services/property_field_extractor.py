@@ -0,0 +1,563 @@
+"""
+Property field extraction engine
+
+Pulls listing fields (price, units, cap rate, NOI, address, ...) out of
+document text with a fixed set of rules. All rules are compiled once into a
+single alternation, so a document is scanned in one pass no matter how many
+rules there are. Labeled rules ("Asking Price: $4,250,000") come before bare
+ones ("$4,250,000") in the alternation, and a match consumes its text, so a
+labeled value is never counted again as a weaker candidate.
+
+Every match is kept as a FieldCandidate with its position and the rule's
+confidence; FieldExtraction.best() picks one value per field. The same
+parsers serve label/value pairs from HTML tables (extract_pairs), so PDF
+uploads and scraped listings share one set of field rules.
+"""
+
+import re
+import string
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+
+from app.models.scraping_models import PropertyData
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+
+# Building blocks for rule patterns
+_NUMBER = r'\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?'
+_GROUPED = r'\d{1,3}(?:,\d{3})+(?:\.\d+)?'  # Comma-grouped amounts only (not years or counts)
+_MONEY = rf'\$?[ \t]*(?:{_NUMBER})(?:[ \t]*(?:million\b|mm\b|m\b|k\b))?'
+_STREET_SUFFIX = (
+    r'Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Court|Ct|'
+    r'Parkway|Pkwy|Place|Pl|Highway|Hwy|Circle|Cir|Trail|Trl'
+)
+
+# Character classes the scanner dispatches on at the start of a word
+_LEAD_CLASSES = ('$', string.digits, string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _first_chars(items, ignore_case: bool = False) -> Optional[set]:
+    """
+    Characters a parsed pattern can start with
+
+    Returns None when that cannot be worked out (the pattern may match
+    empty, or starts with a construct not handled here); such a rule is
+    tried at every word start.
+    """
+    chars = set()
+
+    def add(code: int):
+        char = chr(code)
+        chars.update((char.lower(), char.upper()) if ignore_case else (char,))
+
+    for op, av in items:
+        if op in (sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            continue  # Zero-width
+        if op is sre_parse.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            sub_ignore_case = bool(
+                (ignore_case or add_flags & sre_parse.SRE_FLAG_IGNORECASE)
+                and not del_flags & sre_parse.SRE_FLAG_IGNORECASE
+            )
+            lead = _first_chars(sub.data, sub_ignore_case)
+            if lead is None:
+                return None
+            chars |= lead
+            if sub.getwidth()[0] > 0:
+                return chars
+            continue
+        if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            minimum, _, sub = av
+            lead = _first_chars(sub.data, ignore_case)
+            if lead is None:
+                return None
+            chars |= lead
+            if minimum > 0 and sub.getwidth()[0] > 0:
+                return chars
+            continue
+        if op is sre_parse.BRANCH:
+            for alternative in av[1]:
+                lead = _first_chars(alternative.data, ignore_case)
+                if lead is None or alternative.getwidth()[0] == 0:
+                    return None
+                chars |= lead
+            return chars
+        if op is sre_parse.LITERAL:
+            add(av)
+            return chars
+        if op is sre_parse.IN:
+            for set_op, set_av in av:
+                if set_op is sre_parse.LITERAL:
+                    add(set_av)
+                elif set_op is sre_parse.RANGE:
+                    for code in range(set_av[0], set_av[1] + 1):
+                        add(code)
+                elif set_op is sre_parse.CATEGORY and set_av is sre_parse.CATEGORY_DIGIT:
+                    chars.update(string.digits)
+                else:
+                    return None
+            return chars
+        return None
+
+    return None
+
+
+# Value parsers' patterns
+_MONEY_VALUE = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*(million|mm|m|k)?\b', re.I)
+_INT_VALUE = re.compile(r'\d[\d,]*')
+_DECIMAL_VALUE = re.compile(r'\d+(?:\.\d+)?')
+_YEAR_VALUE = re.compile(r'\b(?:18|19|20)\d{2}\b')
+_ACRES_VALUE = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*ac', re.I)
+
+
+def _parse_money(text: str) -> Optional[float]:
+    """Parse a dollar amount ($4,250,000, $4.25M, 625k, 4.2 million)."""
+    match = _MONEY_VALUE.search(text)
+    if not match:
+        return None
+    amount = float(match.group(1).replace(',', ''))
+    suffix = (match.group(2) or '').lower()
+    if suffix in ('million', 'mm', 'm'):
+        amount *= 1_000_000
+    elif suffix == 'k':
+        amount *= 1_000
+    return amount if amount > 0 else None
+
+
+def _parse_int(text: str) -> Optional[int]:
+    """Parse the first whole number (commas allowed)."""
+    match = _INT_VALUE.search(text)
+    return int(match.group().replace(',', '')) if match else None
+
+
+def _parse_count(text: str) -> Optional[int]:
+    """Parse a unit/space/story count (positive and plausible)."""
+    count = _parse_int(text)
+    return count if count and count <= 100_000 else None
+
+
+def _parse_percent(text: str) -> Optional[float]:
+    match = _DECIMAL_VALUE.search(text)
+    if not match:
+        return None
+    value = float(match.group())
+    return value if 0 < value <= 100 else None
+
+
+def _parse_cap_rate(text: str) -> Optional[float]:
+    value = _parse_percent(text)
+    return value if value is not None and value <= 25 else None
+
+
+def _parse_year(text: str) -> Optional[int]:
+    match = _YEAR_VALUE.search(text)
+    if not match:
+        return None
+    year = int(match.group())
+    return year if year <= datetime.now().year + 5 else None
+
+
+def _parse_acres(text: str) -> Optional[float]:
+    match = _ACRES_VALUE.search(text)
+    return float(match.group(1).replace(',', '')) if match else None
+
+
+def _parse_text(text: str) -> Optional[str]:
+    text = ' '.join(text.split()).strip(' .,:;')
+    return text or None
+
+
+_PROPERTY_TYPES = (
+    (re.compile(r'multi-?\s*family|apartment', re.I), 'Multifamily'),
+    (re.compile(r'office', re.I), 'Office'),
+    (re.compile(r'retail', re.I), 'Retail'),
+    (re.compile(r'industrial', re.I), 'Industrial'),
+    (re.compile(r'mixed[- ]use', re.I), 'Mixed Use'),
+)
+
+
+def _parse_property_type(text: str) -> Optional[str]:
+    """Map a property type mention to its canonical name (unknown labels are kept as written)."""
+    for pattern, name in _PROPERTY_TYPES:
+        if pattern.search(text):
+            return name
+    return _parse_text(text)
+
+
+@dataclass
+class FieldRule:
+    """
+    One extraction rule
+
+    The pattern names its value groups after PropertyData fields (e.g.
+    (?P<asking_price>...)); a rule can fill several fields at once.
+    """
+
+    name: str
+    pattern: str
+    confidence: float
+    ignore_case: bool = True
+    parser: Optional[Callable[[str], Any]] = None  # Overrides the field's parser
+
+
+@dataclass
+class FieldCandidate:
+    """One value found for a field."""
+
+    field: str
+    value: Any
+    start: int  # Character offset in the scanned text (pair index for extract_pairs)
+    end: int
+    confidence: float
+    rule: str
+
+    def to_dict(self) -> dict:
+        return {
+            'value': self.value,
+            'start': self.start,
+            'end': self.end,
+            'confidence': self.confidence,
+            'rule': self.rule
+        }
+
+
+@dataclass
+class FieldExtraction:
+    """All candidates found in a document, by PropertyData field."""
+
+    candidates: Dict[str, List[FieldCandidate]] = field(default_factory=dict)
+
+    def add(self, candidate: FieldCandidate):
+        self.candidates.setdefault(candidate.field, []).append(candidate)
+
+    def best(self, field_name: str) -> Optional[FieldCandidate]:
+        """
+        The most confident candidate for a field
+
+        Ties go to the earliest mention, except for MAX_FIELDS, where the
+        largest value wins (the asking price is usually the biggest bare
+        dollar amount, the building the biggest square footage).
+        """
+        candidates = self.candidates.get(field_name)
+        if not candidates:
+            return None
+        if field_name in PropertyFieldExtractor.MAX_FIELDS:
+            return max(candidates, key=lambda c: (c.confidence, c.value, -c.start))
+        return max(candidates, key=lambda c: (c.confidence, -c.start))
+
+    def value(self, field_name: str) -> Any:
+        candidate = self.best(field_name)
+        return candidate.value if candidate else None
+
+    def confidence(self, fields: Iterable[str]) -> float:
+        """Mean best-candidate confidence over fields (a missing field counts as 0)."""
+        fields = tuple(fields)
+        if not fields:
+            return 0.0
+        total = 0.0
+        for field_name in fields:
+            candidate = self.best(field_name)
+            total += candidate.confidence if candidate else 0.0
+        return total / len(fields)
+
+    def covers(self, fields: Iterable[str], min_confidence: float = 0.0) -> bool:
+        """Whether every field has a candidate at least min_confidence sure."""
+        for field_name in fields:
+            candidate = self.best(field_name)
+            if candidate is None or candidate.confidence < min_confidence:
+                return False
+        return True
+
+    def to_property_data(self, data: Optional[PropertyData] = None) -> PropertyData:
+        """Set each field's best value on data (a new PropertyData by default)."""
+        data = data if data is not None else PropertyData()
+        for field_name in self.candidates:
+            candidate = self.best(field_name)
+            if candidate is not None:
+                setattr(data, field_name, candidate.value)
+        return data
+
+    def to_dict(self) -> dict:
+        return {
+            field_name: [candidate.to_dict() for candidate in candidates]
+            for field_name, candidates in self.candidates.items()
+        }
+
+
+class PropertyFieldExtractor:
+    """
+    Single-pass, rule-based property field extraction
+    """
+
+    # Ordered: where rules could match at the same position, the first listed wins,
+    # so labeled rules precede bare ones
+    RULES = [
+        # Pricing
+        FieldRule('labeled_price', rf'\b(?:asking|offering|purchase|list|sale|sales)\s+price\s*:?\s*(?P<asking_price>{_MONEY})', 0.9),
+        FieldRule('price_per_unit', rf'\bprice\s*(?:per|/)\s*(?:unit|door)\s*:?\s*(?P<price_per_unit>{_MONEY})', 0.85),
+        FieldRule('price_per_sf', rf'\bprice\s*(?:per|/)\s*(?:sf|sq\.?\s*ft\.?|square\s+foot)\s*:?\s*(?P<price_per_sf>{_MONEY})', 0.85),
+        FieldRule('offered_at', rf'\b(?:offered|priced)\s+at\s*:?\s*(?P<asking_price>\$[ \t]*(?:{_NUMBER})(?:[ \t]*(?:million\b|mm\b|m\b|k\b))?)', 0.85),
+        FieldRule('price', rf'\bprice\s*:\s*(?P<asking_price>\$[ \t]*(?:{_NUMBER})(?:[ \t]*(?:million\b|mm\b|m\b|k\b))?)', 0.8),
+        FieldRule('cap_rate', rf'\bcap(?:italization)?\s*rate\s*(?:\([^)\n]{{0,20}}\)\s*)?:?\s*(?P<cap_rate>{_NUMBER})\s*%', 0.9),
+        FieldRule('cap_rate_suffix', rf'(?P<cap_rate>{_NUMBER})\s*%?\s*cap(?:italization)?\s*rate', 0.8),
+        # Any other dollar amount: weak, the largest is taken (rents and expenses are smaller)
+        FieldRule('dollar_amount', rf'(?P<asking_price>\$[ \t]*(?:{_NUMBER})(?:[ \t]*(?:million\b|mm\b|m\b|k\b))?)', 0.3),
+
+        # Income
+        FieldRule('noi', rf'\b(?:net\s+operating\s+income|NOI)\b(?:\s*\([^)\n]{{0,20}}\))?\s*:?\s*(?P<noi>\$?[ \t]*(?:{_GROUPED}))', 0.85),
+        FieldRule('effective_gross_income', rf'\beffective\s+gross\s+income\b(?:\s*\([^)\n]{{0,20}}\))?\s*:?\s*(?P<gross_income>\$?[ \t]*(?:{_GROUPED}))', 0.85),
+        FieldRule('gross_income', rf'\bgross\s+(?:potential\s+|scheduled\s+)?(?:income|rent)\b(?:\s*\([^)\n]{{0,20}}\))?\s*:?\s*(?P<gross_income>\$?[ \t]*(?:{_GROUPED}))', 0.7),
+        FieldRule('occupancy', rf'\boccupancy(?:\s+rate)?\s*:?\s*(?P<occupancy_rate>{_NUMBER})\s*%', 0.85),
+        FieldRule('occupancy_suffix', rf'(?P<occupancy_rate>{_NUMBER})\s*%\s*(?:occupied|leased|occupancy)\b', 0.8),
+
+        # Physical
+        FieldRule('labeled_units', r'\b(?:number\s+of\s+units|total\s+units|unit\s+count|units)\s*:\s*(?P<num_units>\d[\d,]*)', 0.85),
+        FieldRule('units', r'(?<![\d,.$])(?P<num_units>\d[\d,]*)[ \t]*-?[ \t]*(?:units?|apartments|apartment\s+homes|doors)\b', 0.7),
+        FieldRule('labeled_size', rf'\b(?:building\s+size|(?:net\s+)?rentable\s+(?:building\s+)?area|gross\s+building\s+area|GBA|NRA|RBA)\b\s*:?\s*(?P<building_size_sf>{_NUMBER})', 0.85),
+        FieldRule('size', r'(?<![\d,.$])(?P<building_size_sf>\d{1,3}(?:,\d{3})+|\d+)[ \t]*(?:SF|sq\.?[ \t]*ft\.?|square[ \t]+feet)(?![a-z])', 0.5),
+        FieldRule('labeled_lot_size', rf'\blot\s+size\s*:?\s*(?P<lot_size_acres>(?:{_NUMBER})\s*(?:acres?|ac)\b)', 0.85),
+        FieldRule('lot_size', rf'(?<![\d,.$])(?P<lot_size_acres>(?:{_NUMBER})[ \t]*(?:acres?|ac)\b)', 0.5),
+        FieldRule('labeled_year_built', r'\byear\s+built\b[^\d\n]{0,20}(?P<year_built>\d{4})\b', 0.9),
+        FieldRule('built_in', r'\bbuilt\s+in\s+(?P<year_built>\d{4})\b', 0.8),
+        FieldRule('year_built_suffix', r'\b(?P<year_built>\d{4})\s+built\b', 0.6),
+        FieldRule('labeled_stories', r'\b(?:stories|floors)\s*:\s*(?P<num_stories>\d+)', 0.85),
+        FieldRule('labeled_parking', r'\bparking\s+spaces\s*:\s*(?P<parking_spaces>\d[\d,]*)', 0.85),
+
+        # Location
+        FieldRule('labeled_address', r'\b(?:property\s+)?address\s*:[ \t]*(?P<address>[^\n,]{3,80})', 0.8),
+        FieldRule(
+            'street_address',
+            rf"(?P<address>\b\d{{1,6}}[ \t]+(?:[A-Z0-9][A-Za-z0-9.']*[ \t]+){{0,4}}(?:{_STREET_SUFFIX})\b\.?)",
+            0.75,
+            ignore_case=False
+        ),
+        FieldRule(
+            'city_state_zip',
+            r'(?P<city>\b[A-Z][a-z]+(?:[ \t]+[A-Z][a-z]+)*),[ \t]*(?P<state>[A-Z]{2})[ \t]+(?P<zipcode>\d{5})(?:-\d{4})?\b',
+            0.8,
+            ignore_case=False
+        ),
+
+        # Property type: labeled, then by keyword (higher confidence breaks ties between mentioned types)
+        FieldRule('labeled_property_type', r'\b(?:property|asset)\s+type\s*:[ \t]*(?P<property_type>[^\n,]{3,40})', 0.9),
+        FieldRule('multifamily', r'\b(?P<property_type>multi-?\s*family|apartments?)\b', 0.6),
+        FieldRule('office', r'\b(?P<property_type>office)\b', 0.5),
+        FieldRule('retail', r'\b(?P<property_type>retail)\b', 0.45),
+        FieldRule('industrial', r'\b(?P<property_type>industrial)\b', 0.4),
+    ]
+
+    # PropertyData field -> parser of a matched value
+    FIELD_PARSERS: Dict[str, Callable[[str], Any]] = {
+        'asking_price': _parse_money,
+        'price_per_unit': _parse_money,
+        'price_per_sf': _parse_money,
+        'noi': _parse_money,
+        'gross_income': _parse_money,
+        'cap_rate': _parse_cap_rate,
+        'occupancy_rate': _parse_percent,
+        'num_units': _parse_count,
+        'num_stories': _parse_count,
+        'parking_spaces': _parse_count,
+        'building_size_sf': _parse_int,
+        'lot_size_acres': _parse_acres,
+        'year_built': _parse_year,
+        'address': _parse_text,
+        'city': _parse_text,
+        'state': _parse_text,
+        'zipcode': _parse_text,
+        'property_type': _parse_property_type,
+        'zoning': _parse_text,
+    }
+
+    # Fields whose largest value wins among equally confident candidates
+    MAX_FIELDS = ('asking_price', 'building_size_sf')
+
+    # Label/value pairs (HTML tables, "Label: value" list items): label pattern -> field.
+    # The leftmost label match wins; on a tie, the first listed
+    LABELS = [
+        (r'price\s*(?:per|/)\s*(?:unit|door)', 'price_per_unit'),
+        (r'price\s*(?:per|/)\s*(?:sf|sq|square)', 'price_per_sf'),
+        (r'building\s+size|square\s+feet|rentable\s+area|gross\s+building\s+area', 'building_size_sf'),
+        (r'year\s+built', 'year_built'),
+        (r'stories', 'num_stories'),
+        (r'cap\s*rate', 'cap_rate'),
+        (r'occupancy', 'occupancy_rate'),
+        (r'net\s+operating\s+income|\bnoi\b', 'noi'),
+        (r'units', 'num_units'),
+        (r'price|asking', 'asking_price'),
+        (r'parking', 'parking_spaces'),
+        (r'lot\s+size', 'lot_size_acres'),
+        (r'property\s+type', 'property_type'),
+        (r'zoning', 'zoning'),
+    ]
+    LABEL_CONFIDENCE = 0.9
+
+    # (scanner, group name -> (rule, [(field, group name)]), label matcher)
+    _compiled: Optional[Tuple[Pattern, Dict[str, Tuple[FieldRule, List[Tuple[str, str]]]], Pattern]] = None
+    _compile_lock = threading.Lock()
+
+    @staticmethod
+    def extract(text: str) -> FieldExtraction:
+        """
+        Scan document text once for every rule
+
+        Args:
+            text: Document text (e.g. the pages of a PDF, joined)
+
+        Returns:
+            FieldExtraction with every candidate found
+        """
+        extraction = FieldExtraction()
+        PropertyFieldExtractor.scan(text, extraction)
+        return extraction
+
+    @staticmethod
+    def scan(text: str, extraction: FieldExtraction, offset: int = 0) -> FieldExtraction:
+        """
+        Add the candidates in text to an existing extraction
+
+        Lets a document be scanned piece by piece as it is read; offset is
+        where text starts in the whole document, so positions stay comparable.
+        """
+        scanner, rules, _ = PropertyFieldExtractor._get_compiled()
+
+        for match in scanner.finditer(text):
+            rule, groups = rules[match.lastgroup]
+            for field_name, group_name in groups:
+                raw = match.group(group_name)
+                if raw is None:
+                    continue
+                parser = rule.parser or PropertyFieldExtractor.FIELD_PARSERS[field_name]
+                value = parser(raw)
+                if value is None:
+                    continue
+                extraction.add(FieldCandidate(
+                    field=field_name,
+                    value=value,
+                    start=offset + match.start(group_name),
+                    end=offset + match.end(group_name),
+                    confidence=rule.confidence,
+                    rule=rule.name
+                ))
+
+        return extraction
+
+    @staticmethod
+    def extract_pairs(pairs: Iterable[Tuple[str, str]]) -> FieldExtraction:
+        """
+        Extract fields from label/value pairs (e.g. two-cell HTML table rows)
+
+        Args:
+            pairs: (label, value) text pairs
+
+        Returns:
+            FieldExtraction whose candidate positions are pair indexes
+        """
+        _, _, label_pattern = PropertyFieldExtractor._get_compiled()
+        extraction = FieldExtraction()
+
+        for index, (label, value) in enumerate(pairs):
+            match = label_pattern.search(label)
+            if not match:
+                continue
+            field_name = PropertyFieldExtractor.LABELS[int(match.lastgroup[1:])][1]
+            parsed = PropertyFieldExtractor.FIELD_PARSERS[field_name](value)
+            if parsed is None:
+                continue
+            extraction.add(FieldCandidate(
+                field=field_name,
+                value=parsed,
+                start=index,
+                end=index,
+                confidence=PropertyFieldExtractor.LABEL_CONFIDENCE,
+                rule=f'label:{field_name}'
+            ))
+
+        return extraction
+
+    @staticmethod
+    def _get_compiled():
+        """Compile the rule scanner and label matcher once per process."""
+        if PropertyFieldExtractor._compiled is None:
+            with PropertyFieldExtractor._compile_lock:
+                if PropertyFieldExtractor._compiled is None:
+                    PropertyFieldExtractor._compiled = PropertyFieldExtractor._compile()
+        return PropertyFieldExtractor._compiled
+
+    @staticmethod
+    def _compile():
+        """
+        Build the scanner: one alternation of every rule, dispatched on the first character
+
+        Only the rules that can start with a word's first character are tried
+        there: the scanner first checks the character class ($, digit, upper
+        or lower case), then the character itself, so a word that cannot start
+        any rule costs a few checks instead of a failed attempt per rule.
+        """
+        patterns = []
+        leads = []
+        for rule in PropertyFieldExtractor.RULES:
+            if re.compile(rule.pattern).groups != len(re.findall(r'\(\?P<', rule.pattern)):
+                raise ValueError(f"Rule {rule.name} may only use named groups")
+            for field_name in re.findall(r'\(\?P<(\w+)>', rule.pattern):
+                if field_name not in PropertyFieldExtractor.FIELD_PARSERS:
+                    raise ValueError(f"Rule {rule.name} names unknown field {field_name}")
+
+            pattern = f'(?i:{rule.pattern})' if rule.ignore_case else rule.pattern
+            patterns.append(pattern)
+            leads.append(_first_chars(sre_parse.parse(pattern).data))
+
+        # A rule appears under every character it can start with, so each copy
+        # gets its own group names (b<branch>r<rule>_<field>); any of them
+        # identifies the rule and the copy's groups
+        rules = {}
+        branch_count = 0
+
+        def branch(chars: Optional[str], indexes: List[int]) -> str:
+            nonlocal branch_count
+            branch_count += 1
+            alternatives = []
+            for index in indexes:
+                prefix = f'b{branch_count}r{index}'
+                groups = [
+                    (field_name, f'{prefix}_{field_name}')
+                    for field_name in re.findall(r'\(\?P<(\w+)>', PropertyFieldExtractor.RULES[index].pattern)
+                ]
+                for _, group_name in groups:
+                    rules[group_name] = (PropertyFieldExtractor.RULES[index], groups)
+                alternatives.append(re.sub(r'\(\?P<(\w+)>', rf'(?P<{prefix}_\1>', patterns[index]))
+            if chars is None:
+                return f"(?:{'|'.join(alternatives)})"
+            return f"(?=[{re.escape(chars)}])(?:{'|'.join(alternatives)})"
+
+        classes = []
+        for class_chars in _LEAD_CLASSES:
+            # Characters whose candidate rules are the same share a branch (rule order kept)
+            by_rules: Dict[Tuple[int, ...], str] = {}
+            for char in class_chars:
+                indexes = tuple(i for i, lead in enumerate(leads) if lead is None or char in lead)
+                if indexes:
+                    by_rules[indexes] = by_rules.get(indexes, '') + char
+            if by_rules:
+                branches = [branch(chars, list(indexes)) for indexes, chars in by_rules.items()]
+                classes.append(f"(?=[{re.escape(class_chars)}])(?:{'|'.join(branches)})")
+
+        # Rules that may start with anything else are tried at every word start
+        known = set(''.join(_LEAD_CLASSES))
+        other = [i for i, lead in enumerate(leads) if lead is None or not lead <= known]
+        if other:
+            classes.append(branch(None, other))
+
+        # Rules only start at the beginning of a word (or at a symbol)
+        scanner = re.compile(rf"(?<![A-Za-z0-9_])(?:{'|'.join(classes)})")
+        label_pattern = re.compile(
+            '|'.join(f'(?P<l{index}>{label})' for index, (label, _) in enumerate(PropertyFieldExtractor.LABELS)),
+            re.I
+        )
+        return scanner, rules, label_pattern
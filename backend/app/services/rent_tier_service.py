@@ -9,8 +9,9 @@ Academic Research Basis:
 - Classification should use PREDICTED rent, not observed rent (eliminates bias)
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from app.database import db, MarketDecileThresholds
+from app.services.benchmark_registry import BenchmarkRegistry
 from datetime import datetime
 
 
@@ -24,7 +25,8 @@ class RentTierService:
         predicted_rent: float,
         geography: str = 'national',
         bedrooms: Optional[int] = None,
-        year: Optional[int] = None
+        year: Optional[int] = None,
+        thresholds: Optional[Dict] = None
     ) -> Dict:
         """
         Classify property into rent decile based on predicted fundamental rent
@@ -34,6 +36,8 @@ class RentTierService:
             geography: Geographic market ('national', state code, or zipcode)
             bedrooms: Number of bedrooms (thresholds can vary by unit size)
             year: Data year (defaults to current year)
+            thresholds: Optional preloaded threshold dicts keyed by
+                (geography, bedrooms, year); skips the database lookup
 
         Returns:
             Dictionary with:
@@ -54,7 +58,8 @@ class RentTierService:
             predicted_rent,
             'national',
             bedrooms,
-            year
+            year,
+            thresholds
         )
 
         # Get regional classification if specific geography provided
@@ -67,7 +72,8 @@ class RentTierService:
                     predicted_rent,
                     geography,
                     bedrooms,
-                    year
+                    year,
+                    thresholds
                 )
             except ValueError:
                 # Regional thresholds not available, fall back to national
@@ -83,7 +89,8 @@ class RentTierService:
             geography if regional_decile else 'national',
             5,
             bedrooms,
-            year
+            year,
+            thresholds
         )
 
         comparison_to_median = 0.0
@@ -106,7 +113,8 @@ class RentTierService:
         predicted_rent: float,
         geography: str,
         bedrooms: Optional[int],
-        year: int
+        year: int,
+        preloaded: Optional[Dict] = None
     ) -> tuple:
         """
         Internal method to classify in a specific geography
@@ -116,7 +124,7 @@ class RentTierService:
         """
 
         # Get thresholds for this geography
-        thresholds = RentTierService.get_decile_thresholds(geography, bedrooms, year)
+        thresholds = RentTierService._lookup_thresholds(geography, bedrooms, year, preloaded)
 
         if not thresholds:
             # No thresholds available, use hardcoded national estimates
@@ -136,6 +144,30 @@ class RentTierService:
 
         return decile, percentile
 
+    @staticmethod
+    def _lookup_thresholds(
+        geography: str,
+        bedrooms: Optional[int],
+        year: int,
+        preloaded: Optional[Dict] = None
+    ) -> Optional[Dict]:
+        """
+        Resolve thresholds from a preloaded mapping, falling back to the database
+
+        Args:
+            geography: Geographic market
+            bedrooms: Number of bedrooms
+            year: Data year
+            preloaded: Optional thresholds keyed by (geography, bedrooms, year)
+
+        Returns:
+            Dictionary with d1_threshold through d10_threshold, or None if not found
+        """
+        if preloaded is not None and (geography, bedrooms, year) in preloaded:
+            return preloaded[(geography, bedrooms, year)]
+
+        return RentTierService.get_decile_thresholds(geography, bedrooms, year)
+
     @staticmethod
     def get_decile_thresholds(
         geography: str = 'national',
@@ -154,31 +186,32 @@ class RentTierService:
             Dictionary with d1_threshold through d10_threshold, or None if not found
         """
 
-        query = MarketDecileThresholds.query.filter_by(geography=geography)
+        return BenchmarkRegistry.get_decile_thresholds(geography, bedrooms, year)
 
-        if bedrooms is not None:
-            query = query.filter_by(bedrooms=bedrooms)
-
-        if year is not None:
-            query = query.filter_by(data_year=year)
+    @staticmethod
+    def get_decile_thresholds_bulk(
+        geography: str,
+        bedrooms_values: List[int],
+        year: int
+    ) -> Dict:
+        """
+        Load thresholds for several bedroom counts at once
 
-        # Get most recent entry if multiple exist
-        threshold_record = query.order_by(MarketDecileThresholds.data_year.desc()).first()
+        Intended for batch scoring: the result can be passed as ``thresholds``
+        to classify_property so each property skips its own lookup.
 
-        if not threshold_record:
-            return None
+        Args:
+            geography: Geographic market identifier
+            bedrooms_values: Bedroom counts to load
+            year: Data year
 
+        Returns:
+            Dictionary keyed by (geography, bedrooms, year); values are threshold
+            dictionaries, or None where no row exists
+        """
         return {
-            'd1_threshold': threshold_record.d1_threshold,
-            'd2_threshold': threshold_record.d2_threshold,
-            'd3_threshold': threshold_record.d3_threshold,
-            'd4_threshold': threshold_record.d4_threshold,
-            'd5_threshold': threshold_record.d5_threshold,
-            'd6_threshold': threshold_record.d6_threshold,
-            'd7_threshold': threshold_record.d7_threshold,
-            'd8_threshold': threshold_record.d8_threshold,
-            'd9_threshold': threshold_record.d9_threshold,
-            'd10_threshold': threshold_record.d10_threshold
+            (geography, b, year): BenchmarkRegistry.get_decile_thresholds(geography, b, year)
+            for b in {b for b in bedrooms_values if b is not None}
         }
 
     @staticmethod
@@ -186,7 +219,8 @@ class RentTierService:
         geography: str,
         decile: int,
         bedrooms: Optional[int],
-        year: int
+        year: int,
+        preloaded: Optional[Dict] = None
     ) -> Optional[float]:
         """
         Get threshold for a specific decile
@@ -196,11 +230,12 @@ class RentTierService:
             decile: Which decile (1-10)
             bedrooms: Number of bedrooms
             year: Data year
+            preloaded: Optional preloaded thresholds keyed by (geography, bedrooms, year)
 
         Returns:
             Threshold rent value, or None if not found
         """
-        thresholds = RentTierService.get_decile_thresholds(geography, bedrooms, year)
+        thresholds = RentTierService._lookup_thresholds(geography, bedrooms, year, preloaded)
         if not thresholds:
             return None
 
@@ -402,5 +437,7 @@ class RentTierService:
             )
             db.session.add(new_threshold)
 
+        # Tell every worker's BenchmarkRegistry to reload
+        BenchmarkRegistry.bump_version(commit=False)
         db.session.commit()
         return True
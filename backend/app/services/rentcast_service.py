@@ -2,7 +2,9 @@
 
 import requests
 from typing import Optional, List
-from datetime import datetime, timedelta
+from datetime import datetime
+from app.cache import TTLCache, CacheBackend, ResponseStore
+from app.clients import HTTPClient, get_http_client
 from app.models.rentcast_models import (
     RentEstimateData,
     RentalComparable,
@@ -12,50 +14,25 @@ from app.models.rentcast_models import (
 )
 
 
-class RentCastCache:
-    """Simple in-memory cache with TTL support."""
-
-    def __init__(self):
-        self._cache: dict[str, tuple] = {}
-        self._max_size = 1000
-
-    def get(self, key: str) -> Optional[dict]:
-        """Retrieve cached value if not expired."""
-        if key in self._cache:
-            value, expiry = self._cache[key]
-            if datetime.now() < expiry:
-                return value
-            else:
-                del self._cache[key]
-        return None
-
-    def set(self, key: str, value: dict, ttl_seconds: int = 604800):
-        """Store value with TTL (default 7 days)."""
-        if len(self._cache) >= self._max_size:
-            # Simple LRU: remove oldest entry
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
-
-        expiry = datetime.now() + timedelta(seconds=ttl_seconds)
-        self._cache[key] = (value, expiry)
-
-    def clear(self):
-        """Clear all cached entries."""
-        self._cache.clear()
-
-
 class RentCastService:
     """Service for interacting with RentCast API."""
 
     BASE_URL = 'https://api.rentcast.io/v1'
 
-    def __init__(self, api_key: str = '', cache_ttl: int = 604800):
+    def __init__(self, api_key: str = '', cache_ttl: int = 604800,
+                 cache_backend: Optional[CacheBackend] = None,
+                 response_store: Optional[ResponseStore] = None,
+                 http_client: Optional[HTTPClient] = None):
         """
         Initialize RentCast API client.
 
         Args:
             api_key: RentCast API key (required)
             cache_ttl: Cache time-to-live in seconds (default 7 days)
+            cache_backend: Shared cache backend (defaults to a private in-memory cache)
+            response_store: Durable store for raw API responses (optional); saves
+                paid calls across restarts and records quota saved per endpoint
+            http_client: Pooled client for API calls (defaults to the shared 'rentcast' client)
         """
         if not api_key:
             raise ValueError(
@@ -65,7 +42,9 @@ class RentCastService:
 
         self.api_key = api_key
         self.cache_ttl = cache_ttl
-        self.cache = RentCastCache()
+        self.cache = TTLCache('rentcast', default_ttl=cache_ttl, backend=cache_backend, max_entries=1000)
+        self.response_store = response_store
+        self.http = http_client or get_http_client('rentcast')
 
     def get_rent_estimate(
         self,
@@ -96,6 +75,7 @@ class RentCastService:
         cache_key = f"rentcast:estimate:{address}:{zipcode}:{bedrooms}:{bathrooms}:{square_footage}"
         cached_data = self.cache.get(cache_key)
         if cached_data:
+            self._record_quota_saved('rent_estimate')
             return self._dict_to_rent_estimate(cached_data)
 
         try:
@@ -114,7 +94,7 @@ class RentCastService:
 
             # Make API request
             endpoint = f"{self.BASE_URL}/avm/rent/long-term"
-            data = self._make_request(endpoint, params)
+            data = self._make_request(endpoint, params, 'rent_estimate')
 
             if not data:
                 return None
@@ -171,6 +151,7 @@ class RentCastService:
         cache_key = f"rentcast:comps:{address}:{zipcode}:{bedrooms}:{bathrooms}:{comp_count}:{max_radius}"
         cached_data = self.cache.get(cache_key)
         if cached_data:
+            self._record_quota_saved('rental_comparables')
             return [self._dict_to_comparable(comp) for comp in cached_data]
 
         try:
@@ -187,7 +168,7 @@ class RentCastService:
 
             # Make API request
             endpoint = f"{self.BASE_URL}/avm/rent/long-term"
-            data = self._make_request(endpoint, params)
+            data = self._make_request(endpoint, params, 'rental_comparables')
 
             if not data:
                 print(f"No data returned from RentCast API for address: {address}")
@@ -241,6 +222,7 @@ class RentCastService:
         cache_key = f"rentcast:stats:{zipcode}:{data_type}"
         cached_data = self.cache.get(cache_key)
         if cached_data:
+            self._record_quota_saved('market_statistics')
             return self._dict_to_market_stats(cached_data)
 
         try:
@@ -252,7 +234,7 @@ class RentCastService:
 
             # Make API request
             endpoint = f"{self.BASE_URL}/markets"
-            data = self._make_request(endpoint, params)
+            data = self._make_request(endpoint, params, 'market_statistics')
 
             if not data:
                 return None
@@ -298,6 +280,7 @@ class RentCastService:
         cache_key = f"rentcast:trends:{zipcode}:{months}:{data_type}"
         cached_data = self.cache.get(cache_key)
         if cached_data:
+            self._record_quota_saved('market_trends')
             return [self._dict_to_market_trend(trend) for trend in cached_data]
 
         try:
@@ -310,7 +293,7 @@ class RentCastService:
 
             # Make API request
             endpoint = f"{self.BASE_URL}/markets"
-            data = self._make_request(endpoint, params)
+            data = self._make_request(endpoint, params, 'market_trends')
 
             if not data or 'history' not in data:
                 return None
@@ -398,27 +381,53 @@ class RentCastService:
             print(f"Error fetching property valuation: {str(e)}")
             return None
 
-    def _make_request(self, endpoint: str, params: dict) -> Optional[dict]:
+    def get_quota_stats(self) -> Optional[dict]:
         """
-        Make API request to RentCast.
+        Get paid API calls made and saved per endpoint.
+
+        Returns:
+            Response store statistics, or None if no store is configured
+        """
+        if self.response_store is None:
+            return None
+        return self.response_store.get_stats()
+
+    def _record_quota_saved(self, endpoint_name: str):
+        """Count an in-memory cache hit as a saved API call."""
+        if self.response_store is not None:
+            self.response_store.record_saved(endpoint_name)
+
+    def _make_request(self, endpoint: str, params: dict, endpoint_name: str = 'other') -> Optional[dict]:
+        """
+        Make API request to RentCast, serving stored responses when available.
 
         Args:
             endpoint: API endpoint URL
             params: Query parameters
+            endpoint_name: Label for quota accounting
 
         Returns:
             JSON response data or None if error
         """
+        if self.response_store is not None:
+            stored = self.response_store.get(endpoint, params, endpoint_name)
+            if stored is not None:
+                return stored
+
         try:
             headers = {
                 'X-Api-Key': self.api_key,
                 'accept': 'application/json'
             }
 
-            response = requests.get(endpoint, params=params, headers=headers, timeout=10)
+            response = self.http.get(endpoint, params=params, headers=headers)
             response.raise_for_status()
+            data = response.json()
+
+            if self.response_store is not None and data:
+                self.response_store.put(endpoint, params, data, endpoint_name)
 
-            return response.json()
+            return data
 
         except requests.exceptions.RequestException as e:
             print(f"RentCast API request failed: {str(e)}")
@@ -12,7 +12,8 @@ Academic Research Basis:
 import json
 import os
 from typing import Dict, Optional, Tuple
-from app.database import db, RiskBenchmarkData, DealModel
+from app.services.benchmark_registry import BenchmarkRegistry
+from app.services.analysis_context import AnalysisContext
 
 
 class RiskAssessmentService:
@@ -57,7 +58,8 @@ class RiskAssessmentService:
     @staticmethod
     def calculate_systematic_risk(
         rent_decile: int,
-        geography: str = 'US'
+        geography: str = 'US',
+        benchmarks: Optional[Dict] = None
     ) -> Dict:
         """
         Calculate systematic risk (market correlation)
@@ -73,6 +75,8 @@ class RiskAssessmentService:
         Args:
             rent_decile: Property's rent tier (1-10)
             geography: Geographic market
+            benchmarks: Optional preloaded benchmark rows keyed by
+                (rent_decile, geography)
 
         Returns:
             {
@@ -85,10 +89,10 @@ class RiskAssessmentService:
         """
 
         # Get benchmark data
-        benchmark = RiskBenchmarkData.query.filter_by(
-            rent_decile=rent_decile,
-            geography=geography
-        ).first()
+        if benchmarks is not None:
+            benchmark = benchmarks.get((rent_decile, geography))
+        else:
+            benchmark = BenchmarkRegistry.get_benchmark(rent_decile, geography)
 
         if benchmark and benchmark.systematic_risk_beta:
             beta_gdp = benchmark.systematic_risk_beta
@@ -548,7 +552,8 @@ class RiskAssessmentService:
     def calculate_for_deal(
         deal_id: int,
         rent_decile: int,
-        geography: str = 'US'
+        geography: str = 'US',
+        context: Optional[AnalysisContext] = None
     ) -> Dict:
         """
         Calculate complete risk assessment for a deal
@@ -557,29 +562,30 @@ class RiskAssessmentService:
             deal_id: Deal ID to assess
             rent_decile: Property's rent tier
             geography: Geographic market
+            context: Optional AnalysisContext with the deal and benchmarks already loaded
 
         Returns:
             Complete risk analysis with all dimensions
         """
 
-        # Fetch deal
-        deal = DealModel.query.get(deal_id)
-        if not deal:
-            raise ValueError(f"Deal {deal_id} not found")
+        # Fetch deal (once per analysis)
+        context = AnalysisContext.resolve(deal_id, context)
+        deal = context.deal
 
         # Extract property details
         property_age = None
-        if deal.construction_year:
+        year_built = getattr(deal, 'construction_year', None) or deal.year_built
+        if year_built:
             from datetime import datetime
-            property_age = datetime.now().year - deal.construction_year
+            property_age = datetime.now().year - year_built
 
-        property_condition = deal.property_condition
-        num_units = deal.number_of_units or 1
+        property_condition = getattr(deal, 'property_condition', None)
+        num_units = getattr(deal, 'number_of_units', None) or 1
 
         # Get state from address
         state = None
         city = None
-        if deal.street_address:
+        if getattr(deal, 'street_address', None) or deal.property_address:
             # Simple extraction (can be enhanced with geocoding)
             # For now, require state in a separate field or use default
             state = 'CA'  # Default for testing
@@ -588,7 +594,8 @@ class RiskAssessmentService:
         # Calculate systematic risk
         systematic = RiskAssessmentService.calculate_systematic_risk(
             rent_decile=rent_decile,
-            geography=geography
+            geography=geography,
+            benchmarks=context.benchmarks
         )
 
         # Calculate regulatory risk
@@ -5,8 +5,9 @@ import re
 import json
 from bs4 import BeautifulSoup
 from typing import Optional, Dict, List
-from datetime import datetime, timedelta
 from urllib.parse import urlparse, quote_plus
+from app.cache import TTLCache, CacheBackend
+from app.services.property_field_extractor import PropertyFieldExtractor
 from app.models.scraping_models import (
     PropertyData,
     AddressData,
@@ -41,38 +42,6 @@ class ListingNotFoundError(ScrapingError):
     pass
 
 
-class ScrapingCache:
-    """Simple in-memory cache with TTL support for scraping results."""
-
-    def __init__(self):
-        self._cache: dict[str, tuple] = {}
-        self._max_size = 500
-
-    def get(self, key: str) -> Optional[dict]:
-        """Retrieve cached value if not expired."""
-        if key in self._cache:
-            value, expiry = self._cache[key]
-            if datetime.now() < expiry:
-                return value
-            else:
-                del self._cache[key]
-        return None
-
-    def set(self, key: str, value: dict, ttl_seconds: int = 86400):
-        """Store value with TTL (default 24 hours)."""
-        if len(self._cache) >= self._max_size:
-            # Simple LRU: remove oldest entry
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
-
-        expiry = datetime.now() + timedelta(seconds=ttl_seconds)
-        self._cache[key] = (value, expiry)
-
-    def clear(self):
-        """Clear all cached entries."""
-        self._cache.clear()
-
-
 class ScrapingService:
     """Service for scraping property listings from LoopNet, Crexi, and syndication sites."""
 
@@ -87,15 +56,16 @@ class ScrapingService:
         'Upgrade-Insecure-Requests': '1'
     }
 
-    def __init__(self, cache_ttl: int = 86400):
+    def __init__(self, cache_ttl: int = 86400, cache_backend: Optional[CacheBackend] = None):
         """
         Initialize scraping service.
 
         Args:
             cache_ttl: Cache time-to-live in seconds (default 24 hours)
+            cache_backend: Shared cache backend (defaults to a private in-memory cache)
         """
         self.cache_ttl = cache_ttl
-        self.cache = ScrapingCache()
+        self.cache = TTLCache('scraping', default_ttl=cache_ttl, backend=cache_backend, max_entries=500)
 
     def extract_from_url(
         self,
@@ -419,30 +389,12 @@ class ScrapingService:
                 property_data.property_name = name_elem.text.strip()
 
             # Parse table rows for property details
+            pairs = []
             for row in soup.find_all('tr'):
                 cells = row.find_all(['th', 'td'])
                 if len(cells) == 2:
-                    label = cells[0].text.strip().lower()
-                    value = cells[1].text.strip()
-
-                    if 'building size' in label or 'square feet' in label:
-                        property_data.building_size_sf = self._parse_number(value)
-                    elif 'year built' in label:
-                        property_data.year_built = self._parse_year(value)
-                    elif 'stories' in label:
-                        property_data.num_stories = self._parse_number(value)
-                    elif 'units' in label:
-                        property_data.num_units = self._parse_number(value)
-                    elif 'price' in label or 'asking' in label:
-                        property_data.asking_price = self._parse_price(value)
-                    elif 'parking' in label:
-                        property_data.parking_spaces = self._parse_number(value)
-                    elif 'lot size' in label:
-                        property_data.lot_size_acres = self._parse_acres(value)
-                    elif 'property type' in label:
-                        property_data.property_type = value
-                    elif 'zoning' in label:
-                        property_data.zoning = value
+                    pairs.append((cells[0].text.strip(), cells[1].text.strip()))
+            PropertyFieldExtractor.extract_pairs(pairs).to_property_data(property_data)
 
             return property_data if property_data.property_name else None
 
@@ -490,22 +442,12 @@ class ScrapingService:
             if h1:
                 property_data.property_name = h1.text.strip().split(' OFF MARKET')[0]
 
-            # Property details from list items
+            # Property details from "Label: value" list items
+            pairs = []
             for li in soup.find_all('li'):
-                text = li.text.strip().lower()
-
-                if 'property type' in text:
-                    property_data.property_type = li.text.split(':')[-1].strip()
-                elif 'building size' in text:
-                    property_data.building_size_sf = self._parse_number(li.text)
-                elif 'year built' in text:
-                    property_data.year_built = self._parse_year(li.text)
-                elif 'lot size' in text:
-                    property_data.lot_size_acres = self._parse_acres(li.text)
-                elif 'zoning' in text:
-                    property_data.zoning = li.text.split(':')[-1].strip()
-                elif 'units' in text:
-                    property_data.num_units = self._parse_number(li.text)
+                label, _, value = li.text.strip().partition(':')
+                pairs.append((label, value or label))
+            PropertyFieldExtractor.extract_pairs(pairs).to_property_data(property_data)
 
             # Walk/Transit scores
             score_divs = soup.find_all(text=re.compile(r'Score'))
@@ -681,43 +623,6 @@ class ScrapingService:
             pass
         return None
 
-    def _parse_price(self, text: str) -> Optional[float]:
-        """Parse price from text (handles $1.2M, $625k, etc.)."""
-        try:
-            text = text.upper().replace(',', '').replace('$', '')
-
-            if 'M' in text:
-                number = float(re.search(r'[\d.]+', text).group())
-                return number * 1_000_000
-            elif 'K' in text:
-                number = float(re.search(r'[\d.]+', text).group())
-                return number * 1_000
-            else:
-                return float(re.search(r'[\d.]+', text).group())
-        except:
-            pass
-        return None
-
-    def _parse_acres(self, text: str) -> Optional[float]:
-        """Parse acres from text."""
-        try:
-            match = re.search(r'([\d.]+)\s*ac', text.lower())
-            if match:
-                return float(match.group(1))
-        except:
-            pass
-        return None
-
-    def _parse_year(self, text: str) -> Optional[int]:
-        """Parse year from text."""
-        try:
-            match = re.search(r'\b(19|20)\d{2}\b', text)
-            if match:
-                return int(match.group())
-        except:
-            pass
-        return None
-
     def _dict_to_scraping_result(self, data: dict) -> ScrapingResult:
         """Convert dictionary to ScrapingResult."""
         extracted_data = None
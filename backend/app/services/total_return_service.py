@@ -10,10 +10,18 @@ Academic Research Basis:
 - Low-rent properties deliver superior risk-adjusted returns
 """
 
-from typing import Dict, Optional
-from app.database import db, RiskBenchmarkData, DealModel
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+
+from app.database import db, RiskAssessmentModel
+from app.services.benchmark_registry import BenchmarkRegistry
+from app.services.hedonic_model_service import HedonicModelService
+from app.services.rent_tier_service import RentTierService
+from app.services.vectorized_scoring_service import VectorizedScoringService
 from app.services.yield_calculation_service import YieldCalculationService
 from app.services.capital_appreciation_service import CapitalAppreciationService
+from app.services.analysis_context import AnalysisContext
 
 
 class TotalReturnService:
@@ -21,6 +29,11 @@ class TotalReturnService:
     Service for calculating total returns (levered and unlevered)
     """
 
+    # Sensitivity grid axes, in array dimension order
+    GRID_AXES = ('yieldDelta', 'appreciationDelta', 'costOfDebt', 'ltv')
+    MAX_GRID_CELLS = 250000
+    MAX_AXIS_STEPS = 1000
+
     @staticmethod
     def calculate_unlevered_return(
         net_yield: float,
@@ -81,7 +94,8 @@ class TotalReturnService:
     def calculate_for_deal(
         deal_id: int,
         rent_decile: int,
-        holding_period: int = 10
+        holding_period: int = 10,
+        context: Optional[AnalysisContext] = None
     ) -> Dict:
         """
         Calculate complete total return analysis for a deal
@@ -90,6 +104,8 @@ class TotalReturnService:
             deal_id: Deal ID to analyze
             rent_decile: Property's rent tier (1-10)
             holding_period: Years to hold property
+            context: Optional AnalysisContext with the deal and benchmarks already loaded;
+                shared with the yield and appreciation calculations
 
         Returns:
             Complete return analysis:
@@ -105,15 +121,15 @@ class TotalReturnService:
                 }
         """
 
-        # Fetch deal
-        deal = DealModel.query.get(deal_id)
-        if not deal:
-            raise ValueError(f"Deal {deal_id} not found")
+        # Fetch deal (once per analysis)
+        context = AnalysisContext.resolve(deal_id, context)
+        deal = context.deal
 
         # Calculate yields
         yield_analysis = YieldCalculationService.calculate_yields_for_deal(
             deal_id=deal_id,
-            rent_decile=rent_decile
+            rent_decile=rent_decile,
+            context=context
         )
 
         net_yield = yield_analysis['net_yield']
@@ -122,7 +138,8 @@ class TotalReturnService:
         appreciation_analysis = CapitalAppreciationService.calculate_for_deal(
             deal_id=deal_id,
             rent_decile=rent_decile,
-            holding_period=holding_period
+            holding_period=holding_period,
+            context=context
         )
 
         capital_gain_yield = appreciation_analysis['capital_gain_yield_annual']
@@ -151,7 +168,8 @@ class TotalReturnService:
         benchmark_comparison = TotalReturnService.compare_to_benchmark(
             total_return_unlevered=total_return_unlevered,
             rent_decile=rent_decile,
-            geography='US'
+            geography='US',
+            benchmarks=context.benchmarks
         )
 
         return {
@@ -174,7 +192,8 @@ class TotalReturnService:
     def compare_to_benchmark(
         total_return_unlevered: float,
         rent_decile: int,
-        geography: str = 'US'
+        geography: str = 'US',
+        benchmarks: Optional[Dict] = None
     ) -> Dict:
         """
         Compare calculated total return to benchmark ranges
@@ -183,16 +202,18 @@ class TotalReturnService:
             total_return_unlevered: Calculated total return
             rent_decile: Property's rent tier
             geography: Geographic market
+            benchmarks: Optional preloaded benchmark rows keyed by
+                (rent_decile, geography)
 
         Returns:
             Comparison results with position and percentile
         """
 
         # Get benchmark data
-        benchmark = RiskBenchmarkData.query.filter_by(
-            rent_decile=rent_decile,
-            geography=geography
-        ).first()
+        if benchmarks is not None:
+            benchmark = benchmarks.get((rent_decile, geography))
+        else:
+            benchmark = BenchmarkRegistry.get_benchmark(rent_decile, geography)
 
         if not benchmark:
             return {
@@ -290,11 +311,15 @@ class TotalReturnService:
     def sensitivity_analysis(
         deal_id: int,
         rent_decile: int,
-        scenarios: Dict
+        scenarios: Dict,
+        context: Optional[AnalysisContext] = None
     ) -> Dict:
         """
         Run sensitivity analysis on total returns
 
+        The base case is calculated once and each scenario adjusts it, so the
+        cost does not depend on the number of scenarios.
+
         Args:
             deal_id: Deal to analyze
             rent_decile: Property's rent tier
@@ -304,20 +329,22 @@ class TotalReturnService:
                     'optimistic': {'yield_adjustment': 0.5, 'appreciation_adjustment': 1.0},
                     'pessimistic': {'yield_adjustment': -0.5, 'appreciation_adjustment': -1.0}
                 }
+            context: Optional AnalysisContext with the deal and benchmarks already loaded
 
         Returns:
             Results for each scenario
         """
 
+        # Calculate base returns
+        base_returns = TotalReturnService.calculate_for_deal(
+            deal_id=deal_id,
+            rent_decile=rent_decile,
+            context=context
+        )
+
         results = {}
 
         for scenario_name, adjustments in scenarios.items():
-            # Calculate base returns
-            base_returns = TotalReturnService.calculate_for_deal(
-                deal_id=deal_id,
-                rent_decile=rent_decile
-            )
-
             # Apply adjustments
             adjusted_net_yield = base_returns['net_yield'] + adjustments.get('yield_adjustment', 0)
             adjusted_capital_gain = base_returns['capital_gain_yield'] + adjustments.get('appreciation_adjustment', 0)
@@ -343,6 +370,223 @@ class TotalReturnService:
 
         return results
 
+    @staticmethod
+    def sensitivity_grid(
+        deal_id: int,
+        axes: Dict,
+        rent_decile: Optional[int] = None,
+        context: Optional[AnalysisContext] = None
+    ) -> Dict:
+        """
+        Evaluate total returns over a Cartesian grid of assumptions
+
+        The deal's base returns are calculated once; the grid is then pure
+        array arithmetic (see evaluate_grid).
+
+        Args:
+            deal_id: Deal to analyze
+            axes: Axis values keyed by name (see evaluate_grid)
+            rent_decile: Property's rent tier (default: from the latest risk
+                assessment, else classified from the deal's predicted rent)
+            context: Optional AnalysisContext with the deal and benchmarks already loaded
+
+        Returns:
+            Grid dictionary from evaluate_grid, plus 'rent_decile'
+
+        Raises:
+            ValueError: If the deal does not exist, an axis is invalid or the
+                rent decile cannot be determined
+        """
+        context = AnalysisContext.resolve(deal_id, context)
+
+        if rent_decile is None:
+            rent_decile = TotalReturnService._default_rent_decile(context)
+
+        base_returns = TotalReturnService.calculate_for_deal(
+            deal_id=deal_id,
+            rent_decile=rent_decile,
+            context=context
+        )
+
+        grid = TotalReturnService.evaluate_grid(
+            base_net_yield=base_returns['net_yield'],
+            base_capital_gain_yield=base_returns['capital_gain_yield'],
+            base_cost_of_debt=base_returns['cost_of_debt'],
+            base_ltv=base_returns['ltv'],
+            axes=axes
+        )
+        grid['rent_decile'] = rent_decile
+        return grid
+
+    @staticmethod
+    def evaluate_grid(
+        base_net_yield: float,
+        base_capital_gain_yield: float,
+        base_cost_of_debt: float,
+        base_ltv: float,
+        axes: Dict[str, Union[Sequence[float], Dict]]
+    ) -> Dict:
+        """
+        Evaluate unlevered and levered returns over every combination of axis values
+
+        Axes (each a list of values or {'start', 'stop', 'steps'}; omitted
+        axes hold the base value):
+            yieldDelta: Added to net yield (percentage points)
+            appreciationDelta: Added to capital gain yield (percentage points)
+            costOfDebt: Interest rate on debt (percentage)
+            ltv: Loan-to-value ratio (decimal, 0 to < 1)
+
+        Args:
+            base_net_yield: Net yield percentage
+            base_capital_gain_yield: Annual capital gain percentage
+            base_cost_of_debt: Interest rate on debt (percentage)
+            base_ltv: Loan-to-value ratio (decimal)
+            axes: Axis values keyed by name
+
+        Returns:
+            Compact grid:
+                {
+                    'base': {...},
+                    'axes': [{'name': 'yieldDelta', 'values': [...]}, ...],
+                    'shape': [5, 9, 3, 4],
+                    'total_return_unlevered': nested lists over (yieldDelta, appreciationDelta),
+                    'total_return_levered': nested lists over all four axes,
+                    'range': {'min': ..., 'max': ...}
+                }
+
+        Raises:
+            ValueError: If an axis is unknown or invalid, or the grid is too large
+        """
+        unknown = set(axes) - set(TotalReturnService.GRID_AXES)
+        if unknown:
+            raise ValueError(
+                f"Unknown sensitivity axes: {sorted(unknown)}. "
+                f"Use {list(TotalReturnService.GRID_AXES)}"
+            )
+
+        defaults = {
+            'yieldDelta': [0.0],
+            'appreciationDelta': [0.0],
+            'costOfDebt': [base_cost_of_debt],
+            'ltv': [base_ltv]
+        }
+        values = [
+            TotalReturnService._axis_values(name, axes.get(name, defaults[name]))
+            for name in TotalReturnService.GRID_AXES
+        ]
+
+        shape = tuple(len(axis) for axis in values)
+        cells = int(np.prod(shape))
+        if cells > TotalReturnService.MAX_GRID_CELLS:
+            raise ValueError(
+                f"Sensitivity grid has {cells:,} cells; the maximum is {TotalReturnService.MAX_GRID_CELLS:,}"
+            )
+
+        ltv = values[3]
+        if np.any(ltv < 0) or np.any(ltv >= 1.0):
+            raise ValueError("LTV values must be at least 0 and less than 1")
+
+        # Broadcast each axis along its own dimension: (Y,1,1,1), (1,A,1,1), ...
+        yield_delta, appreciation_delta, cost_of_debt, ltv = np.ix_(*values)
+
+        # Same rounding as calculate_unlevered_return's round(), cell for cell
+        unlevered = VectorizedScoringService._round(
+            (base_net_yield + yield_delta) + (base_capital_gain_yield + appreciation_delta), 2
+        )
+        levered = VectorizedScoringService.calculate_levered_return(unlevered, cost_of_debt, ltv)
+
+        base_unlevered = TotalReturnService.calculate_unlevered_return(base_net_yield, base_capital_gain_yield)
+
+        return {
+            'base': {
+                'net_yield': base_net_yield,
+                'capital_gain_yield': base_capital_gain_yield,
+                'cost_of_debt': base_cost_of_debt,
+                'ltv': base_ltv,
+                'total_return_unlevered': base_unlevered,
+                'total_return_levered': TotalReturnService.calculate_levered_return(
+                    base_unlevered, base_cost_of_debt, base_ltv
+                )
+            },
+            'axes': [
+                {'name': name, 'values': axis.tolist()}
+                for name, axis in zip(TotalReturnService.GRID_AXES, values)
+            ],
+            'shape': list(shape),
+            'total_return_unlevered': unlevered[:, :, 0, 0].tolist(),
+            'total_return_levered': levered.tolist(),
+            'range': {
+                'min': float(levered.min()),
+                'max': float(levered.max())
+            }
+        }
+
+    @staticmethod
+    def _axis_values(name: str, spec: Union[Sequence[float], Dict]) -> np.ndarray:
+        """Parse one axis spec (list or {'start', 'stop', 'steps'}) into a 1-D array."""
+        if isinstance(spec, dict):
+            try:
+                start = float(spec['start'])
+                stop = float(spec['stop'])
+                steps = int(spec.get('steps', 5))
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(f"Axis '{name}' range needs numeric 'start', 'stop' and 'steps'")
+            if not (np.isfinite(start) and np.isfinite(stop)):
+                raise ValueError(f"Axis '{name}' range start and stop must be finite numbers")
+            if steps < 1 or steps > TotalReturnService.MAX_AXIS_STEPS:
+                raise ValueError(f"Axis '{name}' steps must be between 1 and {TotalReturnService.MAX_AXIS_STEPS}")
+            return np.round(np.linspace(start, stop, steps), 6)
+
+        if isinstance(spec, (str, bytes)) or not hasattr(spec, '__len__'):
+            raise ValueError(f"Axis '{name}' must be a list of numbers or a start/stop/steps range")
+        if len(spec) < 1 or len(spec) > TotalReturnService.MAX_AXIS_STEPS:
+            raise ValueError(f"Axis '{name}' must have between 1 and {TotalReturnService.MAX_AXIS_STEPS} values")
+        try:
+            values = np.asarray(spec, dtype=float)
+        except (TypeError, ValueError):
+            raise ValueError(f"Axis '{name}' values must be numbers")
+        # null becomes NaN here; NaN or inf would end up as invalid JSON in the grid
+        if values.ndim != 1 or not np.isfinite(values).all():
+            raise ValueError(f"Axis '{name}' values must be finite numbers")
+        return values
+
+    @staticmethod
+    def _default_rent_decile(context: AnalysisContext) -> int:
+        """
+        Rent decile from the deal's latest risk assessment, else from its predicted rent
+
+        Raises:
+            ValueError: If there is no assessment and the deal lacks the fields
+                the hedonic model needs
+        """
+        deal = context.deal
+        if deal.latest_assessment_id:
+            assessment = db.session.get(RiskAssessmentModel, deal.latest_assessment_id)
+            if assessment and assessment.rent_decile_national:
+                return assessment.rent_decile_national
+
+        missing_fields = [f for f in ('square_footage', 'bedrooms', 'bathrooms') if not getattr(deal, f, None)]
+        if missing_fields:
+            raise ValueError(
+                f"rentDecile is required: deal has no risk assessment and is missing {missing_fields}"
+            )
+
+        rent_prediction = HedonicModelService.predict_fundamental_rent({
+            'square_footage': deal.square_footage,
+            'bedrooms': deal.bedrooms,
+            'bathrooms': deal.bathrooms,
+            'year_built': deal.year_built,
+            'property_type': deal.property_type
+        })
+        classification = RentTierService.classify_property(
+            predicted_rent=rent_prediction['predicted_rent'],
+            geography='national',
+            bedrooms=deal.bedrooms,
+            year=context.year,
+            thresholds=context.thresholds
+        )
+        return classification['national_decile']
+
     @staticmethod
     def validate_returns(
         total_return_unlevered: float,
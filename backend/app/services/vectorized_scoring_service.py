@@ -0,0 +1,492 @@
+"""
+Vectorized Scoring Service
+Columnar (NumPy) implementation of the hedonic-to-composite-risk pipeline
+
+Scores whole portfolios at once: every step of DealService.calculate_risk_assessment
+that produces a number (predicted rent, decile, yields, appreciation, returns,
+risk scores) is expressed as array arithmetic over deal attributes.
+
+The arithmetic mirrors the scalar services operation-for-operation so results
+are identical to them, including Python's round() semantics. Use the scalar
+services when the full narrative output (interpretations, components) is needed.
+"""
+
+import math
+from typing import Dict, Optional, Sequence
+from datetime import datetime
+
+import numpy as np
+
+from app.services.benchmark_registry import BenchmarkRegistry
+from app.services.hedonic_model_service import HedonicModelService
+from app.services.rent_tier_service import RentTierService
+from app.services.yield_calculation_service import YieldCalculationService
+from app.services.capital_appreciation_service import CapitalAppreciationService
+from app.services.risk_assessment_service import RiskAssessmentService
+
+
+class VectorizedScoringService:
+    """
+    Service for scoring many properties at once with NumPy
+    """
+
+    # Same defaults DealService.calculate_risk_assessment applies per deal
+    DEFAULT_PROPERTY_VALUE = 200000
+    DEFAULT_COST_OF_DEBT = 6.5
+    DEFAULT_DOWN_PAYMENT_PCT = 25.0
+
+    @staticmethod
+    def score(
+        properties: Dict[str, Sequence],
+        holding_period: int = 10,
+        geography: str = 'US',
+        state: str = 'CA',
+        benchmarks: Optional[Dict] = None,
+        thresholds: Optional[Dict] = None,
+        model_version: str = 'us_national_v1'
+    ) -> Dict[str, np.ndarray]:
+        """
+        Score a batch of properties through the full risk pipeline
+
+        Args:
+            properties: Column arrays, all the same length:
+                - square_footage, bedrooms, bathrooms (required)
+                - year_built, purchase_price, loan_interest_rate,
+                  down_payment_percent, num_units (optional; missing/0/NaN
+                  values take the same defaults as the scalar pipeline)
+                - property_type, epc_score (optional string columns)
+            holding_period: Investment horizon in years (kept for parity with
+                the scalar pipeline; annualized rates do not depend on it)
+            geography: Geographic market for benchmarks
+            state: State used for regulatory risk
+            benchmarks: Preloaded benchmark rows keyed by (rent_decile, geography);
+                loaded from the database when None, pass {} to use research defaults
+            thresholds: Preloaded decile thresholds keyed by (geography, bedrooms, year);
+                loaded from the database when None, pass {} to use default thresholds
+            model_version: Hedonic model version
+
+        Returns:
+            Dictionary of arrays (NaN / 0 for rows where valid is False):
+                valid, predicted_rent, rent_decile, gross_yield, total_cost_pct,
+                net_yield, capital_gain_yield_annual, total_return_unlevered,
+                total_return_levered, systematic_risk_score, regulatory_risk_score,
+                idiosyncratic_risk_score, composite_risk_score, composite_risk_level
+
+        Raises:
+            ValueError: If a required column is missing or columns differ in length
+        """
+        required_columns = ['square_footage', 'bedrooms', 'bathrooms']
+        missing_columns = [c for c in required_columns if c not in properties]
+        if missing_columns:
+            raise ValueError(f"Missing required columns for scoring: {missing_columns}")
+
+        sqft = VectorizedScoringService._column(properties, 'square_footage')
+        n = len(sqft)
+        lengths = {len(v) for v in properties.values() if v is not None}
+        if lengths and lengths != {n}:
+            raise ValueError("All property columns must have the same length")
+
+        bedrooms = VectorizedScoringService._column(properties, 'bedrooms')
+        bathrooms = VectorizedScoringService._column(properties, 'bathrooms')
+        year_built = VectorizedScoringService._column(properties, 'year_built', n)
+        purchase_price = VectorizedScoringService._column(properties, 'purchase_price', n)
+        loan_rate = VectorizedScoringService._column(properties, 'loan_interest_rate', n)
+        down_payment = VectorizedScoringService._column(properties, 'down_payment_percent', n)
+        num_units = VectorizedScoringService._column(properties, 'num_units', n)
+
+        # Scalar pipeline uses truthiness ("x or default"), so 0 and NaN both fall back
+        num_units = VectorizedScoringService._or_default(num_units, 1.0)
+        property_value = VectorizedScoringService._or_default(
+            purchase_price, VectorizedScoringService.DEFAULT_PROPERTY_VALUE
+        )
+        cost_of_debt = VectorizedScoringService._or_default(
+            loan_rate, VectorizedScoringService.DEFAULT_COST_OF_DEBT
+        )
+        down_payment = VectorizedScoringService._or_default(
+            down_payment, VectorizedScoringService.DEFAULT_DOWN_PAYMENT_PCT
+        )
+        ltv = 1.0 - (down_payment / 100)
+
+        valid = (
+            VectorizedScoringService._truthy(sqft) &
+            VectorizedScoringService._truthy(bedrooms) &
+            VectorizedScoringService._truthy(bathrooms) &
+            (property_value > 0) &
+            (ltv < 1.0)
+        )
+
+        current_year = datetime.now().year
+        has_year = VectorizedScoringService._truthy(year_built)
+        age = np.where(has_year, current_year - np.where(has_year, year_built, 0), np.nan)
+
+        # Step 2: Hedonic rent
+        predicted_rent = VectorizedScoringService.predict_fundamental_rent(
+            sqft, bedrooms, bathrooms, age,
+            property_types=properties.get('property_type'),
+            epc_scores=properties.get('epc_score'),
+            model_version=model_version
+        )
+        predicted_rent = np.where(valid, predicted_rent, np.nan)
+
+        # Step 3: Decile classification (national thresholds, as in the scalar pipeline)
+        rent_decile = VectorizedScoringService.classify_deciles(
+            predicted_rent, bedrooms, geography='national',
+            year=current_year, thresholds=thresholds, valid=valid
+        )
+
+        if benchmarks is None:
+            benchmarks = BenchmarkRegistry.get_benchmarks([geography, 'US'])
+
+        # Step 4: Yields (cost components always use US benchmark rows)
+        annual_rent = predicted_rent * 12
+        gross_yield = VectorizedScoringService._round(annual_rent / property_value * 100, 2)
+        costs = VectorizedScoringService.calculate_cost_components(
+            rent_decile, num_units, property_value, annual_rent, benchmarks, geography='US'
+        )
+        net_yield = VectorizedScoringService._round(gross_yield - costs['total_cost_pct'], 2)
+
+        # Step 5: Appreciation
+        capital_gain = VectorizedScoringService._decile_lookup(
+            VectorizedScoringService._appreciation_rates(benchmarks, geography), rent_decile
+        )
+        capital_gain = VectorizedScoringService._round(capital_gain, 2)
+
+        # Step 6: Returns
+        unlevered = VectorizedScoringService._round(net_yield + capital_gain, 2)
+        levered = VectorizedScoringService.calculate_levered_return(unlevered, cost_of_debt, ltv)
+
+        # Step 7: Risk dimensions
+        systematic = VectorizedScoringService._decile_lookup(
+            VectorizedScoringService._systematic_scores(benchmarks, geography), rent_decile
+        )
+        regulatory_score = RiskAssessmentService.calculate_regulatory_risk(
+            state=state, city=None, rent_level=None, ami_percentage=None
+        )['regulatory_risk_score']
+        regulatory = np.where(valid, regulatory_score, np.nan)
+        idiosyncratic = VectorizedScoringService.calculate_idiosyncratic_risk(age, num_units)
+        idiosyncratic = np.where(valid, idiosyncratic, np.nan)
+
+        composite_raw = systematic * 0.40 + regulatory * 0.30 + idiosyncratic * 0.30
+        composite = VectorizedScoringService._round(composite_raw, 1)
+        composite_level = np.select(
+            [composite_raw < 35, composite_raw < 55, composite_raw < 75, composite_raw >= 75],
+            ['Low', 'Medium', 'High', 'Very High'],
+            default=''
+        ).astype(object)
+        composite_level[~valid] = None
+
+        return {
+            'valid': valid,
+            'predicted_rent': predicted_rent,
+            'rent_decile': rent_decile,
+            'gross_yield': gross_yield,
+            'total_cost_pct': costs['total_cost_pct'],
+            'net_yield': net_yield,
+            'capital_gain_yield_annual': capital_gain,
+            'total_return_unlevered': unlevered,
+            'total_return_levered': levered,
+            'systematic_risk_score': systematic,
+            'regulatory_risk_score': regulatory,
+            'idiosyncratic_risk_score': idiosyncratic,
+            'composite_risk_score': composite,
+            'composite_risk_level': composite_level
+        }
+
+    @staticmethod
+    def predict_fundamental_rent(
+        sqft: np.ndarray,
+        bedrooms: np.ndarray,
+        bathrooms: np.ndarray,
+        age: np.ndarray,
+        property_types: Optional[Sequence] = None,
+        epc_scores: Optional[Sequence] = None,
+        model_version: str = 'us_national_v1'
+    ) -> np.ndarray:
+        """
+        Vectorized HedonicModelService.predict_fundamental_rent
+
+        Args:
+            sqft, bedrooms, bathrooms: Property characteristic arrays
+            age: Property age in years (NaN where unknown; defaults to 30)
+            property_types: Optional property type strings
+            epc_scores: Optional EPC grades (A-F)
+            model_version: Hedonic model version
+
+        Returns:
+            Array of predicted monthly rents rounded to cents
+        """
+        coefficients = HedonicModelService.load_coefficients(model_version)['coefficients']
+        n = len(sqft)
+        age = np.where(np.isnan(age), 30, age)
+
+        # Same accumulation order as the scalar model
+        log_rent = np.full(n, float(coefficients['intercept']))
+        log_rent = log_rent + coefficients['log_sqft'] * sqft
+        log_rent = log_rent + coefficients['bedrooms'] * bedrooms
+        log_rent = log_rent + coefficients['bathrooms'] * bathrooms
+        log_rent = log_rent + coefficients['age'] * age
+        if 'age_squared' in coefficients:
+            log_rent = log_rent + coefficients['age_squared'] * (age ** 2)
+
+        def property_type_effect(value):
+            value = (value or '').lower()
+            if 'multifamily' in value or 'apartment' in value:
+                return coefficients.get('property_type_multifamily', 0.0)
+            if 'condo' in value:
+                return coefficients.get('property_type_condo', 0.0)
+            return 0.0
+
+        def epc_effect(value):
+            return coefficients.get(f'epc_score_{value.lower()}' if value else 'epc_score_d')
+
+        log_rent = log_rent + VectorizedScoringService._categorical(property_types, n, property_type_effect)
+
+        epc = VectorizedScoringService._categorical(epc_scores, n, epc_effect)
+        log_rent = np.where(np.isnan(epc), log_rent, log_rent + np.nan_to_num(epc))
+
+        # math.exp keeps the last bit identical to the scalar model; values past
+        # the float range (or NaN from invalid rows) go through np.exp instead
+        finite = log_rent < 709.0
+        predicted = np.exp(np.where(finite, 0.0, log_rent))
+        predicted[finite] = np.fromiter(
+            map(math.exp, log_rent[finite].tolist()), dtype=float, count=int(finite.sum())
+        )
+        return VectorizedScoringService._round(predicted, 2)
+
+    @staticmethod
+    def classify_deciles(
+        predicted_rent: np.ndarray,
+        bedrooms: np.ndarray,
+        geography: str = 'national',
+        year: Optional[int] = None,
+        thresholds: Optional[Dict] = None,
+        valid: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Vectorized RentTierService._classify_in_geography
+
+        Args:
+            predicted_rent: Monthly rents
+            bedrooms: Bedroom counts (thresholds vary by unit size)
+            geography: Geographic market
+            year: Data year (defaults to current year)
+            thresholds: Preloaded thresholds keyed by (geography, bedrooms, year);
+                loaded from the database when None
+            valid: Optional mask; invalid rows get decile 0
+
+        Returns:
+            Integer array of deciles (1-10)
+        """
+        if year is None:
+            year = datetime.now().year
+        if valid is None:
+            valid = np.ones(len(predicted_rent), dtype=bool)
+
+        bedroom_keys = np.where(valid, bedrooms, -1)
+        unique_bedrooms, group_index = np.unique(bedroom_keys, return_inverse=True)
+        bedroom_values = [int(b) if float(b).is_integer() else float(b) for b in unique_bedrooms]
+
+        if thresholds is None:
+            thresholds = RentTierService.get_decile_thresholds_bulk(
+                geography, [b for b in bedroom_values if b != -1], year
+            )
+
+        # One row of ten thresholds per bedroom group; falsy thresholds never match
+        table = np.full((len(bedroom_values), 10), np.nan)
+        for row, b in enumerate(bedroom_values):
+            if b == -1:
+                continue
+            group_thresholds = thresholds.get((geography, b, year))
+            if not group_thresholds:
+                group_thresholds = RentTierService._get_default_national_thresholds(b)
+            for i in range(1, 11):
+                value = group_thresholds.get(f'd{i}_threshold')
+                if value:
+                    table[row, i - 1] = value
+
+        matches = predicted_rent[:, None] <= table[group_index]
+        deciles = np.where(matches.any(axis=1), matches.argmax(axis=1) + 1, 10)
+        return np.where(valid, deciles, 0)
+
+    @staticmethod
+    def calculate_cost_components(
+        rent_decile: np.ndarray,
+        num_units: np.ndarray,
+        property_value: np.ndarray,
+        annual_rent: np.ndarray,
+        benchmarks: Dict,
+        geography: str = 'US'
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized YieldCalculationService.calculate_cost_components
+
+        Returns:
+            Dictionary of rounded cost component arrays (same keys as the scalar service)
+        """
+        maintenance = np.full(11, np.nan)
+        turnover = np.full(11, np.nan)
+        default = np.full(11, np.nan)
+        for decile in range(1, 11):
+            benchmark = benchmarks.get((decile, geography))
+            if benchmark:
+                maintenance[decile] = benchmark.maintenance_cost_pct or 0.0
+                turnover[decile] = benchmark.turnover_cost_pct or 0.0
+                default[decile] = benchmark.default_cost_pct or 0.0
+            else:
+                costs = YieldCalculationService._get_default_costs(decile, 1)
+                maintenance[decile] = costs['maintenance_cost_pct']
+                turnover[decile] = costs['turnover_cost_pct']
+                default[decile] = costs['default_cost_pct']
+
+        maintenance_pct = VectorizedScoringService._decile_lookup(maintenance, rent_decile)
+        turnover_pct = VectorizedScoringService._decile_lookup(turnover, rent_decile)
+        default_pct = VectorizedScoringService._decile_lookup(default, rent_decile)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tax_from_value = (property_value * 0.011) / annual_rent * 100
+        property_tax_pct = np.where(
+            (property_value != 0) & (annual_rent != 0),
+            tax_from_value,
+            np.where(rent_decile <= 5, 1.5, 1.0)
+        )
+
+        management_pct = np.select([num_units >= 10, num_units >= 2], [4.0, 5.0], default=6.5)
+
+        total = maintenance_pct + property_tax_pct + turnover_pct + default_pct + management_pct
+
+        return {
+            'maintenance_cost_pct': VectorizedScoringService._round(maintenance_pct, 2),
+            'turnover_cost_pct': VectorizedScoringService._round(turnover_pct, 2),
+            'default_cost_pct': VectorizedScoringService._round(default_pct, 2),
+            'property_tax_pct': VectorizedScoringService._round(property_tax_pct, 2),
+            'management_cost_pct': VectorizedScoringService._round(management_pct, 2),
+            'total_cost_pct': VectorizedScoringService._round(total, 2)
+        }
+
+    @staticmethod
+    def calculate_levered_return(
+        unlevered_return: np.ndarray,
+        cost_of_debt: np.ndarray,
+        ltv: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized TotalReturnService.calculate_levered_return
+
+        Rows with LTV >= 100% are returned as NaN instead of raising.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            leverage_multiplier = ltv / (1 - ltv)
+            levered = unlevered_return + (unlevered_return - cost_of_debt) * leverage_multiplier
+        levered = VectorizedScoringService._round(levered, 2)
+        levered = np.where(ltv <= 0, unlevered_return, levered)
+        return np.where(ltv >= 1.0, np.nan, levered)
+
+    @staticmethod
+    def calculate_idiosyncratic_risk(age: np.ndarray, num_units: np.ndarray) -> np.ndarray:
+        """
+        Vectorized RiskAssessmentService.calculate_idiosyncratic_risk
+
+        Covers the inputs the deal pipeline supplies: property age and unit
+        count, with condition, concentration and occupancy left at defaults.
+        """
+        known_age = ~np.isnan(age) & (age != 0)
+        age_score = np.select(
+            [~known_age, age < 10, age < 30, age < 50, age < 75],
+            [10.0, 2.0, 5.0, 10.0, 15.0],
+            default=20.0
+        )
+        condition_score = 12.5
+        concentration_score = np.select(
+            [num_units == 1, num_units < 5, num_units < 10],
+            [30.0, 20.0, 10.0],
+            default=5.0
+        )
+        occupancy_score = 5.0
+        diversification_score = np.select(
+            [num_units >= 50, num_units >= 20, num_units >= 10, num_units >= 5],
+            [0.0, 2.5, 5.0, 7.5],
+            default=10.0
+        )
+
+        total = age_score + condition_score + concentration_score + occupancy_score + diversification_score
+        return VectorizedScoringService._round(np.minimum(total, 100.0), 1)
+
+    @staticmethod
+    def _appreciation_rates(benchmarks: Dict, geography: str) -> np.ndarray:
+        """Per-decile annual appreciation rate (index = decile)."""
+        rates = np.full(11, np.nan)
+        for decile in range(1, 11):
+            benchmark = benchmarks.get((decile, geography))
+            if benchmark:
+                rates[decile] = ((benchmark.capital_gain_min or 0.0) + (benchmark.capital_gain_max or 0.0)) / 2
+            else:
+                rates[decile] = CapitalAppreciationService._get_default_appreciation_rate(decile)
+        return rates
+
+    @staticmethod
+    def _systematic_scores(benchmarks: Dict, geography: str) -> np.ndarray:
+        """Per-decile systematic risk score (index = decile)."""
+        scores = np.full(11, np.nan)
+        lookup = {(decile, geography): benchmarks.get((decile, geography)) for decile in range(1, 11)}
+        for decile in range(1, 11):
+            scores[decile] = RiskAssessmentService.calculate_systematic_risk(
+                rent_decile=decile,
+                geography=geography,
+                benchmarks=lookup
+            )['systematic_risk_score']
+        return scores
+
+    @staticmethod
+    def _decile_lookup(table: np.ndarray, rent_decile: np.ndarray) -> np.ndarray:
+        """Gather per-decile values; decile 0 (invalid rows) maps to NaN."""
+        return table[rent_decile]
+
+    @staticmethod
+    def _column(properties: Dict, name: str, n: Optional[int] = None) -> np.ndarray:
+        """Convert a column to a float array, treating None as NaN."""
+        values = properties.get(name)
+        if values is None:
+            return np.full(n, np.nan)
+        return np.array([np.nan if v is None else v for v in values], dtype=float) \
+            if isinstance(values, (list, tuple)) else np.asarray(values, dtype=float)
+
+    @staticmethod
+    def _truthy(values: np.ndarray) -> np.ndarray:
+        """Element-wise Python truthiness for numeric columns (NaN counts as missing)."""
+        return ~np.isnan(values) & (values != 0)
+
+    @staticmethod
+    def _or_default(values: np.ndarray, default: float) -> np.ndarray:
+        """Element-wise ``value or default``."""
+        return np.where(VectorizedScoringService._truthy(values), values, default)
+
+    @staticmethod
+    def _categorical(values: Optional[Sequence], n: int, mapper) -> np.ndarray:
+        """Map a string column through ``mapper`` once per distinct value."""
+        if values is None:
+            return np.full(n, mapper(None) if mapper(None) is not None else np.nan, dtype=float)
+
+        codes = {}
+        index = np.fromiter((codes.setdefault(v, len(codes)) for v in values), dtype=np.int64, count=n)
+        effects = np.array(
+            [np.nan if mapper(v) is None else mapper(v) for v in codes],
+            dtype=float
+        )
+        return effects[index]
+
+    @staticmethod
+    def _round(values: np.ndarray, decimals: int) -> np.ndarray:
+        """
+        Round like Python's round() on floats
+
+        np.round scales by 10**decimals before rounding, which can land on the
+        other side of a .5 tie than the exact decimal rounding Python performs.
+        Near-tie elements are re-rounded with round() so results match exactly.
+        """
+        values = np.asarray(values, dtype=float)
+        rounded = np.round(values, decimals)
+        scaled = values * (10.0 ** decimals)
+        near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+        if near_tie.any():
+            rounded[near_tie] = [round(v, decimals) for v in values[near_tie].tolist()]
+        return rounded
@@ -10,7 +10,8 @@ Academic Research Basis:
 """
 
 from typing import Dict, Optional
-from app.database import db, RiskBenchmarkData, DealModel
+from app.services.benchmark_registry import BenchmarkRegistry
+from app.services.analysis_context import AnalysisContext
 
 
 class YieldCalculationService:
@@ -42,7 +43,8 @@ class YieldCalculationService:
         num_units: int = 1,
         property_value: Optional[float] = None,
         annual_rent: Optional[float] = None,
-        geography: str = 'US'
+        geography: str = 'US',
+        benchmarks: Optional[Dict] = None
     ) -> Dict:
         """
         Calculate all operating cost components as percentages
@@ -53,6 +55,8 @@ class YieldCalculationService:
             property_value: Property value (for tax calculations)
             annual_rent: Annual rental income (for percentage calculations)
             geography: Geographic market ('US', 'Belgium', 'Netherlands')
+            benchmarks: Optional preloaded benchmark rows keyed by
+                (rent_decile, geography); skips the database lookup
 
         Returns:
             Dictionary with all cost components as percentages:
@@ -67,10 +71,10 @@ class YieldCalculationService:
         """
 
         # Get benchmark costs for this decile
-        benchmark = RiskBenchmarkData.query.filter_by(
-            rent_decile=rent_decile,
-            geography=geography
-        ).first()
+        if benchmarks is not None:
+            benchmark = benchmarks.get((rent_decile, geography))
+        else:
+            benchmark = BenchmarkRegistry.get_benchmark(rent_decile, geography)
 
         if not benchmark:
             # Fallback to default cost estimates if no benchmark data
@@ -187,13 +191,18 @@ class YieldCalculationService:
         return round(net_yield, 2)
 
     @staticmethod
-    def calculate_yields_for_deal(deal_id: int, rent_decile: int) -> Dict:
+    def calculate_yields_for_deal(
+        deal_id: int,
+        rent_decile: int,
+        context: Optional[AnalysisContext] = None
+    ) -> Dict:
         """
         Calculate complete yield analysis for a deal
 
         Args:
             deal_id: Deal ID to analyze
             rent_decile: Property's rent tier classification
+            context: Optional AnalysisContext with the deal and benchmarks already loaded
 
         Returns:
             Complete yield breakdown:
@@ -206,16 +215,15 @@ class YieldCalculationService:
                 }
         """
 
-        # Fetch deal from database
-        deal = DealModel.query.get(deal_id)
-        if not deal:
-            raise ValueError(f"Deal {deal_id} not found")
+        # Fetch deal (once per analysis)
+        context = AnalysisContext.resolve(deal_id, context)
+        deal = context.deal
 
         # Calculate annual rent
         monthly_rent = deal.monthly_rent or 0.0
         other_monthly_income = deal.other_monthly_income or 0.0
         vacancy_rate = deal.vacancy_rate or 0.05
-        num_units = deal.number_of_units or 1
+        num_units = getattr(deal, 'number_of_units', None) or 1
 
         # Total monthly income per unit
         monthly_income_per_unit = monthly_rent + other_monthly_income
@@ -242,7 +250,8 @@ class YieldCalculationService:
             num_units=num_units,
             property_value=property_value,
             annual_rent=annual_effective_rent,
-            geography='US'
+            geography='US',
+            benchmarks=context.benchmarks
         )
 
         # Calculate net yield
@@ -300,7 +309,8 @@ class YieldCalculationService:
     def compare_to_benchmark(
         calculated_net_yield: float,
         rent_decile: int,
-        geography: str = 'US'
+        geography: str = 'US',
+        benchmarks: Optional[Dict] = None
     ) -> Dict:
         """
         Compare calculated net yield to benchmark ranges
@@ -309,6 +319,8 @@ class YieldCalculationService:
             calculated_net_yield: The calculated net yield
             rent_decile: Property's rent tier
             geography: Geographic market
+            benchmarks: Optional preloaded benchmark rows keyed by
+                (rent_decile, geography)
 
         Returns:
             Comparison results:
@@ -322,10 +334,10 @@ class YieldCalculationService:
         """
 
         # Get benchmark data
-        benchmark = RiskBenchmarkData.query.filter_by(
-            rent_decile=rent_decile,
-            geography=geography
-        ).first()
+        if benchmarks is not None:
+            benchmark = benchmarks.get((rent_decile, geography))
+        else:
+            benchmark = BenchmarkRegistry.get_benchmark(rent_decile, geography)
 
         if not benchmark:
             return {
@@ -14,15 +14,105 @@ class Config:
     CENSUS_API_BASE_URL = os.getenv('CENSUS_API_BASE_URL', 'https://api.census.gov/data')
     CENSUS_API_YEAR = os.getenv('CENSUS_API_YEAR', '2022')
     CENSUS_CACHE_TTL = int(os.getenv('CENSUS_CACHE_TTL', '86400'))
+    # Every ZIP in a batch is cached, so a full batch may use at most a tenth of
+    # CACHE_MAX_ENTRIES (a larger setting is clamped) and cannot flush other namespaces
+    CENSUS_BATCH_MAX_ZIPCODES = int(os.getenv('CENSUS_BATCH_MAX_ZIPCODES', '5000'))
 
     # Federal Reserve Economic Data (FRED) API Configuration
     FRED_API_KEY = os.getenv('FRED_API_KEY', '')
     FRED_API_BASE_URL = os.getenv('FRED_API_BASE_URL', 'https://api.stlouisfed.org/fred')
     FRED_CACHE_TTL = int(os.getenv('FRED_CACHE_TTL', '3600'))
+    # Local time-series store; series are downloaded once and refreshed incrementally
+    # every FRED_CACHE_TTL seconds. Set FRED_SERIES_STORE_PATH to an empty string to disable
+    FRED_SERIES_STORE_PATH = os.getenv('FRED_SERIES_STORE_PATH', os.path.join(base_dir, 'instance', 'fred_series.db'))
 
     # RentCast Property Data API Configuration
     RENTCAST_API_KEY = os.getenv('RENTCAST_API_KEY', '')
     RENTCAST_CACHE_TTL = int(os.getenv('RENTCAST_CACHE_TTL', '604800'))
+    # On-disk store of raw RentCast responses (kept across restarts to save paid quota);
+    # set RENTCAST_RESPONSE_STORE_PATH to an empty string to disable
+    RENTCAST_RESPONSE_STORE_PATH = os.getenv(
+        'RENTCAST_RESPONSE_STORE_PATH', os.path.join(base_dir, 'instance', 'rentcast_responses.db')
+    )
+    RENTCAST_RESPONSE_STORE_MAX_BYTES = int(os.getenv('RENTCAST_RESPONSE_STORE_MAX_BYTES', str(256 * 1024 * 1024)))
+
+    # Outbound HTTP client (Census, FRED, RentCast): pooled keep-alive sessions,
+    # retries with jittered backoff, per-provider rate limits (requests/second per
+    # worker) and a circuit breaker. Retries: <PROVIDER>_MAX_RETRIES, else
+    # HTTP_MAX_RETRIES if set, else the provider's default (3; 2 for metered RentCast)
+    HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '10'))
+    HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES')) if os.getenv('HTTP_MAX_RETRIES') else None
+    HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '3.05'))
+    HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', '10'))
+    HTTP_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('HTTP_CIRCUIT_FAILURE_THRESHOLD', '5'))
+    HTTP_CIRCUIT_RECOVERY_TIMEOUT = float(os.getenv('HTTP_CIRCUIT_RECOVERY_TIMEOUT', '30'))
+    CENSUS_RATE_LIMIT = float(os.getenv('CENSUS_RATE_LIMIT', '5'))
+    FRED_RATE_LIMIT = float(os.getenv('FRED_RATE_LIMIT', '1'))
+    RENTCAST_RATE_LIMIT = float(os.getenv('RENTCAST_RATE_LIMIT', '5'))
+    RENTCAST_MAX_RETRIES = int(os.getenv('RENTCAST_MAX_RETRIES', '2'))
+
+    # Shared API response cache (Census, FRED, RentCast, scraping)
+    # CACHE_BACKEND: 'memory' (per worker), 'sqlite' (shared by workers on one
+    # host) or 'redis' (any Redis-protocol server)
+    CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'memory')
+    # Sized for a full Census batch (CENSUS_BATCH_MAX_ZIPCODES) plus everything else
+    CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', '50000'))
+    CACHE_MAX_BYTES = int(os.getenv('CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+    CACHE_SQLITE_PATH = os.getenv('CACHE_SQLITE_PATH', os.path.join(base_dir, 'instance', 'api_cache.db'))
+    CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+
+    # Seconds between checks of the shared benchmark data version stamp
+    BENCHMARK_VERSION_CHECK_INTERVAL = int(os.getenv('BENCHMARK_VERSION_CHECK_INTERVAL', '30'))
+    # Seconds between checks of the shared GP leaderboard version stamp
+    GP_LEADERBOARD_CHECK_INTERVAL = int(os.getenv('GP_LEADERBOARD_CHECK_INTERVAL', '30'))
+
+    # Risk assessment history retention: the newest N per deal are always kept,
+    # older ones are deleted after this many days by scripts/compact_risk_assessments.py
+    RISK_ASSESSMENT_KEEP_LATEST = int(os.getenv('RISK_ASSESSMENT_KEEP_LATEST', '10'))
+    RISK_ASSESSMENT_RETENTION_DAYS = int(os.getenv('RISK_ASSESSMENT_RETENTION_DAYS', '90'))
+
+    # Monte Carlo return simulation in the deal memo (paths per deal, RNG seed)
+    MONTE_CARLO_PATHS = int(os.getenv('MONTE_CARLO_PATHS', '100000'))
+    MONTE_CARLO_SEED = int(os.getenv('MONTE_CARLO_SEED', '42'))
+
+    # Deal comparison: most deals per request, memos generated in parallel
+    COMPARE_MAX_DEALS = int(os.getenv('COMPARE_MAX_DEALS', '500'))
+    COMPARE_MAX_WORKERS = int(os.getenv('COMPARE_MAX_WORKERS', '4'))
+
+    # PDF extraction: processes parsing pages in parallel (default: CPU count, up to 4;
+    # 1 parses in the request thread) and the most pages read per document
+    PDF_EXTRACTION_WORKERS = int(os.getenv('PDF_EXTRACTION_WORKERS', '0')) or None
+    PDF_MAX_PAGES = int(os.getenv('PDF_MAX_PAGES', '40'))
+    # LLM extraction sees only the most relevant pages: tokens of page text per
+    # document and per call (longer selections are split into parallel calls)
+    PDF_LLM_TOKEN_BUDGET = int(os.getenv('PDF_LLM_TOKEN_BUDGET', '6000'))
+    PDF_LLM_CALL_TOKEN_BUDGET = int(os.getenv('PDF_LLM_CALL_TOKEN_BUDGET', '3000'))
+    PDF_LLM_MAX_PARALLEL_CALLS = int(os.getenv('PDF_LLM_MAX_PARALLEL_CALLS', '3'))
+    # The LLM is skipped when regex matches find the address, city, state, price and
+    # units with at least this confidence (0-1; above 1 always calls the LLM)
+    PDF_REGEX_MIN_CONFIDENCE = float(os.getenv('PDF_REGEX_MIN_CONFIDENCE', '0.7'))
+
+    # Background jobs (python -m app.jobs.worker): PDF extraction, Excel exports and
+    # deal comparisons queued with ?async=true. JOB_ASYNC_DEFAULT queues them without it.
+    # JOB_TYPE_CONCURRENCY caps running jobs per type across all workers,
+    # e.g. "extract_pdf=2,compare_deals=1"
+    JOB_ASYNC_DEFAULT = os.getenv('JOB_ASYNC_DEFAULT', 'false').lower() == 'true'
+    JOB_WORKER_PROCESSES = int(os.getenv('JOB_WORKER_PROCESSES', '2'))
+    JOB_POLL_INTERVAL = float(os.getenv('JOB_POLL_INTERVAL', '1.0'))
+    JOB_LEASE_SECONDS = int(os.getenv('JOB_LEASE_SECONDS', '300'))
+    JOB_MAX_ATTEMPTS = int(os.getenv('JOB_MAX_ATTEMPTS', '3'))
+    JOB_RESULT_TTL = int(os.getenv('JOB_RESULT_TTL', '86400'))
+    JOB_TYPE_CONCURRENCY = {
+        job_type.strip(): int(limit)
+        for job_type, limit in (
+            item.split('=') for item in os.getenv(
+                'JOB_TYPE_CONCURRENCY', 'extract_pdf=2,export_deal=2,export_underwriting=2,compare_deals=1'
+            ).split(',') if '=' in item
+        )
+    }
+
+    # Report the number of SQL statements each request ran in an X-SQL-Statements header
+    SQL_STATEMENT_COUNT_HEADER = os.getenv('SQL_STATEMENT_COUNT_HEADER', 'true').lower() == 'true'
 
     # Frontend URL for CORS (only used in development)
     FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:5173')
@@ -0,0 +1,246 @@
+"""
+Benchmark Query Plans
+Seeds large tables, then checks that each hot lookup query is planned as an
+index scan on the index declared for it in app/migrations/versions.py and
+runs within a latency budget
+
+Usage:
+    python scripts/benchmark_query_plans.py [scale] [database_url]
+
+    scale: Number of deals to seed; other tables scale with it (default 20000)
+    database_url: SQLAlchemy URL of an EMPTY database (default: temporary SQLite file)
+"""
+
+import sys
+import os
+import tempfile
+import time
+from datetime import datetime, date, timedelta
+from statistics import median
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from app import create_app
+from app.database import db
+from app.migrations import MIGRATIONS, get_applied_versions
+
+LATENCY_BUDGET_MS = 5.0
+RUNS = 50
+
+STATUSES = ['potential', 'ongoing', 'completed', 'rejected']
+IMPORT_STATUSES = ['pending', 'processing', 'completed', 'failed']
+GEOGRAPHIES = [f"{zip_code:05d}" for zip_code in range(90000, 90500)]
+
+# (name, SQL, parameters, index the plan must use)
+HOT_QUERIES = [
+    ('deal list page',
+     "SELECT id, deal_name, status, updated_at FROM deals "
+     "WHERE updated_at < :updated_at OR (updated_at = :updated_at AND id < :id) "
+     "ORDER BY updated_at DESC, id DESC LIMIT 101",
+     {'updated_at': '2024-06-01 00:00:00', 'id': 1000}, 'ix_deals_updated_at_id'),
+    ('deal list by status',
+     "SELECT id, deal_name, updated_at FROM deals WHERE status = :status "
+     "ORDER BY updated_at DESC, id DESC LIMIT 101",
+     {'status': 'ongoing'}, 'ix_deals_status_updated_at_id'),
+    ('latest risk assessment',
+     "SELECT * FROM risk_assessments WHERE deal_id = :deal_id ORDER BY id DESC LIMIT 1",
+     {'deal_id': 1234}, 'ix_risk_assessments_deal_id'),
+    ('imports by status',
+     "SELECT id, source_url, created_at FROM property_imports WHERE import_status = :status "
+     "ORDER BY created_at DESC LIMIT 50",
+     {'status': 'failed'}, 'ix_property_imports_status_created_at'),
+    ('imports by deal',
+     "SELECT id, created_at FROM property_imports WHERE deal_id = :deal_id ORDER BY created_at DESC",
+     {'deal_id': 77}, 'ix_property_imports_deal_id_created_at'),
+    ('decile thresholds',
+     "SELECT * FROM market_decile_thresholds WHERE geography = :geography AND bedrooms = :bedrooms "
+     "AND data_year = :data_year LIMIT 1",
+     {'geography': '90123', 'bedrooms': 2, 'data_year': 2023}, 'ix_market_decile_thresholds_lookup'),
+    ('risk benchmark',
+     "SELECT * FROM risk_benchmark_data WHERE rent_decile = :decile AND geography = :geography LIMIT 1",
+     {'decile': 7, 'geography': '90123'}, 'ix_risk_benchmark_data_decile_geography'),
+    ('fund metrics',
+     "SELECT * FROM fund_metrics WHERE fund_id = :fund_id ORDER BY as_of_date DESC LIMIT 1",
+     {'fund_id': 42}, 'ix_fund_metrics_fund_id_as_of_date'),
+    ('fund quarterly performance',
+     "SELECT * FROM fund_quarterly_performance WHERE fund_id = :fund_id ORDER BY year, quarter LIMIT 8",
+     {'fund_id': 42}, 'ix_fund_quarterly_performance_fund_id'),
+    ('fund strategies',
+     "SELECT * FROM investment_strategies WHERE fund_id = :fund_id ORDER BY deployed_capital DESC",
+     {'fund_id': 42}, 'ix_investment_strategies_fund_id'),
+    ('fund cash flows',
+     "SELECT * FROM fund_cash_flows WHERE fund_id = :fund_id ORDER BY year, quarter LIMIT 8",
+     {'fund_id': 42}, 'ix_fund_cash_flows_fund_id'),
+    ('fund activities',
+     "SELECT * FROM fund_activities WHERE fund_id = :fund_id ORDER BY activity_date DESC LIMIT 10",
+     {'fund_id': 42}, 'ix_fund_activities_fund_id_date'),
+    ('fund benchmarks',
+     "SELECT * FROM benchmark_data WHERE fund_id = :fund_id ORDER BY as_of_date DESC",
+     {'fund_id': 42}, 'ix_benchmark_data_fund_id_as_of_date'),
+    ('GP quarterly performance',
+     "SELECT * FROM gp_quarterly_performance WHERE gp_id = :gp_id ORDER BY year DESC, quarter DESC LIMIT 8",
+     {'gp_id': 42}, 'ix_gp_quarterly_performance_gp_id'),
+    ('GP portfolio summary',
+     "SELECT * FROM gp_portfolio_summary WHERE gp_id = :gp_id AND year = :year ORDER BY quartile",
+     {'gp_id': 42, 'year': 2023}, 'ix_gp_portfolio_summary_gp_id'),
+]
+
+
+def insert_rows(table_name: str, rows: list):
+    """Bulk insert rows in chunks"""
+    table = db.metadata.tables[table_name]
+    for i in range(0, len(rows), 5000):
+        db.session.execute(table.insert(), rows[i:i + 5000])
+    db.session.commit()
+
+
+def seed(scale: int):
+    """Seed every hot table; child tables scale with the parent counts"""
+    now = datetime(2024, 1, 1)
+    fund_count = gp_count = max(10, scale // 40)
+
+    insert_rows('deals', [{
+        'id': i, 'deal_name': f'Deal {i}', 'location': 'Los Angeles, CA',
+        'status': STATUSES[i % 4], 'created_at': now,
+        'updated_at': now + timedelta(minutes=(i * 7919) % (scale * 10))
+    } for i in range(1, scale + 1)])
+
+    insert_rows('risk_assessments', [{
+        'deal_id': 1 + i % scale, 'created_at': now, 'updated_at': now
+    } for i in range(scale * 2)])
+
+    insert_rows('property_imports', [{
+        'deal_id': 1 + i % scale, 'source_url': f'https://example.com/listing/{i}',
+        'import_status': IMPORT_STATUSES[i % 4],
+        'created_at': now + timedelta(minutes=i), 'updated_at': now
+    } for i in range(scale)])
+
+    insert_rows('market_decile_thresholds', [{
+        'geography': geography, 'bedrooms': bedrooms, 'data_year': year,
+        'last_updated': now, 'created_at': now
+    } for geography in GEOGRAPHIES for bedrooms in range(5) for year in (2022, 2023)])
+
+    insert_rows('risk_benchmark_data', [{
+        'rent_decile': decile, 'geography': geography, 'created_at': now
+    } for geography in GEOGRAPHIES for decile in range(1, 11)])
+
+    insert_rows('funds', [{
+        'id': i, 'fund_name': f'Fund {i}', 'status': 'active', 'created_at': now, 'updated_at': now
+    } for i in range(1, fund_count + 1)])
+    insert_rows('gps', [{
+        'id': i, 'gp_name': f'GP {i}', 'created_at': now, 'updated_at': now
+    } for i in range(1, gp_count + 1)])
+
+    quarters = [(year, quarter) for year in range(2014, 2024) for quarter in range(1, 5)]
+    for table_name in ('fund_quarterly_performance', 'fund_cash_flows'):
+        insert_rows(table_name, [{
+            'fund_id': fund_id, 'year': year, 'quarter': quarter, 'created_at': now
+        } for fund_id in range(1, fund_count + 1) for year, quarter in quarters])
+
+    insert_rows('gp_quarterly_performance', [{
+        'gp_id': gp_id, 'year': year, 'quarter': quarter, 'created_at': now
+    } for gp_id in range(1, gp_count + 1) for year, quarter in quarters])
+
+    insert_rows('gp_portfolio_summary', [{
+        'gp_id': gp_id, 'year': year, 'quartile': quartile, 'created_at': now
+    } for gp_id in range(1, gp_count + 1) for year in range(2014, 2024) for quartile in range(1, 5)])
+
+    days = [date(2020, 1, 1) + timedelta(days=30 * i) for i in range(40)]
+    insert_rows('fund_metrics', [{
+        'fund_id': fund_id, 'as_of_date': day, 'created_at': now
+    } for fund_id in range(1, fund_count + 1) for day in days])
+    insert_rows('fund_activities', [{
+        'fund_id': fund_id, 'activity_date': day, 'description': 'Distribution', 'created_at': now
+    } for fund_id in range(1, fund_count + 1) for day in days])
+    insert_rows('benchmark_data', [{
+        'fund_id': fund_id, 'metric_name': 'Net IRR', 'as_of_date': day, 'created_at': now
+    } for fund_id in range(1, fund_count + 1) for day in days])
+    insert_rows('investment_strategies', [{
+        'fund_id': fund_id, 'strategy_name': f'Strategy {i}', 'deployed_capital': float(i * 1000),
+        'created_at': now, 'updated_at': now
+    } for fund_id in range(1, fund_count + 1) for i in range(40)])
+
+    # Refresh planner statistics
+    db.session.execute(text('ANALYZE'))
+    db.session.commit()
+
+
+def explain(sql: str, params: dict) -> str:
+    """Get the query plan as text"""
+    if db.engine.dialect.name == 'sqlite':
+        rows = db.session.execute(text('EXPLAIN QUERY PLAN ' + sql), params).fetchall()
+        return '\n'.join(row[-1] for row in rows)
+    rows = db.session.execute(text('EXPLAIN ' + sql), params).fetchall()
+    return '\n'.join(row[0] for row in rows)
+
+
+def time_query(sql: str, params: dict) -> float:
+    """Median latency in milliseconds over RUNS executions"""
+    statement = text(sql)
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        db.session.execute(statement, params).fetchall()
+        timings.append((time.perf_counter() - start) * 1000)
+    return median(timings)
+
+
+def main():
+    """Seed, migrate and check every hot query"""
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    database_url = sys.argv[2] if len(sys.argv) > 2 else None
+
+    temp_dir = None
+    if database_url is None:
+        temp_dir = tempfile.mkdtemp()
+        database_url = f"sqlite:///{os.path.join(temp_dir, 'benchmark.db')}"
+
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': database_url,
+        'CACHE_BACKEND': 'memory',
+        'RENTCAST_RESPONSE_STORE_PATH': '',
+        'FRED_SERIES_STORE_PATH': ''
+    })
+
+    print("=" * 60)
+    print("QUERY PLAN BENCHMARK")
+    print("=" * 60)
+
+    failures = []
+    with app.app_context():
+        applied = get_applied_versions(db.engine)
+        print(f"Database: {db.engine.dialect.name}, schema versions {applied}")
+        assert applied == [m.version for m in MIGRATIONS], "migrations were not applied"
+
+        start = time.perf_counter()
+        seed(scale)
+        print(f"Seeded {scale:,} deals (+ child tables) in {time.perf_counter() - start:.1f}s\n")
+
+        for name, sql, params, index_name in HOT_QUERIES:
+            plan = explain(sql, params)
+            latency = time_query(sql, params)
+            uses_index = index_name in plan
+            within_budget = latency <= LATENCY_BUDGET_MS
+
+            status = '✓' if uses_index and within_budget else '✗'
+            print(f"  {status} {name:<28} {latency:7.3f} ms  {'uses ' + index_name if uses_index else 'NO INDEX'}")
+            if not uses_index:
+                print(f"      plan: {plan}")
+                failures.append(f"{name}: plan does not use {index_name}")
+            if not within_budget:
+                failures.append(f"{name}: {latency:.3f} ms exceeds {LATENCY_BUDGET_MS} ms")
+
+    print("\n" + "=" * 60)
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("ALL HOT QUERIES USE THEIR INDEXES ✓")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
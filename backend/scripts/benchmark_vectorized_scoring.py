@@ -0,0 +1,152 @@
+"""
+Benchmark Vectorized Scoring
+Scores synthetic properties with VectorizedScoringService and checks that a
+sample matches the scalar services exactly
+
+Usage:
+    python scripts/benchmark_vectorized_scoring.py [num_properties]
+"""
+
+import sys
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.vectorized_scoring_service import VectorizedScoringService
+from app.services.hedonic_model_service import HedonicModelService
+from app.services.rent_tier_service import RentTierService
+from app.services.yield_calculation_service import YieldCalculationService
+from app.services.capital_appreciation_service import CapitalAppreciationService
+from app.services.total_return_service import TotalReturnService
+from app.services.risk_assessment_service import RiskAssessmentService
+
+
+def generate_properties(n: int, seed: int = 42) -> dict:
+    """Generate synthetic deal attributes"""
+    rng = np.random.default_rng(seed)
+    property_types = np.array(['Multifamily', 'Single Family', 'Condo', 'Apartment', None], dtype=object)
+    year_built = rng.integers(1900, 2025, n).astype(float)
+    year_built[rng.random(n) < 0.1] = np.nan
+
+    return {
+        'square_footage': rng.integers(400, 4000, n).astype(float),
+        'bedrooms': rng.integers(1, 6, n).astype(float),
+        'bathrooms': rng.choice([1.0, 1.5, 2.0, 2.5, 3.0], n),
+        'year_built': year_built,
+        'purchase_price': np.round(rng.uniform(80000, 2000000, n), -2),
+        'loan_interest_rate': np.round(rng.uniform(4.0, 9.0, n), 3),
+        'down_payment_percent': rng.choice([0.0, 10.0, 20.0, 25.0, 30.0], n),
+        'property_type': property_types[rng.integers(0, len(property_types), n)]
+    }
+
+
+def score_scalar(row: dict, thresholds: dict) -> dict:
+    """Run the scalar services the same way DealService._run_risk_pipeline does"""
+    rent = HedonicModelService.predict_fundamental_rent({
+        'square_footage': row['square_footage'],
+        'bedrooms': row['bedrooms'],
+        'bathrooms': row['bathrooms'],
+        'year_built': row['year_built'],
+        'property_type': row['property_type'],
+        'epc_score': None
+    })['predicted_rent']
+
+    decile = RentTierService.classify_property(
+        predicted_rent=rent, geography='national', bedrooms=row['bedrooms'], thresholds=thresholds
+    )['national_decile']
+
+    annual_rent = rent * 12
+    value = row['purchase_price'] or 200000
+    gross = YieldCalculationService.calculate_gross_yield(annual_rent, value)
+    costs = YieldCalculationService.calculate_cost_components(
+        rent_decile=decile, num_units=1, property_value=value, annual_rent=annual_rent, benchmarks={}
+    )
+    net = YieldCalculationService.calculate_net_yield(gross, costs)
+    appreciation = CapitalAppreciationService.project_future_value(
+        current_value=value, rent_decile=decile, benchmarks={}
+    )['annualized_appreciation_rate']
+    unlevered = TotalReturnService.calculate_unlevered_return(net, appreciation)
+    ltv = 1.0 - ((row['down_payment_percent'] or 25.0) / 100)
+    levered = TotalReturnService.calculate_levered_return(
+        unlevered, row['loan_interest_rate'] or 6.5, ltv
+    )
+
+    age = datetime.now().year - row['year_built'] if row['year_built'] else None
+    composite = RiskAssessmentService.calculate_composite_risk(
+        systematic_risk=RiskAssessmentService.calculate_systematic_risk(decile, benchmarks={}),
+        regulatory_risk=RiskAssessmentService.calculate_regulatory_risk(state='CA'),
+        idiosyncratic_risk=RiskAssessmentService.calculate_idiosyncratic_risk(property_age=age, num_units=1),
+        rent_decile=decile
+    )
+
+    return {
+        'predicted_rent': rent,
+        'rent_decile': decile,
+        'net_yield': net,
+        'capital_gain_yield_annual': appreciation,
+        'total_return_unlevered': unlevered,
+        'total_return_levered': levered,
+        'composite_risk_score': composite['composite_risk_score'],
+        'composite_risk_level': composite['composite_risk_level']
+    }
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    sample_size = min(n, 5000)
+    year = datetime.now().year
+
+    print("=" * 60)
+    print(f"VECTORIZED SCORING BENCHMARK ({n:,} properties)")
+    print("=" * 60)
+
+    properties = generate_properties(n)
+
+    # No database: research defaults for benchmarks and thresholds
+    thresholds = {('national', b, year): None for b in range(1, 6)}
+
+    start = time.perf_counter()
+    results = VectorizedScoringService.score(properties, benchmarks={}, thresholds=thresholds)
+    elapsed = time.perf_counter() - start
+
+    print(f"\nScored {n:,} properties in {elapsed:.2f}s ({n / elapsed:,.0f} per second)")
+    print(f"  Valid rows: {int(results['valid'].sum()):,}")
+    print(f"  Mean levered return: {np.nanmean(results['total_return_levered']):.2f}%")
+
+    # Parity check against the scalar services
+    mismatches = 0
+    for i in range(sample_size):
+        row = {
+            key: (None if isinstance(values[i], float) and np.isnan(values[i]) else
+                  values[i].item() if hasattr(values[i], 'item') else values[i])
+            for key, values in properties.items()
+        }
+        row['bedrooms'] = int(row['bedrooms'])
+        if row['year_built'] is not None:
+            row['year_built'] = int(row['year_built'])
+
+        expected = score_scalar(row, thresholds)
+        for key, value in expected.items():
+            actual = results[key][i]
+            actual = actual.item() if hasattr(actual, 'item') else actual
+            if actual != value:
+                mismatches += 1
+                if mismatches <= 10:
+                    print(f"  MISMATCH row {i} {key}: vectorized={actual} scalar={value}")
+
+    print(f"\nParity check on {sample_size:,} rows: {mismatches} mismatches")
+
+    if mismatches:
+        print("❌ Vectorized results differ from scalar services")
+        sys.exit(1)
+
+    print("✅ Vectorized results match scalar services")
+
+
+if __name__ == '__main__':
+    main()
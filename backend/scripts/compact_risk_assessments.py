@@ -0,0 +1,36 @@
+"""
+Compact Risk Assessments
+Deletes risk assessment history outside the retention policy
+(RISK_ASSESSMENT_KEEP_LATEST newest per deal are kept; older rows are
+removed after RISK_ASSESSMENT_RETENTION_DAYS)
+
+Saving assessments never deletes history, so this is the only place the
+policy is applied: run it nightly (e.g. from cron)
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.database import RiskAssessmentModel
+from app.services.deal_service import DealService
+
+
+def main():
+    """Compact risk assessments for every deal"""
+    app = create_app()
+
+    with app.app_context():
+        before = RiskAssessmentModel.query.count()
+        deleted = DealService.compact_risk_assessments()
+
+        print(f"Keep latest: {app.config.get('RISK_ASSESSMENT_KEEP_LATEST')} per deal")
+        print(f"Retention: {app.config.get('RISK_ASSESSMENT_RETENTION_DAYS')} days")
+        print(f"✓ Deleted {deleted:,} of {before:,} risk assessments")
+
+
+if __name__ == '__main__':
+    main()
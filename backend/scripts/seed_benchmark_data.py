@@ -13,6 +13,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import db, RiskBenchmarkData, HedonicModelCoefficients
+from app.services.benchmark_registry import BenchmarkRegistry
 from app import create_app
 
 
@@ -411,6 +412,10 @@ def main():
         seed_netherlands_benchmarks()
         seed_hedonic_coefficients()
 
+        # Tell every running worker to reload its benchmark registry
+        version = BenchmarkRegistry.bump_version()
+        print(f"\n✓ Benchmark data version bumped to {version}")
+
         # Summary
         print("\n" + "=" * 60)
         print("SEEDING COMPLETE")
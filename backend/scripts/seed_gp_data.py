@@ -10,6 +10,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from app import create_app
 from app.database import db, GPModel, GPQuarterlyPerformanceModel, GPPortfolioSummaryModel
+from app.services.gp_leaderboard import GPLeaderboard
 import json
 
 def seed_gp_data():
@@ -246,7 +247,8 @@ def seed_gp_data():
             )
             db.session.add(qp)
 
-        # Commit all changes
+        # Commit all changes (and tell every worker to reload the leaderboard)
+        GPLeaderboard.bump_version(commit=False)
         db.session.commit()
         print("✓ Successfully seeded GP data!")
         print(f"  - Created {GPModel.query.count()} GPs")
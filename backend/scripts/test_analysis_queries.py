@@ -0,0 +1,128 @@
+"""
+Test Analysis Query Counts
+Checks that an analysis loads the deal and reference data once: the memo runs
+a fixed number of SQL statements, and a sensitivity run costs the same
+whether it has 3 scenarios or 30
+
+Usage:
+    python scripts/test_analysis_queries.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.database import db, DealModel
+from app.query_counter import count_queries
+from app.services.analysis_cache import AnalysisResultCache
+from app.services.deal_memo_service import DealMemoService
+from app.services.total_return_service import TotalReturnService
+
+MEMO_STATEMENT_BUDGET = 10
+
+
+def _seed_deal() -> int:
+    deal = DealModel(
+        deal_name='Query Count Test',
+        location='Austin, TX',
+        property_address='123 Main St, Austin, TX 78701',
+        purchase_price=350000,
+        down_payment_percent=25,
+        loan_interest_rate=6.5,
+        loan_term_years=30,
+        monthly_rent=2400,
+        vacancy_rate=5,
+        property_tax_annual=6000,
+        insurance_annual=1500,
+        bedrooms=3,
+        bathrooms=2,
+        square_footage=1600,
+        property_type='Single Family',
+        year_built=1995
+    )
+    db.session.add(deal)
+    db.session.commit()
+    return deal.id
+
+
+def _scenarios(count: int) -> dict:
+    return {
+        f'scenario_{i}': {'yield_adjustment': (i - count / 2) * 0.1, 'appreciation_adjustment': i * 0.05}
+        for i in range(count)
+    }
+
+
+def main():
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        'CACHE_BACKEND': 'memory',
+        'RENTCAST_RESPONSE_STORE_PATH': '',
+        'FRED_SERIES_STORE_PATH': ''
+    })
+    failures = 0
+
+    with app.app_context():
+        deal_id = _seed_deal()
+
+        print("=" * 60)
+        print("MEMO")
+        print("=" * 60)
+        AnalysisResultCache.clear()
+        with count_queries() as memo_counter:
+            DealMemoService.generate_memo(deal_id)
+        print(f"Memo statements: {memo_counter.statements}")
+        if memo_counter.statements > MEMO_STATEMENT_BUDGET:
+            print(f"✗ Memo ran more than {MEMO_STATEMENT_BUDGET} statements")
+            failures += 1
+        else:
+            print("✓ Memo within statement budget")
+
+        with count_queries() as cached_counter:
+            DealMemoService.generate_memo(deal_id)
+        print(f"Cached memo statements: {cached_counter.statements}")
+
+        print("\n" + "=" * 60)
+        print("SENSITIVITY")
+        print("=" * 60)
+        counts = {}
+        for scenario_count in (3, 30):
+            with count_queries() as counter:
+                TotalReturnService.sensitivity_analysis(
+                    deal_id=deal_id,
+                    rent_decile=5,
+                    scenarios=_scenarios(scenario_count)
+                )
+            counts[scenario_count] = counter.statements
+            print(f"{scenario_count} scenarios: {counter.statements} statements")
+
+        if counts[3] != counts[30]:
+            print("✗ Statement count grows with the number of scenarios")
+            failures += 1
+        else:
+            print("✓ Statement count independent of scenario count")
+
+    print("\n" + "=" * 60)
+    print("ENDPOINT")
+    print("=" * 60)
+    with app.app_context():
+        AnalysisResultCache.clear()
+    response = app.test_client().get(f'/api/v1/deals/{deal_id}/deal-memo')
+    header = response.headers.get('X-SQL-Statements')
+    print(f"Status {response.status_code}, X-SQL-Statements: {header}")
+    if response.status_code != 200 or header is None:
+        print("✗ Memo endpoint did not report its statement count")
+        failures += 1
+    else:
+        print("✓ Memo endpoint reports its statement count")
+
+    if failures:
+        print(f"\n✗ {failures} check(s) failed")
+        sys.exit(1)
+    print("\n✓ All checks passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,285 @@
+"""
+Test Cache Backends
+Check LRU/TTL eviction and per-namespace stats of the memory backend, two
+processes sharing one SQLite cache file, and the Redis backend against a
+local RESP stub server (no Redis install needed)
+"""
+
+import sys
+import os
+import fnmatch
+import multiprocessing
+import socketserver
+import tempfile
+import threading
+import time
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.cache import MemoryBackend, SQLiteBackend, RedisBackend, TTLCache
+
+
+class RESPStubHandler(socketserver.StreamRequestHandler):
+    """Minimal Redis stand-in: GET/SET PX/DEL/SCAN/HINCRBY/HGETALL/AUTH/SELECT."""
+
+    store = {}
+    hashes = {}
+    commands = []
+    lock = threading.Lock()
+
+    def handle(self):
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            count = int(line[1:-2])
+            args = []
+            for _ in range(count):
+                length = int(self.rfile.readline()[1:-2])
+                args.append(self.rfile.read(length + 2)[:-2])
+
+            with RESPStubHandler.lock:
+                RESPStubHandler.commands.append(args[0].decode().upper())
+                reply = self._execute(args[0].decode().upper(), args[1:])
+            self.wfile.write(reply)
+
+    def _execute(self, command, args):
+        store = RESPStubHandler.store
+        if command in ('AUTH', 'SELECT'):
+            return b'+OK\r\n'
+        if command == 'SET':
+            expires_at = time.time() + int(args[3]) / 1000 if len(args) > 3 else None
+            store[args[0]] = (args[1], expires_at)
+            return b'+OK\r\n'
+        if command == 'GET':
+            entry = store.get(args[0])
+            if entry is None or (entry[1] is not None and time.time() >= entry[1]):
+                store.pop(args[0], None)
+                return b'$-1\r\n'
+            return self._bulk(entry[0])
+        if command == 'DEL':
+            removed = sum(1 for key in args if store.pop(key, None) is not None)
+            return b':%d\r\n' % removed
+        if command == 'SCAN':
+            pattern = args[2].decode()
+            keys = [key for key in store if fnmatch.fnmatchcase(key.decode(), pattern)]
+            return b'*2\r\n' + self._bulk(b'0') + b'*%d\r\n' % len(keys) + b''.join(self._bulk(k) for k in keys)
+        if command == 'HINCRBY':
+            fields = RESPStubHandler.hashes.setdefault(args[0], {})
+            fields[args[1]] = fields.get(args[1], 0) + int(args[2])
+            return b':%d\r\n' % fields[args[1]]
+        if command == 'HGETALL':
+            fields = RESPStubHandler.hashes.get(args[0], {})
+            items = [part for name, value in fields.items() for part in (name, str(value).encode())]
+            return b'*%d\r\n' % len(items) + b''.join(self._bulk(item) for item in items)
+        return b'-ERR unknown command\r\n'
+
+    @staticmethod
+    def _bulk(value):
+        return b'$%d\r\n%s\r\n' % (len(value), value)
+
+
+def start_resp_server():
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), RESPStubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"redis://:secret@127.0.0.1:{server.server_address[1]}/2"
+
+
+def sqlite_worker(path, worker, count):
+    """Runs in a separate process: writes its own keys and bumps a shared counter."""
+    backend = SQLiteBackend(path, max_entries=None, max_bytes=None)
+    for i in range(count):
+        backend.set('shared', f'w{worker}:{i}', f'value {worker}/{i}'.encode(), 60)
+        backend.incr_counter('shared', 'writes')
+
+
+def test_memory_lru():
+    """Least recently used entries go first; a read refreshes recency"""
+    print("\n" + "=" * 60)
+    print("TEST 1: MEMORY BACKEND LRU ORDER")
+    print("=" * 60)
+
+    backend = MemoryBackend(max_entries=3)
+    for key in ('a', 'b', 'c'):
+        backend.set('census', key, key.encode(), 60)
+    assert backend.get('census', 'a') == b'a'
+
+    backend.set('fred', 'd', b'd', 60)
+    backend.set('fred', 'e', b'e', 60)
+    remaining = [key for key in 'abcde' if backend.get('census', key) or backend.get('fred', key)]
+    print(f"  After 5 sets with limit 3 (a read again): {remaining}")
+    assert remaining == ['a', 'd', 'e']
+
+    census, fred = backend.get_namespace_stats('census'), backend.get_namespace_stats('fred')
+    print(f"  census: {census}, fred: {fred}")
+    assert census == {'entries': 1, 'bytes': 1, 'evictions': 2}
+    assert fred == {'entries': 2, 'bytes': 2, 'evictions': 0}
+
+
+def test_memory_bytes_and_ttl():
+    """Byte limit evicts by size, oversized values are refused, TTL expires entries"""
+    print("\n" + "=" * 60)
+    print("TEST 2: MEMORY BACKEND BYTES AND TTL")
+    print("=" * 60)
+
+    backend = MemoryBackend(max_entries=None, max_bytes=100)
+    for i in range(4):
+        backend.set('rentcast', f'k{i}', b'x' * 30, 60)
+    stats = backend.get_namespace_stats('rentcast')
+    print(f"  4 x 30 bytes with a 100 byte limit: {stats}")
+    assert stats == {'entries': 3, 'bytes': 90, 'evictions': 1}
+    assert backend.get('rentcast', 'k0') is None
+
+    backend.set('rentcast', 'huge', b'x' * 101, 60)
+    assert backend.get('rentcast', 'huge') is None
+    assert backend.get_namespace_stats('rentcast')['entries'] == 3
+
+    backend.set('rentcast', 'k1', b'y' * 10, 60)
+    assert backend.get_namespace_stats('rentcast')['bytes'] == 70
+
+    backend.set('fred', 'short', b'1', 0.1)
+    assert backend.get('fred', 'short') == b'1'
+    time.sleep(0.15)
+    assert backend.get('fred', 'short') is None
+    assert backend.get_namespace_stats('fred') == {'entries': 0, 'bytes': 0, 'evictions': 0}
+
+    backend.clear('rentcast')
+    assert backend.get_namespace_stats('rentcast')['bytes'] == 0
+    print("  Oversized value refused, overwrite re-accounted, TTL and clear reset stats")
+
+
+def test_ttl_cache():
+    """The front-end counts hits and misses and treats backend errors as misses"""
+    print("\n" + "=" * 60)
+    print("TEST 3: TTL CACHE FRONT-END")
+    print("=" * 60)
+
+    cache = TTLCache('test-front', default_ttl=60, backend=MemoryBackend(max_entries=10))
+    cache.set('zip:78701', {'population': 12000})
+    assert cache.get('zip:78701') == {'population': 12000}
+    assert cache.get('zip:00000') is None
+    stats = cache.get_stats()
+    print(f"  {stats}")
+    assert (stats['hits'], stats['misses'], stats['sets'], stats['hit_rate']) == (1, 1, 1, 0.5)
+
+    # Nothing listens on port 1: every call fails and is reported as a miss
+    down = TTLCache('test-down', backend=RedisBackend('redis://127.0.0.1:1/0', socket_timeout=0.2))
+    down.set('a', 1)
+    assert down.get('a') is None
+    errors = down.get_stats()['errors']
+    print(f"  Unreachable backend: {errors} errors, no exception")
+    assert errors >= 2
+
+
+def test_sqlite_shared():
+    """Two processes write to one SQLite file; a third sees every entry"""
+    print("\n" + "=" * 60)
+    print("TEST 4: SQLITE SHARED ACROSS PROCESSES")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'cache.db')
+        SQLiteBackend(path)
+
+        context = multiprocessing.get_context('spawn')
+        workers = [context.Process(target=sqlite_worker, args=(path, worker, 200)) for worker in range(2)]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(60)
+            assert process.exitcode == 0
+
+        backend = SQLiteBackend(path, max_entries=None, max_bytes=None)
+        stats = backend.get_namespace_stats('shared')
+        counters = backend.get_counters('shared')
+        print(f"  {stats}, counters {counters}")
+        assert stats['entries'] == 400
+        assert counters == {'writes': 400}
+        assert backend.get('shared', 'w1:199') == b'value 1/199'
+
+        # Limits apply to what the other processes wrote
+        limited = SQLiteBackend(path, max_entries=100, max_bytes=None)
+        limited.set('other', 'new', b'new', 60)
+        assert limited.get_namespace_stats('shared')['entries'] == 99
+        assert limited.get_namespace_stats('shared')['evictions'] == 301
+        assert limited.get('other', 'new') == b'new'
+
+        limited.set('other', 'short', b'1', 0.1)
+        time.sleep(0.15)
+        assert limited.get('other', 'short') is None
+        print("  Entry limit evicted the other processes' oldest entries; TTL honored")
+
+
+def test_redis_stub():
+    """RESP round trips: values, expiry, namespace clear, counters, auth/select"""
+    print("\n" + "=" * 60)
+    print("TEST 5: REDIS BACKEND (RESP STUB)")
+    print("=" * 60)
+
+    server, url = start_resp_server()
+    try:
+        backend = RedisBackend(url, max_bytes=1000)
+        payload = bytes(range(256))
+        backend.set('census', 'zip:78701', payload, 60)
+        backend.set('census', 'zip:78702', b'two', 60)
+        backend.set('fred', 'DGS10', b'4.1', 60)
+        assert backend.get('census', 'zip:78701') == payload
+        assert backend.get('census', 'missing') is None
+        assert RESPStubHandler.commands[:2] == ['AUTH', 'SELECT']
+
+        backend.set('census', 'too-big', b'x' * 1001, 60)
+        assert backend.get('census', 'too-big') is None
+
+        backend.set('fred', 'short', b'1', 0.1)
+        time.sleep(0.15)
+        assert backend.get('fred', 'short') is None
+
+        stats = backend.get_namespace_stats('census')
+        print(f"  census: {stats}")
+        assert stats == {'entries': 2, 'bytes': None, 'evictions': None}
+
+        backend.clear('census')
+        assert backend.get_namespace_stats('census')['entries'] == 0
+        assert backend.get('fred', 'DGS10') == b'4.1'
+
+        backend.incr_counter('rentcast', 'saved:/markets', 3)
+        backend.incr_counter('rentcast', 'saved:/markets')
+        assert backend.get_counters('rentcast') == {'saved:/markets': 4}
+
+        # A dropped connection is reopened transparently
+        backend._local.conn[0].close()
+        assert backend.get('fred', 'DGS10') == b'4.1'
+        print(f"  {len(RESPStubHandler.commands)} commands, reconnect after drop OK")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    """Run all cache backend tests"""
+    print("=" * 60)
+    print("CACHE BACKEND TESTS")
+    print("=" * 60)
+
+    try:
+        test_memory_lru()
+        test_memory_bytes_and_ttl()
+        test_ttl_cache()
+        test_sqlite_shared()
+        test_redis_stub()
+
+        print("\n" + "=" * 60)
+        print("ALL TESTS PASSED ✓")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""
+Test Deal Pagination
+Check keyset pagination of GET /deals and the board's load-more cursors on
+SQLite, including deals created within the same second and rows stored
+before timestamps were normalized
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app import create_app
+from app.database import db
+from app.migrations import MIGRATIONS
+from app.services.deal_service import DealService
+
+
+def make_app():
+    return create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        'CACHE_BACKEND': 'memory',
+        'RENTCAST_RESPONSE_STORE_PATH': '',
+        'FRED_SERIES_STORE_PATH': ''
+    })
+
+
+def create_deals(app, count, status='ongoing'):
+    with app.app_context():
+        return [
+            DealService.create_deal({'dealName': f'Deal {i}', 'location': 'Austin, TX', 'status': status}).id
+            for i in range(count)
+        ]
+
+
+def follow_cursors(client, url, limit=3, max_pages=20):
+    """GET pages until nextCursor is null; returns the ids of each page."""
+    pages = []
+    cursor = None
+    for _ in range(max_pages):
+        separator = '&' if '?' in url else '?'
+        page_url = f"{url}{separator}limit={limit}&fields=id" + (f"&cursor={cursor}" if cursor else '')
+        body = client.get(page_url).get_json()
+        pages.append([deal['id'] for deal in body['deals']])
+        cursor = body['nextCursor']
+        if not cursor:
+            return pages
+    raise AssertionError(f"Cursor never reached the end: {pages}")
+
+
+def test_same_second():
+    """Deals created within one second are each listed exactly once"""
+    print("\n" + "=" * 60)
+    print("TEST 1: DEALS CREATED IN THE SAME SECOND")
+    print("=" * 60)
+
+    app = make_app()
+    ids = create_deals(app, 7)
+    pages = follow_cursors(app.test_client(), '/api/v1/deals')
+    print(f"  Pages: {pages}")
+
+    assert pages == [[7, 6, 5], [4, 3, 2], [1]]
+    assert sorted(sum(pages, [])) == sorted(ids)
+
+
+def test_legacy_timestamps():
+    """Rows stored by func.now() (no fraction) page correctly after migration 5"""
+    print("\n" + "=" * 60)
+    print("TEST 2: LEGACY TIMESTAMPS")
+    print("=" * 60)
+
+    app = make_app()
+    create_deals(app, 6)
+    with app.app_context():
+        # As func.now() stored them: whole seconds, two deals per second
+        db.session.execute(text(
+            "UPDATE deals SET updated_at = '2026-10-16 19:30:2' || ((id + 1) / 2), "
+            "created_at = '2026-10-16 19:30:2' || ((id + 1) / 2)"
+        ))
+        db.session.commit()
+
+        migration = next(m for m in MIGRATIONS if m.version == 5)
+        with db.engine.begin() as conn:
+            for operation in migration.operations:
+                operation.apply(conn)
+
+        stored = db.session.execute(text("SELECT updated_at FROM deals WHERE id = 1")).scalar()
+        print(f"  Stored after migration: {stored}")
+        assert stored == '2026-10-16 19:30:21.000000'
+
+    pages = follow_cursors(app.test_client(), '/api/v1/deals', limit=2)
+    print(f"  Pages: {pages}")
+    assert pages == [[6, 5], [4, 3], [2, 1]]
+
+
+def test_board_load_more():
+    """A board column's nextCursor continues without repeating its last card"""
+    print("\n" + "=" * 60)
+    print("TEST 3: BOARD LOAD MORE")
+    print("=" * 60)
+
+    app = make_app()
+    create_deals(app, 5, status='ongoing')
+    create_deals(app, 2, status='potential')
+    client = app.test_client()
+
+    board = client.get('/api/v1/deals/board?perStatus=2&fields=id').get_json()['board']
+    column = board['ongoing']
+    shown = [deal['id'] for deal in column['deals']]
+    print(f"  Board: {shown} of {column['count']}, more: {bool(column['nextCursor'])}")
+    assert shown == [5, 4] and column['count'] == 5
+    assert board['potential']['nextCursor'] is None
+
+    more = client.get(f"/api/v1/deals?status=ongoing&limit=2&fields=id&cursor={column['nextCursor']}").get_json()
+    loaded = [deal['id'] for deal in more['deals']]
+    print(f"  Load more: {loaded}")
+    assert loaded == [3, 2]
+
+    rest = follow_cursors(client, f"/api/v1/deals?status=ongoing&cursor={more['nextCursor']}", limit=2)
+    assert rest == [[1]]
+
+
+def main():
+    """Run all deal pagination tests"""
+    print("=" * 60)
+    print("DEAL PAGINATION TESTS")
+    print("=" * 60)
+
+    try:
+        test_same_second()
+        test_legacy_timestamps()
+        test_board_load_more()
+
+        print("\n" + "=" * 60)
+        print("ALL TESTS PASSED ✓")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+"""
+Test HTTP Client
+Exercise retries, backoff, rate limiting and circuit breaking of the pooled
+HTTP client against a local stub server (no external API calls)
+"""
+
+import sys
+import os
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from app.clients.http_client import HTTPClient, ProviderPolicy, CircuitOpenError
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves scripted responses: /flaky fails twice, /throttled sends 429 once, /down always 503,
+    /truncated cuts its body short and /loop redirects to itself"""
+
+    calls = {}
+    connections = set()
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        StubHandler.calls[path] = StubHandler.calls.get(path, 0) + 1
+        StubHandler.connections.add(self.client_address[1])
+        count = StubHandler.calls[path]
+
+        if path == '/flaky' and count <= 2:
+            self._reply(503, {'error': 'unavailable'})
+        elif path == '/throttled' and count == 1:
+            self._reply(429, {'error': 'slow down'}, {'Retry-After': '0'})
+        elif path == '/down':
+            self._reply(503, {'error': 'down'})
+        elif path == '/truncated':
+            self.send_response(200)
+            self.send_header('Content-Length', '100')
+            self.end_headers()
+            self.wfile.write(b'{"ok": tr')
+            self.close_connection = True
+        elif path == '/loop':
+            self.send_response(302)
+            self.send_header('Location', '/loop')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        else:
+            self._reply(200, {'ok': True, 'path': path})
+
+    def _reply(self, status, body, headers=None):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server():
+    StubHandler.protocol_version = 'HTTP/1.1'  # keep-alive
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_retries(base_url):
+    """Retry 5xx and 429 until success"""
+    print("\n" + "=" * 60)
+    print("TEST 1: RETRIES WITH BACKOFF")
+    print("=" * 60)
+
+    client = HTTPClient('stub', ProviderPolicy(max_retries=3, backoff_base=0.01))
+
+    response = client.get(f"{base_url}/flaky")
+    print(f"  /flaky -> {response.status_code} after {StubHandler.calls['/flaky']} attempts")
+    assert response.status_code == 200
+    assert StubHandler.calls['/flaky'] == 3
+
+    response = client.get(f"{base_url}/throttled")
+    print(f"  /throttled -> {response.status_code} after {StubHandler.calls['/throttled']} attempts")
+    assert response.status_code == 200
+
+    print(f"  Stats: {client.get_stats()}")
+
+
+def test_keep_alive(base_url):
+    """Sequential calls reuse one pooled connection"""
+    print("\n" + "=" * 60)
+    print("TEST 2: CONNECTION REUSE")
+    print("=" * 60)
+
+    client = HTTPClient('stub', ProviderPolicy())
+    StubHandler.connections.clear()
+    for _ in range(10):
+        client.get(f"{base_url}/ok").raise_for_status()
+
+    print(f"  10 requests used {len(StubHandler.connections)} connection(s)")
+    assert len(StubHandler.connections) == 1
+
+
+def test_rate_limit(base_url):
+    """Token bucket spaces requests beyond the burst"""
+    print("\n" + "=" * 60)
+    print("TEST 3: RATE LIMITING")
+    print("=" * 60)
+
+    client = HTTPClient('stub', ProviderPolicy(rate_per_second=20, burst=5))
+    start = time.perf_counter()
+    for _ in range(15):
+        client.get(f"{base_url}/ok")
+    elapsed = time.perf_counter() - start
+
+    # 5 burst tokens, then 10 more at 20/s = ~0.5s
+    print(f"  15 requests at 20/s (burst 5) took {elapsed:.2f}s")
+    assert elapsed >= 0.45
+
+
+def test_circuit_breaker(base_url):
+    """Repeated failures open the circuit; later calls fail fast"""
+    print("\n" + "=" * 60)
+    print("TEST 4: CIRCUIT BREAKER")
+    print("=" * 60)
+
+    client = HTTPClient('stub', ProviderPolicy(
+        max_retries=0, failure_threshold=3, recovery_timeout=0.5
+    ))
+
+    for _ in range(3):
+        assert client.get(f"{base_url}/down").status_code == 503
+    print(f"  Circuit after 3 failures: {client.circuit.state}")
+    assert client.circuit.state == 'open'
+
+    calls_before = StubHandler.calls['/down']
+    try:
+        client.get(f"{base_url}/down")
+        raise AssertionError("expected CircuitOpenError")
+    except CircuitOpenError as e:
+        print(f"  Short-circuited: {e}")
+    assert StubHandler.calls['/down'] == calls_before
+
+    time.sleep(0.6)
+    assert client.get(f"{base_url}/ok").status_code == 200
+    print(f"  Circuit after successful trial: {client.circuit.state}")
+    assert client.circuit.state == 'closed'
+
+
+def test_half_open_errors(base_url):
+    """Errors other than connection/timeout during a half-open trial never strand the circuit"""
+    print("\n" + "=" * 60)
+    print("TEST 5: HALF-OPEN TRIAL ERRORS")
+    print("=" * 60)
+
+    client = HTTPClient('stub', ProviderPolicy(
+        max_retries=0, failure_threshold=1, recovery_timeout=0.2
+    ))
+
+    client.get(f"{base_url}/down")
+    assert client.circuit.state == 'open'
+
+    # Each failed trial reopens the circuit for the next one
+    for path, error in (('/truncated', requests.exceptions.ChunkedEncodingError),
+                        ('/loop', requests.exceptions.TooManyRedirects)):
+        time.sleep(0.3)
+        try:
+            client.get(f"{base_url}{path}")
+            raise AssertionError(f"expected {error.__name__}")
+        except error:
+            pass
+        print(f"  {path} trial raised {error.__name__}; circuit {client.circuit.state}")
+        assert client.circuit.state == 'open'
+
+    # A malformed URL is the caller's fault: the trial slot is given back
+    time.sleep(0.3)
+    try:
+        client.get('http://')
+        raise AssertionError("expected InvalidURL")
+    except requests.exceptions.InvalidURL:
+        pass
+    print(f"  Invalid URL trial: circuit {client.circuit.state}")
+    assert client.get(f"{base_url}/ok").status_code == 200
+    assert client.circuit.state == 'closed'
+
+
+def main():
+    """Run all HTTP client tests"""
+    print("=" * 60)
+    print("HTTP CLIENT TESTS")
+    print("=" * 60)
+
+    server, base_url = start_stub_server()
+
+    try:
+        test_retries(base_url)
+        test_keep_alive(base_url)
+        test_rate_limit(base_url)
+        test_circuit_breaker(base_url)
+        test_half_open_errors(base_url)
+
+        print("\n" + "=" * 60)
+        print("ALL TESTS PASSED ✓")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Test Job Worker Shutdown
+Start the job worker pool as `python -m app.jobs.worker` and check that
+SIGTERM (docker stop) and SIGINT to the process group (Ctrl-C) stop the pool
+and every worker cleanly (temporary SQLite database, no external services)
+"""
+
+import sys
+import os
+import re
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Add parent directory to path
+sys.path.append(BACKEND_DIR)
+
+from app import create_app
+
+STARTUP_TIMEOUT = 60
+SHUTDOWN_TIMEOUT = 15
+
+
+def start_pool(directory, processes=2):
+    """Start the pool in its own process group; returns (process, output lines)."""
+    database_url = f"sqlite:///{os.path.join(directory, 'jobs.db')}"
+    # The web app normally creates the schema before workers start
+    create_app({
+        'SQLALCHEMY_DATABASE_URI': database_url,
+        'CACHE_BACKEND': 'memory',
+        'RENTCAST_RESPONSE_STORE_PATH': '',
+        'FRED_SERIES_STORE_PATH': ''
+    })
+
+    env = {
+        **os.environ,
+        'DATABASE_URL': database_url,
+        'CACHE_BACKEND': 'memory',
+        'RENTCAST_RESPONSE_STORE_PATH': '',
+        'FRED_SERIES_STORE_PATH': '',
+        'JOB_POLL_INTERVAL': '0.2',
+        'PYTHONUNBUFFERED': '1'
+    }
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'app.jobs.worker', '--processes', str(processes)],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        start_new_session=True
+    )
+    lines = []
+
+    def read():
+        for line in process.stdout:
+            lines.append(line.rstrip())
+
+    threading.Thread(target=read, daemon=True).start()
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while len(re.findall(r'Job worker \S+ started', '\n'.join(lines))) < processes:
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            raise AssertionError("Workers did not start:\n" + '\n'.join(lines[-20:]))
+        time.sleep(0.1)
+    return process, lines
+
+
+def stop_and_wait(process, lines, send):
+    """Send a signal and wait for the pool to exit; returns seconds taken."""
+    started = time.monotonic()
+    send()
+    try:
+        exit_code = process.wait(SHUTDOWN_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+        raise AssertionError(f"Pool still running {SHUTDOWN_TIMEOUT}s after the signal")
+    time.sleep(0.2)  # let the reader thread drain the pipe
+
+    assert exit_code == 0, f"exit code {exit_code}:\n" + '\n'.join(lines[-20:])
+    # Both workers write to one pipe, so their lines may run together
+    stopped = re.findall(r'Job worker \S+ stopped', '\n'.join(lines))
+    assert len(stopped) == 2, '\n'.join(lines[-20:])
+    return time.monotonic() - started
+
+
+def test_sigterm():
+    """SIGTERM to the pool process (what docker stop sends)"""
+    print("\n" + "=" * 60)
+    print("TEST 1: SIGTERM")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        process, lines = start_pool(directory)
+        elapsed = stop_and_wait(process, lines, lambda: process.send_signal(signal.SIGTERM))
+        print(f"  Pool and both workers exited cleanly in {elapsed:.1f}s")
+
+
+def test_sigint_process_group():
+    """SIGINT to the whole process group (what Ctrl-C in a terminal sends)"""
+    print("\n" + "=" * 60)
+    print("TEST 2: CTRL-C (SIGINT TO THE PROCESS GROUP)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        process, lines = start_pool(directory)
+        elapsed = stop_and_wait(process, lines, lambda: os.killpg(process.pid, signal.SIGINT))
+        print(f"  Pool and both workers exited cleanly in {elapsed:.1f}s")
+
+
+def test_sigterm_process_group():
+    """SIGTERM to every process at once (e.g. a supervisor killing the group)"""
+    print("\n" + "=" * 60)
+    print("TEST 3: SIGTERM TO THE PROCESS GROUP")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        process, lines = start_pool(directory)
+        elapsed = stop_and_wait(process, lines, lambda: os.killpg(process.pid, signal.SIGTERM))
+        print(f"  Pool and both workers exited cleanly in {elapsed:.1f}s")
+
+
+def main():
+    """Run all job worker shutdown tests"""
+    print("=" * 60)
+    print("JOB WORKER SHUTDOWN TESTS")
+    print("=" * 60)
+
+    try:
+        test_sigterm()
+        test_sigint_process_group()
+        test_sigterm_process_group()
+
+        print("\n" + "=" * 60)
+        print("ALL TESTS PASSED ✓")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
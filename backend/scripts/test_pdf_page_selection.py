@@ -0,0 +1,207 @@
+"""
+Test PDF Page Selection
+Check relevance-ranked page selection, batching and merged LLM extraction
+against a stub LLM client (no external API calls)
+"""
+
+import sys
+import os
+import json
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.pdf_extraction_service import PDFExtractionService
+from app.services.pdf_page_selector import PDFPageSelector
+
+
+NARRATIVE = (
+    "The Austin metro continues to attract employers and residents, supporting demand "
+    "for well-located rental housing across the submarket. Retail, dining and parks are "
+    "within walking distance, and the neighborhood has seen steady investment. "
+) * 12
+
+
+def build_offering_memorandum():
+    """30-page OM: pricing summary on page 2, rent roll and T-12 on pages 24-25, narrative elsewhere."""
+    pages = [NARRATIVE] * 30
+    pages[0] = "Offering Memorandum\nOak Ridge Apartments\nExclusively listed\n" + NARRATIVE[:400]
+    pages[1] = (
+        "Pricing Summary\n"
+        "Oak Ridge Apartments\n"
+        "123 Main Street, Austin, TX 78701\n"
+        "Asking Price: $4,250,000\n"
+        "Price Per Unit: $88,541\n"
+        "Cap Rate: 6.25%\n"
+        "48 Units | Year Built: 1986 | 42,000 SF\n"
+    )
+    pages[23] = (
+        "Rent Roll\n" +
+        "\n".join(f"Unit {100 + i}  2 Bed / 1 Bath  850 SF  $1,150" for i in range(48)) +
+        "\nTotal: 48 Units"
+    )
+    pages[24] = (
+        "Trailing 12 Operating Statement (T-12)\n"
+        "Gross Potential Income: $662,400\n"
+        "Effective Gross Income: $621,000\n"
+        "Total Expenses: $355,400\n"
+        "Net Operating Income (NOI): $265,600\n"
+    )
+    return pages
+
+
+class StubMessages:
+    """Answers like the LLM would, from the numbers visible in the prompt."""
+
+    def __init__(self, fail_on=None, delay=0.05):
+        self.prompts = []
+        self.fail_on = fail_on
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def create(self, model, max_tokens, messages):
+        prompt = messages[0]['content']
+        with self._lock:
+            self.prompts.append(prompt)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.fail_on and self.fail_on in prompt:
+                raise RuntimeError('stub failure')
+            return SimpleNamespace(content=[SimpleNamespace(text='```json\n' + json.dumps(self._answer(prompt)) + '\n```')])
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    @staticmethod
+    def _answer(prompt):
+        def number(pattern):
+            match = re.search(pattern, prompt)
+            return float(match.group(1).replace(',', '')) if match else None
+
+        units = number(r'(\d+) Units')
+        return {
+            'address': '123 Main Street' if '123 Main Street' in prompt else None,
+            'city': 'Austin' if 'Austin, TX 78701' in prompt else None,
+            'askingPrice': number(r'Asking Price: \$([\d,]+)'),
+            'capRate': number(r'Cap Rate: ([\d.]+)%'),
+            'numUnits': int(units) if units else None,
+            'yearBuilt': int(number(r'Year Built: (\d{4})') or 0) or None,
+            'noi': number(r'Net Operating Income \(NOI\): \$([\d,]+)'),
+            'grossIncome': number(r'Effective Gross Income: \$([\d,]+)')
+        }
+
+
+class StubLLMClient:
+    def __init__(self, **kwargs):
+        self.messages = StubMessages(**kwargs)
+
+
+def test_selection():
+    """Pricing, rent roll and T-12 pages are chosen; narrative is not"""
+    print("\n" + "=" * 60)
+    print("TEST 1: PAGE SELECTION")
+    print("=" * 60)
+
+    pages = build_offering_memorandum()
+    selected = PDFPageSelector.select_pages(pages, token_budget=6000, page_token_limit=3000)
+    chosen = [page_score.page + 1 for page_score in selected]
+    tokens = sum(page_score.tokens for page_score in selected)
+    print(f"  Selected pages {chosen} ({tokens} tokens of {PDFPageSelector.estimate_tokens(''.join(pages))})")
+
+    assert 2 in chosen and 25 in chosen
+    assert len(chosen) <= 4
+    assert tokens <= 6000
+
+    leading = PDFPageSelector.select_pages([NARRATIVE] * 5, token_budget=1000)
+    print(f"  No signals: falls back to leading pages {[page_score.page + 1 for page_score in leading]}")
+    assert [page_score.page for page_score in leading] == list(range(len(leading)))
+
+
+def test_single_call():
+    """One call when the selection fits the per-call budget"""
+    print("\n" + "=" * 60)
+    print("TEST 2: SINGLE LLM CALL")
+    print("=" * 60)
+
+    client = StubLLMClient()
+    service = PDFExtractionService(max_workers=1, llm_client=client)
+    data = service._extract_with_llm(build_offering_memorandum())
+
+    print(f"  Calls: {len(client.messages.prompts)}, prompt {len(client.messages.prompts[0])} chars")
+    print(f"  Price {data.asking_price}, cap rate {data.cap_rate}, NOI {data.noi}, units {data.num_units}")
+    assert len(client.messages.prompts) == 1
+    assert data.asking_price == 4250000 and data.noi == 265600 and data.num_units == 48
+    assert 'Page 2' in client.messages.prompts[0] and 'Page 25' in client.messages.prompts[0]
+
+
+def test_parallel_batches():
+    """Small call budget: parallel calls, merged by evidence"""
+    print("\n" + "=" * 60)
+    print("TEST 3: PARALLEL BATCHES")
+    print("=" * 60)
+
+    client = StubLLMClient(delay=0.2)
+    service = PDFExtractionService(max_workers=1, llm_client=client, llm_call_token_budget=300)
+    started = time.perf_counter()
+    data = service._extract_with_llm(build_offering_memorandum())
+    elapsed = time.perf_counter() - started
+
+    print(f"  Calls: {len(client.messages.prompts)}, max in flight {client.messages.max_active}, {elapsed:.2f}s")
+    print(f"  Price {data.asking_price}, NOI {data.noi}, gross income {data.gross_income}, units {data.num_units}")
+    assert len(client.messages.prompts) > 1
+    assert client.messages.max_active > 1
+    assert data.asking_price == 4250000 and data.noi == 265600 and data.year_built == 1986
+
+
+def test_failures():
+    """A failed batch is skipped; if every call fails, regex extraction takes over"""
+    print("\n" + "=" * 60)
+    print("TEST 4: FAILED CALLS")
+    print("=" * 60)
+
+    client = StubLLMClient(fail_on='Operating Statement')
+    service = PDFExtractionService(max_workers=1, llm_client=client, llm_call_token_budget=300)
+    data = service._extract_with_llm(build_offering_memorandum())
+    print(f"  T-12 batch failed: price {data.asking_price}, NOI {data.noi}")
+    assert data.asking_price == 4250000 and data.noi is None
+
+    client = StubLLMClient(fail_on='Page')
+    service = PDFExtractionService(max_workers=1, llm_client=client)
+    data = service._extract_with_llm(build_offering_memorandum())
+    print(f"  All calls failed, regex fallback: address {data.address}, price {data.asking_price}")
+    assert data.address and data.asking_price
+
+
+def main():
+    """Run all page selection tests"""
+    print("=" * 60)
+    print("PDF PAGE SELECTION TESTS")
+    print("=" * 60)
+
+    try:
+        test_selection()
+        test_single_call()
+        test_parallel_batches()
+        test_failures()
+
+        print("\n" + "=" * 60)
+        print("ALL TESTS PASSED ✓")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+"""
+Test Property Field Extractor
+Check the single-pass rule engine on document text and HTML label/value
+pairs, and that PDF extraction skips the LLM when the regex matches suffice
+(stub LLM client, no external API calls)
+"""
+
+import sys
+import os
+import time
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from app.services.pdf_extraction_service import PDFExtractionService
+from app.services.property_field_extractor import PropertyFieldExtractor
+
+
+PRICING_PAGE = [
+    'Pricing Summary',
+    'Oak Ridge Apartments',
+    '123 Main Street, Austin, TX 78701',
+    'Asking Price: $4,250,000',
+    'Price Per Unit: $88,541',
+    'Cap Rate: 6.25%',
+    '48 Units | Year Built: 1986 | 42,000 SF',
+    'Net Operating Income (NOI): $265,600',
+]
+UNLABELED_PAGE = [
+    'Oak Ridge Apartments',
+    'A well-located apartment community near downtown.',
+    'Forty-eight homes on a 2.1 acre site.',
+]
+NARRATIVE = [f'Market commentary line {i} about the submarket, rent growth and $1,150 average rents.' for i in range(50)]
+
+
+def make_pdf(pages):
+    """Build a minimal text PDF: one list of lines per page."""
+    objects = ['<</Type/Catalog/Pages 2 0 R>>']
+    kids = ' '.join(f'{3 + 2 * i} 0 R' for i in range(len(pages)))
+    objects.append(f'<</Type/Pages/Kids[{kids}]/Count {len(pages)}>>')
+    font = 3 + 2 * len(pages)
+    for i, lines in enumerate(pages):
+        content = 'BT /F1 10 Tf 40 760 Td 12 TL ' + ' '.join(f'({line}) Tj T*' for line in lines) + ' ET'
+        objects.append(f'<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]/Contents {4 + 2 * i} 0 R/Resources<</Font<</F1 {font} 0 R>>>>>>')
+        objects.append(f'<</Length {len(content)}>>\nstream\n{content}\nendstream')
+    objects.append('<</Type/Font/Subtype/Type1/BaseFont/Helvetica>>')
+
+    pdf = b'%PDF-1.4\n'
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += f'{number} 0 obj\n{obj}\nendobj\n'.encode()
+    xref = len(pdf)
+    pdf += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    pdf += b''.join(f'{offset:010d} 00000 n \n'.encode() for offset in offsets)
+    pdf += f'trailer<</Size {len(objects) + 1}/Root 1 0 R>>\nstartxref\n{xref}\n%%EOF'.encode()
+    return pdf
+
+
+class StubLLMClient:
+    """Counts calls; always answers with the same listing."""
+
+    def __init__(self):
+        self.calls = 0
+        self.messages = SimpleNamespace(create=self._create)
+
+    def _create(self, model, max_tokens, messages):
+        self.calls += 1
+        text = '{"address": "123 Main Street", "askingPrice": 4250000, "numUnits": 48}'
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+def test_document_text():
+    """Labeled values win over bare ones; every candidate keeps its position"""
+    print("\n" + "=" * 60)
+    print("TEST 1: DOCUMENT TEXT")
+    print("=" * 60)
+
+    text = '\n'.join(PRICING_PAGE + NARRATIVE)
+    extraction = PropertyFieldExtractor.extract(text)
+    data = extraction.to_property_data()
+
+    for field_name in ('address', 'city', 'asking_price', 'num_units', 'cap_rate', 'noi', 'building_size_sf'):
+        candidate = extraction.best(field_name)
+        print(f"  {field_name}: {candidate.value} @ {candidate.start} ({candidate.rule}, {candidate.confidence})")
+
+    assert data.asking_price == 4250000 and data.price_per_unit == 88541
+    assert data.city == 'Austin' and data.state == 'TX' and data.zipcode == '78701'
+    assert data.num_units == 48 and data.year_built == 1986 and data.cap_rate == 6.25
+    assert data.noi == 265600 and data.building_size_sf == 42000
+    assert data.property_type == 'Multifamily'
+
+    price = extraction.best('asking_price')
+    assert text[price.start:price.end] == '$4,250,000'
+    # Rents are weak candidates, never the asking price
+    rents = [c for c in extraction.candidates['asking_price'] if c.value == 1150]
+    assert len(rents) == len(NARRATIVE) and all(c.confidence < price.confidence for c in rents)
+
+    bare = PropertyFieldExtractor.extract('Listed for $3,900,000 with $45,000 in upgrades, $1.2M seller credit')
+    print(f"  Bare amounts only: asking price {bare.value('asking_price')}")
+    assert bare.value('asking_price') == 3900000
+
+
+def test_single_pass_speed():
+    """One scan of a large document"""
+    print("\n" + "=" * 60)
+    print("TEST 2: SINGLE PASS")
+    print("=" * 60)
+
+    text = '\n'.join((PRICING_PAGE + NARRATIVE) * 80)
+    PropertyFieldExtractor.extract('warm up')
+    started = time.perf_counter()
+    extraction = PropertyFieldExtractor.extract(text)
+    elapsed = time.perf_counter() - started
+
+    candidates = sum(len(c) for c in extraction.candidates.values())
+    print(f"  {len(text):,} chars, {candidates:,} candidates in {elapsed * 1000:.1f} ms")
+    assert extraction.value('asking_price') == 4250000
+    assert elapsed < 0.5
+
+
+def test_html_pairs():
+    """Table rows and list items go through the same parsers"""
+    print("\n" + "=" * 60)
+    print("TEST 3: HTML LABEL/VALUE PAIRS")
+    print("=" * 60)
+
+    html = """
+    <table>
+      <tr><th>Price</th><td>$1.2M</td></tr>
+      <tr><th>Price Per Unit</th><td>$100,000</td></tr>
+      <tr><th>Building Size</th><td>18,400 SF</td></tr>
+      <tr><th>Units</th><td>12</td></tr>
+      <tr><th>Year Built</th><td>Built 1978, renovated 2015</td></tr>
+      <tr><th>Lot Size</th><td>0.75 AC</td></tr>
+      <tr><th>Property Type</th><td>Multifamily</td></tr>
+      <tr><th>Zoning</th><td>MF-3</td></tr>
+    </table>
+    """
+    soup = BeautifulSoup(html, 'html5lib')
+    pairs = [
+        tuple(cell.text.strip() for cell in row.find_all(['th', 'td']))
+        for row in soup.find_all('tr')
+    ]
+    data = PropertyFieldExtractor.extract_pairs(pairs).to_property_data()
+    print(f"  {data.asking_price} / {data.price_per_unit} / {data.building_size_sf} SF / {data.num_units} units / "
+          f"{data.year_built} / {data.lot_size_acres} ac / {data.property_type} / {data.zoning}")
+
+    assert data.asking_price == 1200000 and data.price_per_unit == 100000
+    assert data.building_size_sf == 18400 and data.num_units == 12 and data.year_built == 1978
+    assert data.lot_size_acres == 0.75 and data.property_type == 'Multifamily' and data.zoning == 'MF-3'
+
+
+def test_llm_skipped():
+    """The LLM is only called when the regex matches fall short"""
+    print("\n" + "=" * 60)
+    print("TEST 4: LLM ONLY WHEN NEEDED")
+    print("=" * 60)
+
+    client = StubLLMClient()
+    service = PDFExtractionService(max_workers=1, llm_client=client)
+
+    labeled = make_pdf([PRICING_PAGE] + [NARRATIVE] * 20)
+    pages, extraction = service._extract_pages(labeled)
+    assert extraction.value('asking_price') == 4250000
+    result = service.extract_from_pdf(labeled)
+    print(f"  Labeled OM: {result.method}, confidence {result.confidence_score}, "
+          f"{len(pages)} of 21 pages read, {client.calls} LLM calls")
+    assert result.method == 'pdf_regex_extraction' and client.calls == 0
+    assert result.extracted_data.asking_price == 4250000
+    assert len(pages) < 21
+
+    unlabeled = make_pdf([UNLABELED_PAGE] + [NARRATIVE] * 3)
+    result = service.extract_from_pdf(unlabeled)
+    print(f"  Unlabeled OM: {result.method}, {client.calls} LLM calls")
+    assert result.method == 'pdf_llm_extraction' and client.calls == 1
+
+    always = PDFExtractionService(max_workers=1, llm_client=client, regex_min_confidence=1.1)
+    result = always.extract_from_pdf(labeled)
+    print(f"  regex_min_confidence above 1: {result.method}, {client.calls} LLM calls")
+    assert result.method == 'pdf_llm_extraction' and client.calls == 2
+
+
+def main():
+    """Run all property field extractor tests"""
+    print("=" * 60)
+    print("PROPERTY FIELD EXTRACTOR TESTS")
+    print("=" * 60)
+
+    try:
+        test_document_text()
+        test_single_pass_speed()
+        test_html_pairs()
+        test_llm_skipped()
+
+        print("\n" + "=" * 60)
+        print("ALL TESTS PASSED ✓")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
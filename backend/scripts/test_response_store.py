@@ -0,0 +1,208 @@
+"""
+Test Response Store
+Check key normalization, TTL expiry and size-cap eviction of the durable API
+response store, and the per-endpoint quota counters reported by
+GET /rentcast/quota-stats (local stub server, no external API calls)
+"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.api.v1 import routes
+from app.cache import MemoryBackend, SQLiteBackend, ResponseStore
+from app.services.rentcast_service import RentCastService
+
+
+class StubRentCastHandler(BaseHTTPRequestHandler):
+    """Answers rent estimate and market requests, counting calls per path"""
+
+    calls = {}
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        StubRentCastHandler.calls[path] = StubRentCastHandler.calls.get(path, 0) + 1
+        if path.endswith('/avm/rent/long-term'):
+            body = {'rent': 1450, 'rentRangeLow': 1300, 'rentRangeHigh': 1600}
+        else:
+            body = {'zipCode': '78701', 'rentalData': {'averageRent': 1500}}
+
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubRentCastHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+def test_key_normalization():
+    """Parameter order, case, whitespace and numeric type do not change the key"""
+    print("\n" + "=" * 60)
+    print("TEST 1: KEY NORMALIZATION")
+    print("=" * 60)
+
+    endpoint = '/avm/rent/long-term'
+    key = ResponseStore.make_key(endpoint, {'address': '123 Main St', 'bedrooms': 2, 'bathrooms': 2})
+    same = [
+        {'bathrooms': 2.0, 'bedrooms': 2, 'address': '123 Main St'},
+        {'address': '  123   MAIN st ', 'bedrooms': 2.0, 'bathrooms': 2},
+        {'address': '123 main st', 'bedrooms': 2, 'bathrooms': 2, 'squareFootage': None},
+    ]
+    for params in same:
+        assert ResponseStore.make_key(endpoint, params) == key, params
+
+    different = [
+        ResponseStore.make_key(endpoint, {'address': '123 Main St', 'bedrooms': 3, 'bathrooms': 2}),
+        ResponseStore.make_key(endpoint, {'address': '125 Main St', 'bedrooms': 2, 'bathrooms': 2}),
+        ResponseStore.make_key('/markets', {'address': '123 Main St', 'bedrooms': 2, 'bathrooms': 2}),
+    ]
+    print(f"  {len(same)} variants share key {key[:12]}..., {len(different)} distinct requests do not")
+    assert key not in different and len(set(different)) == len(different)
+
+
+def test_ttl_expiry():
+    """A stored response is served until its TTL passes, then counts as a miss"""
+    print("\n" + "=" * 60)
+    print("TEST 2: TTL EXPIRY")
+    print("=" * 60)
+
+    store = ResponseStore('rentcast', MemoryBackend(max_entries=None), ttl_seconds=0.2)
+    store.put('/markets', {'zipCode': '78701'}, {'averageRent': 1500}, 'market_statistics')
+    assert store.get('/markets', {'zipCode': '78701 '}, 'market_statistics') == {'averageRent': 1500}
+
+    time.sleep(0.25)
+    assert store.get('/markets', {'zipCode': '78701'}, 'market_statistics') is None
+
+    stats = store.get_stats()
+    print(f"  Process: {stats['process']}, endpoints: {stats['endpoints']}")
+    assert stats['process'] == {'hits': 1, 'misses': 1, 'errors': 0}
+    assert stats['endpoints']['market_statistics'] == {'calls_made': 1, 'calls_saved': 1, 'saved_pct': 50.0}
+
+
+def test_size_cap():
+    """Past the byte cap the least recently used responses are evicted"""
+    print("\n" + "=" * 60)
+    print("TEST 3: SIZE CAP EVICTION")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        backend = SQLiteBackend(os.path.join(directory, 'responses.db'), max_bytes=2000)
+        store = ResponseStore('rentcast', backend, ttl_seconds=3600)
+        response = {'comparables': ['x' * 80] * 5}
+        size = len(json.dumps(response, separators=(',', ':')))
+
+        for zipcode in range(78701, 78711):
+            store.put('/listings', {'zipCode': str(zipcode)}, response, 'rental_comparables')
+
+        stats = store.get_stats()
+        kept = [z for z in range(78701, 78711) if store.get('/listings', {'zipCode': str(z)}, 'rental_comparables')]
+        print(f"  10 x {size} bytes under a 2000 byte cap: kept {kept}, {stats['bytes']} bytes, "
+              f"{stats['evictions']} evictions")
+        assert stats['bytes'] <= 2000 and stats['entries'] == len(kept)
+        assert stats['evictions'] == 10 - len(kept)
+        assert kept == list(range(78711 - len(kept), 78711))
+
+        store.put('/listings', {'zipCode': 'huge'}, {'data': 'x' * 3000}, 'rental_comparables')
+        assert store.get('/listings', {'zipCode': 'huge'}, 'rental_comparables') is None
+
+
+def test_quota_stats_endpoint():
+    """Calls made and saved per endpoint survive a restart and are reported by the API"""
+    print("\n" + "=" * 60)
+    print("TEST 4: /rentcast/quota-stats")
+    print("=" * 60)
+
+    server, base_url = start_stub_server()
+    with tempfile.TemporaryDirectory() as directory:
+        store_path = os.path.join(directory, 'rentcast_responses.db')
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+            'CACHE_BACKEND': 'memory',
+            'FRED_SERIES_STORE_PATH': '',
+            'RENTCAST_API_KEY': 'test-key',
+            'RENTCAST_RESPONSE_STORE_PATH': store_path
+        })
+        client = app.test_client()
+
+        try:
+            routes._rentcast_service = None
+            with app.app_context():
+                routes.get_rentcast_service().BASE_URL = base_url
+
+            # First call is paid; the differently written address is a store hit;
+            # repeating the first one is an in-memory cache hit
+            for address in ('123 Main St', '123  MAIN st', '123 Main St'):
+                body = client.get(f'/api/v1/rentcast/rent-estimate?address={address}').get_json()
+                assert body['success'], body
+            assert client.get('/api/v1/rentcast/market-stats?zipcode=78701').get_json()['success']
+
+            # A new process with an empty memory cache still reuses the stored response
+            restarted = RentCastService(
+                api_key='test-key',
+                cache_backend=MemoryBackend(),
+                response_store=ResponseStore('rentcast', SQLiteBackend(store_path), ttl_seconds=3600)
+            )
+            restarted.BASE_URL = base_url
+            assert restarted.get_market_statistics('78701') is not None
+
+            stats = client.get('/api/v1/rentcast/quota-stats').get_json()['data']
+            print(f"  Stub calls: {StubRentCastHandler.calls}")
+            print(f"  Endpoints: {stats['endpoints']}")
+            assert sum(StubRentCastHandler.calls.values()) == 2
+            assert stats['endpoints']['rent_estimate'] == {'calls_made': 1, 'calls_saved': 2, 'saved_pct': 66.7}
+            assert stats['endpoints']['market_statistics'] == {'calls_made': 1, 'calls_saved': 1, 'saved_pct': 50.0}
+            assert stats['total_calls_made'] == 2 and stats['total_calls_saved'] == 3
+            assert stats['entries'] == 2
+
+            routes._rentcast_service = None
+            app.config['RENTCAST_RESPONSE_STORE_PATH'] = ''
+            response = client.get('/api/v1/rentcast/quota-stats')
+            print(f"  Store disabled: {response.status_code}")
+            assert response.status_code == 404
+        finally:
+            routes._rentcast_service = None
+            server.shutdown()
+
+
+def main():
+    """Run all response store tests"""
+    print("=" * 60)
+    print("RESPONSE STORE TESTS")
+    print("=" * 60)
+
+    try:
+        test_key_normalization()
+        test_ttl_expiry()
+        test_size_cap()
+        test_quota_stats_endpoint()
+
+        print("\n" + "=" * 60)
+        print("ALL TESTS PASSED ✓")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+#!/bin/bash
+# Container entrypoint: runs the background job worker pool next to gunicorn.
+#
+# docker stop signals only this script (PID 1), so SIGTERM/SIGINT are
+# forwarded to both children: gunicorn finishes in-flight requests and the
+# pool lets running jobs finish before exiting. If either child dies the
+# other is stopped too, so the container exits and the platform restarts it
+# instead of serving without workers. Give long jobs time to drain with
+# `docker stop --time` (default 10s).
+
+python -m app.jobs.worker &
+worker_pid=$!
+
+gunicorn \
+    --bind 0.0.0.0:${PORT} \
+    --workers 2 \
+    --timeout 120 \
+    --access-logfile - \
+    --error-logfile - \
+    "app:create_app()" &
+web_pid=$!
+
+stop() {
+    kill -TERM "$web_pid" "$worker_pid" 2>/dev/null
+}
+trap stop TERM INT
+
+# Returns when either child exits (or a forwarded signal interrupts it)
+wait -n "$web_pid" "$worker_pid"
+status=$?
+stop
+
+# Wait for both to finish, even if another signal interrupts the wait
+while kill -0 "$web_pid" 2>/dev/null || kill -0 "$worker_pid" 2>/dev/null; do
+    wait
+done
+exit $status